@@ -8,26 +8,11 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
 
 # Import our models and config
+# Importing the packages registers every table (including the polymorphic
+# account type tables) on Base.metadata for autogenerate support
+import src.models  # noqa: F401
+import src.models.account_types  # noqa: F401
 from src.database.base import Base
-
-# from src.models.accounts import Account
-# from src.models.balance_history import BalanceHistory
-# from src.models.balance_reconciliation import BalanceReconciliation
-# from src.models.bill_splits import BillSplit
-# from src.models.cashflow import CashflowForecast
-# from src.models.categories import Category
-# from src.models.credit_limit_history import CreditLimitHistory
-# from src.models.deposit_schedules import DepositSchedule
-# from src.models.feature_flags import FeatureFlag
-# from src.models.income_categories import IncomeCategory
-# from src.models.income import Income
-# from src.models.liabilities import Liability
-# from src.models.payment_schedules import PaymentSchedule
-# from src.models.payments import Payment, PaymentSource
-# from src.models.recurring_bills import RecurringBill
-# from src.models.recurring_income import RecurringIncome
-# from src.models.statement_history import StatementHistory
-# from src.models.transaction_history import TransactionHistory
 from src.utils.config import get_settings
 
 settings = get_settings()
@@ -37,7 +37,8 @@ async def feature_flag_exception_handler(
     """
     # Log the error
     logger.info(
-        f"Feature flag error: {str(exc)}",
+        "Feature flag error: %s",
+        exc,
         extra={
             "path": request.url.path,
             "method": request.method,
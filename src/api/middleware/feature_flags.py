@@ -87,7 +87,9 @@ class FeatureFlagMiddleware(BaseHTTPMiddleware):
 
                     # Raise domain exception - will be caught by FastAPI's exception handler
                     logger.info(
-                        f"Blocking request to {request.url.path} - feature '{flag_name}' is disabled",
+                        "Blocking request to %s - feature '%s' is disabled",
+                        request.url.path,
+                        flag_name,
                         extra={
                             "path": request.url.path,
                             "feature": flag_name,
@@ -108,7 +110,8 @@ class FeatureFlagMiddleware(BaseHTTPMiddleware):
             # Log successful check if we had matches
             if matches:
                 logger.debug(
-                    f"Feature flag check passed for {request.url.path}",
+                    "Feature flag check passed for %s",
+                    request.url.path,
                     extra={"path": request.url.path},
                 )
 
@@ -120,7 +123,7 @@ class FeatureFlagMiddleware(BaseHTTPMiddleware):
             raise
         except Exception as e:
             # Log unexpected errors and then re-raise
-            logger.error(f"Unexpected error in FeatureFlagMiddleware: {e}")
+            logger.error("Unexpected error in FeatureFlagMiddleware: %s", e)
             raise
 
     async def _get_matching_patterns(self, path: str) -> list:
@@ -209,7 +212,7 @@ class FeatureFlagMiddleware(BaseHTTPMiddleware):
             self._cache = transformed_requirements
 
         except Exception as e:
-            logger.error(f"Error loading API requirements: {e}")
+            logger.error("Error loading API requirements: %s", e)
             # Keep existing cache if available
             if not self._cache:
                 self._cache = {}
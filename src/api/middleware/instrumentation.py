@@ -0,0 +1,141 @@
+"""
+Request instrumentation middleware.
+
+This middleware opens a RequestMetrics scope for every HTTP request so SQL
+statements and proxied repository/service calls are attributed to it. When
+the request completes, its figures are added to the process-wide metrics
+registry, optionally reported in a Server-Timing response header, and logged
+if the request executed more statements than the configured query budget.
+"""
+
+import logging
+from typing import Callable, Optional
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.utils.instrumentation import (
+    MetricsRegistry,
+    metrics_registry,
+    request_metrics_scope,
+)
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+def route_template(request: Request) -> str:
+    """
+    Get the path template of the route that handled a request.
+
+    Routes of included routers only know their path relative to the router
+    prefix, so the prefix is taken from the matching leading segments of the
+    request path.
+
+    Args:
+        request: The handled HTTP request
+
+    Returns:
+        str: Template such as /api/v1/accounts/{account_id}, or "unmatched"
+    """
+    template = getattr(request.scope.get("route"), "path", None)
+    if not template:
+        return "unmatched"
+    if ":path}" in template:
+        # Path convertors span several segments, so no prefix can be derived
+        return template
+
+    template_parts = template.split("/")[1:]
+    path_parts = request.url.path.split("/")
+    if len(path_parts) <= len(template_parts):
+        return template
+    return "/".join(path_parts[: -len(template_parts)] + template_parts)
+
+
+class RequestInstrumentationMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware recording statement counts and latency for each request.
+    """
+
+    def __init__(
+        self,
+        app,
+        server_timing: bool = False,
+        query_budget: Optional[int] = None,
+        registry: MetricsRegistry = metrics_registry,
+        exclude_paths: tuple = ("/metrics",),
+    ):
+        """
+        Initialize the instrumentation middleware.
+
+        Args:
+            app: The FastAPI application
+            server_timing: Add a Server-Timing header to every response
+            query_budget: Log requests executing more statements than this
+            registry: Registry aggregating request metrics
+            exclude_paths: Paths that are not recorded, such as the scrape endpoint
+        """
+        super().__init__(app)
+        self.server_timing = server_timing
+        self.query_budget = query_budget
+        self.registry = registry
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        """
+        Handle a request inside a metrics scope.
+
+        Args:
+            request: The incoming HTTP request
+            call_next: The next middleware or route handler
+
+        Returns:
+            The HTTP response
+        """
+        if request.url.path in self.exclude_paths:
+            return await call_next(request)
+
+        with request_metrics_scope() as metrics:
+            response = await call_next(request)
+
+        # Label by route template rather than raw path to bound cardinality
+        route_path = route_template(request)
+
+        budget_exceeded = (
+            self.query_budget is not None
+            and metrics.statement_count > self.query_budget
+        )
+        if budget_exceeded:
+            slowest = ", ".join(
+                f"{'.'.join(key)} ({timing.calls} calls, {timing.seconds * 1000:.1f}ms)"
+                for key, timing in metrics.slowest_methods()
+            )
+            logger.warning(
+                "%s %s executed %d SQL statements (budget %d) in %.1fms; "
+                "slowest methods: %s",
+                request.method,
+                route_path,
+                metrics.statement_count,
+                self.query_budget,
+                metrics.elapsed * 1000,
+                slowest or "none",
+                extra={
+                    "path": request.url.path,
+                    "route": route_path,
+                    "statement_count": metrics.statement_count,
+                    "query_budget": self.query_budget,
+                },
+            )
+
+        self.registry.record_request(
+            request.method,
+            route_path,
+            response.status_code,
+            metrics,
+            budget_exceeded=budget_exceeded,
+        )
+
+        if self.server_timing:
+            response.headers["Server-Timing"] = metrics.server_timing()
+
+        return response
@@ -0,0 +1,60 @@
+"""
+Request id middleware.
+
+Every request is handled inside a request id scope so log records emitted
+while serving it carry the same id. A caller-supplied X-Request-ID header is
+reused (letting ids propagate from a proxy or client), otherwise a new id is
+generated; either way it is echoed in the response header.
+"""
+
+from typing import Callable
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.utils.structured_logging import request_id_scope
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# Longer caller-supplied ids are replaced to keep log lines bounded
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestIdMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware assigning a correlation id to each request.
+    """
+
+    def __init__(self, app, header_name: str = REQUEST_ID_HEADER):
+        """
+        Initialize the request id middleware.
+
+        Args:
+            app: The FastAPI application
+            header_name: Header carrying the request id
+        """
+        super().__init__(app)
+        self.header_name = header_name
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        """
+        Handle a request inside a request id scope.
+
+        Args:
+            request: The incoming HTTP request
+            call_next: The next middleware or route handler
+
+        Returns:
+            The HTTP response with the request id header set
+        """
+        supplied = request.headers.get(self.header_name)
+        if supplied and (
+            len(supplied) > MAX_REQUEST_ID_LENGTH or not supplied.isprintable()
+        ):
+            supplied = None
+
+        with request_id_scope(supplied) as request_id:
+            response = await call_next(request)
+
+        response.headers[self.header_name] = request_id
+        return response
@@ -0,0 +1,166 @@
+"""
+Response cache middleware.
+
+GET requests to selected read-heavy routes are served from the in-process
+ResponseCache while the data version they were computed under is current.
+Every cached response carries an ETag, and a request whose If-None-Match
+matches the current entity tag gets a bodiless 304 Not Modified, so clients
+polling these endpoints neither recompute nor re-download unchanged data.
+
+The cache key is the path plus the sorted query string, so responses for
+different users (overview takes a user_id parameter) or filters are stored
+separately. Writes committed through any session bump the data version (see
+src/utils/response_cache.py), which makes all earlier entries stale.
+
+Responses built here carry only the body headers and the caching headers,
+so the middleware must be registered inside CORSMiddleware for cache hits
+and 304 responses to get CORS headers.
+"""
+
+import re
+from typing import Callable, Dict, Mapping, Optional, Pattern, Tuple
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from src.utils.response_cache import (
+    CachedResponse,
+    DataVersion,
+    ResponseCache,
+    data_version,
+    response_cache,
+)
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+# Headers describing the body that are replayed from the cache
+_REPLAYED_HEADERS = ("content-type", "content-language")
+
+
+def compile_route_template(template: str) -> Pattern[str]:
+    """
+    Compile a route template such as /accounts/{account_id} into a regex.
+
+    Args:
+        template: Path template with {name} parameters
+
+    Returns:
+        Pattern[str]: Regex matching the whole path
+    """
+    parts = re.split(r"\{[^}/]+\}", template)
+    return re.compile("^" + "[^/]+".join(re.escape(part) for part in parts) + "$")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware caching selected GET responses with ETag revalidation.
+    """
+
+    def __init__(
+        self,
+        app,
+        routes: Mapping[str, float],
+        cache: ResponseCache = response_cache,
+        version: DataVersion = data_version,
+    ):
+        """
+        Initialize the response cache middleware.
+
+        Args:
+            app: The FastAPI application
+            routes: Seconds each response stays fresh, keyed by full path
+                template; the TTL bounds content that also depends on the clock
+            cache: Cache storing rendered responses
+            version: Data version invalidating cached responses
+        """
+        super().__init__(app)
+        self.cache = cache
+        self.version = version
+        self.routes: Tuple[Tuple[Pattern[str], float], ...] = tuple(
+            (compile_route_template(template), ttl) for template, ttl in routes.items()
+        )
+
+    def _ttl_for(self, path: str) -> Optional[float]:
+        for pattern, ttl in self.routes:
+            if pattern.match(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def _respond(
+        request: Request, entry: CachedResponse, cache_status: str
+    ) -> Response:
+        headers: Dict[str, str] = {
+            "ETag": entry.etag,
+            # Clients may keep the body but must revalidate before reusing it
+            "Cache-Control": "private, no-cache",
+            CACHE_STATUS_HEADER: cache_status,
+        }
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+        headers.update(entry.headers)
+        return Response(
+            content=entry.body, status_code=entry.status_code, headers=headers
+        )
+
+    async def dispatch(self, request: Request, call_next: Callable):
+        """
+        Serve a request from the cache, or cache its response.
+
+        Args:
+            request: The incoming HTTP request
+            call_next: The next middleware or route handler
+
+        Returns:
+            The cached, revalidated or freshly computed HTTP response
+        """
+        if request.method != "GET":
+            return await call_next(request)
+        ttl = self._ttl_for(request.url.path)
+        if ttl is None:
+            return await call_next(request)
+
+        query = "&".join(
+            f"{name}={value}"
+            for name, value in sorted(request.query_params.multi_items())
+        )
+        key = (request.url.path, query)
+        # Captured before computing so a write committed meanwhile leaves the
+        # new entry already stale rather than cached under the newer version
+        version = self.version.current
+
+        entry = self.cache.get(key, version)
+        if entry is not None:
+            return self._respond(request, entry, "HIT")
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b""
+        async for chunk in response.body_iterator:
+            body += chunk
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name in _REPLAYED_HEADERS
+        }
+        entry = self.cache.put(key, version, ttl, response.status_code, headers, body)
+
+        cached = self._respond(request, entry, "MISS")
+        # Keep any other headers set further down the stack
+        for name, value in response.headers.items():
+            if name not in ("content-length", *_REPLAYED_HEADERS) and (
+                name not in cached.headers
+            ):
+                cached.headers[name] = value
+        return cached
@@ -8,15 +8,18 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.response_formatter import with_formatted_response
+from src.common.cashflow_types import TimeResolution
 from src.database.database import get_db
 from src.models.accounts import Account
 from src.schemas.account_types import AccountCreateUnion, AccountResponseUnion
 from src.schemas.accounts import (
     AccountResponse,
     AccountStatementHistoryResponse,
+    AccountSummary,
     AccountUpdate,
     AvailableCreditResponse,
 )
+from src.schemas.balance_history import BalanceHistoryBucket, BalanceHistorySeries
 from src.schemas.balance_reconciliation import (
     BalanceReconciliation,
     BalanceReconciliationCreate,
@@ -27,30 +30,21 @@ from src.schemas.credit_limit_history import (
     CreditLimitHistoryUpdate,
 )
 from src.services.accounts import AccountService
+from src.services.balance_history import BalanceHistoryService
 from src.services.balance_reconciliation import BalanceReconciliationService
+from src.utils.decimal_precision import DecimalPrecision
 
 router = APIRouter(tags=["accounts"])
 
 
 def get_account_service(db: AsyncSession = Depends(get_db)) -> AccountService:
-    from src.repositories.accounts import AccountRepository
-    from src.repositories.credit_limit_history import CreditLimitHistoryRepository
-    from src.repositories.statement_history import StatementHistoryRepository
-    from src.repositories.transaction_history import TransactionHistoryRepository
-
-    # Initialize all required repositories
-    account_repo = AccountRepository(db)
-    statement_repo = StatementHistoryRepository(db)
-    credit_limit_repo = CreditLimitHistoryRepository(db)
-    transaction_repo = TransactionHistoryRepository(db)
-
-    # Return properly initialized service
-    return AccountService(
-        account_repo=account_repo,
-        statement_repo=statement_repo,
-        credit_limit_repo=credit_limit_repo,
-        transaction_repo=transaction_repo,
-    )
+    return AccountService(db)
+
+
+def get_balance_history_service(
+    db: AsyncSession = Depends(get_db),
+) -> BalanceHistoryService:
+    return BalanceHistoryService(db)
 
 
 def get_reconciliation_service(
@@ -62,9 +56,19 @@ def get_reconciliation_service(
 @router.get("/", response_model=List[AccountResponse])
 async def get_accounts(db: AsyncSession = Depends(get_db)):
     """Get all accounts"""
+    # AccountResponse only reads base columns, so no subtype table is joined
     result = await db.execute(select(Account))
     accounts = result.scalars().all()
-    return accounts
+    return AccountResponse.model_validate_list(accounts)
+
+
+@router.get("/summary", response_model=List[AccountSummary])
+async def get_account_summaries(
+    include_closed: bool = True,
+    account_service: AccountService = Depends(get_account_service),
+):
+    """Get a lightweight summary of all accounts for list views"""
+    return await account_service.list_account_summaries(include_closed=include_closed)
 
 
 @router.get("/{account_id}", response_model=AccountResponseUnion)
@@ -325,3 +329,41 @@ async def get_statement_history(
     if not result:
         raise HTTPException(status_code=404, detail="Account not found")
     return result
+
+
+@router.get("/{account_id}/balance-history", response_model=BalanceHistorySeries)
+async def get_balance_history_series(
+    account_id: int,
+    start_date: date,
+    end_date: date,
+    resolution: TimeResolution = TimeResolution.DAILY,
+    balance_history_service: BalanceHistoryService = Depends(
+        get_balance_history_service
+    ),
+):
+    """Get a downsampled balance history series for charting"""
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+
+    buckets = await balance_history_service.get_balance_series(
+        account_id, start_date, end_date, resolution
+    )
+    return BalanceHistorySeries(
+        account_id=account_id,
+        resolution=resolution,
+        buckets=[
+            BalanceHistoryBucket(
+                **{
+                    key: (
+                        DecimalPrecision.round_for_display(value)
+                        if isinstance(value, Decimal)
+                        else value
+                    )
+                    for key, value in bucket.items()
+                }
+            )
+            for bucket in buckets
+        ],
+    )
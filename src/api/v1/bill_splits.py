@@ -1,6 +1,6 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Path
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,8 +14,11 @@ from src.schemas.bill_splits import (
     BulkOperationResult,
     BulkSplitOperation,
     HistoricalAnalysis,
+    SplitCandidateEvaluationRequest,
+    SplitCandidateEvaluationResponse,
+    SplitOptimizationResult,
 )
-from src.services.bill_splits import BillSplitService
+from src.services.bill_splits import BillSplitService, BillSplitValidationError
 
 router = APIRouter(tags=["bill-splits"])
 
@@ -59,6 +62,53 @@ async def validate_bulk_operation(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    "/evaluate",
+    response_model=SplitCandidateEvaluationResponse,
+    description="Score candidate split allocations and return the best ones",
+)
+async def evaluate_split_candidates(
+    request: SplitCandidateEvaluationRequest, db: AsyncSession = Depends(get_db)
+):
+    """Evaluate candidate split allocations for a liability without saving them"""
+    service = BillSplitService(db)
+    try:
+        return await service.evaluate_split_candidates(
+            request.liability_id, request.candidates, request.top_k
+        )
+    except BillSplitValidationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get(
+    "/optimize/monthly/{year}/{month}",
+    response_model=SplitOptimizationResult,
+    description="Jointly compute optimal splits for all unpaid bills in a month",
+)
+async def optimize_monthly_splits(
+    year: int = Path(..., ge=2000, le=9999),
+    month: int = Path(..., ge=1, le=12),
+    db: AsyncSession = Depends(get_db),
+):
+    """Compute cost-minimizing splits for every unpaid bill due in a month"""
+    service = BillSplitService(db)
+    return await service.optimize_monthly_splits(year, month)
+
+
+@router.get(
+    "/optimize/{bill_id}",
+    response_model=SplitOptimizationResult,
+    description="Compute the cost-minimizing split for a bill",
+)
+async def optimize_splits(bill_id: int, db: AsyncSession = Depends(get_db)):
+    """Compute the cost-minimizing split for a bill without saving it"""
+    service = BillSplitService(db)
+    try:
+        return await service.optimize_splits(bill_id)
+    except BillSplitValidationError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.get(
     "/analysis/{bill_id}",
     response_model=HistoricalAnalysis,
@@ -14,8 +14,12 @@ from src.schemas.cashflow import (
     DeficitCalculation,
     HourlyRates,
     MinimumRequired,
+    ProbabilisticForecastParameters,
+    ProbabilisticForecastResponse,
 )
 from src.services.cashflow.cashflow_base import CashflowBaseService
+from src.services.cashflow.cashflow_forecast_service import ForecastService
+from src.services.cashflow.cashflow_metrics_service import MetricsService
 
 router = APIRouter(prefix="/cashflow", tags=["cashflow"])
 
@@ -89,9 +93,21 @@ async def calculate_90_day_forecast(
     db: AsyncSession = Depends(get_db),
 ):
     """Calculate 90-day rolling forecast"""
-    service = CashflowBaseService(db)
+    service = MetricsService(db)
     forecasts = await service.calculate_90_day_forecast(start_date)
-    return forecasts
+    return CashflowResponse.model_validate_list(forecasts)
+
+
+@router.post("/forecast/probabilistic", response_model=ProbabilisticForecastResponse)
+async def calculate_probabilistic_forecast(
+    params: ProbabilisticForecastParameters, db: AsyncSession = Depends(get_db)
+):
+    """Calculate Monte Carlo balance bands and overdraft probabilities"""
+    service = ForecastService(db)
+    try:
+        return await service.get_probabilistic_forecast(params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/{forecast_id}/minimum-required", response_model=MinimumRequired)
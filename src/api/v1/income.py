@@ -75,7 +75,7 @@ async def list_income(
     )
     service = IncomeService(db)
     items, total = await service.list(filters, skip, limit)
-    return items
+    return IncomeResponse.model_validate_list(items)
 
 
 @router.get("/undeposited", response_model=list[IncomeResponse])
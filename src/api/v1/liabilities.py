@@ -108,7 +108,8 @@ async def list_unpaid_liabilities(db: AsyncSession = Depends(get_db)):
     List all unpaid liabilities.
     """
     liability_service = LiabilityService(db)
-    return await liability_service.get_unpaid_liabilities()
+    liabilities = await liability_service.get_unpaid_liabilities()
+    return LiabilityResponse.model_validate_list(liabilities)
 
 
 @router.get("/by-date-range/", response_model=List[LiabilityResponse])
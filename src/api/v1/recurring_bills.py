@@ -87,7 +87,9 @@ async def generate_bills(
 ):
     """Generate liabilities for a recurring bill pattern"""
     service = RecurringBillService(db)
-    bills = await service.generate_bills(recurring_bill_id, request.month, request.year)
+    bills = await service.generate_bills(
+        recurring_bill_id, request.month, request.year, months=request.months
+    )
     if not bills:
         raise HTTPException(
             status_code=400,
@@ -102,8 +104,8 @@ async def generate_bills_for_month(
     active_only: bool = True,
     db: AsyncSession = Depends(get_db),
 ):
-    """Generate liabilities for all recurring bills for a specific month"""
+    """Generate liabilities for all recurring bills for a month or run of months"""
     service = RecurringBillService(db)
     return await service.generate_bills_for_month(
-        request.month, request.year, active_only=active_only
+        request.month, request.year, active_only=active_only, months=request.months
     )
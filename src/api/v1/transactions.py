@@ -53,7 +53,9 @@ async def list_transactions(
     transactions, total = await service.get_account_transactions(
         account_id, skip=skip, limit=limit, start_date=start_date, end_date=end_date
     )
-    return TransactionList(items=transactions, total=total)
+    return TransactionList(
+        items=Transaction.model_validate_list(transactions), total=total
+    )
 
 
 @router.get("/{transaction_id}", response_model=Transaction)
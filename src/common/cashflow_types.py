@@ -7,12 +7,24 @@ This module contains shared domain types used across different application layer
 
 from datetime import date, datetime
 from decimal import Decimal
+from enum import Enum
 from typing import Dict, Union
 
 # Type definition for date/datetime parameters
 DateType = Union[date, datetime]
 
 
+class TimeResolution(str, Enum):
+    """Bucket sizes for downsampled time series such as balance history.
+
+    Weekly buckets start on Monday, matching PostgreSQL's date_trunc('week').
+    """
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
 class CashflowWarningThresholds:
     """Standard warning thresholds for cashflow analysis.
 
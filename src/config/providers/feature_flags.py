@@ -249,7 +249,7 @@ class DatabaseConfigProvider(ConfigProvider):
 
         except Exception as e:
             # Log error and fall back to defaults
-            logger.error(f"Error loading feature requirements from database: {e}")
+            logger.error("Error loading feature requirements from database: %s", e)
             return get_default_requirements()
 
     async def invalidate_cache(self, feature_name: Optional[str] = None) -> None:
@@ -311,7 +311,7 @@ class DatabaseConfigProvider(ConfigProvider):
             raise
         except Exception as e:
             # Log other errors and fall back to defaults
-            logger.error(f"Error loading feature {feature_name} requirements: {e}")
+            logger.error("Error loading feature %s requirements: %s", feature_name, e)
 
             # Try defaults
             defaults = get_default_requirements()
@@ -0,0 +1,113 @@
+"""
+Dialect-aware SQL expression helpers.
+
+Repositories occasionally need date arithmetic that differs between the
+database engines Debtonator supports (SQLite for development and tests,
+PostgreSQL for production). This module centralizes those expressions so
+repositories can push calculations into the database without scattering
+dialect checks throughout the query code.
+
+All datetime columns are stored as naive UTC per ADR-011, so the helpers
+here never need to account for time zone conversion.
+"""
+
+from typing import Any
+
+from sqlalchemy import Float, cast, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.common.cashflow_types import TimeResolution
+
+SECONDS_PER_DAY = 86400
+
+
+def get_dialect_name(session: AsyncSession) -> str:
+    """
+    Get the name of the SQL dialect the session is bound to.
+
+    Args:
+        session (AsyncSession): Session to inspect
+
+    Returns:
+        str: Dialect name such as "sqlite" or "postgresql"
+    """
+    return session.get_bind().dialect.name
+
+
+def insert_ignoring_conflicts(model: Any, dialect_name: str) -> Any:
+    """
+    Build an INSERT that skips rows violating a unique constraint.
+
+    Used for idempotent set-based inserts: rows that already exist are left
+    untouched and are not part of any RETURNING result.
+
+    Args:
+        model (Any): Mapped class or table to insert into
+        dialect_name (str): Name of the active SQL dialect
+
+    Returns:
+        Any: Insert statement with ON CONFLICT DO NOTHING
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing()
+    return sqlite.insert(model).on_conflict_do_nothing()
+
+
+def days_between(
+    later: ColumnElement, earlier: ColumnElement, dialect_name: str
+) -> ColumnElement:
+    """
+    Build an expression for the fractional number of days between two datetimes.
+
+    Returns NULL when either operand is NULL, which makes the expression safe
+    to use with window functions such as LAG where the first row has no
+    predecessor.
+
+    Args:
+        later (ColumnElement): The later datetime expression
+        earlier (ColumnElement): The earlier datetime expression
+        dialect_name (str): Name of the active SQL dialect
+
+    Returns:
+        ColumnElement: Float expression of days between the two datetimes
+    """
+    if dialect_name == "postgresql":
+        return cast(func.extract("epoch", later - earlier), Float) / SECONDS_PER_DAY
+    return cast(func.julianday(later) - func.julianday(earlier), Float)
+
+
+def date_bucket(
+    column: ColumnElement, resolution: TimeResolution, dialect_name: str
+) -> ColumnElement:
+    """
+    Build an expression truncating a datetime to the start of its time bucket.
+
+    SQLite returns the bucket as an ISO date string while PostgreSQL returns a
+    timestamp; callers should pass results through normalize_db_date to get a
+    Python date either way.
+
+    Args:
+        column (ColumnElement): Datetime expression to truncate
+        resolution (TimeResolution): Bucket size
+        dialect_name (str): Name of the active SQL dialect
+
+    Returns:
+        ColumnElement: Expression identifying the bucket start date
+    """
+    if dialect_name == "postgresql":
+        field = {
+            TimeResolution.DAILY: "day",
+            TimeResolution.WEEKLY: "week",
+            TimeResolution.MONTHLY: "month",
+        }[resolution]
+        return func.date_trunc(field, column)
+
+    if resolution == TimeResolution.WEEKLY:
+        # 'weekday 0' advances to the next Sunday (or stays on Sunday), so
+        # stepping back six days lands on the Monday starting that week
+        return func.date(column, "weekday 0", "-6 days")
+    if resolution == TimeResolution.MONTHLY:
+        return func.date(column, "start of month")
+    return func.date(column)
@@ -7,6 +7,7 @@ at the package level for backward compatibility.
 
 # Dynamic import for account types
 import importlib
+import logging
 import os
 import pkgutil
 from pathlib import Path
@@ -96,7 +97,7 @@ def _import_submodules(package_name):
                         if isinstance(obj, type) and issubclass(obj, Exception):
                             globals()[obj_name] = obj
             except ImportError as e:
-                print(f"Error importing {name}: {e}")
+                logging.getLogger(__name__).warning("Error importing %s: %s", name, e)
 
 
 # Import any additional account type errors that might be added in the future
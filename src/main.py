@@ -6,27 +6,46 @@ from decimal import Decimal
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import ValidationError
 
 # Import all models to ensure they are registered
 from .api.base import api_router
 from .api.handlers.feature_flags import feature_flag_exception_handler
 from .api.middleware.feature_flags import FeatureFlagMiddleware
+from .api.middleware.instrumentation import RequestInstrumentationMiddleware
+from .api.middleware.request_id import RequestIdMiddleware
+from .api.middleware.response_cache import ResponseCacheMiddleware
 from .api.response_formatter import format_response
 from .config.providers.feature_flags import DatabaseConfigProvider
 from .database.base import Base
-from .database.database import engine, get_db
+from .database.database import async_session, engine, get_db
 from .errors.feature_flags import FeatureFlagError
 from .registry.account_registry_init import register_account_types
 from .registry.account_types import (
     RegistryNotInitializedException,
     account_type_registry,
 )
+from .repositories.factory import RepositoryFactory
 from .repositories.feature_flags import FeatureFlagRepository
+from .services.event_subscribers import register_event_subscribers
+from .services.factory import ServiceFactory
 from .services.feature_flags import FeatureFlagService
+from .utils.compute_executor import compute_executor
 from .utils.config import settings
+from .utils.domain_events import domain_events
 from .utils.feature_flags.feature_flags import get_registry
+from .utils.instrumentation import instrument_engine, metrics_registry
+from .utils.response_cache import track_data_version
+from .utils.startup_profile import StartupProfile
+from .utils.structured_logging import configure_logging
+
+# Structured root handler; see src/utils/structured_logging.py
+configure_logging(
+    level=settings.LOG_LEVEL,
+    json_format=settings.LOG_FORMAT.lower() == "json",
+    sample_rates=settings.log_sample_rates,
+)
 
 
 # Create tables
@@ -35,26 +54,9 @@ async def create_tables():
         await conn.run_sync(Base.metadata.create_all)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Startup: Initialize registries and database
-
-    # Initialize account type registry first (no async dependencies)
-    register_account_types()
-
-    # Verify account type registry was properly initialized
-    try:
-        types = account_type_registry.get_all_types()
-        logger.info(f"Account type registry initialized with {len(types)} types")
-    except RegistryNotInitializedException as e:
-        logger.error(f"Account type registry initialization failed: {str(e)}")
-        raise RuntimeError("Failed to initialize account type registry") from e
-
-    # Create database tables
-    await create_tables()
-
-    # Initialize feature flag registry from database
-    async for db_session in get_db:
+async def initialize_feature_flags(app: FastAPI):
+    """Load feature flags from the database and add the feature flag middleware."""
+    async for db_session in get_db():
         try:
             # Create repository and service
             repository = FeatureFlagRepository(db_session)
@@ -78,17 +80,58 @@ async def lifespan(app: FastAPI):
                 )
                 logger.info("Feature flag middleware initialized")
             except Exception as e:
-                logger.error(f"Failed to initialize feature flag middleware: {e}")
+                logger.error("Failed to initialize feature flag middleware: %s", e)
 
             break  # Successfully initialized, exit the loop
         except Exception as e:
-            logger.error(f"Failed to initialize feature flags: {e}")
+            logger.error("Failed to initialize feature flags: %s", e)
             # Session will be automatically closed when the loop exits
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Startup: Initialize registries and database
+    profile = StartupProfile()
+
+    # Initialize account type registry first (no async dependencies)
+    with profile.phase("account_types"):
+        register_account_types()
+
+        # Verify account type registry was properly initialized
+        try:
+            types = account_type_registry.get_all_types()
+            logger.info("Account type registry initialized with %d types", len(types))
+        except RegistryNotInitializedException as e:
+            logger.error("Account type registry initialization failed: %s", e)
+            raise RuntimeError("Failed to initialize account type registry") from e
+
+    # Resolve type-specific repository and service functions once per process
+    with profile.phase("dispatch_tables"):
+        RepositoryFactory.get_dispatch_table()
+        ServiceFactory.get_dispatch_table()
+
+    # Create database tables, unless migrations manage the schema
+    if settings.DATABASE_CREATE_TABLES:
+        with profile.phase("create_tables"):
+            await create_tables()
+
+    # Initialize feature flag registry from database
+    with profile.phase("feature_flags"):
+        await initialize_feature_flags(app)
+
+    # Keep derived data current from committed domain events
+    with profile.phase("event_subscribers"):
+        event_handlers = register_event_subscribers(domain_events, async_session)
+
+    logger.info("Startup completed in %.1f ms (%s)", profile.total_ms, profile.report())
+
     yield  # App runs here
 
-    # Shutdown logic could go here if needed
     logger.info("Application shutting down")
+    await domain_events.drain()
+    for handler in event_handlers:
+        domain_events.unsubscribe(handler)
+    compute_executor.shutdown()
 
 
 app = FastAPI(
@@ -118,9 +161,12 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     except Exception as e:
         body_str = f"Error reading body: {str(e)}"
 
-    logger.error(f"Request validation error: {exc.errors()}")
-    logger.error(f"Request path: {request.url.path}")
-    logger.error(f"Request body: {body_str}")
+    logger.error(
+        "Request validation error on %s: %s; body: %s",
+        request.url.path,
+        exc.errors(),
+        body_str,
+    )
 
     return JSONResponse(
         status_code=422,
@@ -133,8 +179,7 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
     """
     Handle Pydantic validation errors with detailed logging for debugging.
     """
-    logger.error(f"Pydantic validation error: {exc}")
-    logger.error(f"Request path: {request.url.path}")
+    logger.error("Pydantic validation error on %s: %s", request.url.path, exc)
 
     return JSONResponse(
         status_code=422,
@@ -149,16 +194,6 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
 app.add_exception_handler(FeatureFlagError, feature_flag_exception_handler)
 
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
 # Custom decimal encoder for JSON serialization
 class DecimalEncoder(json.JSONEncoder):
     def default(self, o):
@@ -197,6 +232,50 @@ async def decimal_precision_middleware(request: Request, call_next):
     return response
 
 
+# Serve read-heavy endpoints from the response cache until a committed write
+# bumps the data version; added after the decimal middleware so the formatted
+# body is cached. TTLs bound content that also depends on the clock.
+if settings.RESPONSE_CACHE_ENABLED:
+    track_data_version()
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        routes={
+            f"{settings.API_V1_PREFIX}/banking/overview": 30,
+            f"{settings.API_V1_PREFIX}/banking/accounts/types": 300,
+            f"{settings.API_V1_PREFIX}/realtime-cashflow/": 5,
+            f"{settings.API_V1_PREFIX}/realtime-cashflow/cross-account-analysis": 30,
+            f"{settings.API_V1_PREFIX}/categories/": 300,
+            f"{settings.API_V1_PREFIX}/cashflow/cashflow/": 300,
+        },
+    )
+
+
+# Configure CORS; added after the response cache so cache hits and 304
+# responses get CORS headers too
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+
+# Record statement counts and latency per request; added last so it wraps
+# every other middleware
+if settings.METRICS_ENABLED:
+    instrument_engine(engine)
+    app.add_middleware(
+        RequestInstrumentationMiddleware,
+        server_timing=settings.SERVER_TIMING_ENABLED,
+        query_budget=settings.REQUEST_QUERY_BUDGET,
+    )
+
+# Correlate log records per request; added after instrumentation so the id is
+# already set while every other middleware runs
+app.add_middleware(RequestIdMiddleware)
+
+
 # Include API router
 app.include_router(api_router)
 
@@ -210,3 +289,11 @@ async def root():
         "description": settings.DESCRIPTION,
         "docs": f"{settings.API_V1_PREFIX}/docs",
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Request, SQL statement and method metrics in Prometheus text format"""
+    return PlainTextResponse(
+        metrics_registry.render(), media_type="text/plain; version=0.0.4"
+    )
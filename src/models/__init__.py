@@ -32,6 +32,7 @@ from src.models.balance_reconciliation import BalanceReconciliation
 from src.models.payment_schedules import PaymentSchedule
 from src.models.deposit_schedules import DepositSchedule
 from src.models.balance_history import BalanceHistory
+from src.models.balance_history_rollups import BalanceHistoryRollup
 from src.models.cashflow import CashflowForecast
 
 # Ensure all models are accessible from models package
@@ -55,6 +56,7 @@ __all__ = [
     "PaymentSchedule",
     "DepositSchedule",
     "BalanceHistory",
+    "BalanceHistoryRollup",
     "CashflowForecast",
     "FeatureFlag",
 ]
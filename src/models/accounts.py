@@ -49,6 +49,23 @@ class Account(BaseDBModel):
         Numeric(12, 4), nullable=False, default=0, comment="Available balance"
     )
 
+    # Running transaction totals, kept in step with transaction_history by the
+    # TransactionService so available credit needs no aggregate per read
+    pending_debit_total: Mapped[Decimal] = mapped_column(
+        Numeric(12, 4),
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Sum of debit transactions",
+    )
+    pending_credit_total: Mapped[Decimal] = mapped_column(
+        Numeric(12, 4),
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Sum of credit transactions",
+    )
+
     # New fields for ADR-016
     institution: Mapped[Optional[str]] = mapped_column(
         String(100), nullable=True, comment="Financial institution for the account"
@@ -122,6 +139,9 @@ class Account(BaseDBModel):
     balance_history: Mapped[List["BalanceHistory"]] = relationship(
         "BalanceHistory", back_populates="account", cascade="all, delete-orphan"
     )
+    balance_history_rollups: Mapped[List["BalanceHistoryRollup"]] = relationship(
+        "BalanceHistoryRollup", back_populates="account", cascade="all, delete-orphan"
+    )
 
     # SQLAlchemy polymorphic mapping
     __mapper_args__ = {
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base_model import BaseDBModel
@@ -33,3 +33,7 @@ class BalanceHistory(BaseDBModel):
     account: Mapped["Account"] = relationship(
         "Account", back_populates="balance_history"
     )
+
+    __table_args__ = (
+        Index("idx_balance_history_account_timestamp", "account_id", "timestamp"),
+    )
@@ -0,0 +1,74 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import ForeignKey, Integer, Numeric, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.common.cashflow_types import TimeResolution
+from src.models.base_model import BaseDBModel
+
+
+class BalanceHistoryRollup(BaseDBModel):
+    """
+    Model for downsampled balance history aggregates.
+
+    Each row summarizes every raw BalanceHistory record of one account within
+    one daily or monthly period. Rollups let long-range balance charts read a
+    few hundred rows instead of every balance change, and survive compaction
+    of old raw records.
+
+    This is a pure data structure model per ADR-012; rollups are built and
+    maintained by the BalanceHistoryService.
+    """
+
+    __tablename__ = "balance_history_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "account_id",
+            "resolution",
+            "period_start",
+            name="uq_balance_history_rollups_account_period",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    account_id: Mapped[int] = mapped_column(
+        ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False
+    )
+    resolution: Mapped[TimeResolution] = mapped_column(
+        SQLEnum(TimeResolution), nullable=False, comment="Rollup tier"
+    )
+    period_start: Mapped[datetime] = mapped_column(
+        DateTime(),
+        nullable=False,
+        comment="Start of the summarized period (naive UTC midnight)",
+    )
+
+    open_balance: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    close_balance: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    high_balance: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    low_balance: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    average_balance: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+
+    open_available_credit: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4))
+    close_available_credit: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4))
+    min_available_credit: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4))
+    max_available_credit: Mapped[Optional[Decimal]] = mapped_column(Numeric(12, 4))
+
+    record_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, comment="Number of raw records summarized"
+    )
+
+    # Relationships
+    account: Mapped["Account"] = relationship(
+        "Account", back_populates="balance_history_rollups"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BalanceHistoryRollup(account_id={self.account_id}, "
+            f"resolution={self.resolution}, period_start={self.period_start})>"
+        )
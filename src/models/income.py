@@ -116,6 +116,14 @@ class Income(BaseDBModel):
     __table_args__ = (
         Index("idx_income_date", "date"),
         Index("idx_income_deposited", "deposited"),
+        # One generated entry per recurring template and date; makes generation
+        # idempotent (NULLs never conflict, so one-off income is unaffected)
+        Index(
+            "uq_income_recurring_income_date",
+            "recurring_income_id",
+            "date",
+            unique=True,
+        ),
         CheckConstraint("amount >= 0", name="ck_income_positive_amount"),
     )
 
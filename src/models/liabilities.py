@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from sqlalchemy import JSON, Boolean, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Numeric, String, Text
+from sqlalchemy import ForeignKey, Index, Numeric, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base_model import BaseDBModel
@@ -113,5 +113,25 @@ class Liability(BaseDBModel):
         "PaymentSchedule", back_populates="liability", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index("idx_liabilities_due_date", "due_date"),
+        Index("idx_liabilities_primary_account_due", "primary_account_id", "due_date"),
+        # Partial index for the unpaid bill queries (upcoming, overdue)
+        Index(
+            "idx_liabilities_unpaid_due_date",
+            "due_date",
+            sqlite_where=text("paid = 0 AND active = 1"),
+            postgresql_where=text("paid = false AND active = true"),
+        ),
+        # One generated liability per recurring bill and due date; makes
+        # generation idempotent (NULLs never conflict, so one-off bills are free)
+        Index(
+            "uq_liabilities_recurring_bill_due",
+            "recurring_bill_id",
+            "due_date",
+            unique=True,
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Liability {self.name} due {self.due_date}>"
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base_model import BaseDBModel
@@ -41,6 +41,8 @@ class Payment(BaseDBModel):
         "PaymentSource", back_populates="payment", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (Index("idx_payments_payment_date", "payment_date"),)
+
     def __repr__(self) -> str:
         return f"<Payment {self.amount} on {self.payment_date}>"
 
@@ -60,5 +62,10 @@ class PaymentSource(BaseDBModel):
     payment = relationship("Payment", back_populates="sources")
     account = relationship("Account", back_populates="payment_sources")
 
+    __table_args__ = (
+        Index("idx_payment_sources_payment_id", "payment_id"),
+        Index("idx_payment_sources_account_id", "account_id"),
+    )
+
     def __repr__(self) -> str:
         return f"<PaymentSource {self.amount} from account {self.account_id}>"
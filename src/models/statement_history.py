@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Numeric
+from sqlalchemy import DateTime, ForeignKey, Index, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base_model import BaseDBModel
@@ -47,5 +47,9 @@ class StatementHistory(BaseDBModel):
         "Account", back_populates="statement_history"
     )
 
+    __table_args__ = (
+        Index("idx_statement_history_account_date", "account_id", "statement_date"),
+    )
+
     def __repr__(self) -> str:
         return f"<StatementHistory {self.account_id} - {self.statement_date}>"
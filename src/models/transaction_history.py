@@ -4,7 +4,7 @@ from enum import Enum
 
 from sqlalchemy import DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base_model import BaseDBModel
@@ -49,6 +49,10 @@ class TransactionHistory(BaseDBModel):
     # Relationship
     account: Mapped["Account"] = relationship("Account", back_populates="transactions")
 
+    __table_args__ = (
+        Index("idx_transaction_history_account_date", "account_id", "transaction_date"),
+    )
+
     def __repr__(self):
         return (
             f"<TransactionHistory(id={self.id}, "
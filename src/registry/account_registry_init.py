@@ -3,28 +3,14 @@ Account type registry initialization.
 
 This module handles the registration of all account types with the AccountTypeRegistry.
 It is called during application startup to ensure all account types are available
-for use throughout the application.
+for use throughout the application. Model and schema classes are registered by
+import path and imported the first time they are looked up, so registering the
+types does not import every account type's schema module.
 
 Implemented as part of ADR-016 Account Type Expansion.
 """
 
-from src.models.account_types.banking import (
-    BNPLAccount,
-    CheckingAccount,
-    CreditAccount,
-    EWAAccount,
-    PaymentAppAccount,
-    SavingsAccount,
-)
 from src.registry.account_types import account_type_registry
-from src.schemas.account_types.banking import (
-    BNPLAccountCreate,
-    CheckingAccountCreate,
-    CreditAccountCreate,
-    EWAAccountCreate,
-    PaymentAppAccountCreate,
-    SavingsAccountCreate,
-)
 
 
 def register_account_types() -> None:
@@ -37,8 +23,8 @@ def register_account_types() -> None:
     # Banking Account Types
     account_type_registry.register(
         account_type_id="checking",
-        model_class=CheckingAccount,
-        schema_class=CheckingAccountCreate,
+        model_class="src.models.account_types.banking.checking:CheckingAccount",
+        schema_class="src.schemas.account_types.banking.checking:CheckingAccountCreate",
         name="Checking Account",
         description="Standard transaction account for day-to-day banking",
         category="Banking",
@@ -49,8 +35,8 @@ def register_account_types() -> None:
 
     account_type_registry.register(
         account_type_id="savings",
-        model_class=SavingsAccount,
-        schema_class=SavingsAccountCreate,
+        model_class="src.models.account_types.banking.savings:SavingsAccount",
+        schema_class="src.schemas.account_types.banking.savings:SavingsAccountCreate",
         name="Savings Account",
         description="Interest-bearing account for saving money",
         category="Banking",
@@ -61,8 +47,8 @@ def register_account_types() -> None:
 
     account_type_registry.register(
         account_type_id="credit",
-        model_class=CreditAccount,
-        schema_class=CreditAccountCreate,
+        model_class="src.models.account_types.banking.credit:CreditAccount",
+        schema_class="src.schemas.account_types.banking.credit:CreditAccountCreate",
         name="Credit Card",
         description="Revolving credit account with a credit limit",
         category="Banking",
@@ -73,8 +59,8 @@ def register_account_types() -> None:
 
     account_type_registry.register(
         account_type_id="payment_app",
-        model_class=PaymentAppAccount,
-        schema_class=PaymentAppAccountCreate,
+        model_class="src.models.account_types.banking.payment_app:PaymentAppAccount",
+        schema_class="src.schemas.account_types.banking.payment_app:PaymentAppAccountCreate",
         name="Payment App",
         description="Digital wallet like PayPal, Venmo, or Cash App",
         category="Banking",
@@ -85,8 +71,8 @@ def register_account_types() -> None:
 
     account_type_registry.register(
         account_type_id="bnpl",
-        model_class=BNPLAccount,
-        schema_class=BNPLAccountCreate,
+        model_class="src.models.account_types.banking.bnpl:BNPLAccount",
+        schema_class="src.schemas.account_types.banking.bnpl:BNPLAccountCreate",
         name="Buy Now, Pay Later",
         description="Short-term installment plan for purchases",
         category="Banking",
@@ -97,8 +83,8 @@ def register_account_types() -> None:
 
     account_type_registry.register(
         account_type_id="ewa",
-        model_class=EWAAccount,
-        schema_class=EWAAccountCreate,
+        model_class="src.models.account_types.banking.ewa:EWAAccount",
+        schema_class="src.schemas.account_types.banking.ewa:EWAAccountCreate",
         name="Earned Wage Access",
         description="Early access to earned wages before payday",
         category="Banking",
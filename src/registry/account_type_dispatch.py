@@ -0,0 +1,148 @@
+"""
+Account type dispatch tables.
+
+Type-specific repository and service behavior lives in plain modules of async
+functions (for example src.services.account_types.banking.checking), each
+taking a session as its first argument. Resolving those functions involves
+importing the module and reflecting over its members, which is too costly to
+repeat inside request loops.
+
+An AccountTypeDispatchTable resolves every module once and exposes an
+immutable account_type -> function_name -> function mapping that the
+ServiceFactory and RepositoryFactory share for the lifetime of the process.
+
+Implemented as part of ADR-016 Account Type Expansion.
+"""
+
+import importlib
+import inspect
+import logging
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+from src.registry.account_types import (
+    RegistryNotInitializedException,
+    account_type_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def known_account_types(defaults: Iterable[str] = ()) -> List[str]:
+    """
+    List account types to resolve: registered types plus factory defaults.
+
+    Args:
+        defaults: Account types a factory has default module paths for
+
+    Returns:
+        List[str]: Account type identifiers, registered types first
+    """
+    try:
+        registered = [info["id"] for info in account_type_registry.get_all_types()]
+    except RegistryNotInitializedException:
+        registered = []
+    return list(dict.fromkeys([*registered, *defaults]))
+
+
+class AccountTypeDispatchTable:
+    """
+    Immutable mapping from account type to its type-specific functions.
+
+    Only public coroutine functions are collected. Functions are stored
+    unbound; callers pass the session as the first argument.
+    """
+
+    def __init__(self, functions: Mapping[str, Mapping[str, Callable]]):
+        """
+        Initialize the table from resolved functions.
+
+        Args:
+            functions: Functions keyed by account type, then function name
+        """
+        self._functions: Mapping[str, Mapping[str, Callable]] = MappingProxyType(
+            {
+                account_type: MappingProxyType(dict(type_functions))
+                for account_type, type_functions in functions.items()
+            }
+        )
+
+    @classmethod
+    def from_modules(
+        cls, module_paths: Mapping[str, Optional[str]]
+    ) -> "AccountTypeDispatchTable":
+        """
+        Build a table by importing one module per account type.
+
+        Modules that cannot be imported are logged and leave their account
+        type without functions, matching the factories' previous behavior of
+        falling back to base functionality.
+
+        Args:
+            module_paths: Module path keyed by account type
+
+        Returns:
+            AccountTypeDispatchTable: The resolved table
+        """
+        modules: Dict[str, Optional[object]] = {}
+        functions: Dict[str, Dict[str, Callable]] = {}
+
+        for account_type, module_path in module_paths.items():
+            if not module_path:
+                continue
+
+            if module_path not in modules:
+                try:
+                    modules[module_path] = importlib.import_module(module_path)
+                except ImportError as e:
+                    logger.debug(
+                        "No type-specific module %s for %s: %s",
+                        module_path,
+                        account_type,
+                        e,
+                    )
+                    modules[module_path] = None
+
+            module = modules[module_path]
+            if module is None:
+                continue
+
+            functions[account_type] = {
+                name: func
+                for name, func in inspect.getmembers(
+                    module, inspect.iscoroutinefunction
+                )
+                if not name.startswith("_")
+            }
+
+        return cls(functions)
+
+    @property
+    def account_types(self) -> frozenset:
+        """Account types that have at least one resolved module."""
+        return frozenset(self._functions)
+
+    def functions(self, account_type: str) -> Mapping[str, Callable]:
+        """
+        Get every type-specific function for an account type.
+
+        Args:
+            account_type: Account type identifier
+
+        Returns:
+            Mapping[str, Callable]: Read-only function mapping, empty if none
+        """
+        return self._functions.get(account_type, MappingProxyType({}))
+
+    def get(self, account_type: str, function_name: str) -> Optional[Callable]:
+        """
+        Look up a single type-specific function.
+
+        Args:
+            account_type: Account type identifier
+            function_name: Name of the function
+
+        Returns:
+            Optional[Callable]: The unbound function, or None if not defined
+        """
+        return self.functions(account_type).get(function_name)
@@ -8,7 +8,8 @@ This enables dynamic account type management and validation.
 Implements the singleton pattern for global access to registered account types.
 """
 
-from typing import Any, ClassVar, Dict, List, Optional, Type
+import importlib
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union
 
 
 class RegistryNotInitializedException(Exception):
@@ -53,8 +54,8 @@ class AccountTypeRegistry:
     def register(
         self,
         account_type_id: str,
-        model_class: Type,
-        schema_class: Type,
+        model_class: Union[Type, str],
+        schema_class: Union[Type, str],
         name: str,
         description: str,
         category: str,
@@ -67,8 +68,10 @@ class AccountTypeRegistry:
 
         Args:
             account_type_id: The unique identifier for the account type
-            model_class: The SQLAlchemy model class for this account type
-            schema_class: The Pydantic schema class for this account type
+            model_class: The SQLAlchemy model class for this account type, or
+                its "module:Class" import path to import on first use
+            schema_class: The Pydantic schema class for this account type, or
+                its "module:Class" import path to import on first use
             name: The human-readable name of the account type
             description: A description of the account type
             category: The category this account type belongs to (e.g., Banking, Investment)
@@ -97,7 +100,7 @@ class AccountTypeRegistry:
         Returns:
             The SQLAlchemy model class for the account type, or None if not found
         """
-        return self._registry.get(account_type_id, {}).get("model_class")
+        return self._resolve_class(account_type_id, "model_class")
 
     def get_schema_class(self, account_type_id: str) -> Optional[Type]:
         """
@@ -109,7 +112,19 @@ class AccountTypeRegistry:
         Returns:
             The Pydantic schema class for the account type, or None if not found
         """
-        return self._registry.get(account_type_id, {}).get("schema_class")
+        return self._resolve_class(account_type_id, "schema_class")
+
+    def _resolve_class(self, account_type_id: str, key: str) -> Optional[Type]:
+        """Get a registered class, importing it the first time it is requested."""
+        info = self._registry.get(account_type_id)
+        if info is None:
+            return None
+        target = info[key]
+        if isinstance(target, str):
+            module_path, _, class_name = target.partition(":")
+            target = getattr(importlib.import_module(module_path), class_name)
+            info[key] = target
+        return target
 
     def get_all_types(self, feature_flag_service=None) -> List[Dict[str, Any]]:
         """
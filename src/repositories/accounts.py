@@ -10,12 +10,13 @@ Enhanced as part of ADR-016, ADR-019, and ADR-024 implementation.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, TypeVar
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
-from sqlalchemy import or_, select
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, with_polymorphic
 
+from src.models.account_types.banking.credit import CreditAccount
 from src.models.accounts import Account
 from src.registry.account_types import account_type_registry
 from src.repositories.polymorphic_base_repository import PolymorphicBaseRepository
@@ -158,6 +159,9 @@ class AccountRepository(PolymorphicBaseRepository[Account, int]):
         """
         Get all active accounts.
 
+        Loads type-specific fields with one extra query per account type
+        present, so they are available without lazy loading.
+
         Returns:
             List[Account]: List of active accounts (not closed)
         """
@@ -165,6 +169,7 @@ class AccountRepository(PolymorphicBaseRepository[Account, int]):
             select(Account)
             .where(Account.is_closed == False)  # noqa: E712
             .order_by(Account.name)
+            .options(*self._list_load_options())
         )
         return result.scalars().all()
 
@@ -181,8 +186,9 @@ class AccountRepository(PolymorphicBaseRepository[Account, int]):
         Note:
             Feature flag validation is now handled by the FeatureFlagRepositoryProxy layer.
         """
-        # Query for the specific account type
-        query = select(Account).where(Account.account_type == account_type)
+        # Select the registered subtype so only its table is joined
+        model_class = self.registry.get_model_class(account_type) or Account
+        query = select(model_class).where(model_class.account_type == account_type)
         result = await self.session.execute(query)
         return result.scalars().all()
 
@@ -199,13 +205,64 @@ class AccountRepository(PolymorphicBaseRepository[Account, int]):
         Returns:
             Optional[Account]: Account instance with type-specific data or None
         """
-        # Load all polymorphic types - this ensures we get the specific type's data
-        poly_account = with_polymorphic(Account, "*")
+        # get() loads all polymorphic types and reuses session-loaded accounts
+        return await self.get(account_id)
 
-        result = await self.session.execute(
-            select(poly_account).where(poly_account.id == account_id)
+    async def get_accounts_by_ids(self, account_ids: List[int]) -> List[Account]:
+        """
+        Get several accounts by ID in a single query.
+
+        Uses polymorphic loading so type-specific fields (such as credit
+        limits) are available without further queries, and reuses accounts
+        already loaded in the session.
+
+        Args:
+            account_ids (List[int]): Account IDs to load
+
+        Returns:
+            List[Account]: Found accounts (missing IDs are skipped)
+        """
+        return list((await self.get_many(account_ids)).values())
+
+    async def get_account_summaries(
+        self, include_closed: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a lightweight summary of every account for list views and cashflow.
+
+        Only the base account columns are selected, plus the credit limit and
+        available credit from the credit table, so no other subtype table is
+        joined and no ORM objects are built.
+
+        Args:
+            include_closed (bool): Whether to include closed accounts
+
+        Returns:
+            List[Dict[str, Any]]: Account summaries ordered by name, with
+                credit fields set to None for non-credit accounts
+        """
+        credit = CreditAccount.__table__
+        query = (
+            select(
+                Account.id,
+                Account.name,
+                Account.account_type,
+                Account.current_balance,
+                Account.available_balance,
+                Account.currency,
+                Account.is_closed,
+                credit.c.credit_limit,
+                credit.c.available_credit,
+            )
+            .outerjoin(credit, credit.c.id == Account.id)
+            .order_by(Account.name)
         )
-        return result.scalars().first()
+
+        if not include_closed:
+            query = query.where(Account.is_closed == False)  # noqa: E712
+
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings()]
 
     async def update_balance(
         self, account_id: int, amount_change: Decimal
@@ -247,6 +304,75 @@ class AccountRepository(PolymorphicBaseRepository[Account, int]):
         await self.session.refresh(account)
         return account
 
+    async def adjust_pending_totals(
+        self,
+        account_id: int,
+        debit_change: Decimal = Decimal(0),
+        credit_change: Decimal = Decimal(0),
+    ) -> bool:
+        """
+        Add to an account's running debit and credit totals.
+
+        The increment happens in a single UPDATE statement, so concurrent
+        transactions on the same account cannot lose each other's changes.
+
+        Args:
+            account_id (int): Account ID
+            debit_change (Decimal): Amount to add to the debit total
+            credit_change (Decimal): Amount to add to the credit total
+
+        Returns:
+            bool: True if the account exists
+        """
+        result = await self.session.execute(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(
+                pending_debit_total=Account.pending_debit_total + debit_change,
+                pending_credit_total=Account.pending_credit_total + credit_change,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount > 0
+
+    async def get_pending_totals(
+        self, account_ids: Optional[List[int]] = None
+    ) -> Dict[int, Tuple[Decimal, Decimal]]:
+        """
+        Get the stored running transaction totals of accounts.
+
+        Args:
+            account_ids (Optional[List[int]]): Accounts to read (defaults to all)
+
+        Returns:
+            Dict[int, Tuple[Decimal, Decimal]]: Debit and credit totals by account ID
+        """
+        query = select(
+            Account.id, Account.pending_debit_total, Account.pending_credit_total
+        )
+        if account_ids is not None:
+            query = query.where(Account.id.in_(account_ids))
+        result = await self.session.execute(query)
+        return {row[0]: (row[1], row[2]) for row in result.all()}
+
+    async def set_pending_totals(
+        self, account_id: int, debit_total: Decimal, credit_total: Decimal
+    ) -> None:
+        """
+        Overwrite an account's running transaction totals.
+
+        Args:
+            account_id (int): Account ID
+            debit_total (Decimal): Sum of the account's debit transactions
+            credit_total (Decimal): Sum of the account's credit transactions
+        """
+        await self.session.execute(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(pending_debit_total=debit_total, pending_credit_total=credit_total)
+            .execution_options(synchronize_session="fetch")
+        )
+
     async def update_statement_balance(
         self, account_id: int, statement_balance: Decimal, statement_date: datetime
     ) -> Optional[Account]:
@@ -7,15 +7,17 @@ balance history-related queries.
 
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, case, delete, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from src.common.cashflow_types import TimeResolution
+from src.database.sql_functions import date_bucket, get_dialect_name
 from src.models.balance_history import BalanceHistory
 from src.repositories.base_repository import BaseRepository
-from src.utils.datetime_utils import date_in_collection, normalize_db_date, utc_now
+from src.utils.datetime_utils import normalize_db_date, utc_now
 
 
 class BalanceHistoryRepository(BaseRepository[BalanceHistory, int]):
@@ -290,44 +292,199 @@ class BalanceHistoryRepository(BaseRepository[BalanceHistory, int]):
         Returns:
             List[date]: List of dates with no balance records
         """
+        today = utc_now().date()
+        missing = await self.get_missing_days_for_accounts(
+            [account_id], today - timedelta(days=days), today
+        )
+        return missing[account_id]
+
+    async def get_missing_days_for_accounts(
+        self, account_ids: List[int], start_date: date, end_date: date
+    ) -> Dict[int, List[date]]:
+        """
+        Find days with no balance records for several accounts.
 
-        # Normalize to start of day for consistent day counting
-        today = utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
-        end_date = today
-        start_date = today - timedelta(days=days)
+        Recorded days for every account are fetched in a single grouped query
+        and normalized once into per-account sets, so checking each calendar
+        day is a constant-time membership test rather than a scan over every
+        recorded date.
+
+        Args:
+            account_ids (List[int]): Account IDs to check
+            start_date (date): First day of the range (inclusive)
+            end_date (date): Last day of the range (inclusive)
+
+        Returns:
+            Dict[int, List[date]]: Missing dates in ascending order keyed by account ID
+        """
+        recorded: Dict[int, Set[date]] = {
+            account_id: set() for account_id in account_ids
+        }
+        if not account_ids:
+            return {}
+
+        # Naive UTC bounds per ADR-011; end bound covers the whole final day
+        range_start = datetime.combine(start_date, datetime.min.time())
+        range_end = datetime.combine(end_date, datetime.max.time())
+        record_day = func.date(BalanceHistory.timestamp)
 
-        # Get all dates with balance records
         result = await self.session.execute(
-            select(func.date(BalanceHistory.timestamp))
+            select(BalanceHistory.account_id, record_day)
             .where(
                 and_(
-                    BalanceHistory.account_id == account_id,
+                    BalanceHistory.account_id.in_(account_ids),
+                    BalanceHistory.timestamp >= range_start,
+                    BalanceHistory.timestamp <= range_end,
+                )
+            )
+            .group_by(BalanceHistory.account_id, record_day)
+        )
+        for account_id, day in result.all():
+            recorded[account_id].add(normalize_db_date(day))
+
+        calendar = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        return {
+            account_id: [day for day in calendar if day not in days_recorded]
+            for account_id, days_recorded in recorded.items()
+        }
+
+    async def get_balance_ohlc(
+        self,
+        account_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: TimeResolution = TimeResolution.DAILY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a downsampled open/high/low/close balance series for an account.
+
+        Args:
+            account_id (int): Account ID
+            start_date (datetime): Start date (inclusive)
+            end_date (datetime): End date (inclusive)
+            resolution (TimeResolution): Bucket size for the series
+
+        Returns:
+            List[Dict[str, Any]]: One entry per bucket in chronological order
+        """
+        series = await self.get_balance_ohlc_for_accounts(
+            [account_id], start_date, end_date, resolution
+        )
+        return series[account_id]
+
+    async def get_balance_ohlc_for_accounts(
+        self,
+        account_ids: List[int],
+        start_date: datetime,
+        end_date: datetime,
+        resolution: TimeResolution = TimeResolution.DAILY,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get downsampled open/high/low/close balance series for several accounts.
+
+        Records are bucketed by day, week (Monday start) or month in the
+        database. Row numbers over each (account, bucket) partition identify
+        the opening and closing records, so only one row per bucket is
+        returned regardless of how many balance changes were recorded.
+
+        Each bucket contains: period_start, open_balance, high_balance,
+        low_balance, close_balance, average_balance, open_available_credit,
+        close_available_credit, min_available_credit, max_available_credit
+        and record_count.
+
+        Args:
+            account_ids (List[int]): Account IDs to summarize
+            start_date (datetime): Start date (inclusive)
+            end_date (datetime): End date (inclusive)
+            resolution (TimeResolution): Bucket size for the series
+
+        Returns:
+            Dict[int, List[Dict[str, Any]]]: Buckets in chronological order keyed by account ID
+        """
+        series: Dict[int, List[Dict[str, Any]]] = {
+            account_id: [] for account_id in account_ids
+        }
+        if not account_ids:
+            return series
+
+        bucket = date_bucket(
+            BalanceHistory.timestamp, resolution, get_dialect_name(self.session)
+        )
+        partition = (BalanceHistory.account_id, bucket)
+
+        ranked = (
+            select(
+                BalanceHistory.account_id.label("account_id"),
+                bucket.label("period_start"),
+                BalanceHistory.balance.label("balance"),
+                BalanceHistory.available_credit.label("available_credit"),
+                func.row_number()
+                .over(
+                    partition_by=partition,
+                    order_by=(BalanceHistory.timestamp, BalanceHistory.id),
+                )
+                .label("position"),
+                func.row_number()
+                .over(
+                    partition_by=partition,
+                    order_by=(
+                        BalanceHistory.timestamp.desc(),
+                        BalanceHistory.id.desc(),
+                    ),
+                )
+                .label("reverse_position"),
+            )
+            .where(
+                and_(
+                    BalanceHistory.account_id.in_(account_ids),
                     BalanceHistory.timestamp >= start_date,
                     BalanceHistory.timestamp <= end_date,
                 )
             )
-            .group_by(func.date(BalanceHistory.timestamp))
+            .subquery()
         )
 
-        # Process results to normalize date format using our utility
-        recorded_dates = []
-        for row in result.all():
-            date_val = row[0]
-            # Use our utility to handle any date format from the database
-            normalized_date = normalize_db_date(date_val)
-            recorded_dates.append(normalized_date)
+        def at_position(column, position_column):
+            return func.max(case((position_column == 1, column)))
 
-        # Find missing dates
-        missing_dates = []
-        current_date = start_date.date()
-        end = end_date.date()
+        result = await self.session.execute(
+            select(
+                ranked.c.account_id,
+                ranked.c.period_start,
+                at_position(ranked.c.balance, ranked.c.position).label("open_balance"),
+                func.max(ranked.c.balance).label("high_balance"),
+                func.min(ranked.c.balance).label("low_balance"),
+                at_position(ranked.c.balance, ranked.c.reverse_position).label(
+                    "close_balance"
+                ),
+                func.avg(ranked.c.balance).label("average_balance"),
+                at_position(ranked.c.available_credit, ranked.c.position).label(
+                    "open_available_credit"
+                ),
+                at_position(ranked.c.available_credit, ranked.c.reverse_position).label(
+                    "close_available_credit"
+                ),
+                func.min(ranked.c.available_credit).label("min_available_credit"),
+                func.max(ranked.c.available_credit).label("max_available_credit"),
+                func.count().label("record_count"),
+            )
+            .group_by(ranked.c.account_id, ranked.c.period_start)
+            .order_by(ranked.c.account_id, ranked.c.period_start)
+        )
 
-        while current_date <= end:
-            if not date_in_collection(current_date, recorded_dates):
-                missing_dates.append(current_date)
-            current_date += timedelta(days=1)
+        for row in result.all():
+            entry = row._asdict()
+            account_id = entry.pop("account_id")
+            entry["period_start"] = normalize_db_date(entry["period_start"])
+            for key, value in entry.items():
+                if key not in ("period_start", "record_count") and value is not None:
+                    entry[key] = Decimal(str(value))
+            series[account_id].append(entry)
 
-        return missing_dates
+        return series
 
     async def get_available_credit_trend(
         self, account_id: int, days: int = 30
@@ -366,3 +523,97 @@ class BalanceHistoryRepository(BaseRepository[BalanceHistory, int]):
 
         balances = result.scalars().all()
         return [(b.timestamp, b.available_credit) for b in balances]
+
+    async def get_account_ids_with_history(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[int]:
+        """
+        Get IDs of accounts that have balance records within a date range.
+
+        Args:
+            start_date (datetime): Start date (inclusive)
+            end_date (datetime): End date (inclusive)
+
+        Returns:
+            List[int]: Distinct account IDs
+        """
+        result = await self.session.execute(
+            select(BalanceHistory.account_id)
+            .where(
+                and_(
+                    BalanceHistory.timestamp >= start_date,
+                    BalanceHistory.timestamp <= end_date,
+                )
+            )
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def get_earliest_timestamp(self, account_id: int) -> Optional[datetime]:
+        """
+        Get the oldest balance record timestamp for an account.
+
+        Args:
+            account_id (int): Account ID
+
+        Returns:
+            Optional[datetime]: Oldest timestamp or None if no records exist
+        """
+        result = await self.session.execute(
+            select(func.min(BalanceHistory.timestamp)).where(
+                BalanceHistory.account_id == account_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_earliest_compactable_timestamp(
+        self, cutoff: datetime
+    ) -> Optional[datetime]:
+        """
+        Get the oldest timestamp among records eligible for compaction.
+
+        Args:
+            cutoff (datetime): Only records before this are considered
+
+        Returns:
+            Optional[datetime]: Oldest eligible timestamp or None
+        """
+        result = await self.session.execute(
+            select(func.min(BalanceHistory.timestamp)).where(
+                and_(
+                    BalanceHistory.timestamp < cutoff,
+                    BalanceHistory.is_reconciled == False,
+                    or_(BalanceHistory.notes.is_(None), BalanceHistory.notes == ""),
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_compactable_before(
+        self, cutoff: datetime, account_ids: Optional[List[int]] = None
+    ) -> int:
+        """
+        Delete raw balance records older than a cutoff.
+
+        Records that are reconciled or carry notes are preserved because they
+        hold information rollups cannot represent.
+
+        Args:
+            cutoff (datetime): Records with timestamps before this are deleted
+            account_ids (Optional[List[int]]): Restrict to these accounts
+
+        Returns:
+            int: Number of records deleted
+        """
+        query = delete(BalanceHistory).where(
+            and_(
+                BalanceHistory.timestamp < cutoff,
+                BalanceHistory.is_reconciled == False,
+                or_(BalanceHistory.notes.is_(None), BalanceHistory.notes == ""),
+            )
+        )
+        if account_ids is not None:
+            query = query.where(BalanceHistory.account_id.in_(account_ids))
+
+        result = await self.session.execute(query)
+        return result.rowcount
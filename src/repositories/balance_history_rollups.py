@@ -0,0 +1,202 @@
+"""
+Balance history rollup repository implementation.
+
+This module provides a repository for BalanceHistoryRollup records, the daily
+and monthly aggregate tiers that back long-range balance history queries.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.cashflow_types import TimeResolution
+from src.models.balance_history_rollups import BalanceHistoryRollup
+from src.repositories.base_repository import BaseRepository
+from src.utils.datetime_utils import naive_utc_now
+
+# Resolutions that are persisted as rollup tiers, finest first
+ROLLUP_TIERS = (TimeResolution.DAILY, TimeResolution.MONTHLY)
+
+
+class BalanceHistoryRollupRepository(BaseRepository[BalanceHistoryRollup, int]):
+    """
+    Repository for BalanceHistoryRollup model operations.
+
+    Rollups are keyed by (account_id, resolution, period_start). Buckets are
+    written with replace semantics so rebuilding a period is idempotent.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with database session.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        super().__init__(session, BalanceHistoryRollup)
+
+    @staticmethod
+    def _validate_tier(resolution: TimeResolution) -> None:
+        """
+        Ensure a resolution is a persisted rollup tier.
+
+        Args:
+            resolution (TimeResolution): Resolution to check
+
+        Raises:
+            ValueError: If the resolution has no rollup tier
+        """
+        if resolution not in ROLLUP_TIERS:
+            raise ValueError(f"No rollup tier for resolution '{resolution.value}'")
+
+    async def get_rollups(
+        self,
+        account_ids: List[int],
+        resolution: TimeResolution,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[BalanceHistoryRollup]:
+        """
+        Get rollups for accounts within a period range.
+
+        Args:
+            account_ids (List[int]): Account IDs
+            resolution (TimeResolution): Rollup tier to read
+            start_date (datetime): Earliest period start (inclusive)
+            end_date (datetime): Latest period start (inclusive)
+
+        Returns:
+            List[BalanceHistoryRollup]: Rollups ordered by account and period
+        """
+        self._validate_tier(resolution)
+        if not account_ids:
+            return []
+
+        result = await self.session.execute(
+            select(BalanceHistoryRollup)
+            .where(
+                and_(
+                    BalanceHistoryRollup.account_id.in_(account_ids),
+                    BalanceHistoryRollup.resolution == resolution,
+                    BalanceHistoryRollup.period_start >= start_date,
+                    BalanceHistoryRollup.period_start <= end_date,
+                )
+            )
+            .order_by(
+                BalanceHistoryRollup.account_id, BalanceHistoryRollup.period_start
+            )
+        )
+        return result.scalars().all()
+
+    async def get_earliest_period_start(
+        self, account_id: int, resolution: TimeResolution
+    ) -> Optional[datetime]:
+        """
+        Get the start of the oldest rollup period stored for an account.
+
+        Args:
+            account_id (int): Account ID
+            resolution (TimeResolution): Rollup tier to check
+
+        Returns:
+            Optional[datetime]: Oldest period start or None if the tier is empty
+        """
+        self._validate_tier(resolution)
+        result = await self.session.execute(
+            select(func.min(BalanceHistoryRollup.period_start)).where(
+                and_(
+                    BalanceHistoryRollup.account_id == account_id,
+                    BalanceHistoryRollup.resolution == resolution,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def replace_rollups(
+        self, resolution: TimeResolution, buckets: Dict[int, List[Dict[str, Any]]]
+    ) -> int:
+        """
+        Write rollup buckets, replacing any existing rows for the same periods.
+
+        Each bucket must carry a `period_start` date plus the aggregate fields
+        produced by BalanceHistoryRepository.get_balance_ohlc_for_accounts.
+        Existing rows are removed with one DELETE per account and new rows
+        are written with a single multi-row INSERT.
+
+        Args:
+            resolution (TimeResolution): Rollup tier being written
+            buckets (Dict[int, List[Dict[str, Any]]]): Buckets keyed by account ID
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        self._validate_tier(resolution)
+        now = naive_utc_now()
+        rows = []
+
+        for account_id, account_buckets in buckets.items():
+            if not account_buckets:
+                continue
+
+            period_starts = [
+                datetime.combine(bucket["period_start"], datetime.min.time())
+                for bucket in account_buckets
+            ]
+            await self.session.execute(
+                delete(BalanceHistoryRollup).where(
+                    and_(
+                        BalanceHistoryRollup.account_id == account_id,
+                        BalanceHistoryRollup.resolution == resolution,
+                        BalanceHistoryRollup.period_start.in_(period_starts),
+                    )
+                )
+            )
+
+            for period_start, bucket in zip(period_starts, account_buckets):
+                rows.append(
+                    {
+                        **bucket,
+                        "account_id": account_id,
+                        "resolution": resolution,
+                        "period_start": period_start,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+
+        if rows:
+            await self.session.execute(insert(BalanceHistoryRollup), rows)
+        return len(rows)
+
+    async def delete_before(
+        self,
+        resolution: TimeResolution,
+        cutoff: date,
+        account_ids: Optional[List[int]] = None,
+    ) -> int:
+        """
+        Delete rollups whose period starts before a cutoff.
+
+        Args:
+            resolution (TimeResolution): Rollup tier to prune
+            cutoff (date): Periods starting before this date are deleted
+            account_ids (Optional[List[int]]): Restrict to these accounts
+
+        Returns:
+            int: Number of rollup rows deleted
+        """
+        self._validate_tier(resolution)
+        query = delete(BalanceHistoryRollup).where(
+            and_(
+                BalanceHistoryRollup.resolution == resolution,
+                BalanceHistoryRollup.period_start
+                < datetime.combine(cutoff, datetime.min.time()),
+            )
+        )
+        if account_ids is not None:
+            query = query.where(BalanceHistoryRollup.account_id.in_(account_ids))
+
+        result = await self.session.execute(query)
+        return result.rowcount
@@ -12,6 +12,7 @@ from typing import (
     AsyncContextManager,
     Dict,
     Generic,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -19,9 +20,10 @@ from typing import (
     TypeVar,
 )
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectin_polymorphic, with_polymorphic
+from sqlalchemy.orm.util import identity_key
 
 from src.database.base import Base
 from src.utils.datetime_utils import naive_utc_now
@@ -30,6 +32,29 @@ ModelType = TypeVar("ModelType", bound=Base)
 PKType = TypeVar("PKType")
 
 
+def selectin_subtypes(model_class: Type[Base]) -> List[Any]:
+    """
+    Get loader options that load subtype columns for a list of mixed entities.
+
+    With joined-table inheritance, with_polymorphic outer-joins every subtype
+    table for every row. selectin_polymorphic instead selects the base rows
+    and then issues one query per subtype actually present, touching only that
+    subtype's table.
+
+    Args:
+        model_class (Type[Base]): Base class of the inheritance hierarchy
+
+    Returns:
+        List[Any]: Loader options to pass to Select.options(), empty when the
+            class has no subtypes
+    """
+    mapper = inspect(model_class)
+    subtypes = [m.class_ for m in mapper.self_and_descendants if m is not mapper]
+    if not subtypes:
+        return []
+    return [selectin_polymorphic(model_class, subtypes)]
+
+
 class BaseRepository(Generic[ModelType, PKType]):
     """
     Generic base repository for CRUD operations.
@@ -120,31 +145,118 @@ class BaseRepository(Generic[ModelType, PKType]):
         """
         return False
 
+    def _load_entity(self) -> Any:
+        """
+        Get the entity selected by primary key lookups.
+
+        Keyed lookups of a few rows of unknown type are loaded in one round
+        trip by joining the subtype tables on the primary key. Scans over many
+        rows use _list_load_options instead.
+
+        Returns:
+            Any: The model class, or a with_polymorphic entity covering all
+                subtypes when polymorphic loading is needed
+        """
+        if self._needs_polymorphic_loading():
+            return with_polymorphic(self.model_class, "*")
+        return self.model_class
+
+    def _list_load_options(self) -> List[Any]:
+        """
+        Get loader options for queries returning several records.
+
+        Returns:
+            List[Any]: selectin_polymorphic options when polymorphic loading
+                is needed, otherwise none
+        """
+        if self._needs_polymorphic_loading():
+            return selectin_subtypes(self.model_class)
+        return []
+
+    def _get_cached(
+        self, id: PKType, model_class: Optional[Type[ModelType]] = None
+    ) -> Optional[ModelType]:
+        """
+        Get an already loaded instance from the session identity map.
+
+        The session lives for one request, so its identity map doubles as a
+        request-scoped entity cache. A SELECT would return this same instance
+        without refreshing it, so it is only skipped when every column
+        attribute (including subtype columns) is loaded and the instance has
+        not been deleted.
+
+        Args:
+            id (PKType): Primary key value
+            model_class (Type[ModelType], optional): Class the instance must be
+                an instance of, defaulting to the repository model class
+
+        Returns:
+            Optional[ModelType]: Cached instance, or None if it must be queried
+        """
+        model_class = model_class or self.model_class
+        obj = self.session.identity_map.get(identity_key(model_class, id))
+        if obj is None or not isinstance(obj, model_class):
+            return None
+        state = inspect(obj)
+        if state.deleted or state.was_deleted or state.detached:
+            return None
+        if state.unloaded.intersection(state.mapper.column_attrs.keys()):
+            return None
+        return obj
+
     async def get(self, id: PKType) -> Optional[ModelType]:
         """
         Get a single record by primary key.
 
+        Instances already loaded in the session are returned without a query.
+
         Args:
             id (PKType): Primary key value
 
         Returns:
             Optional[ModelType]: Found object or None
         """
-        if self._needs_polymorphic_loading():
-            # Use polymorphic loading for models with inheritance
-            from sqlalchemy.orm import with_polymorphic
+        cached = self._get_cached(id)
+        if cached is not None:
+            return cached
 
-            poly_model = with_polymorphic(self.model_class, "*")
-            result = await self.session.execute(
-                select(poly_model).where(poly_model.id == id)
-            )
-        else:
-            # Standard loading for non-polymorphic models
+        entity = self._load_entity()
+        result = await self.session.execute(select(entity).where(entity.id == id))
+        return result.scalars().first()
+
+    async def get_many(self, ids: Iterable[PKType]) -> Dict[PKType, ModelType]:
+        """
+        Get several records by primary key in a single query.
+
+        Instances already loaded in the session are reused and only the
+        remaining keys are selected.
+
+        Args:
+            ids (Iterable[PKType]): Primary key values; duplicates are ignored
+
+        Returns:
+            Dict[PKType, ModelType]: Found objects keyed by primary key, in the
+                order requested (missing keys are left out)
+        """
+        requested = list(dict.fromkeys(ids))
+        found: Dict[PKType, ModelType] = {}
+        missing = []
+        for id in requested:
+            cached = self._get_cached(id)
+            if cached is None:
+                missing.append(id)
+            else:
+                found[id] = cached
+
+        if missing:
+            entity = self._load_entity()
             result = await self.session.execute(
-                select(self.model_class).where(self.model_class.id == id)
+                select(entity).where(entity.id.in_(missing))
             )
+            for obj in result.scalars():
+                found[obj.id] = obj
 
-        return result.scalars().first()
+        return {id: found[id] for id in requested if id in found}
 
     async def get_with_joins(
         self, id: PKType, relationships: List[str] = None
@@ -189,7 +301,12 @@ class BaseRepository(Generic[ModelType, PKType]):
         Returns:
             List[ModelType]: List of found objects
         """
-        query = select(self.model_class).offset(skip).limit(limit)
+        query = (
+            select(self.model_class)
+            .offset(skip)
+            .limit(limit)
+            .options(*self._list_load_options())
+        )
 
         if filters:
             for field, value in filters.items():
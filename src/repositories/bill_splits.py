@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import and_, case, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
@@ -437,6 +437,119 @@ class BillSplitRepository(BaseRepository[BillSplit, int]):
         # Use DecimalPrecision for consistent handling
         return DecimalPrecision.round_for_calculation(total)
 
+    async def get_upcoming_totals_by_account(
+        self,
+        account_ids: List[int],
+        start_date: datetime,
+        short_end_date: datetime,
+        long_end_date: datetime,
+        exclude_liability_id: Optional[int] = None,
+    ) -> Dict[int, Tuple[Decimal, Decimal]]:
+        """
+        Sum split obligations for several accounts over two horizons in one query.
+
+        Args:
+            account_ids (List[int]): IDs of the accounts to total
+            start_date (datetime): Start of both horizons, must be timezone-aware (UTC)
+            short_end_date (datetime): End of the short horizon, must be timezone-aware (UTC)
+            long_end_date (datetime): End of the long horizon, must be timezone-aware (UTC)
+            exclude_liability_id (Optional[int]): Liability whose splits are ignored,
+                typically the one currently being split
+
+        Returns:
+            Dict[int, Tuple[Decimal, Decimal]]: (short horizon total, long horizon total)
+                per account; accounts without obligations map to zeros
+        """
+        totals = {
+            account_id: (Decimal("0"), Decimal("0")) for account_id in account_ids
+        }
+        if not account_ids:
+            return totals
+
+        db_start_date = naive_start_of_day(ensure_utc(start_date))
+        db_short_end = naive_end_of_day(ensure_utc(short_end_date))
+        db_long_end = naive_end_of_day(ensure_utc(long_end_date))
+
+        query = (
+            select(
+                BillSplit.account_id,
+                func.sum(
+                    case(
+                        (Liability.due_date <= db_short_end, BillSplit.amount), else_=0
+                    )
+                ),
+                func.sum(BillSplit.amount),
+            )
+            .join(BillSplit.liability)
+            .where(
+                and_(
+                    BillSplit.account_id.in_(account_ids),
+                    Liability.due_date >= db_start_date,
+                    Liability.due_date <= db_long_end,
+                )
+            )
+            .group_by(BillSplit.account_id)
+        )
+        if exclude_liability_id is not None:
+            query = query.where(BillSplit.liability_id != exclude_liability_id)
+
+        result = await self.session.execute(query)
+        for account_id, short_total, long_total in result.all():
+            totals[account_id] = (
+                DecimalPrecision.round_for_calculation(Decimal(str(short_total or 0))),
+                DecimalPrecision.round_for_calculation(Decimal(str(long_total or 0))),
+            )
+        return totals
+
+    async def get_obligation_schedule(
+        self,
+        account_ids: List[int],
+        start_date: datetime,
+        end_date: datetime,
+        exclude_liability_ids: Optional[List[int]] = None,
+    ) -> Dict[int, List[Tuple[datetime, Decimal]]]:
+        """
+        Get unpaid split obligations per account grouped by due date.
+
+        Args:
+            account_ids (List[int]): IDs of the accounts to include
+            start_date (datetime): Start date, must be timezone-aware (UTC)
+            end_date (datetime): End date, must be timezone-aware (UTC)
+            exclude_liability_ids (Optional[List[int]]): Liabilities whose splits
+                are ignored, typically those being re-allocated
+
+        Returns:
+            Dict[int, List[Tuple[datetime, Decimal]]]: (naive UTC due date, amount)
+                pairs per account ordered by due date
+        """
+        schedule: Dict[int, List[Tuple[datetime, Decimal]]] = {
+            account_id: [] for account_id in account_ids
+        }
+        if not account_ids:
+            return schedule
+
+        query = (
+            select(BillSplit.account_id, Liability.due_date, func.sum(BillSplit.amount))
+            .join(BillSplit.liability)
+            .where(
+                and_(
+                    BillSplit.account_id.in_(account_ids),
+                    Liability.due_date >= naive_start_of_day(ensure_utc(start_date)),
+                    Liability.due_date <= naive_end_of_day(ensure_utc(end_date)),
+                    Liability.paid == False,  # noqa: E712
+                )
+            )
+            .group_by(BillSplit.account_id, Liability.due_date)
+            .order_by(BillSplit.account_id, Liability.due_date)
+        )
+        if exclude_liability_ids:
+            query = query.where(BillSplit.liability_id.not_in(exclude_liability_ids))
+
+        result = await self.session.execute(query)
+        for account_id, due_date, amount in result.all():
+            schedule[account_id].append((due_date, Decimal(str(amount))))
+        return schedule
+
     async def get_split_distribution(self, liability_id: int) -> Dict[int, Decimal]:
         """
         Get the distribution of splits across accounts for a liability,
@@ -8,7 +8,7 @@ forecast-related queries.
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, delete, desc, func, insert, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.cashflow import CashflowForecast
@@ -116,6 +116,44 @@ class CashflowForecastRepository(CashflowBaseRepository[CashflowForecast]):
         )
         return result.scalars().all()
 
+    async def replace_range(
+        self, forecasts: List[CashflowForecast]
+    ) -> List[CashflowForecast]:
+        """
+        Store forecasts for a run of days, replacing any stored for those days.
+
+        Existing forecasts are removed with one DELETE over the covered days and
+        the new ones are written with one multi-row INSERT ... RETURNING; a
+        unit-of-work flush would issue one INSERT per forecast here.
+
+        Args:
+            forecasts (List[CashflowForecast]): New, unsaved forecasts
+
+        Returns:
+            List[CashflowForecast]: The stored forecasts, ordered by date
+        """
+        if not forecasts:
+            return []
+        dates = [forecast.forecast_date for forecast in forecasts]
+        await self.session.execute(
+            delete(CashflowForecast).where(
+                and_(
+                    CashflowForecast.forecast_date >= naive_start_of_day(min(dates)),
+                    CashflowForecast.forecast_date <= naive_end_of_day(max(dates)),
+                )
+            )
+        )
+        columns = [attr.key for attr in inspect(CashflowForecast).column_attrs]
+        # Only the attributes set on each forecast, so column defaults apply
+        rows = [
+            {key: forecast.__dict__[key] for key in columns if key in forecast.__dict__}
+            for forecast in forecasts
+        ]
+        result = await self.session.scalars(
+            insert(CashflowForecast).returning(CashflowForecast), rows
+        )
+        return sorted(result.all(), key=lambda forecast: forecast.forecast_date)
+
     async def get_latest_forecast(self) -> Optional[CashflowForecast]:
         """
         Get the most recent forecast.
@@ -20,11 +20,13 @@ consistent decimal precision handling for financial calculations.
 from collections import defaultdict
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Row, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import with_polymorphic
 
+from src.models.account_types.banking.credit import CreditAccount
 from src.models.accounts import Account
 from src.models.liabilities import Liability
 from src.models.payments import Payment, PaymentSource
@@ -58,7 +60,10 @@ class RealtimeCashflowRepository(CashflowBaseRepository[Account]):
         Returns:
             List[Account]: List of all accounts
         """
-        query = select(Account)
+        # Credit limits are the only type-specific fields realtime analysis
+        # reads, so join just the credit table rather than every subtype
+        poly_account = with_polymorphic(Account, [CreditAccount])
+        query = select(poly_account)
         result = await self.session.execute(query)
         return result.scalars().all()
 
@@ -179,16 +184,20 @@ class RealtimeCashflowRepository(CashflowBaseRepository[Account]):
 
     async def get_transaction_history(
         self, account_id: int, days: int = 30
-    ) -> List[TransactionHistory]:
+    ) -> Sequence[Row]:
         """
         Get transaction history for an account over specified days.
 
+        Only the columns realtime analysis reads are selected, so no
+        TransactionHistory objects are built.
+
         Args:
             account_id (int): Account ID to get history for
             days (int): Number of days to look back (default: 30)
 
         Returns:
-            List[TransactionHistory]: List of transactions
+            Sequence[Row]: Rows of (transaction_date, amount, description,
+                transaction_type) ordered by date
         """
         # Calculate date range
         end_date = datetime.now().replace(tzinfo=None)
@@ -199,7 +208,12 @@ class RealtimeCashflowRepository(CashflowBaseRepository[Account]):
 
         # Query for transactions in date range
         query = (
-            select(TransactionHistory)
+            select(
+                TransactionHistory.transaction_date,
+                TransactionHistory.amount,
+                TransactionHistory.description,
+                TransactionHistory.transaction_type,
+            )
             .where(
                 and_(
                     TransactionHistory.account_id == account_id,
@@ -211,7 +225,7 @@ class RealtimeCashflowRepository(CashflowBaseRepository[Account]):
         )
 
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_transactions_with_description(
         self, account_id: int, days: int = 30
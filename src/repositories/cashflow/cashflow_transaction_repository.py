@@ -5,16 +5,16 @@ This module provides a repository for cashflow transaction operations,
 including retrieving day transactions, historical transactions, and projected transactions.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from src.models.accounts import Account
 from src.models.income import Income
 from src.models.liabilities import Liability
-from src.models.payments import Payment
+from src.models.payments import Payment, PaymentSource
 from src.repositories.cashflow.cashflow_base import CashflowBaseRepository
 from src.utils.datetime_utils import naive_end_of_day, naive_start_of_day
 
@@ -124,9 +124,13 @@ class CashflowTransactionRepository(CashflowBaseRepository[Liability]):
 
     async def get_historical_payments(
         self, account_ids: List[int], start_date, end_date
-    ) -> List[Payment]:
+    ) -> Sequence[Row]:
         """
-        Get historical payments for accounts in a date range.
+        Get historical payment outflows for accounts in a date range.
+
+        Selects only the columns historical analysis reads, one row per
+        payment source drawn from one of the accounts, so no Payment or
+        PaymentSource objects are built.
 
         Args:
             account_ids (List[int]): List of account IDs to get payments for
@@ -134,25 +138,34 @@ class CashflowTransactionRepository(CashflowBaseRepository[Liability]):
             end_date: End date for range
 
         Returns:
-            List[Payment]: List of payments with sources loaded
+            Sequence[Row]: Rows of (payment_date, amount, account_id, category)
+                where amount is the source amount
         """
         # Prepare date range
         range_start, range_end = self._prepare_date_range(start_date, end_date)
 
-        # Query for payments in date range
+        # Query for payment sources of the accounts in date range
         query = (
-            select(Payment)
-            .options(selectinload(Payment.sources))
-            .where(Payment.payment_date.between(range_start, range_end))
+            select(
+                Payment.payment_date,
+                PaymentSource.amount,
+                PaymentSource.account_id,
+                Payment.category,
+            )
+            .join(PaymentSource, PaymentSource.payment_id == Payment.id)
+            .where(
+                PaymentSource.account_id.in_(account_ids),
+                Payment.payment_date.between(range_start, range_end),
+            )
         )
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_historical_income(
         self, account_ids: List[int], start_date, end_date
-    ) -> List[Income]:
+    ) -> Sequence[Row]:
         """
-        Get historical income for accounts in a date range.
+        Get historical deposited income for accounts in a date range.
 
         Args:
             account_ids (List[int]): List of account IDs to get income for
@@ -160,19 +173,19 @@ class CashflowTransactionRepository(CashflowBaseRepository[Liability]):
             end_date: End date for range
 
         Returns:
-            List[Income]: List of income entries
+            Sequence[Row]: Rows of (date, amount, account_id)
         """
         # Prepare date range
         range_start, range_end = self._prepare_date_range(start_date, end_date)
 
         # Query for income in date range
-        query = select(Income).where(
+        query = select(Income.date, Income.amount, Income.account_id).where(
             Income.account_id.in_(account_ids),
             Income.date.between(range_start, range_end),
             Income.deposited == True,  # Only include deposited income
         )
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def get_bills_in_date_range(
         self, account_id: int, start_date, end_date, include_pending: bool = True
@@ -238,6 +251,128 @@ class CashflowTransactionRepository(CashflowBaseRepository[Liability]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_bills_due_between(
+        self,
+        account_ids: Sequence[int],
+        start_date,
+        end_date,
+        include_pending: bool = True,
+    ) -> Sequence[Row]:
+        """
+        Get bills due in a date range for several accounts at once.
+
+        The batched counterpart of get_bills_due_on_date for projections
+        spanning many days and accounts.
+
+        Args:
+            account_ids (Sequence[int]): Primary account IDs to get bills for
+            start_date: Start date for range
+            end_date: End date for range
+            include_pending (bool): Whether to include pending bills
+
+        Returns:
+            Sequence[Row]: Rows of (primary_account_id, due_date, amount, name)
+        """
+        range_start, range_end = self._prepare_date_range(start_date, end_date)
+
+        query = select(
+            Liability.primary_account_id,
+            Liability.due_date,
+            Liability.amount,
+            Liability.name,
+        ).where(
+            Liability.primary_account_id.in_(account_ids),
+            Liability.due_date.between(range_start, range_end),
+        )
+
+        if not include_pending:
+            query = query.where(Liability.status != "pending")
+
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_income_expected_between(
+        self,
+        account_ids: Sequence[int],
+        start_date,
+        end_date,
+        include_pending: bool = True,
+    ) -> Sequence[Row]:
+        """
+        Get income expected in a date range for several accounts at once.
+
+        The batched counterpart of get_income_expected_on_date.
+
+        Args:
+            account_ids (Sequence[int]): Account IDs to get income for
+            start_date: Start date for range
+            end_date: End date for range
+            include_pending (bool): Whether to include pending income
+
+        Returns:
+            Sequence[Row]: Rows of (account_id, date, amount, source)
+        """
+        range_start, range_end = self._prepare_date_range(start_date, end_date)
+
+        query = select(
+            Income.account_id, Income.date, Income.amount, Income.source
+        ).where(
+            Income.account_id.in_(account_ids),
+            Income.date.between(range_start, range_end),
+        )
+
+        if not include_pending:
+            query = query.where(Income.deposited == True)
+
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_last_deposited_income_dates(
+        self, end_date: datetime
+    ) -> Dict[str, datetime]:
+        """
+        Get the date of the latest deposited income of each source.
+
+        Args:
+            end_date (datetime): Latest income date considered
+
+        Returns:
+            Dict[str, datetime]: Naive UTC date of the latest deposit by source
+        """
+        query = (
+            select(Income.source, func.max(Income.date))
+            .where(
+                Income.deposited == True,
+                Income.date <= naive_end_of_day(end_date),
+            )
+            .group_by(Income.source)
+        )
+        result = await self.session.execute(query)
+        return {source: last_date for source, last_date in result.all()}
+
+    async def get_recurring_bills_for_accounts(
+        self, account_ids: Sequence[int]
+    ) -> Sequence[Row]:
+        """
+        Get recurring bills for several accounts at once.
+
+        Args:
+            account_ids (Sequence[int]): Primary account IDs to get bills for
+
+        Returns:
+            Sequence[Row]: Rows of (primary_account_id, due_date, amount, name)
+        """
+        query = select(
+            Liability.primary_account_id,
+            Liability.due_date,
+            Liability.amount,
+            Liability.name,
+        ).where(
+            Liability.primary_account_id.in_(account_ids), Liability.recurring == True
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
     async def get_account_by_id(self, account_id: int) -> Optional[Account]:
         """
         Get an account by ID.
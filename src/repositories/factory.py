@@ -16,10 +16,8 @@ Implemented as part of ADR-014 Repository Layer Compliance, ADR-016 Account Type
 ADR-019 Banking Account Types, and ADR-024 Feature Flag System.
 """
 
-import importlib
-import inspect
 import logging
-from typing import Any, Dict, Optional, Set
+from typing import Any, Callable, Mapping, Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -27,6 +25,10 @@ from src.config.providers.feature_flags import (
     DatabaseConfigProvider,
     InMemoryConfigProvider,
 )
+from src.registry.account_type_dispatch import (
+    AccountTypeDispatchTable,
+    known_account_types,
+)
 from src.registry.account_types import account_type_registry
 from src.repositories.accounts import AccountRepository
 from src.repositories.base_repository import BaseRepository
@@ -59,8 +61,50 @@ class RepositoryFactory:
         transaction_repo = await self._get_repository(TransactionHistoryRepository)
     """
 
-    # Cache for loaded repository modules
-    _module_cache: Dict[str, Any] = {}
+    # Default repository module per account type when the registry has no entry
+    _DEFAULT_MODULE_PATHS = {
+        "checking": "src.repositories.account_types.banking.checking",
+        "savings": "src.repositories.account_types.banking.savings",
+        "credit": "src.repositories.account_types.banking.credit",
+        "bnpl": "src.repositories.account_types.banking.bnpl",
+        "payment_app": "src.repositories.account_types.banking.payment_app",
+        "ewa": "src.repositories.account_types.banking.ewa",
+        "mortgage": "src.repositories.account_types.loan.mortgage",
+        "personal": "src.repositories.account_types.loan.personal",
+        "auto": "src.repositories.account_types.loan.auto",
+        "student": "src.repositories.account_types.loan.student",
+        "brokerage": "src.repositories.account_types.investment.brokerage",
+        "retirement": "src.repositories.account_types.investment.retirement",
+        "crypto": "src.repositories.account_types.investment.crypto",
+    }
+
+    # Process-wide dispatch table, built on first use
+    _dispatch_table: Optional[AccountTypeDispatchTable] = None
+
+    @classmethod
+    def get_dispatch_table(cls) -> AccountTypeDispatchTable:
+        """
+        Get the dispatch table of type-specific repository functions.
+
+        The table is built once per process; call reset_dispatch_table after
+        registering new account types at runtime.
+
+        Returns:
+            AccountTypeDispatchTable: Shared dispatch table
+        """
+        if cls._dispatch_table is None:
+            cls._dispatch_table = AccountTypeDispatchTable.from_modules(
+                {
+                    account_type: cls._get_module_path(account_type)
+                    for account_type in known_account_types(cls._DEFAULT_MODULE_PATHS)
+                }
+            )
+        return cls._dispatch_table
+
+    @classmethod
+    def reset_dispatch_table(cls) -> None:
+        """Discard the dispatch table so it is rebuilt on next use."""
+        cls._dispatch_table = None
 
     @classmethod
     async def create_account_repository(
@@ -95,29 +139,10 @@ class RepositoryFactory:
                 )
             return base_repo
 
-        # If account type is specified but registry is not available,
-        # try to load the module using default path structure
-        module_path = cls._get_module_path(account_type)
-        if not module_path:
-            # Wrap with proxy if feature flag service is provided
-            if feature_flag_service:
-                return await cls._wrap_with_proxy(
-                    base_repo, feature_flag_service, session, config_provider
-                )
-            return base_repo
-
-        # Get the specialized module
-        module = cls._get_or_load_module(module_path)
-        if not module:
-            # Wrap with proxy if feature flag service is provided
-            if feature_flag_service:
-                return await cls._wrap_with_proxy(
-                    base_repo, feature_flag_service, session, config_provider
-                )
-            return base_repo
-
-        # Bind specialized functions to the base repository
-        cls._bind_module_functions(base_repo, module, session)
+        # Bind specialized functions for the type, if it has any
+        functions = cls.get_dispatch_table().functions(account_type)
+        if functions:
+            cls._bind_functions(base_repo, functions, session)
 
         # Wrap with proxy if feature flag service is provided
         if feature_flag_service:
@@ -203,70 +228,24 @@ class RepositoryFactory:
             category, sub_type = account_type.split("_", 1)
             return f"src.repositories.account_types.{category}.{sub_type}"
 
-        # Try to map common account types to default modules
-        type_to_module = {
-            "checking": "src.repositories.account_types.banking.checking",
-            "savings": "src.repositories.account_types.banking.savings",
-            "credit": "src.repositories.account_types.banking.credit",
-            "bnpl": "src.repositories.account_types.banking.bnpl",
-            "payment_app": "src.repositories.account_types.banking.payment_app",
-            "ewa": "src.repositories.account_types.banking.ewa",
-            "mortgage": "src.repositories.account_types.loan.mortgage",
-            "personal": "src.repositories.account_types.loan.personal",
-            "auto": "src.repositories.account_types.loan.auto",
-            "student": "src.repositories.account_types.loan.student",
-            "brokerage": "src.repositories.account_types.investment.brokerage",
-            "retirement": "src.repositories.account_types.investment.retirement",
-            "crypto": "src.repositories.account_types.investment.crypto",
-        }
-
-        return type_to_module.get(account_type)
+        return cls._DEFAULT_MODULE_PATHS.get(account_type)
 
     @classmethod
-    def _get_or_load_module(cls, module_path: str) -> Optional[Any]:
-        """
-        Get a cached module or load it if not cached.
-
-        Args:
-            module_path: Module path to load
-
-        Returns:
-            Loaded module or None if loading fails
-        """
-        # Return cached module if available
-        if module_path in cls._module_cache:
-            return cls._module_cache[module_path]
-
-        # Try to import the module
-        try:
-            module = importlib.import_module(module_path)
-            cls._module_cache[module_path] = module
-            return module
-        except ImportError as e:
-            # Log the error but don't raise an exception
-            logger.warning(f"Could not import repository module {module_path}: {e}")
-            return None
-
-    @classmethod
-    def _bind_module_functions(
+    def _bind_functions(
         cls,
         repo: BaseRepository,
-        module: Any,
+        functions: Mapping[str, Callable],
         session: AsyncSession,
     ) -> None:
         """
-        Bind functions from the module to the repository instance.
+        Bind type-specific functions to the repository instance.
 
         Args:
             repo: Repository instance to bind functions to
-            module: Module containing functions to bind
+            functions: Functions taking a session as first parameter, by name
             session: SQLAlchemy async session to pass to the bound functions
         """
-        # Find all async functions in the module that take a session as first parameter
-        for name, func in inspect.getmembers(module, inspect.iscoroutinefunction):
-            if name.startswith("_"):
-                continue
-
+        for name, func in functions.items():
             # Create a bound method that passes the session to the function
             async def bound_method(*args, _func=func, **kwargs):
                 return await _func(session, *args, **kwargs)
@@ -278,8 +257,6 @@ class RepositoryFactory:
             # Bind the method to the repository instance
             setattr(repo, name, bound_method)
 
-        logger.debug(f"Bound {module.__name__} functions to repository")
-
 
 class RepositoryFactoryHelper:
     """
@@ -297,18 +274,4 @@ class RepositoryFactoryHelper:
         Returns:
             Set of function names available for this account type
         """
-        module_path = RepositoryFactory._get_module_path(account_type)
-        if not module_path:
-            return set()
-
-        module = RepositoryFactory._get_or_load_module(module_path)
-        if not module:
-            return set()
-
-        functions = {
-            name
-            for name, func in inspect.getmembers(module, inspect.iscoroutinefunction)
-            if not name.startswith("_")
-        }
-
-        return functions
+        return set(RepositoryFactory.get_dispatch_table().functions(account_type))
@@ -7,12 +7,13 @@ implementing standard CRUD functionality along with Income-specific query method
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import Integer, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
+from src.database.sql_functions import get_dialect_name, insert_ignoring_conflicts
 from src.models.income import Income
 from src.repositories.base_repository import BaseRepository
 from src.utils.datetime_utils import ensure_utc, naive_end_of_day, naive_start_of_day
@@ -285,6 +286,59 @@ class IncomeRepository(BaseRepository[Income, int]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_generated_months(
+        self, recurring_ids: List[int], start_date: datetime, end_date: datetime
+    ) -> Set[Tuple[int, int, int]]:
+        """
+        Get the months already generated for recurring income templates.
+
+        Args:
+            recurring_ids (List[int]): IDs of the recurring income templates
+            start_date (datetime): Start of the period (inclusive)
+            end_date (datetime): End of the period (exclusive)
+
+        Returns:
+            Set[Tuple[int, int, int]]: (recurring income ID, year, month) of
+                each existing entry
+        """
+        if not recurring_ids:
+            return set()
+        result = await self.session.execute(
+            select(Income.recurring_income_id, Income.date).where(
+                and_(
+                    Income.recurring_income_id.in_(recurring_ids),
+                    Income.date >= start_date,
+                    Income.date < end_date,
+                )
+            )
+        )
+        return {
+            (recurring_id, income_date.year, income_date.month)
+            for recurring_id, income_date in result.all()
+        }
+
+    async def insert_generated(self, rows: List[Dict[str, Any]]) -> List[Income]:
+        """
+        Insert income entries generated from recurring templates in one statement.
+
+        Rows whose template already has an entry on the same date are skipped
+        by the unique constraint, so repeated generation is idempotent even
+        when two requests race.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column values of each income entry
+
+        Returns:
+            List[Income]: Income entries actually inserted, ordered by date
+        """
+        if not rows:
+            return []
+        stmt = insert_ignoring_conflicts(
+            Income, get_dialect_name(self.session)
+        ).returning(Income)
+        result = await self.session.scalars(stmt, rows)
+        return sorted(result.all(), key=lambda i: (i.date, i.source))
+
     async def get_income_statistics_by_period(
         self,
         start_date: datetime,
@@ -431,7 +485,9 @@ class IncomeRepository(BaseRepository[Income, int]):
             conditions.append(Income.recurring == recurring)
 
         # Build base query
-        query = select(Income).options(joinedload(Income.account))
+        query = select(Income).options(
+            joinedload(Income.account), joinedload(Income.category)
+        )
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -8,9 +8,9 @@ pattern as specified in ADR-014.
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.income import Income
@@ -41,12 +41,13 @@ class IncomeTrendsRepository(BaseRepository[Income, int]):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         source: Optional[str] = None,
-    ) -> List[Income]:
+    ) -> Sequence[Row]:
         """Get income records with optional filtering.
 
         This method retrieves income records that match the provided filters.
         All datetime parameters are processed to ensure proper timezone handling
-        according to ADR-011.
+        according to ADR-011. Only the columns trend analysis reads are
+        selected, so long histories do not build Income objects.
 
         Args:
             start_date: Optional start date filter (UTC timezone)
@@ -54,9 +55,11 @@ class IncomeTrendsRepository(BaseRepository[Income, int]):
             source: Optional income source filter
 
         Returns:
-            List of income records matching the criteria
+            Rows of (source, date, amount) ordered by date
         """
-        query = select(self.model_class)
+        query = select(
+            self.model_class.source, self.model_class.date, self.model_class.amount
+        ).order_by(self.model_class.date)
 
         # Apply date filters with proper timezone handling
         if start_date:
@@ -76,7 +79,7 @@ class IncomeTrendsRepository(BaseRepository[Income, int]):
             query = query.where(self.model_class.source == source)
 
         result = await self.session.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def group_records_by_source(
         self, records: List[Income]
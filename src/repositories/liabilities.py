@@ -6,12 +6,13 @@ queries for bill/liability-related functionality.
 """
 
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
+from src.database.sql_functions import get_dialect_name, insert_ignoring_conflicts
 from src.models.bill_splits import BillSplit
 from src.models.liabilities import Liability, LiabilityStatus
 from src.repositories.base_repository import BaseRepository
@@ -206,6 +207,21 @@ class LiabilityRepository(BaseRepository[Liability, int]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_active_bills(self) -> List[Liability]:
+        """
+        Get active bills that are still unpaid.
+
+        Returns:
+            List[Liability]: Active unpaid bills ordered by due date
+        """
+        query = (
+            select(Liability)
+            .where(Liability.active == True, Liability.paid == False)
+            .order_by(Liability.due_date)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
     async def find_bills_by_status(
         self, status: LiabilityStatus, limit: int = 100
     ) -> List[Liability]:
@@ -404,3 +420,27 @@ class LiabilityRepository(BaseRepository[Liability, int]):
         update_data = {"paid": False, "status": LiabilityStatus.PENDING}
 
         return await self.update(liability_id, update_data)
+
+    async def insert_generated(self, rows: List[Dict[str, Any]]) -> List[Liability]:
+        """
+        Insert liabilities generated from recurring bills in one statement.
+
+        Rows whose recurring bill already has a liability on the same due date
+        are skipped by the unique constraint, so repeated generation is
+        idempotent even when two requests race.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column values of each liability
+
+        Returns:
+            List[Liability]: Liabilities actually inserted, ordered by due date
+        """
+        if not rows:
+            return []
+        stmt = insert_ignoring_conflicts(
+            Liability, get_dialect_name(self.session)
+        ).returning(Liability)
+        result = await self.session.scalars(stmt, rows)
+        return sorted(
+            result.all(), key=lambda liability: (liability.due_date, liability.name)
+        )
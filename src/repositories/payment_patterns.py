@@ -7,10 +7,9 @@ implementing specialized queries for payment pattern detection and analysis.
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-import numpy as np
-from sqlalchemy import select
+from sqlalchemy import Row, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,6 +21,7 @@ from src.utils.datetime_utils import (
     naive_start_of_day,
     utc_now,
 )
+from src.utils.decimal_precision import DecimalPrecision
 
 
 class PaymentPatternRepository(BaseRepository[Payment, int]):
@@ -41,34 +41,31 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
         """
         super().__init__(session, Payment)
 
-    async def get_payments_with_filters(
+    def _filtered_payments_query(
         self,
+        query: Select,
         liability_id: Optional[int] = None,
         account_id: Optional[int] = None,
         category_id: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         order_by_asc: bool = True,
-        include_sources: bool = False,
-    ) -> List[Payment]:
+    ) -> Select:
         """
-        Get payments with various filter criteria.
+        Apply the payment pattern filters and ordering to a query.
 
         Args:
+            query (Select): Query selecting from payments
             liability_id (Optional[int]): Filter by liability/bill ID
             account_id (Optional[int]): Filter by account ID
             category_id (Optional[str]): Filter by category ID
             start_date (Optional[datetime]): Start date filter (inclusive)
             end_date (Optional[datetime]): End date filter (inclusive)
             order_by_asc (bool): Sort by payment date ascending if True, descending if False
-            include_sources (bool): Include payment sources in the result
 
         Returns:
-            List[Payment]: Filtered payments
+            Select: The filtered and ordered query
         """
-        # Build base query
-        query = select(Payment)
-
         # Add filters
         if liability_id is not None:
             query = query.where(Payment.liability_id == liability_id)
@@ -97,9 +94,43 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
 
         # Add ordering
         if order_by_asc:
-            query = query.order_by(Payment.payment_date.asc())
-        else:
-            query = query.order_by(Payment.payment_date.desc())
+            return query.order_by(Payment.payment_date.asc())
+        return query.order_by(Payment.payment_date.desc())
+
+    async def get_payments_with_filters(
+        self,
+        liability_id: Optional[int] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        order_by_asc: bool = True,
+        include_sources: bool = False,
+    ) -> List[Payment]:
+        """
+        Get payments with various filter criteria.
+
+        Args:
+            liability_id (Optional[int]): Filter by liability/bill ID
+            account_id (Optional[int]): Filter by account ID
+            category_id (Optional[str]): Filter by category ID
+            start_date (Optional[datetime]): Start date filter (inclusive)
+            end_date (Optional[datetime]): End date filter (inclusive)
+            order_by_asc (bool): Sort by payment date ascending if True, descending if False
+            include_sources (bool): Include payment sources in the result
+
+        Returns:
+            List[Payment]: Filtered payments
+        """
+        query = self._filtered_payments_query(
+            select(Payment),
+            liability_id=liability_id,
+            account_id=account_id,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            order_by_asc=order_by_asc,
+        )
 
         # Add relationship loading if requested
         if include_sources:
@@ -109,6 +140,74 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_payment_points(
+        self,
+        liability_id: Optional[int] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        order_by_asc: bool = True,
+    ) -> Sequence[Row]:
+        """
+        Get the fields pattern analysis reads from payments matching the filters.
+
+        Takes the same filters as get_payments_with_filters but selects only
+        columns, so no Payment objects are built for long histories. The rows
+        work with the metric helpers of this repository.
+
+        Args:
+            liability_id (Optional[int]): Filter by liability/bill ID
+            account_id (Optional[int]): Filter by account ID
+            category_id (Optional[str]): Filter by category ID
+            start_date (Optional[datetime]): Start date filter (inclusive)
+            end_date (Optional[datetime]): End date filter (inclusive)
+            order_by_asc (bool): Sort by payment date ascending if True, descending if False
+
+        Returns:
+            Sequence[Row]: Rows of (payment_date, amount, category)
+        """
+        query = self._filtered_payments_query(
+            select(Payment.payment_date, Payment.amount, Payment.category),
+            liability_id=liability_id,
+            account_id=account_id,
+            category_id=category_id,
+            start_date=start_date,
+            end_date=end_date,
+            order_by_asc=order_by_asc,
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
+    async def get_payment_points_for_liabilities(
+        self, liability_ids: Sequence[int]
+    ) -> Sequence[Row]:
+        """
+        Get the pattern analysis fields of every payment of several bills.
+
+        The batched counterpart of get_payment_points(liability_id=...), so
+        patterns for a whole portfolio of bills are analyzed from one query.
+
+        Args:
+            liability_ids (Sequence[int]): Liability/bill IDs
+
+        Returns:
+            Sequence[Row]: Rows of (liability_id, payment_date, amount, category)
+                ordered by liability and then payment date ascending
+        """
+        query = (
+            select(
+                Payment.liability_id,
+                Payment.payment_date,
+                Payment.amount,
+                Payment.category,
+            )
+            .where(Payment.liability_id.in_(liability_ids))
+            .order_by(Payment.liability_id, Payment.payment_date.asc())
+        )
+        result = await self.session.execute(query)
+        return result.all()
+
     async def get_bill_payments(
         self,
         liability_id: int,
@@ -176,6 +275,9 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
         if not days_between:  # If no valid intervals found
             return (0.0, 0.0, 0, 0)
 
+        # NumPy is imported on first use to keep it out of application startup
+        import numpy as np
+
         # Calculate metrics
         mean_days = float(np.mean(days_between))
         std_dev = float(np.std(days_between))
@@ -210,13 +312,20 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
                 Decimal("0"),
             )
 
+        import numpy as np
+
         amounts = [payment.amount for payment in payments]
 
-        average_amount = Decimal(str(np.mean(amounts)))
-        std_dev_amount = Decimal(str(np.std(amounts)))
-        min_amount = min(amounts)
-        max_amount = max(amounts)
-        total_amount = sum(amounts)
+        # Round to money precision so results validate as MoneyDecimal
+        average_amount = DecimalPrecision.round_for_display(
+            Decimal(str(np.mean(amounts)))
+        )
+        std_dev_amount = DecimalPrecision.round_for_display(
+            Decimal(str(np.std(amounts)))
+        )
+        min_amount = DecimalPrecision.round_for_display(min(amounts))
+        max_amount = DecimalPrecision.round_for_display(max(amounts))
+        total_amount = DecimalPrecision.round_for_display(sum(amounts))
 
         return (average_amount, std_dev_amount, min_amount, max_amount, total_amount)
 
@@ -229,10 +338,15 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
         """
         Get optimal date range for pattern analysis based on payment dates.
 
+        When given, the default dates also bound the range derived from the
+        payments so it never extends past the requested analysis window.
+
         Args:
             payments (List[Payment]): List of payments to analyze
-            default_start_date (Optional[datetime]): Default start date if no payments
-            default_end_date (Optional[datetime]): Default end date if no payments
+            default_start_date (Optional[datetime]): Default start date if no
+                payments, and earliest start date otherwise
+            default_end_date (Optional[datetime]): Default end date if no
+                payments, and latest end date otherwise
 
         Returns:
             Tuple[datetime, datetime]: Start and end dates for analysis period
@@ -266,6 +380,12 @@ class PaymentPatternRepository(BaseRepository[Payment, int]):
         ) - timedelta(days=1)
         end_date = max_date.replace(hour=23, minute=59, second=59, microsecond=999999)
 
+        # Keep the range within the requested analysis window
+        if default_start_date is not None:
+            start_date = max(start_date, ensure_utc(default_start_date))
+        if default_end_date is not None:
+            end_date = min(end_date, ensure_utc(default_end_date))
+
         return (ensure_utc(start_date), ensure_utc(end_date))
 
     async def get_most_common_category(self, payments: List[Payment]) -> Optional[str]:
@@ -7,7 +7,7 @@ payment-related queries.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy import and_, between, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -163,6 +163,49 @@ class PaymentRepository(BaseRepository[Payment, int]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def get_recent_payment_accounts(
+        self, liability_ids: Sequence[int], limit: int = 5
+    ) -> Dict[int, List[int]]:
+        """
+        Get the accounts that funded the most recent payments of several bills.
+
+        Args:
+            liability_ids (Sequence[int]): Liability IDs
+            limit (int): Number of most recent payments considered per bill
+
+        Returns:
+            Dict[int, List[int]]: Distinct source account IDs keyed by liability
+                ID, most recently used first; bills without payments are omitted
+        """
+        recent = (
+            select(
+                Payment.id,
+                Payment.liability_id,
+                func.row_number()
+                .over(
+                    partition_by=Payment.liability_id,
+                    order_by=desc(Payment.payment_date),
+                )
+                .label("recency"),
+            )
+            .where(Payment.liability_id.in_(liability_ids))
+            .subquery()
+        )
+        query = (
+            select(recent.c.liability_id, PaymentSource.account_id)
+            .join(PaymentSource, PaymentSource.payment_id == recent.c.id)
+            .where(recent.c.recency <= limit)
+            .order_by(recent.c.liability_id, recent.c.recency)
+        )
+        result = await self.session.execute(query)
+
+        accounts: Dict[int, List[int]] = {}
+        for liability_id, account_id in result:
+            bill_accounts = accounts.setdefault(liability_id, [])
+            if account_id not in bill_accounts:
+                bill_accounts.append(account_id)
+        return accounts
+
     async def get_payments_for_account(
         self, account_id: int, include_sources: bool = False
     ) -> List[Payment]:
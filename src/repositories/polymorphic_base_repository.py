@@ -78,6 +78,50 @@ class PolymorphicBaseRepository(BaseRepository[PolyModelType, PKType]):
         """
         return True
 
+    async def get_typed(
+        self, id: PKType, entity_type: str, registry: Any = None
+    ) -> Optional[PolyModelType]:
+        """
+        Get an entity whose polymorphic type the caller already knows.
+
+        Only the base table and that type's table are joined, instead of
+        every subtype table as in get().
+
+        Args:
+            id: The ID of the entity to get
+            entity_type: The polymorphic identity of the entity
+            registry: Optional registry for model class lookup, overrides the class registry
+
+        Returns:
+            The entity, or None if no entity of that type has the ID
+
+        Raises:
+            ValueError: If no registry is provided or no model class is found
+        """
+        registry_to_use = registry or self.registry
+
+        if not registry_to_use:
+            raise ValueError(
+                "No registry provided for polymorphic type lookup. "
+                "Either provide a registry or set the class registry."
+            )
+
+        model_class = registry_to_use.get_model_class(entity_type)
+
+        if not model_class:
+            raise ValueError(
+                f"No model class registered for entity type '{entity_type}'"
+            )
+
+        cached = self._get_cached(id, model_class)
+        if cached is not None:
+            return cached
+
+        result = await self.session.execute(
+            select(model_class).where(model_class.id == id)
+        )
+        return result.scalars().first()
+
     async def create(self, obj_in: Dict[str, Any]) -> PolyModelType:
         """
         Create method is disabled for polymorphic base repository.
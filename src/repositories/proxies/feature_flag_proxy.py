@@ -17,6 +17,7 @@ from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from src.config.providers.feature_flags import ConfigProvider
 from src.errors.feature_flags import FeatureDisabledError
+from src.utils.instrumentation import track_method
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -87,8 +88,10 @@ class FeatureFlagRepositoryProxy:
             # Check if this method is restricted by any feature flags
             await self._check_feature_requirements(name, args, kwargs)
 
-            # Call the original method
-            return await attr(*args, **kwargs)
+            # Call the original method, recording its latency and rows returned
+            with track_method("repository", self._repository_class_name, name) as call:
+                call.result = await attr(*args, **kwargs)
+            return call.result
 
         # Cache the wrapped method
         self._method_cache[name] = wrapped
@@ -118,8 +121,9 @@ class FeatureFlagRepositoryProxy:
         # If no account type found and not a general method, allow it
         if not account_type and not method_name.startswith("get_all"):
             logger.debug(
-                f"No account type found for {self._repository_class_name}.{method_name}, "
-                "allowing method call"
+                "No account type found for %s.%s, allowing method call",
+                self._repository_class_name,
+                method_name,
             )
             return
 
@@ -177,8 +181,10 @@ class FeatureFlagRepositoryProxy:
             # If feature is disabled and this method requires it, raise an error
             if not is_enabled:
                 logger.info(
-                    f"Blocking {self._repository_class_name}.{method_name} due to "
-                    f"disabled feature {feature_name}"
+                    "Blocking %s.%s due to disabled feature %s",
+                    self._repository_class_name,
+                    method_name,
+                    feature_name,
                 )
                 raise FeatureDisabledError(
                     feature_name=feature_name,
@@ -301,7 +307,7 @@ class FeatureFlagRepositoryProxy:
         to ensure the proxy immediately reflects the new values.
         """
         self._feature_check_cache = {}
-        logger.debug(f"Cleared feature check cache for {self._repository_class_name}")
+        logger.debug("Cleared feature check cache for %s", self._repository_class_name)
 
     async def _is_feature_enabled(
         self, feature_name: str, account_type: Optional[str] = None
@@ -353,6 +359,8 @@ class FeatureFlagRepositoryProxy:
         except Exception as e:
             # Log error and allow the operation to proceed (fail open)
             logger.error(
-                f"Error checking feature {feature_name}: {e}. Allowing operation to proceed."
+                "Error checking feature %s: %s. Allowing operation to proceed.",
+                feature_name,
+                e,
             )
             return True
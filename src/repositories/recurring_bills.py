@@ -7,7 +7,7 @@ recurring bill-related queries.
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -313,6 +313,37 @@ class RecurringBillRepository(BaseRepository[RecurringBill, int]):
         count = result.scalar_one()
         return count > 0
 
+    async def get_generated_due_dates(
+        self, recurring_bill_ids: List[int], start_date: datetime, end_date: datetime
+    ) -> Set[Tuple[int, date]]:
+        """
+        Get the due dates already generated for recurring bills in a period.
+
+        Args:
+            recurring_bill_ids (List[int]): Recurring bill IDs
+            start_date (datetime): Start of the period (inclusive)
+            end_date (datetime): End of the period (exclusive)
+
+        Returns:
+            Set[Tuple[int, date]]: (recurring bill ID, due date) of each
+                existing liability
+        """
+        if not recurring_bill_ids:
+            return set()
+        result = await self.session.execute(
+            select(Liability.recurring_bill_id, Liability.due_date).where(
+                and_(
+                    Liability.recurring_bill_id.in_(recurring_bill_ids),
+                    Liability.due_date >= start_date,
+                    Liability.due_date < end_date,
+                )
+            )
+        )
+        return {
+            (recurring_bill_id, due_date.date())
+            for recurring_bill_id, due_date in result.all()
+        }
+
     async def get_upcoming_bills(
         self, start_date: date, end_date: date
     ) -> List[Tuple[RecurringBill, date]]:
@@ -83,7 +83,10 @@ class RecurringIncomeRepository(BaseRepository[RecurringIncome, int]):
         """
         query = (
             select(RecurringIncome)
-            .options(joinedload(RecurringIncome.account))
+            .options(
+                joinedload(RecurringIncome.account),
+                joinedload(RecurringIncome.category),
+            )
             .where(RecurringIncome.active == True)
         )
 
@@ -299,7 +302,10 @@ class RecurringIncomeRepository(BaseRepository[RecurringIncome, int]):
         # Get all active recurring incomes
         query = (
             select(RecurringIncome)
-            .options(joinedload(RecurringIncome.account))
+            .options(
+                joinedload(RecurringIncome.account),
+                joinedload(RecurringIncome.category),
+            )
             .where(RecurringIncome.active == True)
         )
 
@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.sql_functions import days_between, get_dialect_name
 from src.models.transaction_history import TransactionHistory, TransactionType
 from src.repositories.base_repository import BaseRepository
 from src.utils.datetime_utils import (
@@ -219,6 +220,33 @@ class TransactionHistoryRepository(BaseRepository[TransactionHistory, int]):
         total = result.scalar_one_or_none()
         return total or Decimal("0.0")
 
+    async def get_totals_by_account(
+        self, account_ids: Optional[List[int]] = None
+    ) -> Dict[int, Dict[TransactionType, Decimal]]:
+        """
+        Sum transaction amounts per account and type in one query.
+
+        Args:
+            account_ids (List[int], optional): Accounts to sum (defaults to all)
+
+        Returns:
+            Dict[int, Dict[TransactionType, Decimal]]: Totals by account ID and
+                type; accounts and types without transactions are omitted
+        """
+        query = select(
+            TransactionHistory.account_id,
+            TransactionHistory.transaction_type,
+            func.sum(TransactionHistory.amount),
+        ).group_by(TransactionHistory.account_id, TransactionHistory.transaction_type)
+        if account_ids is not None:
+            query = query.where(TransactionHistory.account_id.in_(account_ids))
+
+        result = await self.session.execute(query)
+        totals: Dict[int, Dict[TransactionType, Decimal]] = {}
+        for account_id, transaction_type, total in result.all():
+            totals.setdefault(account_id, {})[transaction_type] = total
+        return totals
+
     async def get_transaction_count(
         self,
         account_id: int,
@@ -375,101 +403,156 @@ class TransactionHistoryRepository(BaseRepository[TransactionHistory, int]):
         Returns:
             List[Dict[str, Any]]: Identified transaction patterns
         """
-        # Get transactions within lookback period using ADR-011 compliant utilities
-        current_date = utc_now()
-        start_date = days_ago(lookback_days)
-        transactions = await self.get_by_date_range(
-            account_id, start_date, current_date
+        patterns = await self.get_transaction_patterns_for_accounts(
+            [account_id], lookback_days
         )
+        return patterns.get(account_id, [])
 
-        # Group transactions by description (simplified pattern detection)
-        patterns = {}
-        for tx in transactions:
-            # Skip transactions with no description
-            if not tx.description:
-                continue
-
-            key = tx.description.lower()
-            if key not in patterns:
-                patterns[key] = {
-                    "description": tx.description,
-                    "count": 0,
-                    "average_amount": Decimal("0.0"),
-                    "transaction_type": tx.transaction_type,
-                    "occurrences": [],
-                }
+    async def get_transaction_patterns_for_accounts(
+        self, account_ids: List[int], lookback_days: int = 90
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Identify recurring transaction patterns for several accounts at once.
+
+        Transactions are grouped by account and lowercased description in the
+        database. Inter-arrival gaps come from a LAG window over each group
+        ordered by transaction date, so counts, amount totals and gap
+        statistics are all aggregated in a single query and only one row per
+        pattern is returned to Python.
+
+        Using ADR-011 compliant datetime handling with utilities.
+
+        Args:
+            account_ids (List[int]): Account IDs to analyze
+            lookback_days (int, optional): Number of days to look back
 
-            patterns[key]["count"] += 1
-            patterns[key]["occurrences"].append(
-                {"date": tx.transaction_date, "amount": tx.amount}
+        Returns:
+            Dict[int, List[Dict[str, Any]]]: Patterns keyed by account ID, each
+                list sorted by confidence (highest first). Accounts without any
+                recurring pattern map to an empty list.
+        """
+        result: Dict[int, List[Dict[str, Any]]] = {
+            account_id: [] for account_id in account_ids
+        }
+        if not account_ids:
+            return result
+
+        # Same inclusive window as get_by_date_range per ADR-011
+        range_start = start_of_day(ensure_utc(days_ago(lookback_days)))
+        range_end = end_of_day(ensure_utc(utc_now()))
+
+        pattern_key = func.lower(TransactionHistory.description)
+        group_window = {
+            "partition_by": (TransactionHistory.account_id, pattern_key),
+            "order_by": TransactionHistory.transaction_date,
+        }
+
+        occurrences = (
+            select(
+                TransactionHistory.account_id.label("account_id"),
+                pattern_key.label("pattern_key"),
+                TransactionHistory.amount.label("amount"),
+                TransactionHistory.transaction_date.label("transaction_date"),
+                func.lag(TransactionHistory.transaction_date)
+                .over(**group_window)
+                .label("previous_date"),
+                func.first_value(TransactionHistory.description)
+                .over(**group_window)
+                .label("first_description"),
+                func.first_value(
+                    TransactionHistory.transaction_type,
+                    type_=TransactionHistory.transaction_type.type,
+                )
+                .over(**group_window)
+                .label("first_type"),
+            )
+            .where(
+                TransactionHistory.account_id.in_(account_ids),
+                TransactionHistory.transaction_date >= range_start,
+                TransactionHistory.transaction_date <= range_end,
+                TransactionHistory.description.is_not(None),
             )
+            .subquery()
+        )
+
+        gap_days = days_between(
+            occurrences.c.transaction_date,
+            occurrences.c.previous_date,
+            get_dialect_name(self.session),
+        )
+        occurrence_count = func.count()
 
-        # Calculate statistics for each pattern
-        result = []
-        for key, data in patterns.items():
-            if data["count"] < 2:
-                continue  # Skip one-time transactions
-
-            # Calculate average amount
-            total = sum(o["amount"] for o in data["occurrences"])
-            data["average_amount"] = total / data["count"]
-
-            # Calculate average days between occurrences
-            if data["count"] > 1:
-                dates = sorted([o["date"] for o in data["occurrences"]])
-                day_diffs = []
-                for i in range(1, len(dates)):
-                    diff_days = (dates[i] - dates[i - 1]).total_seconds() / (
-                        60 * 60 * 24
-                    )
-                    day_diffs.append(diff_days)
-
-                data["average_days_between"] = sum(day_diffs) / len(day_diffs)
-
-                # Estimate confidence (higher count and consistent intervals = higher confidence)
-                count_factor = min(
-                    data["count"] / 10, 1.0
-                )  # Max 1.0 at 10+ occurrences
-
-                # Check for consistency in intervals
-                if day_diffs:
-                    std_dev = (
-                        sum(
-                            (x - (sum(day_diffs) / len(day_diffs))) ** 2
-                            for x in day_diffs
-                        )
-                        / len(day_diffs)
-                    ) ** 0.5
-                    consistency_factor = max(
-                        0, 1.0 - (std_dev / 30)
-                    )  # Lower std_dev = higher consistency
-                else:
-                    consistency_factor = 0.0
-
-                data["confidence"] = (count_factor * 0.6) + (consistency_factor * 0.4)
-
-                # Identify potential recurrence pattern
-                if data["average_days_between"] > 0:
-                    if 25 <= data["average_days_between"] <= 35:
-                        data["pattern_type"] = "Monthly"
-                    elif 6 <= data["average_days_between"] <= 8:
-                        data["pattern_type"] = "Weekly"
-                    elif 13 <= data["average_days_between"] <= 16:
-                        data["pattern_type"] = "Bi-weekly"
-                    else:
-                        data["pattern_type"] = (
-                            f'Every {round(data["average_days_between"])} days'
-                        )
-
-            result.append(data)
-
-        # Sort by confidence (if available) or count
-        return sorted(
-            result,
-            key=lambda x: x.get("confidence", 0) if "confidence" in x else x["count"],
-            reverse=True,
+        query = (
+            select(
+                occurrences.c.account_id,
+                func.max(occurrences.c.first_description).label("description"),
+                func.max(occurrences.c.first_type).label("transaction_type"),
+                occurrence_count.label("count"),
+                func.sum(occurrences.c.amount).label("total_amount"),
+                func.min(occurrences.c.transaction_date).label("first_occurrence"),
+                func.max(occurrences.c.transaction_date).label("last_occurrence"),
+                func.avg(gap_days).label("average_days_between"),
+                func.avg(gap_days * gap_days).label("mean_squared_gap"),
+            )
+            .group_by(occurrences.c.account_id, occurrences.c.pattern_key)
+            .having(occurrence_count >= 2)  # Skip one-time transactions
         )
 
+        rows = (await self.session.execute(query)).all()
+
+        for row in rows:
+            average_gap = float(row.average_days_between or 0.0)
+            # Population variance: E[x^2] - E[x]^2, clamped for float error
+            variance = max(float(row.mean_squared_gap or 0.0) - average_gap**2, 0.0)
+            std_dev = variance**0.5
+
+            # Estimate confidence (higher count and consistent intervals = higher confidence)
+            count_factor = min(row.count / 10, 1.0)  # Max 1.0 at 10+ occurrences
+            consistency_factor = max(
+                0, 1.0 - (std_dev / 30)
+            )  # Lower std_dev = higher consistency
+
+            pattern = {
+                "description": row.description,
+                "count": row.count,
+                "average_amount": Decimal(str(row.total_amount)) / row.count,
+                "transaction_type": row.transaction_type,
+                "first_occurrence": row.first_occurrence,
+                "last_occurrence": row.last_occurrence,
+                "average_days_between": average_gap,
+                "confidence": (count_factor * 0.6) + (consistency_factor * 0.4),
+            }
+
+            # Identify potential recurrence pattern
+            if average_gap > 0:
+                pattern["pattern_type"] = self._classify_recurrence(average_gap)
+
+            result[row.account_id].append(pattern)
+
+        for patterns in result.values():
+            patterns.sort(key=lambda x: x["confidence"], reverse=True)
+
+        return result
+
+    @staticmethod
+    def _classify_recurrence(average_days_between: float) -> str:
+        """
+        Describe a recurrence interval in human-readable form.
+
+        Args:
+            average_days_between (float): Average days between occurrences
+
+        Returns:
+            str: Recurrence pattern label
+        """
+        if 25 <= average_days_between <= 35:
+            return "Monthly"
+        if 6 <= average_days_between <= 8:
+            return "Weekly"
+        if 13 <= average_days_between <= 16:
+            return "Bi-weekly"
+        return f"Every {round(average_days_between)} days"
+
     async def bulk_create_transactions(
         self, account_id: int, transactions: List[Dict[str, Any]]
     ) -> List[TransactionHistory]:
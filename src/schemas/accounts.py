@@ -56,7 +56,7 @@ def validate_account_type(account_type: str, feature_flag_service=None) -> str:
         import logging
 
         logger = logging.getLogger(__name__)
-        logger.error(f"Registry error during account type validation: {str(e)}")
+        logger.error("Registry error during account type validation: %s", e)
         raise
 
 
@@ -283,6 +283,31 @@ class AccountResponse(AccountInDB):
     """
 
 
+class AccountSummary(BaseSchemaValidator):
+    """
+    Schema for the lightweight account projection used by list views.
+
+    Carries only identity, type and balance fields so accounts can be listed
+    without loading any type-specific data beyond the credit fields.
+    """
+
+    id: int = Field(..., gt=0, description="Account ID (unique identifier)")
+    name: str = Field(..., min_length=1, max_length=50, description="Account name")
+    account_type: str = Field(..., description="Account type identifier")
+    current_balance: MoneyDecimal = Field(..., description="Current account balance")
+    available_balance: MoneyDecimal = Field(
+        ..., description="Available account balance"
+    )
+    currency: str = Field(default="USD", description="ISO 4217 currency code")
+    is_closed: bool = Field(default=False, description="Whether the account is closed")
+    credit_limit: Optional[MoneyDecimal] = Field(
+        default=None, description="Credit limit (credit accounts only)"
+    )
+    available_credit: Optional[MoneyDecimal] = Field(
+        default=None, description="Available credit (credit accounts only)"
+    )
+
+
 class AccountStatementHistoryResponse(BaseSchemaValidator):
     """
     Schema for account statement history response.
@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import List
 
 from pydantic import Field, field_validator
 
+from src.common.cashflow_types import TimeResolution
 from src.schemas.base_schema import BaseSchemaValidator, MoneyDecimal
 
 
@@ -157,3 +159,57 @@ class BalanceTrend(BaseSchemaValidator):
             if value != expected_net_change:
                 raise ValueError("net_change must equal end_balance - start_balance")
         return value
+
+
+class BalanceHistoryBucket(BaseSchemaValidator):
+    """
+    Schema for one period of a downsampled balance history series.
+
+    Summarizes every balance record of an account within a day, week or month.
+    """
+
+    period_start: date = Field(..., description="First day of the period")
+    open_balance: MoneyDecimal = Field(
+        ..., description="First recorded balance in the period"
+    )
+    close_balance: MoneyDecimal = Field(
+        ..., description="Last recorded balance in the period"
+    )
+    high_balance: MoneyDecimal = Field(
+        ..., description="Highest recorded balance in the period"
+    )
+    low_balance: MoneyDecimal = Field(
+        ..., description="Lowest recorded balance in the period"
+    )
+    average_balance: MoneyDecimal = Field(
+        ..., description="Average of recorded balances in the period"
+    )
+    open_available_credit: MoneyDecimal | None = Field(
+        None, description="First recorded available credit (credit accounts only)"
+    )
+    close_available_credit: MoneyDecimal | None = Field(
+        None, description="Last recorded available credit (credit accounts only)"
+    )
+    min_available_credit: MoneyDecimal | None = Field(
+        None, description="Lowest recorded available credit (credit accounts only)"
+    )
+    max_available_credit: MoneyDecimal | None = Field(
+        None, description="Highest recorded available credit (credit accounts only)"
+    )
+    record_count: int = Field(
+        ..., ge=1, description="Number of balance records summarized"
+    )
+
+
+class BalanceHistorySeries(BaseSchemaValidator):
+    """
+    Schema for a downsampled balance history series.
+    """
+
+    account_id: int = Field(..., gt=0, description="ID of the account")
+    resolution: TimeResolution = Field(
+        ..., description="Bucket size of the series (daily, weekly or monthly)"
+    )
+    buckets: List[BalanceHistoryBucket] = Field(
+        default_factory=list, description="Periods in chronological order"
+    )
@@ -6,11 +6,25 @@ ensuring consistent datetime handling and decimal precision validation across
 all API boundaries.
 """
 
+import types
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Annotated, Dict
-
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 # 2 decimal places for monetary values (e.g., $100.00)
 MoneyDecimal = Annotated[
@@ -58,6 +72,93 @@ RatioDict = Dict[str, RatioDecimal]
 IntMoneyDict = Dict[int, MoneyDecimal]
 IntPercentageDict = Dict[int, PercentageDecimal]
 
+SchemaT = TypeVar("SchemaT", bound="BaseSchemaValidator")
+
+# Kinds of decimal dictionary fields checked by validate_decimal_dictionaries
+_MONEY_DICT = "money"
+_PERCENTAGE_DICT = "percentage"
+_CORRELATION_DICT = "correlation"
+_RATIO_DICT = "ratio"
+
+
+def _decimal_dict_kind(annotation: Any) -> Optional[str]:
+    if annotation in (MoneyDict, IntMoneyDict):
+        return _MONEY_DICT
+    if annotation in (PercentageDict, IntPercentageDict):
+        return _PERCENTAGE_DICT
+    if annotation == CorrelationDict:
+        return _CORRELATION_DICT
+    if annotation == RatioDict:
+        return _RATIO_DICT
+    return None
+
+
+def _may_hold_datetime(annotation: Any) -> bool:
+    """Whether a field with this annotation can hold a datetime value."""
+    if annotation is Any or annotation is object:
+        return True
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _may_hold_datetime(get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        return any(_may_hold_datetime(arg) for arg in get_args(annotation))
+    if origin is not None:
+        # Containers such as List[datetime]; only top-level values are checked
+        return False
+    if isinstance(annotation, type):
+        return issubclass(annotation, datetime)
+    # Unresolved forward references, type variables and the like may resolve
+    # to anything, so they are checked
+    return True
+
+
+class _FieldMetadata(NamedTuple):
+    """Fields of a schema class that its model validators need to inspect."""
+
+    datetime_fields: Tuple[str, ...]
+    # Field names and aliases that may carry datetimes in model_validate input
+    datetime_input_keys: Tuple[str, ...]
+    decimal_dict_fields: Tuple[Tuple[str, str], ...]  # (field name, kind)
+
+
+def _field_metadata(cls: type) -> _FieldMetadata:
+    """Get the field metadata of a schema class, computing it on first use."""
+    metadata = cls.__dict__.get("__schema_field_metadata__")
+    if metadata is None:
+        datetime_fields = []
+        input_keys = []
+        decimal_dict_fields = []
+        for name, field_info in cls.model_fields.items():
+            if _may_hold_datetime(field_info.annotation):
+                datetime_fields.append(name)
+                input_keys.append(name)
+                for alias in (field_info.alias, field_info.validation_alias):
+                    if isinstance(alias, str) and alias not in input_keys:
+                        input_keys.append(alias)
+            kind = _decimal_dict_kind(field_info.annotation)
+            if kind is not None:
+                decimal_dict_fields.append((name, kind))
+        metadata = _FieldMetadata(
+            tuple(datetime_fields), tuple(input_keys), tuple(decimal_dict_fields)
+        )
+        # Stored per class rather than inherited, since subclasses add fields
+        type.__setattr__(cls, "__schema_field_metadata__", metadata)
+    return metadata
+
+
+def _with_utc_datetimes(data: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Label naive datetimes under the given keys as UTC, copying only if needed."""
+    copied = False
+    for key in keys:
+        value = data.get(key)
+        if isinstance(value, datetime) and value.tzinfo is None:
+            if not copied:
+                # Copy to avoid modifying the original object
+                data = dict(data)
+                copied = True
+            data[key] = value.replace(tzinfo=timezone.utc)
+    return data
+
 
 class BaseSchemaValidator(BaseModel):
     """Base schema validator with UTC timezone enforcement and decimal precision handling.
@@ -120,13 +221,11 @@ class BaseSchemaValidator(BaseModel):
             The validated model
         """
         if from_attributes and hasattr(obj, "__dict__"):
-            # Create a copy of the object's dict to avoid modifying the original
-            obj_dict = dict(obj.__dict__)
-
-            # Add UTC timezone to datetime fields
-            for field_name, field_value in obj_dict.items():
-                if isinstance(field_value, datetime) and field_value.tzinfo is None:
-                    obj_dict[field_name] = field_value.replace(tzinfo=timezone.utc)
+            # Only fields that can hold a datetime are checked, and the
+            # object's dict is copied only when one of them is naive
+            obj_dict = _with_utc_datetimes(
+                obj.__dict__, _field_metadata(cls).datetime_input_keys
+            )
 
             # Use the modified dict for validation
             return super().model_validate(obj_dict, strict=strict, context=context)
@@ -136,6 +235,38 @@ class BaseSchemaValidator(BaseModel):
             obj, strict=strict, from_attributes=from_attributes, context=context
         )
 
+    @classmethod
+    def model_validate_list(
+        cls: type[SchemaT], objs: Iterable[Any], *, context=None
+    ) -> List[SchemaT]:
+        """Validate many objects, such as ORM rows for a list response.
+
+        Naive datetimes are labelled as UTC as in model_validate, and the whole
+        list is then validated in one call of a list validator built once per
+        class, rather than one model_validate call per object.
+
+        Args:
+            objs: Objects, or dictionaries, to validate
+            context: Optional validation context
+
+        Returns:
+            The validated models, in order
+        """
+        keys = _field_metadata(cls).datetime_input_keys
+        items = [
+            (
+                _with_utc_datetimes(obj.__dict__, keys)
+                if hasattr(obj, "__dict__")
+                else obj
+            )
+            for obj in objs
+        ]
+        adapter = cls.__dict__.get("__schema_list_adapter__")
+        if adapter is None:
+            adapter = TypeAdapter(List[cls])
+            type.__setattr__(cls, "__schema_list_adapter__", adapter)
+        return adapter.validate_python(items, from_attributes=True, context=context)
+
     # Instead of a wildcard field validator that affects all fields (including discriminators),
     # we use a model validator to check datetime fields after the model is instantiated
     @model_validator(mode="after")
@@ -154,7 +285,9 @@ class BaseSchemaValidator(BaseModel):
         Raises:
             ValueError: If any datetime field is naive (no timezone) or not in UTC
         """
-        for field_name, field_value in self.__dict__.items():
+        values = self.__dict__
+        for field_name in _field_metadata(type(self)).datetime_fields:
+            field_value = values.get(field_name)
             if isinstance(field_value, datetime):
                 if field_value.tzinfo is None:
                     raise ValueError(
@@ -162,7 +295,7 @@ class BaseSchemaValidator(BaseModel):
                         f"Got naive datetime: {field_value}. "
                         "Please provide datetime with UTC timezone (e.g., with Z suffix in ISO format)."
                     )
-                if field_value.utcoffset().total_seconds() != 0:
+                if field_value.utcoffset():
                     raise ValueError(
                         f"Field '{field_name}' must have UTC timezone. "
                         f"Got datetime with non-UTC offset: {field_value} (offset: {field_value.utcoffset()}). "
@@ -178,20 +311,15 @@ class BaseSchemaValidator(BaseModel):
         This validator checks all dictionary fields to ensure decimal values have
         the appropriate precision based on the field's type annotation.
         """
-        for field_name, field_value in self.__dict__.items():
-            # Skip non-dictionary fields
+        values = self.__dict__
+        for field_name, kind in _field_metadata(type(self)).decimal_dict_fields:
+            field_value = values.get(field_name)
+            # Skip non-dictionary values, such as None
             if not isinstance(field_value, dict):
                 continue
 
-            field_info = self.model_fields.get(field_name)
-            if not field_info or not hasattr(field_info, "annotation"):
-                continue
-
-            # Check dictionary field types based on the field annotation
-            annotation = field_info.annotation
-
             # Handle MoneyDict fields
-            if annotation in (MoneyDict, IntMoneyDict):
+            if kind == _MONEY_DICT:
                 for key, value in field_value.items():
                     if isinstance(value, Decimal) and value.as_tuple().exponent < -2:
                         raise ValueError(
@@ -199,7 +327,7 @@ class BaseSchemaValidator(BaseModel):
                         )
 
             # Handle PercentageDict fields
-            elif annotation in (PercentageDict, IntPercentageDict):
+            elif kind == _PERCENTAGE_DICT:
                 for key, value in field_value.items():
                     if isinstance(value, Decimal):
                         # Check decimal places
@@ -214,7 +342,7 @@ class BaseSchemaValidator(BaseModel):
                             )
 
             # Handle CorrelationDict fields
-            elif annotation == CorrelationDict:
+            elif kind == _CORRELATION_DICT:
                 for key, value in field_value.items():
                     if isinstance(value, Decimal):
                         # Check decimal places
@@ -229,7 +357,7 @@ class BaseSchemaValidator(BaseModel):
                             )
 
             # Handle RatioDict fields
-            elif annotation == RatioDict:
+            elif kind == _RATIO_DICT:
                 for key, value in field_value.items():
                     if isinstance(value, Decimal) and value.as_tuple().exponent < -4:
                         raise ValueError(
@@ -258,10 +386,14 @@ class BaseSchemaValidator(BaseModel):
         Returns:
             The model instance with timezone-aware datetime fields
         """
-        for field_name, field_value in self.__dict__.items():
+        local_tz = None
+        values = self.__dict__
+        for field_name in _field_metadata(type(self)).datetime_fields:
+            field_value = values.get(field_name)
             if isinstance(field_value, datetime) and field_value.tzinfo is None:
-                # Get the local timezone
-                local_tz = datetime.now().astimezone().tzinfo
+                # Get the local timezone, once per model
+                if local_tz is None:
+                    local_tz = datetime.now().astimezone().tzinfo
 
                 # For naive datetimes (e.g., from default_factory=datetime.now),
                 # first make it timezone-aware as local time
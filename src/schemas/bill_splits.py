@@ -280,6 +280,139 @@ class ImpactAnalysis(BaseSchemaValidator):
     )
 
 
+class SplitCandidate(BaseSchemaValidator):
+    """
+    Schema for one candidate allocation of a liability across accounts.
+
+    Candidates are hypothetical; evaluating them never writes splits.
+    """
+
+    allocations: IntMoneyDict = Field(
+        ..., min_length=1, description="Amount allocated to each account ID"
+    )
+    label: Optional[str] = Field(
+        None, max_length=100, description="Optional caller-supplied label"
+    )
+
+    @model_validator(mode="after")
+    def validate_allocations(self) -> "SplitCandidate":
+        """
+        Validate that every allocation amount is positive.
+
+        Returns:
+            SplitCandidate: The validated candidate
+
+        Raises:
+            ValueError: If any allocation is zero or negative
+        """
+        for account_id, amount in self.allocations.items():
+            if amount <= 0:
+                raise ValueError(
+                    f"Allocation for account {account_id} must be greater than 0"
+                )
+        return self
+
+
+class SplitCandidateEvaluationRequest(BaseSchemaValidator):
+    """
+    Schema for evaluating many candidate split allocations in one request.
+    """
+
+    liability_id: int = Field(..., gt=0, description="ID of the liability to split")
+    candidates: List[SplitCandidate] = Field(
+        ..., min_length=1, max_length=500, description="Allocations to evaluate"
+    )
+    top_k: int = Field(
+        5, ge=1, le=100, description="Number of best candidates to return"
+    )
+
+
+class SplitCandidateScore(BaseSchemaValidator):
+    """
+    Schema for the evaluation of a single candidate allocation.
+
+    Credit utilization is the projected ratio of balance plus 30-day
+    obligations plus the allocation to the credit limit, capped at 1.
+    """
+
+    candidate_index: int = Field(
+        ..., ge=0, description="Position of the candidate in the request"
+    )
+    label: Optional[str] = Field(None, description="Label supplied with the candidate")
+    allocations: IntMoneyDict = Field(..., description="Evaluated allocation")
+    credit_utilization: IntPercentageDict = Field(
+        ..., description="Projected utilization ratio per credit account"
+    )
+    short_term_impact: IntMoneyDict = Field(
+        ..., description="30-day impact per account"
+    )
+    long_term_impact: IntMoneyDict = Field(..., description="90-day impact per account")
+    risk_score: PercentageDecimal = Field(
+        ..., description="Risk score for the allocation"
+    )
+    optimization_score: PercentageDecimal = Field(
+        ..., description="Overall optimization score"
+    )
+    is_feasible: bool = Field(
+        ...,
+        description="Whether the allocation covers the liability without "
+        "overdrawing or exceeding a credit limit",
+    )
+    risk_factors: List[str] = Field(..., description="Identified risk factors")
+
+
+class SplitCandidateEvaluationResponse(BaseSchemaValidator):
+    """
+    Schema for the ranked results of a batch candidate evaluation.
+
+    Feasible candidates rank ahead of infeasible ones, then by optimization
+    score.
+    """
+
+    liability_id: int = Field(..., gt=0, description="ID of the liability split")
+    evaluated_count: int = Field(
+        ..., ge=0, description="Number of candidates evaluated"
+    )
+    results: List[SplitCandidateScore] = Field(
+        ..., description="Best candidates, highest ranked first"
+    )
+
+
+class OptimizedLiabilitySplit(BaseSchemaValidator):
+    """
+    Schema for the optimal allocation of a single liability.
+    """
+
+    liability_id: int = Field(..., gt=0, description="ID of the liability")
+    amount: MoneyDecimal = Field(..., description="Liability amount")
+    due_date: datetime = Field(..., description="Liability due date (UTC timezone)")
+    allocations: IntMoneyDict = Field(
+        ..., description="Optimal amount to draw from each account ID"
+    )
+    unallocated_amount: MoneyDecimal = Field(
+        ..., ge=0, description="Amount no account could fund without overdrawing"
+    )
+
+
+class SplitOptimizationResult(BaseSchemaValidator):
+    """
+    Schema for a cost-minimizing split plan across one or more liabilities.
+
+    Liabilities are solved jointly, so an account is never committed to one
+    bill when it is needed to cover another due before its next deposit.
+    """
+
+    liabilities: List[OptimizedLiabilitySplit] = Field(
+        ..., description="Optimal splits ordered by due date"
+    )
+    estimated_interest: MoneyDecimal = Field(
+        ..., ge=0, description="Estimated one-month interest on credit allocations"
+    )
+    is_feasible: bool = Field(
+        ..., description="Whether every liability could be fully funded"
+    )
+
+
 class HistoricalAnalysis(BaseSchemaValidator):
     """
     Schema for comprehensive historical analysis results.
@@ -24,6 +24,9 @@ from src.schemas.cashflow.cashflow_forecasting import (
     CustomForecastParameters,
     CustomForecastResponse,
     CustomForecastResult,
+    ProbabilisticForecastDay,
+    ProbabilisticForecastParameters,
+    ProbabilisticForecastResponse,
 )
 from src.schemas.cashflow.cashflow_historical import (
     HistoricalPeriodAnalysis,
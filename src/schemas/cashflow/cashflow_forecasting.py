@@ -254,3 +254,107 @@ class AccountForecastResponse(BaseSchemaValidator):
     timestamp: datetime = Field(
         ..., description="When this forecast was generated in UTC timezone"
     )
+
+
+class ProbabilisticForecastParameters(BaseSchemaValidator):
+    """
+    Schema for probabilistic (Monte Carlo) forecast parameters.
+
+    Income timing and amounts and variable bill amounts are sampled from
+    their historical patterns across many simulated paths.
+    All datetime fields are stored in UTC timezone.
+    """
+
+    start_date: datetime = Field(
+        ..., description="Start date for the forecast in UTC timezone"
+    )
+    end_date: datetime = Field(
+        ..., description="End date for the forecast in UTC timezone"
+    )
+    account_ids: Optional[List[int]] = Field(
+        None, description="Specific accounts to include in forecast"
+    )
+    include_pending: bool = Field(
+        True, description="Whether to include pending income records"
+    )
+    include_income_patterns: bool = Field(
+        True,
+        description=(
+            "Whether to simulate recurring income detected from income history "
+            "(detected across all accounts)"
+        ),
+    )
+    paths: int = Field(
+        default=2000,
+        ge=100,
+        le=20000,
+        description="Number of simulated balance paths",
+    )
+    seed: Optional[int] = Field(
+        None, ge=0, description="Random seed for reproducible results"
+    )
+    overdraft_threshold: MoneyDecimal = Field(
+        default=Decimal("0"),
+        description="Balance below which a simulated path counts as overdrawn",
+    )
+
+
+class ProbabilisticForecastDay(BaseSchemaValidator):
+    """
+    Schema for one day of a probabilistic forecast.
+
+    Balance bands are percentiles of the simulated closing balance.
+    All datetime fields are stored in UTC timezone.
+    """
+
+    date: datetime = Field(..., description="Date of this forecast point in UTC")
+    percentile_5: MoneyDecimal = Field(
+        ..., description="Closing balance exceeded by 95% of simulated paths"
+    )
+    percentile_25: MoneyDecimal = Field(
+        ..., description="Closing balance exceeded by 75% of simulated paths"
+    )
+    median: MoneyDecimal = Field(..., description="Median simulated closing balance")
+    percentile_75: MoneyDecimal = Field(
+        ..., description="Closing balance exceeded by 25% of simulated paths"
+    )
+    percentile_95: MoneyDecimal = Field(
+        ..., description="Closing balance exceeded by 5% of simulated paths"
+    )
+    mean_balance: MoneyDecimal = Field(
+        ..., description="Mean simulated closing balance"
+    )
+    overdraft_probability: PercentageDecimal = Field(
+        ...,
+        description="Share of simulated paths below the overdraft threshold (0-1)",
+    )
+
+
+class ProbabilisticForecastResponse(BaseSchemaValidator):
+    """
+    Schema for probabilistic forecast response.
+
+    Contains per-day balance bands with the simulation metadata.
+    All datetime fields are stored in UTC timezone.
+    """
+
+    parameters: ProbabilisticForecastParameters = Field(
+        ..., description="Parameters used for this forecast"
+    )
+    days: List[ProbabilisticForecastDay] = Field(..., description="Daily balance bands")
+    starting_balance: MoneyDecimal = Field(
+        ..., description="Combined available balance the paths start from"
+    )
+    overdraft_probability: PercentageDecimal = Field(
+        ...,
+        description="Share of simulated paths overdrawn on any day of the period",
+    )
+    income_streams: int = Field(
+        ..., ge=0, description="Number of recurring income patterns simulated"
+    )
+    variable_bills: int = Field(
+        ..., ge=0, description="Number of bills with amounts sampled from history"
+    )
+    timestamp: datetime = Field(
+        ..., description="When this forecast was generated in UTC timezone"
+    )
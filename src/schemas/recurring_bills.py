@@ -102,7 +102,8 @@ class GenerateBillsRequest(BaseSchemaValidator):
     """
     Schema for generating bills from a recurring bill pattern.
 
-    Used to create one-time bills from recurring bill templates for a specific month.
+    Used to create one-time bills from recurring bill templates for a specific month,
+    or for a run of consecutive months starting there.
     """
 
     month: int = Field(
@@ -111,3 +112,9 @@ class GenerateBillsRequest(BaseSchemaValidator):
     year: int = Field(
         ..., ge=2000, le=3000, description="Year for which to generate bills"
     )
+    months: int = Field(
+        default=1,
+        ge=1,
+        le=36,
+        description="Number of consecutive months to generate, starting at month",
+    )
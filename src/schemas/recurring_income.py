@@ -144,10 +144,17 @@ class GenerateIncomeRequest(BaseSchemaValidator):
     """
     Schema for generating income entries from a recurring pattern.
 
-    Used to create actual income entries from recurring income patterns for a specific month.
+    Used to create actual income entries from recurring income patterns for a specific
+    month, or for a run of consecutive months starting there.
     """
 
     month: int = Field(
         ..., ge=1, le=12, description="Month to generate income for (1-12)"
     )
     year: int = Field(..., ge=2000, le=3000, description="Year to generate income for")
+    months: int = Field(
+        default=1,
+        ge=1,
+        le=36,
+        description="Number of consecutive months to generate, starting at month",
+    )
@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.utils.datetime_utils import ensure_utc
+
 
 async def validate_create(session: AsyncSession, data: Dict[str, Any]) -> None:
     """
@@ -49,7 +51,7 @@ async def validate_create(session: AsyncSession, data: Dict[str, Any]) -> None:
         next_payment_date = data["next_payment_date"]
         now = datetime.now(timezone.utc)
 
-        if next_payment_date < now:
+        if next_payment_date and ensure_utc(next_payment_date) < now:
             raise ValueError("Next payment date must be in the future")
 
     # Validate installments paid does not exceed installment count
@@ -147,9 +149,9 @@ async def update_overview(
         account: BNPL account model instance
         overview: Overview dictionary to update
     """
-    # BNPL balance is considered debt
-    overview["bnpl_balance"] += account.current_balance
-    overview["total_debt"] += account.current_balance
+    # BNPL balance is considered debt whichever sign it is stored with
+    overview["bnpl_balance"] += abs(account.current_balance)
+    overview["total_debt"] += abs(account.current_balance)
 
 
 async def get_upcoming_payments(
@@ -183,7 +185,7 @@ async def get_upcoming_payments(
     if (
         account.installments_paid < account.installment_count
         and account.next_payment_date
-        and now <= account.next_payment_date <= end_date
+        and now <= ensure_utc(account.next_payment_date) <= end_date
     ):
 
         upcoming_payments.append(
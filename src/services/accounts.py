@@ -7,22 +7,33 @@ update, deletion, and specialized operations like statement balance and credit l
 Refactored to comply with ADR-014 Repository Layer Compliance.
 """
 
+import logging
 from datetime import date
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.accounts import Account as AccountModel
+from src.models.transaction_history import TransactionType
 from src.registry.account_types import account_type_registry
 from src.repositories.accounts import AccountRepository
 from src.repositories.credit_limit_history import CreditLimitHistoryRepository
 from src.repositories.statement_history import StatementHistoryRepository
 from src.repositories.transaction_history import TransactionHistoryRepository
-from src.schemas.account_types import AccountCreateUnion, AccountResponseUnion
 from src.schemas.accounts import (
     AccountInDB,
     AccountStatementHistoryResponse,
+    AccountSummary,
     AccountUpdate,
     AvailableCreditResponse,
     StatementBalanceHistory,
@@ -37,6 +48,13 @@ from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
 from src.utils.decimal_precision import DecimalPrecision
 
+# The discriminated unions build every account type's schemas; they are only
+# needed for annotations here, so importing the service stays cheap
+if TYPE_CHECKING:
+    from src.schemas.account_types import AccountCreateUnion, AccountResponseUnion
+
+logger = logging.getLogger(__name__)
+
 
 class AccountService(BaseService):
     """
@@ -67,9 +85,6 @@ class AccountService(BaseService):
         """
         super().__init__(session, feature_flag_service, config_provider)
 
-        # Storage for dynamically loaded type-specific functions
-        self._type_specific_functions: Dict[str, Callable] = {}
-
     async def validate_account_balance(
         self, account: AccountModel, amount: Decimal
     ) -> Tuple[bool, Optional[str]]:
@@ -243,8 +258,8 @@ class AccountService(BaseService):
             account.available_credit = DecimalPrecision.round_for_display(available)
 
     async def create_account(
-        self, account_data: AccountCreateUnion
-    ) -> AccountResponseUnion:
+        self, account_data: "AccountCreateUnion"
+    ) -> "AccountResponseUnion":
         """
         Create a new account of the appropriate type
 
@@ -434,8 +449,8 @@ class AccountService(BaseService):
             )
 
         # Check for pending transactions
-        pending_debits = await self._get_pending_transactions(account.id)
-        pending_credits = await self._get_pending_payments(account.id)
+        pending_debits = account.pending_debit_total or Decimal(0)
+        pending_credits = account.pending_credit_total or Decimal(0)
 
         if pending_debits > Decimal(0) or pending_credits > Decimal(0):
             return False, "Cannot delete account with pending transactions"
@@ -492,7 +507,26 @@ class AccountService(BaseService):
         account_repo = await self._get_repository(AccountRepository)
 
         accounts = await account_repo.get_active_accounts()
-        return [AccountInDB.model_validate(account) for account in accounts]
+        return AccountInDB.model_validate_list(accounts)
+
+    async def list_account_summaries(
+        self, include_closed: bool = True
+    ) -> List[AccountSummary]:
+        """
+        List a lightweight summary of every account.
+
+        Args:
+            include_closed: Whether to include closed accounts
+
+        Returns:
+            List of account summaries ordered by name
+        """
+        account_repo = await self._get_repository(AccountRepository)
+
+        summaries = await account_repo.get_account_summaries(
+            include_closed=include_closed
+        )
+        return AccountSummary.model_validate_list(summaries)
 
     async def validate_statement_update(
         self,
@@ -746,9 +780,9 @@ class AccountService(BaseService):
                 "Available credit calculation only available for credit accounts"
             )
 
-        # Get pending payments and transactions using transaction repository
-        pending_debits = await self._get_pending_transactions(account_id)
-        pending_credits = await self._get_pending_payments(account_id)
+        # Running totals maintained by the TransactionService
+        pending_debits = db_account.pending_debit_total or Decimal(0)
+        pending_credits = db_account.pending_credit_total or Decimal(0)
 
         # Calculate real-time available credit with proper precision
         current_balance = db_account.available_balance
@@ -826,37 +860,58 @@ class AccountService(BaseService):
         # If balance is negative (debit), subtract from limit
         return credit_account.credit_limit - abs(credit_account.available_balance)
 
-    async def _get_pending_transactions(self, account_id: int) -> Decimal:
+    async def reconcile_pending_totals(
+        self, account_ids: Optional[List[int]] = None
+    ) -> Dict[str, int]:
         """
-        Get sum of pending debit transactions
+        Verify accounts' running transaction totals against transaction history.
+
+        Intended for scheduled jobs; the TransactionService keeps the totals
+        current, so drift only appears when transaction_history is written
+        some other way. Totals that differ from the full aggregate are
+        logged and corrected.
 
         Args:
-            account_id: ID of the account to get transactions for
+            account_ids: Accounts to check (defaults to every account)
 
         Returns:
-            Sum of pending debit transactions
+            Dict[str, int]: Number of accounts checked and corrected
         """
-        # Get transaction repository
+        account_repo = await self._get_repository(AccountRepository)
         transaction_repo = await self._get_repository(TransactionHistoryRepository)
 
-        transactions = await transaction_repo.get_debit_sum_for_account(account_id)
-        return transactions or Decimal(0)
-
-    async def _get_pending_payments(self, account_id: int) -> Decimal:
-        """
-        Get sum of pending credit transactions
+        stored_totals = await account_repo.get_pending_totals(account_ids)
+        actual_totals = await transaction_repo.get_totals_by_account(
+            list(stored_totals)
+        )
 
-        Args:
-            account_id: ID of the account to get transactions for
+        corrected = 0
+        for account_id, (stored_debits, stored_credits) in stored_totals.items():
+            totals = actual_totals.get(account_id, {})
+            debits = DecimalPrecision.round_for_calculation(
+                totals.get(TransactionType.DEBIT, Decimal(0))
+            )
+            credits = DecimalPrecision.round_for_calculation(
+                totals.get(TransactionType.CREDIT, Decimal(0))
+            )
+            if debits == (stored_debits or Decimal(0)) and credits == (
+                stored_credits or Decimal(0)
+            ):
+                continue
 
-        Returns:
-            Sum of pending credit transactions
-        """
-        # Get transaction repository
-        transaction_repo = await self._get_repository(TransactionHistoryRepository)
+            logger.warning(
+                "Pending totals of account %s drifted: debits %s (stored %s), "
+                "credits %s (stored %s)",
+                account_id,
+                debits,
+                stored_debits,
+                credits,
+                stored_credits,
+            )
+            await account_repo.set_pending_totals(account_id, debits, credits)
+            corrected += 1
 
-        payments = await transaction_repo.get_credit_sum_for_account(account_id)
-        return payments or Decimal(0)
+        return {"accounts_checked": len(stored_totals), "accounts_corrected": corrected}
 
     async def get_statement_history(
         self, account_id: int
@@ -913,7 +968,7 @@ class AccountService(BaseService):
         existing_obj: Any = None,
     ) -> None:
         """
-        Apply type-specific validation using dynamically loaded validation functions.
+        Apply type-specific validation using the service dispatch table.
 
         Args:
             account_type: Account type for which to load validation
@@ -925,33 +980,28 @@ class AccountService(BaseService):
             ValueError: If validation fails
         """
         # The feature flag check has been moved to the ServiceProxy layer
-
-        # Use the ServiceFactory to dynamically bind service modules
         from src.services.factory import ServiceFactory
 
-        # Try to load and bind the service module
-        success = ServiceFactory.bind_account_type_service(
-            self, account_type, self._session
+        validator_func = ServiceFactory.get_dispatch_table().get(
+            account_type, validation_type
         )
-        if not success:
+        if validator_func is None:
             return
 
-        # Check if we have a type-specific validator function
-        function_key = f"{account_type}.{validation_type}"
-        if function_key in self._type_specific_functions:
-            validator_func = self._type_specific_functions[function_key]
+        # Type-specific validators work on plain dictionaries
+        if hasattr(data, "model_dump"):
+            data = data.model_dump()
 
-            # Call the validator function with appropriate arguments
-            if existing_obj:
-                await validator_func(data, existing_obj)
-            else:
-                await validator_func(data)
+        if existing_obj:
+            await validator_func(self._session, data, existing_obj)
+        else:
+            await validator_func(self._session, data)
 
     async def _apply_type_specific_function(
         self, account_type: str, function_name: str, *args, **kwargs
     ) -> Any:
         """
-        Apply type-specific function using dynamically loaded functions.
+        Apply a type-specific function using the service dispatch table.
 
         Args:
             account_type: Account type for which to load function
@@ -965,27 +1015,57 @@ class AccountService(BaseService):
         Note:
             Feature flag checks are handled by the ServiceProxy layer
         """
-        # The feature flag check has been moved to the ServiceProxy layer
-
-        # Use the ServiceFactory to dynamically bind service modules
         from src.services.factory import ServiceFactory
 
-        # Try to load and bind the service module
-        success = ServiceFactory.bind_account_type_service(
-            self, account_type, self._session
-        )
-        if not success:
+        func = ServiceFactory.get_dispatch_table().get(account_type, function_name)
+        if func is None:
             return None
 
-        # Check if we have a type-specific function
-        function_key = f"{account_type}.{function_name}"
-        if function_key in self._type_specific_functions:
-            func = self._type_specific_functions[function_key]
+        return await func(self._session, *args, **kwargs)
 
-            # Call the function with the provided arguments
-            return await func(*args, **kwargs)
+    async def _apply_type_specific_function_to_accounts(
+        self,
+        function_name: str,
+        accounts: Iterable[AccountModel],
+        *args,
+        account_arg: Callable[[AccountModel], Any] = lambda account: account,
+        **kwargs,
+    ) -> Dict[int, Any]:
+        """
+        Apply a type-specific function to many accounts.
 
-        return None
+        The function is resolved once per account type rather than once per
+        account, which keeps overview pages cheap for users with many accounts.
+
+        Args:
+            function_name: Name of function to call
+            accounts: Accounts to apply the function to
+            *args: Positional arguments passed after the account argument
+            account_arg: Maps an account to the argument passed for it
+                (defaults to the account itself)
+            **kwargs: Keyword arguments to pass to the function
+
+        Returns:
+            Dict[int, Any]: Results keyed by account ID; accounts whose type
+                has no such function are omitted
+        """
+        from src.services.factory import ServiceFactory
+
+        dispatch_table = ServiceFactory.get_dispatch_table()
+        accounts_by_type: Dict[str, List[AccountModel]] = {}
+        for account in accounts:
+            accounts_by_type.setdefault(account.account_type, []).append(account)
+
+        results: Dict[int, Any] = {}
+        for account_type, type_accounts in accounts_by_type.items():
+            func = dispatch_table.get(account_type, function_name)
+            if func is None:
+                continue
+            for account in type_accounts:
+                results[account.id] = await func(
+                    self._session, account_arg(account), *args, **kwargs
+                )
+        return results
 
     async def get_banking_overview(self, user_id: int) -> Dict[str, Any]:
         """
@@ -1018,18 +1098,19 @@ class AccountService(BaseService):
             "total_debt": Decimal("0.00"),
         }
 
-        # Process each account, updating the overview
-        for account in accounts:
-            if account.is_closed:
-                continue
+        open_accounts = [account for account in accounts if not account.is_closed]
 
-            # Apply type-specific overview update function if available
-            type_specific_update = await self._apply_type_specific_function(
-                account.account_type, "update_overview", account, overview
-            )
+        # Apply type-specific overview update functions where available. They
+        # update the overview in place and return None, so an account counts
+        # as handled whenever its type has such a function.
+        handled = await self._apply_type_specific_function_to_accounts(
+            "update_overview", open_accounts, overview
+        )
 
-            # If there was a type-specific handler, continue to next account
-            if type_specific_update is not None:
+        # Process each remaining account, updating the overview
+        for account in open_accounts:
+            # Skip accounts already handled by a type-specific function
+            if account.id in handled:
                 continue
 
             # Apply basic categorization if no type-specific function was found
@@ -1086,19 +1167,16 @@ class AccountService(BaseService):
         # Get accounts for the user
         accounts = await account_repo.get_by_user(user_id)
 
-        # Process each account type
-        for account in accounts:
-            if account.is_closed:
-                continue
-
-            # Get upcoming payments for this account type if supported
-            account_payments = await self._apply_type_specific_function(
-                account.account_type, "get_upcoming_payments", account.id, days
-            )
-
-            # Add to the list if we got payments
-            if account_payments:
-                upcoming_payments.extend(account_payments)
+        # Get upcoming payments for every account type that supports them
+        account_payments = await self._apply_type_specific_function_to_accounts(
+            "get_upcoming_payments",
+            [account for account in accounts if not account.is_closed],
+            days,
+            account_arg=lambda account: account.id,
+        )
+        for payments in account_payments.values():
+            if payments:
+                upcoming_payments.extend(payments)
 
         # Sort by due date
         return sorted(upcoming_payments, key=lambda x: x["due_date"])
@@ -1120,4 +1198,4 @@ class AccountService(BaseService):
         account_repo = await self._get_repository(AccountRepository)
 
         accounts = await account_repo.get_by_user_and_type(user_id, account_type)
-        return [AccountInDB.model_validate(account) for account in accounts]
+        return AccountInDB.model_validate_list(accounts)
@@ -4,22 +4,123 @@ Balance history service implementation.
 This module provides a service for managing balance history records.
 """
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from statistics import mean, stdev
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.cashflow_types import TimeResolution
 from src.models.balance_history import BalanceHistory
+from src.models.balance_history_rollups import BalanceHistoryRollup
 from src.repositories.accounts import AccountRepository
 from src.repositories.balance_history import BalanceHistoryRepository
+from src.repositories.balance_history_rollups import BalanceHistoryRollupRepository
 from src.schemas.balance_history import BalanceHistoryCreate, BalanceTrend
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
-from src.utils.datetime_utils import ensure_utc, utc_now
+from src.utils.config import settings
+from src.utils.datetime_utils import ensure_utc, naive_utc_now, utc_now
 from src.utils.decimal_precision import DecimalPrecision
 
+ROLLUP_AGGREGATE_FIELDS = (
+    "open_balance",
+    "close_balance",
+    "high_balance",
+    "low_balance",
+    "average_balance",
+    "open_available_credit",
+    "close_available_credit",
+    "min_available_credit",
+    "max_available_credit",
+    "record_count",
+)
+
+
+def _period_start(day: date, resolution: TimeResolution) -> date:
+    """Get the first day of the period containing a date."""
+    if resolution == TimeResolution.MONTHLY:
+        return day.replace(day=1)
+    if resolution == TimeResolution.WEEKLY:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _next_period_start(day: date, resolution: TimeResolution) -> date:
+    """Get the first day of the period following the one containing a date."""
+    start = _period_start(day, resolution)
+    if resolution == TimeResolution.MONTHLY:
+        return (start + timedelta(days=32)).replace(day=1)
+    if resolution == TimeResolution.WEEKLY:
+        return start + timedelta(days=7)
+    return start + timedelta(days=1)
+
+
+def _day_bounds(start_day: date, end_day: date) -> Tuple[datetime, datetime]:
+    """Get naive UTC datetime bounds covering whole days (ADR-011)."""
+    return (
+        datetime.combine(start_day, datetime.min.time()),
+        datetime.combine(end_day, datetime.max.time()),
+    )
+
+
+def _rollup_to_bucket(rollup: BalanceHistoryRollup) -> Dict[str, Any]:
+    """Convert a stored rollup into the bucket dictionary format."""
+    bucket = {field: getattr(rollup, field) for field in ROLLUP_AGGREGATE_FIELDS}
+    bucket["period_start"] = rollup.period_start.date()
+    return bucket
+
+
+def _optional_extreme(values: Iterable[Optional[Decimal]], pick) -> Optional[Decimal]:
+    """Apply min or max to values, ignoring missing ones."""
+    present = [value for value in values if value is not None]
+    return pick(present) if present else None
+
+
+def _merge_ohlc_buckets(
+    buckets: List[Dict[str, Any]], resolution: TimeResolution
+) -> List[Dict[str, Any]]:
+    """
+    Combine chronologically ordered buckets into coarser periods.
+
+    Open values come from the first bucket of each period and close values
+    from the last; averages are weighted by the number of raw records.
+    """
+    merged: Dict[date, Dict[str, Any]] = {}
+    for bucket in buckets:
+        key = _period_start(bucket["period_start"], resolution)
+        current = merged.get(key)
+        if current is None:
+            merged[key] = {**bucket, "period_start": key}
+            continue
+
+        total = current["record_count"] + bucket["record_count"]
+        current["average_balance"] = DecimalPrecision.round_for_calculation(
+            (
+                current["average_balance"] * current["record_count"]
+                + bucket["average_balance"] * bucket["record_count"]
+            )
+            / total
+        )
+        current["record_count"] = total
+        current["close_balance"] = bucket["close_balance"]
+        current["high_balance"] = max(current["high_balance"], bucket["high_balance"])
+        current["low_balance"] = min(current["low_balance"], bucket["low_balance"])
+
+        if current["open_available_credit"] is None:
+            current["open_available_credit"] = bucket["open_available_credit"]
+        if bucket["close_available_credit"] is not None:
+            current["close_available_credit"] = bucket["close_available_credit"]
+        current["min_available_credit"] = _optional_extreme(
+            (current["min_available_credit"], bucket["min_available_credit"]), min
+        )
+        current["max_available_credit"] = _optional_extreme(
+            (current["max_available_credit"], bucket["max_available_credit"]), max
+        )
+
+    return list(merged.values())
+
 
 class BalanceHistoryService(BaseService):
     """
@@ -82,7 +183,57 @@ class BalanceHistoryService(BaseService):
         entry_data["timestamp"] = current_time
 
         # Use repository to create record
-        return await balance_repo.create(entry_data)
+        entry = await balance_repo.create(entry_data)
+
+        # Keep the rollup tiers for this day and month current
+        await self._merge_into_rollups([entry])
+
+        return entry
+
+    async def record_current_balances(
+        self,
+        account_ids: Iterable[int],
+        reconciled_account_ids: Iterable[int] = (),
+    ) -> List[BalanceHistory]:
+        """
+        Record the current balance of several accounts at once.
+
+        Used by the domain event subscriber to turn a batch of committed
+        balance changes into one entry per account and a single rollup
+        update. Credit accounts also record their available credit.
+
+        Args:
+            account_ids (Iterable[int]): Accounts to record
+            reconciled_account_ids (Iterable[int]): Accounts whose balance was
+                just reconciled; their entries are marked as reconciled
+
+        Returns:
+            List[BalanceHistory]: Created entries (missing accounts are skipped)
+        """
+        account_repo = await self._get_repository(AccountRepository)
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+
+        accounts = await account_repo.get_accounts_by_ids(list(account_ids))
+        if not accounts:
+            return []
+
+        reconciled = set(reconciled_account_ids)
+        current_time = naive_utc_now()
+        entries = await balance_repo.bulk_create(
+            [
+                {
+                    "account_id": account.id,
+                    "balance": account.available_balance,
+                    "available_credit": getattr(account, "available_credit", None),
+                    "is_reconciled": account.id in reconciled,
+                    "timestamp": current_time,
+                }
+                for account in accounts
+            ]
+        )
+
+        await self._merge_into_rollups(entries)
+        return entries
 
     async def get_balance_history(
         self,
@@ -333,3 +484,416 @@ class BalanceHistoryService(BaseService):
         """
         balance_repo = await self._get_repository(BalanceHistoryRepository)
         return await balance_repo.get_available_credit_trend(account_id, days)
+
+    async def get_balance_ohlc(
+        self,
+        account_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: TimeResolution = TimeResolution.DAILY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a downsampled open/high/low/close balance series for charting.
+
+        Args:
+            account_id (int): Account ID
+            start_date (datetime): Start date (inclusive)
+            end_date (datetime): End date (inclusive)
+            resolution (TimeResolution): Bucket size for the series
+
+        Returns:
+            List[Dict[str, Any]]: One entry per bucket in chronological order
+        """
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+        return await balance_repo.get_balance_ohlc(
+            account_id,
+            ensure_utc(start_date).replace(tzinfo=None),
+            ensure_utc(end_date).replace(tzinfo=None),
+            resolution,
+        )
+
+    async def find_missing_days_for_accounts(
+        self, account_ids: List[int], days: int = 30
+    ) -> Dict[int, List[date]]:
+        """
+        Find days with no balance records for several accounts at once.
+
+        Args:
+            account_ids (List[int]): Account IDs to check
+            days (int): Number of days to check
+
+        Returns:
+            Dict[int, List[date]]: Missing dates keyed by account ID
+        """
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+        today = utc_now().date()
+        return await balance_repo.get_missing_days_for_accounts(
+            account_ids, today - timedelta(days=days), today
+        )
+
+    async def get_balance_series(
+        self,
+        account_id: int,
+        start_date: date,
+        end_date: date,
+        resolution: TimeResolution = TimeResolution.DAILY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a downsampled balance series using the coarsest sufficient tier.
+
+        Monthly series read the monthly rollup tier; daily and weekly series
+        read the daily tier (weekly buckets are merged from daily rollups).
+        Any period without a stored rollup is filled from raw balance
+        records, so the series is complete even before the next rollup
+        refresh. Reads never write rollups; history recorded before an
+        account's first rollup is rolled up by backfill_rollups.
+
+        Args:
+            account_id (int): Account ID
+            start_date (date): First day of the series (inclusive)
+            end_date (date): Last day of the series (inclusive)
+            resolution (TimeResolution): Bucket size for the series
+
+        Returns:
+            List[Dict[str, Any]]: One entry per period in chronological order
+        """
+        tier = (
+            TimeResolution.MONTHLY
+            if resolution == TimeResolution.MONTHLY
+            else TimeResolution.DAILY
+        )
+        rollup_repo = await self._get_repository(BalanceHistoryRollupRepository)
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+
+        series_start = _period_start(start_date, resolution)
+        range_start, range_end = _day_bounds(series_start, end_date)
+        rollups = await rollup_repo.get_rollups(
+            [account_id], tier, range_start, range_end
+        )
+        by_period = {
+            bucket["period_start"]: bucket
+            for bucket in (_rollup_to_bucket(rollup) for rollup in rollups)
+        }
+
+        missing = []
+        period = _period_start(series_start, tier)
+        while period <= end_date:
+            if period not in by_period:
+                missing.append(period)
+            period = _next_period_start(period, tier)
+
+        if missing:
+            # One raw query spanning every uncovered period; buckets for
+            # periods that already have a rollup are discarded
+            fill_end = min(
+                end_date, _next_period_start(missing[-1], tier) - timedelta(days=1)
+            )
+            missing_periods = set(missing)
+            for bucket in await balance_repo.get_balance_ohlc(
+                account_id, *_day_bounds(missing[0], fill_end), tier
+            ):
+                if bucket["period_start"] in missing_periods:
+                    by_period[bucket["period_start"]] = bucket
+
+        buckets = [by_period[key] for key in sorted(by_period)]
+        if resolution == TimeResolution.WEEKLY:
+            buckets = _merge_ohlc_buckets(buckets, TimeResolution.WEEKLY)
+        return buckets
+
+    async def refresh_rollups(
+        self,
+        start_date: date,
+        end_date: Optional[date] = None,
+        account_ids: Optional[List[int]] = None,
+    ) -> Dict[str, int]:
+        """
+        Rebuild daily and monthly rollups from raw balance records.
+
+        Intended for scheduled jobs and repairs; balances recorded through
+        this service are merged into the rollups as they are written. When a
+        raw retention period is configured, days older than it are skipped
+        because their raw records may already have been compacted.
+
+        Args:
+            start_date (date): First day to rebuild (inclusive)
+            end_date (Optional[date]): Last day to rebuild (defaults to today)
+            account_ids (Optional[List[int]]): Accounts to rebuild (defaults to
+                every account with balance records in the range)
+
+        Returns:
+            Dict[str, int]: Number of daily and monthly rollups written
+        """
+        end_date = end_date or utc_now().date()
+        if settings.BALANCE_HISTORY_RAW_RETENTION_DAYS is not None:
+            horizon = utc_now().date() - timedelta(
+                days=settings.BALANCE_HISTORY_RAW_RETENTION_DAYS
+            )
+            start_date = max(start_date, horizon)
+
+        if account_ids is None:
+            balance_repo = await self._get_repository(BalanceHistoryRepository)
+            account_ids = await balance_repo.get_account_ids_with_history(
+                *_day_bounds(start_date, end_date)
+            )
+        return await self._rebuild_rollups(account_ids, start_date, end_date)
+
+    async def apply_retention_policy(
+        self,
+        raw_retention_days: Optional[int] = None,
+        daily_rollup_retention_days: Optional[int] = None,
+        as_of: Optional[date] = None,
+    ) -> Dict[str, int]:
+        """
+        Compact old raw balance records and daily rollups.
+
+        Raw records older than the raw retention period are rolled up before
+        deletion; reconciled records and records with notes are always kept.
+        Daily rollups older than their retention period are deleted a whole
+        month at a time, leaving the monthly tier to represent them.
+
+        Args:
+            raw_retention_days (Optional[int]): Days of raw records to keep
+                (defaults to BALANCE_HISTORY_RAW_RETENTION_DAYS)
+            daily_rollup_retention_days (Optional[int]): Days of daily rollups
+                to keep (defaults to BALANCE_HISTORY_DAILY_ROLLUP_RETENTION_DAYS)
+            as_of (Optional[date]): Reference day for the policy (defaults to today)
+
+        Returns:
+            Dict[str, int]: Counts of raw records and daily rollups deleted
+
+        Raises:
+            ValueError: If daily rollups would be kept for less time than raw records
+        """
+        if raw_retention_days is None:
+            raw_retention_days = settings.BALANCE_HISTORY_RAW_RETENTION_DAYS
+        if daily_rollup_retention_days is None:
+            daily_rollup_retention_days = (
+                settings.BALANCE_HISTORY_DAILY_ROLLUP_RETENTION_DAYS
+            )
+        if (
+            raw_retention_days is not None
+            and daily_rollup_retention_days is not None
+            and daily_rollup_retention_days < raw_retention_days
+        ):
+            raise ValueError(
+                "Daily rollup retention must not be shorter than raw retention"
+            )
+
+        as_of = as_of or utc_now().date()
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+        rollup_repo = await self._get_repository(BalanceHistoryRollupRepository)
+        summary = {"raw_records_deleted": 0, "daily_rollups_deleted": 0}
+
+        if raw_retention_days is not None:
+            cutoff = as_of - timedelta(days=raw_retention_days)
+            cutoff_start, _ = _day_bounds(cutoff, cutoff)
+            earliest = await balance_repo.get_earliest_compactable_timestamp(
+                cutoff_start
+            )
+            if earliest is not None:
+                last_day = cutoff - timedelta(days=1)
+                account_ids = await balance_repo.get_account_ids_with_history(
+                    *_day_bounds(earliest.date(), last_day)
+                )
+                await self._rebuild_rollups(account_ids, earliest.date(), last_day)
+                summary["raw_records_deleted"] = (
+                    await balance_repo.delete_compactable_before(cutoff_start)
+                )
+
+        if daily_rollup_retention_days is not None:
+            cutoff = _period_start(
+                as_of - timedelta(days=daily_rollup_retention_days),
+                TimeResolution.MONTHLY,
+            )
+            summary["daily_rollups_deleted"] = await rollup_repo.delete_before(
+                TimeResolution.DAILY, cutoff
+            )
+
+        return summary
+
+    async def backfill_rollups(
+        self, account_ids: Optional[List[int]] = None
+    ) -> Dict[str, int]:
+        """
+        Roll up raw history recorded before each account's first rollup.
+
+        Rollups only exist from the first balance recorded through this
+        service, so older or imported history has none, and the month of the
+        first rollup only covers the balances recorded since. Run once after
+        upgrading or importing history (see tools/backfill_balance_rollups.py);
+        accounts whose daily rollups already start at their first raw record
+        are skipped.
+
+        Args:
+            account_ids (Optional[List[int]]): Accounts to backfill (defaults
+                to every account with balance records)
+
+        Returns:
+            Dict[str, int]: Number of daily and monthly rollups written
+        """
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+        rollup_repo = await self._get_repository(BalanceHistoryRollupRepository)
+
+        today = utc_now().date()
+        if account_ids is None:
+            account_ids = await balance_repo.get_account_ids_with_history(
+                *_day_bounds(date.min, today)
+            )
+
+        summary = {"daily": 0, "monthly": 0}
+        for account_id in account_ids:
+            earliest_record = await balance_repo.get_earliest_timestamp(account_id)
+            if earliest_record is None:
+                continue
+            first_day = earliest_record.date()
+
+            first_rollup = await rollup_repo.get_earliest_period_start(
+                account_id, TimeResolution.DAILY
+            )
+            if first_rollup is None:
+                last_day = today
+            elif first_rollup.date() <= first_day:
+                continue
+            else:
+                # Include the whole month of the first rollup so its monthly
+                # rollup is re-merged from a complete daily tier
+                last_day = _next_period_start(
+                    first_rollup.date(), TimeResolution.MONTHLY
+                ) - timedelta(days=1)
+
+            written = await self.refresh_rollups(first_day, last_day, [account_id])
+            summary["daily"] += written["daily"]
+            summary["monthly"] += written["monthly"]
+        return summary
+
+    async def _merge_into_rollups(self, entries: List[BalanceHistory]) -> None:
+        """
+        Merge newly recorded balances into their daily and monthly rollups.
+
+        Each entry is treated as the latest balance of its day and month, so
+        only the touched rollup rows are read and rewritten; no raw records
+        are scanned. Balances recorded out of order leave opening and closing
+        values approximate until refresh_rollups rebuilds those days.
+
+        Args:
+            entries (List[BalanceHistory]): Newly created balance records
+        """
+        if not entries:
+            return
+        rollup_repo = await self._get_repository(BalanceHistoryRollupRepository)
+
+        new_buckets: Dict[int, List[Dict[str, Any]]] = {}
+        for entry in sorted(entries, key=lambda entry: entry.timestamp):
+            new_buckets.setdefault(entry.account_id, []).append(
+                {
+                    "period_start": entry.timestamp.date(),
+                    "open_balance": entry.balance,
+                    "close_balance": entry.balance,
+                    "high_balance": entry.balance,
+                    "low_balance": entry.balance,
+                    "average_balance": entry.balance,
+                    "open_available_credit": entry.available_credit,
+                    "close_available_credit": entry.available_credit,
+                    "min_available_credit": entry.available_credit,
+                    "max_available_credit": entry.available_credit,
+                    "record_count": 1,
+                }
+            )
+        account_ids = list(new_buckets)
+        days = [entry.timestamp.date() for entry in entries]
+
+        for tier in (TimeResolution.DAILY, TimeResolution.MONTHLY):
+            first_period = _period_start(min(days), tier)
+            last_period = _period_start(max(days), tier)
+            stored: Dict[int, Dict[date, Dict[str, Any]]] = {}
+            for rollup in await rollup_repo.get_rollups(
+                account_ids, tier, *_day_bounds(first_period, last_period)
+            ):
+                bucket = _rollup_to_bucket(rollup)
+                stored.setdefault(rollup.account_id, {})[
+                    bucket["period_start"]
+                ] = bucket
+
+            merged = {}
+            for account_id, buckets in new_buckets.items():
+                existing = stored.get(account_id, {})
+                touched = {_period_start(b["period_start"], tier) for b in buckets}
+                merged[account_id] = _merge_ohlc_buckets(
+                    [existing[period] for period in sorted(touched & existing.keys())]
+                    + buckets,
+                    tier,
+                )
+            await rollup_repo.replace_rollups(tier, merged)
+
+    async def _rebuild_rollups(
+        self, account_ids: List[int], start_date: date, end_date: date
+    ) -> Dict[str, int]:
+        """
+        Rebuild daily rollups for a day range and monthly rollups for its months.
+
+        Daily rollups in the range are recomputed from raw records; days
+        without raw records keep their existing rollups. Other days of the
+        same months that have raw records but no rollup yet are rolled up
+        too, so the monthly tier, merged from the daily tier, never misses
+        history that predates the first rollup.
+
+        Args:
+            account_ids (List[int]): Accounts to rebuild
+            start_date (date): First day to rebuild (inclusive)
+            end_date (date): Last day to rebuild (inclusive)
+
+        Returns:
+            Dict[str, int]: Number of daily and monthly rollups written
+        """
+        if not account_ids or start_date > end_date:
+            return {"daily": 0, "monthly": 0}
+
+        balance_repo = await self._get_repository(BalanceHistoryRepository)
+        rollup_repo = await self._get_repository(BalanceHistoryRollupRepository)
+
+        month_start = _period_start(start_date, TimeResolution.MONTHLY)
+        month_end = _next_period_start(end_date, TimeResolution.MONTHLY) - timedelta(
+            days=1
+        )
+        month_bounds = _day_bounds(month_start, month_end)
+        raw_buckets = await balance_repo.get_balance_ohlc_for_accounts(
+            account_ids, *month_bounds, TimeResolution.DAILY
+        )
+        stored: Dict[int, Dict[date, Dict[str, Any]]] = {}
+        for rollup in await rollup_repo.get_rollups(
+            account_ids, TimeResolution.DAILY, *month_bounds
+        ):
+            bucket = _rollup_to_bucket(rollup)
+            stored.setdefault(rollup.account_id, {})[bucket["period_start"]] = bucket
+
+        # Days outside the range keep existing rollups, which may cover raw
+        # records that have since been compacted
+        daily_buckets = {
+            account_id: [
+                bucket
+                for bucket in buckets
+                if start_date <= bucket["period_start"] <= end_date
+                or bucket["period_start"] not in stored.get(account_id, {})
+            ]
+            for account_id, buckets in raw_buckets.items()
+        }
+        daily_written = await rollup_repo.replace_rollups(
+            TimeResolution.DAILY, daily_buckets
+        )
+
+        monthly_buckets = {}
+        for account_id in account_ids:
+            days = dict(stored.get(account_id, {}))
+            days.update(
+                (bucket["period_start"], bucket)
+                for bucket in daily_buckets.get(account_id, [])
+            )
+            if days:
+                monthly_buckets[account_id] = _merge_ohlc_buckets(
+                    [days[day] for day in sorted(days)], TimeResolution.MONTHLY
+                )
+        monthly_written = await rollup_repo.replace_rollups(
+            TimeResolution.MONTHLY, monthly_buckets
+        )
+
+        return {"daily": daily_written, "monthly": monthly_written}
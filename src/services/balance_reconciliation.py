@@ -18,6 +18,7 @@ from src.schemas.balance_reconciliation import (
 )
 from src.services.base import BaseService
 from src.utils.datetime_utils import utc_now
+from src.utils.domain_events import AccountBalanceChanged, domain_events
 
 
 class BalanceReconciliationError(Exception):
@@ -110,10 +111,21 @@ class BalanceReconciliationService(BaseService):
         reconciliation = await reconciliation_repo.create(reconciliation_data_dict)
 
         # Update account balance
-        await account_repo.update(
-            account.id, {"available_balance": reconciliation_data.new_balance}
+        await account_repo.update_typed_entity(
+            account.id,
+            account.account_type,
+            {"available_balance": reconciliation_data.new_balance},
         )
 
+        domain_events.publish(
+            self._session,
+            AccountBalanceChanged(
+                account_id=account.id,
+                balance=reconciliation_data.new_balance,
+                change=adjustment_amount,
+                reason="reconciliation",
+            ),
+        )
         return reconciliation
 
     async def get_reconciliation(
@@ -8,9 +8,9 @@ and repository caching.
 Implements ADR-014 Repository Layer Compliance with improved service-repository integration.
 """
 
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from src.config.providers.feature_flags import (
     DatabaseConfigProvider,
@@ -21,9 +21,13 @@ from src.repositories.factory import RepositoryFactory
 from src.repositories.polymorphic_base_repository import PolymorphicBaseRepository
 from src.repositories.proxies.feature_flag_proxy import FeatureFlagRepositoryProxy
 from src.services.feature_flags import FeatureFlagService
+from src.utils.concurrency import gather_bounded
+from src.utils.config import settings
 
 # Type variable for repository types
 RepoType = TypeVar("RepoType", bound=BaseRepository)
+ServiceType = TypeVar("ServiceType", bound="BaseService")
+T = TypeVar("T")
 
 
 class BaseService:
@@ -132,3 +136,46 @@ class BaseService:
             feature_flag_service=self._feature_flag_service,
             config_provider=config_provider,
         )
+
+    async def _run_independent(
+        self: ServiceType,
+        *steps: Callable[[ServiceType], Awaitable[Any]],
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """
+        Run independent read-only steps, concurrently when the session allows.
+
+        Each step receives the service instance to run on. An AsyncSession
+        cannot be used by concurrent tasks, so when the session is bound to an
+        engine every step runs on a sibling service with its own short-lived
+        session from the same pool, with at most ``limit`` steps in flight.
+        Sibling sessions only see committed data, so sessions bound to a
+        connection (an explicit outer transaction, as in tests) and a limit of
+        1 run the steps one after another on this service instead.
+
+        Subclasses using this must accept (session, feature_flag_service,
+        config_provider) as their constructor arguments.
+
+        Args:
+            *steps: Callables taking a service and returning an awaitable
+            limit: Maximum concurrent steps, ANALYSIS_MAX_CONCURRENCY by default
+
+        Returns:
+            List[Any]: Step results in the order given
+        """
+        limit = settings.ANALYSIS_MAX_CONCURRENCY if limit is None else limit
+        bind = self._session.bind
+        if limit <= 1 or len(steps) <= 1 or not isinstance(bind, AsyncEngine):
+            return [await step(self) for step in steps]
+
+        def sibling_step(step: Callable[[ServiceType], Awaitable[T]]):
+            async def run() -> T:
+                async with AsyncSession(bind, expire_on_commit=False) as session:
+                    sibling = type(self)(
+                        session, self._feature_flag_service, self._config_provider
+                    )
+                    return await step(sibling)
+
+            return run
+
+        return await gather_bounded([sibling_step(step) for step in steps], limit)
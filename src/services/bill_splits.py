@@ -8,16 +8,19 @@ according to ADR-014 Repository Layer Compliance.
 Uses ADR-011 compliant datetime handling with utilities from datetime_utils.
 """
 
+import heapq
 from datetime import date, datetime, timedelta
-from decimal import Decimal
+from decimal import ROUND_FLOOR, Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.accounts import Account
 from src.models.bill_splits import BillSplit
+from src.models.liabilities import Liability
 from src.repositories.accounts import AccountRepository
 from src.repositories.bill_splits import BillSplitRepository
+from src.repositories.income import IncomeRepository
 from src.repositories.liabilities import LiabilityRepository
 from src.schemas.bill_splits import (
     BillSplitCreate,
@@ -31,14 +34,44 @@ from src.schemas.bill_splits import (
     ImpactAnalysis,
     OptimizationMetrics,
     OptimizationSuggestion,
+    OptimizedLiabilitySplit,
     PatternMetrics,
+    SplitCandidate,
+    SplitCandidateEvaluationResponse,
+    SplitCandidateScore,
+    SplitOptimizationResult,
     SplitPattern,
     SplitSuggestion,
 )
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
-from src.utils.datetime_utils import end_of_day, ensure_utc, start_of_day
+from src.utils.compute_executor import run_compute
+from src.utils.datetime_utils import (
+    end_of_day,
+    ensure_utc,
+    last_day_of_month,
+    normalize_db_date,
+    start_of_day,
+    utc_datetime,
+    utc_now,
+)
 from src.utils.decimal_precision import DecimalPrecision
+from src.utils.split_solver import SplitDemand, SplitSolver
+
+# Horizons, in days, used when projecting upcoming split obligations
+SHORT_TERM_DAYS = 30
+LONG_TERM_DAYS = 90
+
+# Split optimizer cost model. Rates are per dollar allocated for one month;
+# credit utilization penalties apply to the band of the limit an allocation
+# falls into, so the cost grows convexly as a card fills up
+OPTIMIZER_COST_SCALE = 1_000_000
+CREDIT_UTILIZATION_PENALTIES = (
+    (Decimal("0.30"), Decimal("0")),
+    (Decimal("0.50"), Decimal("0.01")),
+    (Decimal("0.90"), Decimal("0.05")),
+    (Decimal("1.00"), Decimal("0.25")),
+)
 
 
 class BillSplitValidationError(Exception):
@@ -355,7 +388,8 @@ class BillSplitService(BaseService):
         except Exception as e:
             return False, str(e)
 
-    def _generate_pattern_id(self, splits: List[Dict[str, any]]) -> str:
+    @staticmethod
+    def _generate_pattern_id(splits: List[Dict[str, any]]) -> str:
         """Generate a unique pattern ID from a set of splits."""
         # Sort splits by account ID to ensure consistent pattern IDs
         sorted_splits = sorted(splits, key=lambda x: x["account_id"])
@@ -365,8 +399,9 @@ class BillSplitService(BaseService):
             pattern_parts.append(f"{split['account_id']}:{split['percentage']:.2f}")
         return "|".join(pattern_parts)
 
+    @staticmethod
     def _calculate_confidence_score(
-        self, occurrences: int, total_patterns: int, _first_seen: date, last_seen: date
+        occurrences: int, total_patterns: int, _first_seen: date, last_seen: date
     ) -> float:
         """
         Calculate a confidence score based on frequency and recency.
@@ -381,6 +416,8 @@ class BillSplitService(BaseService):
             float: Confidence score between 0.1 and 0.9
         """
         today = date.today()
+        if isinstance(last_seen, datetime):
+            last_seen = last_seen.date()
         # Days since last seen is more important for recency
         days_since_last = (today - last_seen).days
 
@@ -399,64 +436,43 @@ class BillSplitService(BaseService):
 
         return min(0.9, max(0.1, weighted_score))  # Ensure score is between 0.1 and 0.9
 
-    async def analyze_historical_patterns(
-        self, liability_id: int
-    ) -> HistoricalAnalysis:
+    @staticmethod
+    def _find_split_patterns(
+        split_rows: List[Tuple[int, int, Decimal, datetime]],
+    ) -> Tuple[List[SplitPattern], PatternMetrics]:
         """
-        Perform comprehensive historical analysis of bill splits.
+        Detect split patterns across liabilities' historical splits.
 
         Args:
-            liability_id: ID of the liability to analyze
+            split_rows: (liability_id, account_id, amount, created_at) of each split
 
         Returns:
-            HistoricalAnalysis: Comprehensive analysis of historical bill split patterns
-
-        Raises:
-            BillSplitValidationError: If liability not found
+            Tuple[List[SplitPattern], PatternMetrics]: Patterns ordered by
+                confidence score, and metrics over all splits
         """
-        # Get repositories using BaseService pattern
-        liability_repo = await self._get_repository(LiabilityRepository)
-        bill_split_repo = await self._get_repository(BillSplitRepository)
-
-        # Get the liability with its category
-        liability = await liability_repo.get_with_relationships(liability_id)
-        if not liability:
-            raise BillSplitValidationError(
-                f"Liability with id {liability_id} not found"
+        # Total each liability's splits once rather than once per split
+        liability_totals: Dict[int, Decimal] = {}
+        for liability_id, _, amount, _ in split_rows:
+            liability_totals[liability_id] = (
+                liability_totals.get(liability_id, Decimal("0")) + amount
             )
 
-        # Get all liabilities with same name or category
-        similar_liabilities = await liability_repo.find_similar_liabilities(
-            liability.name, liability.category_id
-        )
-        similar_liability_ids = [liability.id for liability in similar_liabilities]
-
-        # Get all splits for similar liabilities
-        all_splits = await bill_split_repo.get_splits_for_multiple_liabilities(
-            similar_liability_ids
-        )
-
         # Group splits by liability
         liability_splits: Dict[int, List[Dict]] = {}
         total_splits = 0
-        for split in all_splits:
+        for liability_id, account_id, amount, created_at in split_rows:
             total_splits += 1
-            if split.liability_id not in liability_splits:
-                liability_splits[split.liability_id] = []
-
-            # Calculate total for this liability's splits
-            liability_total = sum(
-                s.amount for s in all_splits if s.liability_id == split.liability_id
-            )
-
-            liability_splits[split.liability_id].append(
+            liability_total = liability_totals[liability_id]
+            liability_splits.setdefault(liability_id, []).append(
                 {
-                    "account_id": split.account_id,
-                    "amount": split.amount,
+                    "account_id": account_id,
+                    "amount": amount,
                     "percentage": (
-                        (split.amount / liability_total) if liability_total else 0
+                        DecimalPrecision.round_for_calculation(amount / liability_total)
+                        if liability_total
+                        else 0
                     ),
-                    "created_at": split.created_at,
+                    "created_at": created_at,
                 }
             )
 
@@ -465,7 +481,7 @@ class BillSplitService(BaseService):
         account_usage: Dict[int, int] = {}
 
         for splits in liability_splits.values():
-            pattern_id = self._generate_pattern_id(splits)
+            pattern_id = BillSplitService._generate_pattern_id(splits)
 
             if pattern_id not in patterns:
                 total_amount = sum(split["amount"] for split in splits)
@@ -496,7 +512,7 @@ class BillSplitService(BaseService):
         pattern_objects = []
         for pattern in patterns.values():
             average_total = sum(pattern["amounts"]) / len(pattern["amounts"])
-            confidence_score = self._calculate_confidence_score(
+            confidence_score = BillSplitService._calculate_confidence_score(
                 pattern["total_occurrences"],
                 len(liability_splits),
                 pattern["first_seen"],
@@ -511,7 +527,9 @@ class BillSplitService(BaseService):
                     first_seen=pattern["first_seen"],
                     last_seen=pattern["last_seen"],
                     average_total=average_total,
-                    confidence_score=confidence_score,
+                    confidence_score=DecimalPrecision.round_for_calculation(
+                        Decimal(str(confidence_score))
+                    ),
                 )
             )
 
@@ -529,6 +547,59 @@ class BillSplitService(BaseService):
             account_usage_frequency=account_usage,
         )
 
+        return pattern_objects, metrics
+
+    async def analyze_historical_patterns(
+        self, liability_id: int
+    ) -> HistoricalAnalysis:
+        """
+        Perform comprehensive historical analysis of bill splits.
+
+        Args:
+            liability_id: ID of the liability to analyze
+
+        Returns:
+            HistoricalAnalysis: Comprehensive analysis of historical bill split patterns
+
+        Raises:
+            BillSplitValidationError: If liability not found
+        """
+        # Get repositories using BaseService pattern
+        liability_repo = await self._get_repository(LiabilityRepository)
+        bill_split_repo = await self._get_repository(BillSplitRepository)
+
+        # Get the liability with its category
+        liability = await liability_repo.get_with_relationships(liability_id)
+        if not liability:
+            raise BillSplitValidationError(
+                f"Liability with id {liability_id} not found"
+            )
+
+        # Get all liabilities with same name or category
+        similar_liabilities = await liability_repo.find_similar_liabilities(
+            liability.name, liability.category_id
+        )
+        similar_liability_ids = [liability.id for liability in similar_liabilities]
+
+        # Get all splits for similar liabilities
+        all_splits = await bill_split_repo.get_splits_for_multiple_liabilities(
+            similar_liability_ids
+        )
+
+        # Plain split rows, so pattern detection can run in a worker process
+        split_rows = [
+            (
+                split.liability_id,
+                split.account_id,
+                split.amount,
+                ensure_utc(split.created_at),
+            )
+            for split in all_splits
+        ]
+        pattern_objects, metrics = await run_compute(
+            BillSplitService._find_split_patterns, split_rows
+        )
+
         # Group patterns by category
         category_patterns: Dict[int, List[SplitPattern]] = {}
         if liability.category_id:
@@ -969,58 +1040,20 @@ class BillSplitService(BaseService):
         # Calculate current metrics
         metrics = await self.calculate_optimization_metrics(splits, accounts)
 
-        # Calculate short-term impact (30 days)
-        short_term_impact = {}
-        for split in splits:
-            account = accounts[split.account_id]
-
-            # Get upcoming bills for next 30 days
-            today = date.today()
-            in_30_days = today + timedelta(days=30)
-
-            # Convert to datetime with proper timezone handling using ADR-011 utility functions
-            start_date = start_of_day(
-                ensure_utc(datetime.combine(today, datetime.min.time()))
-            )
-            end_date = end_of_day(
-                ensure_utc(datetime.combine(in_30_days, datetime.min.time()))
-            )
-
-            # Get splits in date range
-            upcoming_bills_splits = await bill_split_repo.get_splits_in_date_range(
-                account.id, start_date, end_date
-            )
+        # Upcoming obligations for every account in one grouped query
+        obligations = await self._get_upcoming_obligations(list(accounts.keys()))
 
-            # Calculate total
-            upcoming_bills = sum(split.amount for split in upcoming_bills_splits)
-            short_term_impact[account.id] = -(upcoming_bills + split.amount)
-
-        # Calculate long-term impact (90 days)
+        short_term_impact = {}
         long_term_impact = {}
         for split in splits:
-            account = accounts[split.account_id]
-
-            # Get upcoming bills for next 90 days
-            today = date.today()
-            in_90_days = today + timedelta(days=90)
-
-            # Convert to datetime with proper timezone handling using ADR-011 utility functions
-            start_date = start_of_day(
-                ensure_utc(datetime.combine(today, datetime.min.time()))
-            )
-            end_date = end_of_day(
-                ensure_utc(datetime.combine(in_90_days, datetime.min.time()))
+            short_total, long_total = obligations[split.account_id]
+            short_term_impact[split.account_id] = DecimalPrecision.round_for_display(
+                -(short_total + split.amount)
             )
-
-            # Get splits in date range
-            upcoming_bills_splits = await bill_split_repo.get_splits_in_date_range(
-                account.id, start_date, end_date
+            long_term_impact[split.account_id] = DecimalPrecision.round_for_display(
+                -(long_total + split.amount)
             )
 
-            # Calculate total
-            upcoming_bills = sum(split.amount for split in upcoming_bills_splits)
-            long_term_impact[account.id] = -(upcoming_bills + split.amount)
-
         # Identify risk factors
         risk_factors = []
         for account_id, utilization in metrics.credit_utilization.items():
@@ -1067,6 +1100,423 @@ class BillSplitService(BaseService):
             recommendations=recommendations,
         )
 
+    async def _get_upcoming_obligations(
+        self, account_ids: List[int], exclude_liability_id: Optional[int] = None
+    ) -> Dict[int, Tuple[Decimal, Decimal]]:
+        """
+        Get 30-day and 90-day split obligations for several accounts.
+
+        Args:
+            account_ids: IDs of the accounts to total
+            exclude_liability_id: Liability whose existing splits are ignored
+
+        Returns:
+            Dict[int, Tuple[Decimal, Decimal]]: (30-day total, 90-day total) per account
+        """
+        bill_split_repo = await self._get_repository(BillSplitRepository)
+
+        today = start_of_day(utc_now())
+        return await bill_split_repo.get_upcoming_totals_by_account(
+            account_ids,
+            today,
+            end_of_day(today + timedelta(days=SHORT_TERM_DAYS)),
+            end_of_day(today + timedelta(days=LONG_TERM_DAYS)),
+            exclude_liability_id=exclude_liability_id,
+        )
+
+    @staticmethod
+    def _score_candidate(
+        candidate_index: int,
+        candidate: SplitCandidate,
+        liability_amount: Decimal,
+        accounts: Dict[int, Account],
+        obligations: Dict[int, Tuple[Decimal, Decimal]],
+    ) -> SplitCandidateScore:
+        """
+        Score one candidate allocation against preloaded account state.
+
+        Performs no I/O so large candidate sets can be scored after a fixed
+        number of queries.
+
+        Args:
+            candidate_index: Position of the candidate in the request
+            candidate: Allocation to score
+            liability_amount: Amount the allocation must cover
+            accounts: Accounts keyed by ID
+            obligations: (30-day, 90-day) obligations keyed by account ID
+
+        Returns:
+            SplitCandidateScore: Scored candidate
+        """
+        credit_utilization = {}
+        short_term_impact = {}
+        long_term_impact = {}
+        risk_factors = []
+        total_risk = Decimal("0")
+        is_feasible = True
+
+        allocated = sum(candidate.allocations.values(), Decimal("0"))
+        if DecimalPrecision.round_for_display(allocated) != (
+            DecimalPrecision.round_for_display(liability_amount)
+        ):
+            is_feasible = False
+            risk_factors.append(
+                f"Allocations total {allocated} but liability amount is {liability_amount}"
+            )
+
+        for account_id, amount in candidate.allocations.items():
+            account = accounts.get(account_id)
+            if account is None:
+                is_feasible = False
+                total_risk += Decimal("1")
+                risk_factors.append(f"Account {account_id} not found")
+                continue
+
+            short_total, long_total = obligations.get(
+                account_id, (Decimal("0"), Decimal("0"))
+            )
+            short_term_impact[account_id] = DecimalPrecision.round_for_display(
+                -(short_total + amount)
+            )
+            long_term_impact[account_id] = DecimalPrecision.round_for_display(
+                -(long_total + amount)
+            )
+
+            if account.account_type == "credit" and account.credit_limit:
+                projected = abs(account.available_balance) + short_total + amount
+                utilization = projected / account.credit_limit
+                credit_utilization[account_id] = DecimalPrecision.round_for_calculation(
+                    min(Decimal("1"), utilization)
+                )
+                # 90% utilization is treated as maximum risk
+                total_risk += min(Decimal("1"), utilization / Decimal("0.9"))
+
+                if utilization > 1:
+                    is_feasible = False
+                    risk_factors.append(f"Credit limit exceeded on {account.name}")
+                elif utilization > Decimal("0.8"):
+                    risk_factors.append(
+                        f"High credit utilization ({utilization:.1%}) on {account.name}"
+                    )
+            else:
+                headroom = account.available_balance - short_total
+                total_risk += min(Decimal("1"), amount / max(headroom, Decimal("0.01")))
+                if amount > headroom:
+                    is_feasible = False
+                    risk_factors.append(
+                        f"Insufficient 30-day funds in account {account.name}"
+                    )
+
+        risk_score = total_risk / Decimal(len(candidate.allocations))
+        optimization_score = Decimal("1") - risk_score * Decimal("0.8")
+
+        return SplitCandidateScore(
+            candidate_index=candidate_index,
+            label=candidate.label,
+            allocations=candidate.allocations,
+            credit_utilization=credit_utilization,
+            short_term_impact=short_term_impact,
+            long_term_impact=long_term_impact,
+            risk_score=DecimalPrecision.round_for_calculation(risk_score),
+            optimization_score=DecimalPrecision.round_for_calculation(
+                optimization_score
+            ),
+            is_feasible=is_feasible,
+            risk_factors=risk_factors,
+        )
+
+    async def evaluate_split_candidates(
+        self, liability_id: int, candidates: List[SplitCandidate], top_k: int = 5
+    ) -> SplitCandidateEvaluationResponse:
+        """
+        Score many candidate allocations for a liability and return the best.
+
+        The liability, every account referenced by any candidate, and their
+        upcoming obligations are loaded once up front; each candidate is then
+        scored in memory, so the number of queries does not grow with the
+        number of candidates. Existing splits of the liability itself are
+        excluded from obligations since a candidate would replace them.
+
+        Args:
+            liability_id: ID of the liability being split
+            candidates: Allocations to evaluate
+            top_k: Number of best candidates to return
+
+        Returns:
+            SplitCandidateEvaluationResponse: Top candidates, feasible first,
+                then by descending optimization score
+
+        Raises:
+            BillSplitValidationError: If the liability does not exist
+        """
+        liability_repo = await self._get_repository(LiabilityRepository)
+        account_repo = await self._get_repository(AccountRepository)
+
+        liability = await liability_repo.get(liability_id)
+        if not liability:
+            raise BillSplitValidationError(
+                f"Liability with id {liability_id} not found"
+            )
+
+        account_ids = sorted(
+            {
+                account_id
+                for candidate in candidates
+                for account_id in candidate.allocations
+            }
+        )
+        accounts = {
+            account.id: account
+            for account in await account_repo.get_accounts_by_ids(account_ids)
+        }
+        obligations = await self._get_upcoming_obligations(
+            list(accounts.keys()), exclude_liability_id=liability_id
+        )
+
+        scores = [
+            self._score_candidate(
+                index, candidate, liability.amount, accounts, obligations
+            )
+            for index, candidate in enumerate(candidates)
+        ]
+        ranked = heapq.nsmallest(
+            top_k,
+            scores,
+            key=lambda score: (
+                not score.is_feasible,
+                -score.optimization_score,
+                score.candidate_index,
+            ),
+        )
+
+        return SplitCandidateEvaluationResponse(
+            liability_id=liability_id,
+            evaluated_count=len(candidates),
+            results=ranked,
+        )
+
+    @staticmethod
+    def _to_cents(value: Decimal) -> int:
+        """Convert a money amount to whole cents, rounding down."""
+        return int((value * 100).to_integral_value(rounding=ROUND_FLOOR))
+
+    @staticmethod
+    def _funding_capacities(
+        base_funds: Decimal,
+        events: List[Tuple[date, Decimal]],
+        due_dates: List[date],
+    ) -> List[Decimal]:
+        """
+        Compute how much an account can fund cumulatively by each due date.
+
+        Money committed to a liability due on day d stays spent, so the
+        cumulative amount drawn for liabilities due by d must fit the lowest
+        projected funds at any point from d to the end of the horizon.
+
+        Args:
+            base_funds: Funds available today
+            events: (day, signed change) pairs from income and obligations
+            due_dates: Due dates of the liabilities being solved, ascending
+
+        Returns:
+            List[Decimal]: Cumulative capacity per due date
+        """
+        events = sorted(events)
+        capacities = []
+        for due_date in due_dates:
+            funds = base_funds + sum(
+                (delta for day, delta in events if day <= due_date), Decimal("0")
+            )
+            lowest = funds
+            for day, delta in events:
+                if day > due_date:
+                    funds += delta
+                    lowest = min(lowest, funds)
+            capacities.append(lowest)
+        return capacities
+
+    async def _solve_optimal_splits(
+        self, liabilities: List[Liability]
+    ) -> SplitOptimizationResult:
+        """
+        Jointly allocate liabilities across active accounts at minimum cost.
+
+        The cost minimized is one month of credit interest plus a convex
+        credit utilization penalty; cash accounts cost nothing but may never
+        be projected to overdraw once upcoming income and existing split
+        obligations are taken into account. Allocation is exact in cents.
+
+        Args:
+            liabilities: Liabilities to allocate
+
+        Returns:
+            SplitOptimizationResult: Optimal allocation per liability
+        """
+        if not liabilities:
+            return SplitOptimizationResult(
+                liabilities=[], estimated_interest=Decimal("0"), is_feasible=True
+            )
+
+        account_repo = await self._get_repository(AccountRepository)
+        bill_split_repo = await self._get_repository(BillSplitRepository)
+        income_repo = await self._get_repository(IncomeRepository)
+
+        liabilities = sorted(liabilities, key=lambda item: (item.due_date, item.id))
+        accounts = sorted(
+            await account_repo.get_active_accounts(), key=lambda item: item.id
+        )
+        account_ids = [account.id for account in accounts]
+        due_dates = [normalize_db_date(item.due_date) for item in liabilities]
+
+        today = start_of_day(utc_now())
+        horizon_end = end_of_day(
+            max(today, ensure_utc(liabilities[-1].due_date))
+            + timedelta(days=SHORT_TERM_DAYS)
+        )
+        obligations = await bill_split_repo.get_obligation_schedule(
+            account_ids,
+            today,
+            horizon_end,
+            exclude_liability_ids=[item.id for item in liabilities],
+        )
+        income_events: Dict[int, List[Tuple[date, Decimal]]] = {}
+        for income in await income_repo.get_income_in_date_range(today, horizon_end):
+            if not income.deposited:
+                income_events.setdefault(income.account_id, []).append(
+                    (normalize_db_date(income.date), income.amount)
+                )
+
+        solver = SplitSolver(
+            [
+                SplitDemand(
+                    liability_id=item.id,
+                    amount=self._to_cents(item.amount),
+                    preferred_account_id=item.primary_account_id,
+                )
+                for item in liabilities
+            ]
+        )
+        monthly_rates: Dict[int, Decimal] = {}
+        for account in accounts:
+            events = [
+                (normalize_db_date(due_date), -amount)
+                for due_date, amount in obligations[account.id]
+            ]
+
+            if account.account_type == "credit":
+                if not account.credit_limit:
+                    continue
+                used = max(-account.available_balance, Decimal("0"))
+                capacities = self._funding_capacities(
+                    account.credit_limit - used, events, due_dates
+                )
+                monthly_rate = (account.apr or Decimal("0")) / 100 / 12
+                monthly_rates[account.id] = monthly_rate
+
+                # Utilization bands are measured after existing obligations
+                committed = used + sum(
+                    (amount for _, amount in obligations[account.id]), Decimal("0")
+                )
+                cost_tiers = []
+                lower = committed
+                for threshold, penalty in CREDIT_UTILIZATION_PENALTIES:
+                    upper = account.credit_limit * threshold
+                    if upper > lower:
+                        cost_tiers.append(
+                            (
+                                self._to_cents(upper - lower),
+                                int((monthly_rate + penalty) * OPTIMIZER_COST_SCALE),
+                            )
+                        )
+                        lower = upper
+            else:
+                events.extend(income_events.get(account.id, []))
+                capacities = self._funding_capacities(
+                    account.available_balance, events, due_dates
+                )
+                cost_tiers = [(self._to_cents(max(capacities[-1], Decimal("0"))), 0)]
+
+            solver.add_account(
+                account.id,
+                [self._to_cents(max(cap, Decimal("0"))) for cap in capacities],
+                cost_tiers,
+            )
+
+        solution = solver.solve()
+
+        estimated_interest = Decimal("0")
+        results = []
+        for item in liabilities:
+            allocations = {
+                account_id: DecimalPrecision.round_for_display(Decimal(cents) / 100)
+                for account_id, cents in solution.allocations[item.id].items()
+            }
+            for account_id, amount in allocations.items():
+                estimated_interest += amount * monthly_rates.get(
+                    account_id, Decimal("0")
+                )
+            results.append(
+                OptimizedLiabilitySplit(
+                    liability_id=item.id,
+                    amount=DecimalPrecision.round_for_display(item.amount),
+                    due_date=ensure_utc(item.due_date),
+                    allocations=allocations,
+                    unallocated_amount=DecimalPrecision.round_for_display(
+                        Decimal(solution.unallocated.get(item.id, 0)) / 100
+                    ),
+                )
+            )
+
+        return SplitOptimizationResult(
+            liabilities=results,
+            estimated_interest=DecimalPrecision.round_for_display(estimated_interest),
+            is_feasible=not solution.unallocated,
+        )
+
+    async def optimize_splits(self, liability_id: int) -> SplitOptimizationResult:
+        """
+        Compute the cost-minimizing split for a single liability.
+
+        Args:
+            liability_id: ID of the liability to split
+
+        Returns:
+            SplitOptimizationResult: Optimal allocation for the liability
+
+        Raises:
+            BillSplitValidationError: If the liability does not exist
+        """
+        liability_repo = await self._get_repository(LiabilityRepository)
+        liability = await liability_repo.get(liability_id)
+        if not liability:
+            raise BillSplitValidationError(
+                f"Liability with id {liability_id} not found"
+            )
+        return await self._solve_optimal_splits([liability])
+
+    async def optimize_monthly_splits(
+        self, year: int, month: int
+    ) -> SplitOptimizationResult:
+        """
+        Jointly compute cost-minimizing splits for every unpaid liability in a month.
+
+        Solving the month at once keeps an early bill from consuming funds a
+        later bill in the same month depends on.
+
+        Args:
+            year: Year of the month to solve
+            month: Month to solve (1-12)
+
+        Returns:
+            SplitOptimizationResult: Optimal allocation per liability
+        """
+        liability_repo = await self._get_repository(LiabilityRepository)
+        start_date = utc_datetime(year, month, 1)
+        liabilities = await liability_repo.get_bills_due_in_range(
+            start_date, last_day_of_month(start_date)
+        )
+        return await self._solve_optimal_splits(liabilities)
+
     async def generate_optimization_suggestions(
         self, liability_id: int
     ) -> List[OptimizationSuggestion]:
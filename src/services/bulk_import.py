@@ -19,7 +19,7 @@ from src.services.income import IncomeService
 from src.services.liabilities import LiabilityService
 from src.utils.datetime_utils import (
     naive_utc_datetime_from_str,
-    naive_utc_from_date,
+    utc_datetime,
     utc_now,
 )
 
@@ -89,8 +89,8 @@ class BulkImportService(BaseService):
                     raise ValueError("Invalid date")
                 # Get current year for the due date
                 current_year = utc_now().year
-                # Create a naive date for database storage
-                due_date = naive_utc_from_date(current_year, month, day).date()
+                # Schemas take UTC-aware datetimes; the repository stores them naive
+                due_date = utc_datetime(current_year, month, day)
             except ValueError:
                 return None, ImportError(
                     row=row_num, field="date", message="Invalid date format or values"
@@ -173,7 +173,7 @@ class BulkImportService(BaseService):
         except ValidationError as e:
             error = ImportError(
                 row=row_num,
-                field=str(e.errors()[0]["loc"][0]),
+                field=str(next(iter(e.errors()[0]["loc"]), "unknown")),
                 message=str(e.errors()[0]["msg"]),
             )
             return None, error
@@ -211,7 +211,7 @@ class BulkImportService(BaseService):
         except ValidationError as e:
             error = ImportError(
                 row=row_num,
-                field=str(e.errors()[0]["loc"][0]),
+                field=str(next(iter(e.errors()[0]["loc"]), "unknown")),
                 message=str(e.errors()[0]["msg"]),
             )
             return None, error
@@ -10,6 +10,7 @@ from src.common.cashflow_types import DateType
 from src.models.accounts import Account
 from src.models.liabilities import Liability
 from src.registry.transaction_reference import transaction_reference_registry
+from src.repositories.liabilities import LiabilityRepository
 from src.schemas.cashflow import (
     AccountForecastMetrics,
     AccountForecastRequest,
@@ -18,14 +19,42 @@ from src.schemas.cashflow import (
     CustomForecastParameters,
     CustomForecastResponse,
     CustomForecastResult,
+    ProbabilisticForecastDay,
+    ProbabilisticForecastParameters,
+    ProbabilisticForecastResponse,
 )
+from src.schemas.income_trends import IncomeTrendsRequest
 from src.services.cashflow.cashflow_base import CashflowBaseService
-from src.services.cashflow.cashflow_transaction_service import TransactionService
+from src.services.cashflow.cashflow_transaction_service import (
+    TransactionService,
+    _as_naive_utc,
+)
 from src.services.category_matcher import CategoryMatcher
 from src.services.feature_flags import FeatureFlagService
-from src.utils.datetime_utils import naive_end_of_day, naive_start_of_day, utc_now
+from src.services.income_trends import IncomeTrendsService
+from src.services.payment_patterns import BillPaymentPatternService
+from src.utils.cashflow_simulation import (
+    IncomeStream,
+    SimulationInputs,
+    VariableBill,
+    simulate,
+)
+from src.utils.compute_executor import run_compute
+from src.utils.datetime_utils import (
+    naive_end_of_day,
+    naive_start_of_day,
+    utc_datetime,
+    utc_now,
+)
 from src.utils.decimal_precision import DecimalPrecision
 
+# Longest period a probabilistic forecast simulates
+PROBABILISTIC_MAX_DAYS = 366
+# Income history analysed for recurring patterns before a forecast starts
+INCOME_HISTORY_DAYS = 365
+# Days between occurrences of the regular income frequencies
+INCOME_INTERVALS = {"weekly": 7, "biweekly": 14, "monthly": 30}
+
 
 class ForecastService(CashflowBaseService):
     """Service for generating cashflow forecasts."""
@@ -49,6 +78,12 @@ class ForecastService(CashflowBaseService):
         )
         self._registry = transaction_reference_registry
         self._category_matcher = None
+        self._pattern_service = BillPaymentPatternService(
+            session, feature_flag_service, config_provider
+        )
+        self._income_trends_service = IncomeTrendsService(
+            session, feature_flag_service, config_provider
+        )
 
     async def get_required_funds(
         self,
@@ -110,23 +145,24 @@ class ForecastService(CashflowBaseService):
         if not account:
             raise ValueError(f"Account with id {params.account_id} not found")
 
-        # Initialize metrics
-        metrics = await self._calculate_account_metrics(
-            account,
-            params.start_date,
-            params.end_date,
-            params.include_pending,
-            params.include_recurring,
-        )
-
-        # Generate daily forecasts
-        daily_forecasts = await self._generate_account_daily_forecasts(
-            account,
-            params.start_date,
-            params.end_date,
-            params.include_pending,
-            params.include_recurring,
-            params.include_transfers,
+        # Metrics and daily forecasts only read the loaded account columns, so
+        # they run concurrently when possible
+        metrics, daily_forecasts = await self._run_independent(
+            lambda service: service._calculate_account_metrics(
+                account,
+                params.start_date,
+                params.end_date,
+                params.include_pending,
+                params.include_recurring,
+            ),
+            lambda service: service._generate_account_daily_forecasts(
+                account,
+                params.start_date,
+                params.end_date,
+                params.include_pending,
+                params.include_recurring,
+                params.include_transfers,
+            ),
         )
 
         # Calculate overall confidence with proper precision per ADR-013
@@ -236,6 +272,223 @@ class ForecastService(CashflowBaseService):
             timestamp=utc_now(),
         )
 
+    async def get_probabilistic_forecast(
+        self, params: ProbabilisticForecastParameters
+    ) -> ProbabilisticForecastResponse:
+        """Calculate a Monte Carlo forecast of the combined balance.
+
+        Bills due in the period are simulated at their billed amount with the
+        spread of their past payments, and recurring income detected by
+        IncomeTrendsService continues after its last known occurrence with
+        timing and amount uncertainty. Expected income records are included
+        as known amounts. The inputs are loaded with a fixed number of
+        queries and the paths are simulated in NumPy batches, so the cost
+        does not grow with days times paths in Python.
+
+        Args:
+            params: Parameters for the probabilistic forecast
+
+        Returns:
+            ProbabilisticForecastResponse with daily balance bands
+
+        Raises:
+            ValueError: If no accounts match, or the period is empty or longer
+                than PROBABILISTIC_MAX_DAYS
+        """
+        first_day = _as_naive_utc(params.start_date).date()
+        last_day = _as_naive_utc(params.end_date).date()
+        days = (last_day - first_day).days + 1
+        if days < 1:
+            raise ValueError("end_date must not be before start_date")
+        if days > PROBABILISTIC_MAX_DAYS:
+            raise ValueError(
+                f"Probabilistic forecasts cover at most {PROBABILISTIC_MAX_DAYS} days"
+            )
+
+        metrics_repo = await self.metrics_repository
+        accounts = await metrics_repo.get_accounts_for_forecast(params.account_ids)
+        if not accounts:
+            raise ValueError("No valid accounts found for analysis")
+        account_ids = [account.id for account in accounts]
+        starting_balance = sum(
+            (account.available_balance for account in accounts), Decimal("0")
+        )
+
+        fixed_flows = [0.0] * days
+        transaction_repo = await self.transaction_repository
+        for (
+            _,
+            income_date,
+            amount,
+            _,
+        ) in await transaction_repo.get_income_expected_between(
+            account_ids, first_day, last_day, params.include_pending
+        ):
+            fixed_flows[(_as_naive_utc(income_date).date() - first_day).days] += float(
+                amount
+            )
+
+        bills = await self._variable_bills(account_ids, first_day, last_day)
+        income = (
+            await self._income_streams(first_day, last_day, params.include_pending)
+            if params.include_income_patterns
+            else []
+        )
+
+        # The inputs are plain numbers, so the simulation can leave the event loop
+        bands = await run_compute(
+            simulate,
+            SimulationInputs(days, float(starting_balance), fixed_flows, bills, income),
+            paths=params.paths,
+            seed=params.seed,
+            threshold=float(params.overdraft_threshold),
+        )
+
+        def money(value: float) -> Decimal:
+            return DecimalPrecision.round_for_display(Decimal(str(value)))
+
+        def share(value: float) -> Decimal:
+            return DecimalPrecision.round_for_calculation(Decimal(str(value)))
+
+        results = []
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            p5, p25, p50, p75, p95 = (money(band) for band in bands.bands[:, offset])
+            results.append(
+                ProbabilisticForecastDay(
+                    date=utc_datetime(day.year, day.month, day.day),
+                    percentile_5=p5,
+                    percentile_25=p25,
+                    median=p50,
+                    percentile_75=p75,
+                    percentile_95=p95,
+                    mean_balance=money(bands.mean[offset]),
+                    overdraft_probability=share(bands.overdraft_probability[offset]),
+                )
+            )
+
+        return ProbabilisticForecastResponse(
+            parameters=params,
+            days=results,
+            starting_balance=DecimalPrecision.round_for_display(starting_balance),
+            overdraft_probability=share(bands.horizon_overdraft_probability),
+            income_streams=len(income),
+            variable_bills=len(bills),
+            timestamp=utc_now(),
+        )
+
+    async def _variable_bills(
+        self, account_ids: List[int], first_day: date, last_day: date
+    ) -> List[VariableBill]:
+        """Get the unpaid bills due in a period with their amount spread.
+
+        Args:
+            account_ids: Accounts whose bills are included
+            first_day: First day of the period
+            last_day: Last day of the period
+
+        Returns:
+            Bills as offsets from first_day; bills without payment history
+            have no spread
+        """
+        liability_repo = await self._get_repository(LiabilityRepository)
+        included = set(account_ids)
+        bills = [
+            bill
+            for bill in await liability_repo.get_bills_due_in_range(first_day, last_day)
+            if bill.primary_account_id in included
+        ]
+        if not bills:
+            return []
+
+        patterns = await self._pattern_service.analyze_bills_payments(
+            [bill.id for bill in bills]
+        )
+        variable_bills = []
+        for bill in bills:
+            pattern = patterns.get(bill.id)
+            variable_bills.append(
+                VariableBill(
+                    day=(_as_naive_utc(bill.due_date).date() - first_day).days,
+                    amount=float(bill.amount),
+                    std_dev=(
+                        float(pattern.amount_statistics.std_dev_amount)
+                        if pattern
+                        else 0.0
+                    ),
+                )
+            )
+        return variable_bills
+
+    async def _income_streams(
+        self, first_day: date, last_day: date, include_pending: bool = True
+    ) -> List[IncomeStream]:
+        """Get the recurring income patterns continuing into a period.
+
+        Income up to the end of the period is analysed, so a stream starts
+        after its last recorded occurrence and never repeats an expected
+        income record. Without pending income, those records are not in the
+        forecast either, so a stream starts after its last deposited
+        occurrence instead and sources never deposited are left out. Timing
+        spread is derived from the pattern confidence, which
+        IncomeTrendsService lowers by a quarter per day of interval standard
+        deviation.
+
+        Args:
+            first_day: First day of the period
+            last_day: Last day of the period
+            include_pending: Whether undeposited income records count as
+                occurrences
+
+        Returns:
+            Streams for weekly, biweekly and monthly patterns
+        """
+        request = IncomeTrendsRequest(
+            start_date=utc_datetime(first_day.year, first_day.month, first_day.day)
+            - timedelta(days=INCOME_HISTORY_DAYS),
+            end_date=utc_datetime(
+                last_day.year, last_day.month, last_day.day, 23, 59, 59
+            ),
+        )
+        try:
+            analysis = await self._income_trends_service.analyze_trends(request)
+        except ValueError:
+            # No income history to detect patterns from
+            return []
+
+        std_devs = {
+            stats.source: stats.standard_deviation
+            for stats in analysis.source_statistics
+        }
+        last_deposits = None
+        if not include_pending:
+            transaction_repo = await self.transaction_repository
+            last_deposits = await transaction_repo.get_last_deposited_income_dates(
+                request.end_date
+            )
+
+        streams = []
+        for pattern in analysis.patterns:
+            interval = INCOME_INTERVALS.get(pattern.frequency)
+            if interval is None:
+                continue
+            if last_deposits is None:
+                last_occurrence = _as_naive_utc(pattern.last_occurrence).date()
+            elif pattern.source in last_deposits:
+                last_occurrence = last_deposits[pattern.source].date()
+            else:
+                continue
+            streams.append(
+                IncomeStream(
+                    first_day=(last_occurrence - first_day).days + interval,
+                    interval=interval,
+                    timing_std_dev=4.0 * (1.0 - float(pattern.confidence_score)),
+                    amount=float(pattern.average_amount),
+                    std_dev=float(std_devs.get(pattern.source, 0.0)),
+                )
+            )
+        return streams
+
     async def _calculate_account_metrics(
         self,
         account: Account,
@@ -324,12 +577,12 @@ class ForecastService(CashflowBaseService):
 
         # Calculate credit utilization for credit accounts
         credit_utilization = None
-        if account.account_type == "credit" and account.total_limit:
+        if account.account_type == "credit" and account.credit_limit:
             if daily_balances:
-                credit_utilization = abs(min(daily_balances)) / account.total_limit
+                credit_utilization = abs(min(daily_balances)) / account.credit_limit
             else:
                 credit_utilization = (
-                    abs(account.available_balance) / account.total_limit
+                    abs(account.available_balance) / account.credit_limit
                 )
 
         # Calculate balance volatility - use historical data when available
@@ -360,7 +613,9 @@ class ForecastService(CashflowBaseService):
 
         return AccountForecastMetrics(
             average_daily_balance=(
-                Decimal(str(mean(daily_balances))) if daily_balances else Decimal("0")
+                Decimal(str(mean(daily_balances))).quantize(Decimal("0.01"))
+                if daily_balances
+                else Decimal("0")
             ),
             minimum_projected_balance=(
                 min(daily_balances) if daily_balances else account.available_balance
@@ -379,7 +634,11 @@ class ForecastService(CashflowBaseService):
                 else Decimal("0")
             ),
             projected_low_balance_dates=low_balance_dates,
-            credit_utilization=credit_utilization,
+            credit_utilization=(
+                credit_utilization.quantize(Decimal("0.0001"))
+                if credit_utilization is not None
+                else None
+            ),
             balance_volatility=(
                 balance_volatility.quantize(Decimal("0.01"))
                 if balance_volatility
@@ -437,8 +696,8 @@ class ForecastService(CashflowBaseService):
             warning_flags = []
             if current_balance < self._warning_thresholds.LOW_BALANCE:
                 warning_flags.append("low_balance")
-            if account.account_type == "credit" and account.total_limit:
-                utilization = abs(current_balance) / account.total_limit
+            if account.account_type == "credit" and account.credit_limit:
+                utilization = abs(current_balance) / account.credit_limit
                 if utilization > self._warning_thresholds.HIGH_CREDIT_UTILIZATION:
                     warning_flags.append("high_credit_utilization")
             if day_outflow > self._warning_thresholds.LARGE_OUTFLOW:
@@ -547,9 +806,9 @@ class ForecastService(CashflowBaseService):
         # Account-specific confidence adjustments
         if account.account_type == "credit":
             # Credit accounts have different risk profiles
-            if account.total_limit:
+            if account.credit_limit:
                 # Calculate current utilization
-                utilization = abs(balance) / account.total_limit
+                utilization = abs(balance) / account.credit_limit
 
                 # Higher utilization = lower confidence
                 if utilization > Decimal("0.8"):
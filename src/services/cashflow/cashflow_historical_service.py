@@ -1,7 +1,7 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from statistics import mean, stdev
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from src.common.cashflow_types import DateType
@@ -14,6 +14,7 @@ from src.schemas.cashflow import (
 )
 from src.services.cashflow.cashflow_base import CashflowBaseService
 from src.services.cashflow.cashflow_transaction_service import TransactionService
+from src.utils.compute_executor import run_compute
 
 
 class HistoricalService(CashflowBaseService):
@@ -143,29 +144,10 @@ class HistoricalService(CashflowBaseService):
         # Get the balance history repository
         repo = await self._get_repository(BalanceHistoryRepository)
 
-        # Convert dates to UTC-naive datetimes for database queries
-        start_datetime = datetime.combine(start_date, datetime.min.time())
-        end_datetime = datetime.combine(end_date, datetime.max.time())
-
-        # Get balance history records
-        history = await repo.get_by_date_range(
-            account_id=account_id, start_date=start_datetime, end_date=end_datetime
+        missing = await repo.get_missing_days_for_accounts(
+            [account_id], start_date, end_date
         )
-
-        # Get all dates in range
-        all_dates = []
-        current_date = start_date
-        while current_date <= end_date:
-            all_dates.append(current_date)
-            current_date += timedelta(days=1)
-
-        # Get dates with records
-        recorded_dates = [record.timestamp.date() for record in history]
-
-        # Find missing dates
-        missing_dates = [d for d in all_dates if d not in recorded_dates]
-
-        return missing_dates
+        return missing[account_id]
 
     async def mark_balance_reconciled(
         self, history_id: int, reconciled: bool = True, notes: Optional[str] = None
@@ -222,17 +204,16 @@ class HistoricalService(CashflowBaseService):
             account_ids, start_date, end_date
         )
 
-        # Calculate trend metrics
-        metrics = await self._calculate_trend_metrics(transactions)
-
-        # Analyze periods (e.g., monthly, quarterly)
-        period_analysis = await self._analyze_historical_periods(
-            transactions, start_date, end_date
+        # Transactions are plain dictionaries of dates and amounts, so the
+        # analysis can run in a worker process
+        metrics, period_analysis, seasonality = await run_compute(
+            HistoricalService._analyze_transactions,
+            transactions,
+            start_date,
+            end_date,
+            self._holidays,
         )
 
-        # Analyze seasonality
-        seasonality = await self._analyze_seasonality(transactions)
-
         return HistoricalTrendsResponse(
             metrics=metrics,
             period_analysis=period_analysis,
@@ -240,9 +221,40 @@ class HistoricalService(CashflowBaseService):
             timestamp=date.today(),
         )
 
-    async def _calculate_trend_metrics(
-        self, transactions: List[Dict]
-    ) -> HistoricalTrendMetrics:
+    @staticmethod
+    def _analyze_transactions(
+        transactions: List[Dict],
+        start_date: DateType,
+        end_date: DateType,
+        holidays: Dict[str, date],
+    ) -> Tuple[
+        HistoricalTrendMetrics, List[HistoricalPeriodAnalysis], SeasonalityAnalysis
+    ]:
+        """Run the CPU-bound part of a historical trends analysis.
+
+        Args:
+            transactions: List of transaction dictionaries
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            holidays: Holiday dates keyed by name
+
+        Returns:
+            Tuple of (trend metrics, period analyses, seasonality)
+        """
+        # Calculate trend metrics
+        metrics = HistoricalService._calculate_trend_metrics(transactions)
+
+        # Analyze periods (e.g., monthly, quarterly)
+        period_analysis = HistoricalService._analyze_historical_periods(
+            transactions, start_date, end_date
+        )
+
+        # Analyze seasonality
+        seasonality = HistoricalService._analyze_seasonality(transactions, holidays)
+        return metrics, period_analysis, seasonality
+
+    @staticmethod
+    def _calculate_trend_metrics(transactions: List[Dict]) -> HistoricalTrendMetrics:
         """Calculate trend metrics from historical transactions.
 
         Args:
@@ -328,8 +340,9 @@ class HistoricalService(CashflowBaseService):
             confidence_score=confidence_score,
         )
 
-    async def _analyze_historical_periods(
-        self, transactions: List[Dict], start_date: date, end_date: date
+    @staticmethod
+    def _analyze_historical_periods(
+        transactions: List[Dict], start_date: date, end_date: date
     ) -> List[HistoricalPeriodAnalysis]:
         """Analyze transactions in specific periods (e.g., monthly).
 
@@ -422,13 +435,15 @@ class HistoricalService(CashflowBaseService):
 
         return periods
 
-    async def _analyze_seasonality(
-        self, transactions: List[Dict]
+    @staticmethod
+    def _analyze_seasonality(
+        transactions: List[Dict], holidays: Dict[str, date]
     ) -> SeasonalityAnalysis:
         """Analyze seasonal patterns in transactions.
 
         Args:
             transactions: List of transaction dictionaries
+            holidays: Holiday dates keyed by name
 
         Returns:
             SeasonalityAnalysis with seasonal patterns
@@ -454,7 +469,7 @@ class HistoricalService(CashflowBaseService):
             day_of_month_patterns[trans_date.day] += amount
 
             # Holiday impacts
-            for holiday, holiday_date in self._holidays.items():
+            for holiday, holiday_date in holidays.items():
                 # Check if transaction is within 7 days of holiday
                 holiday_date_this_year = holiday_date.replace(year=trans_date.year)
                 days_to_holiday = (trans_date - holiday_date_this_year).days
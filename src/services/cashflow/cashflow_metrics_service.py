@@ -1,5 +1,6 @@
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,9 +9,130 @@ from src.models.accounts import Account
 from src.models.cashflow import CashflowForecast
 from src.schemas.cashflow import CustomForecastResult
 from src.services.cashflow.cashflow_base import CashflowBaseService
-from src.services.cashflow.cashflow_transaction_service import TransactionService
+from src.services.cashflow.cashflow_transaction_service import (
+    TransactionService,
+    _as_naive_utc,
+)
 from src.services.feature_flags import FeatureFlagService
+from src.utils.datetime_utils import naive_utc_from_date, utc_datetime
 from src.utils.decimal_precision import DecimalPrecision
+from src.utils.sliding_window import lookahead_minimums
+
+# Lookahead windows stored on CashflowForecast as min_<days>_day
+MINIMUM_WINDOWS = (14, 30, 60, 90)
+
+
+class CashflowProjection:
+    """
+    Daily cashflow metrics computed from data loaded once for a date range.
+
+    Built by MetricsService.get_projection. Metrics for a day are computed on
+    first request and reused, and match what get_metrics_for_date returns.
+    """
+
+    def __init__(
+        self,
+        accounts: Sequence[Account],
+        start_date: date,
+        end_date: date,
+        transactions: Dict[date, List[Dict]],
+        confidence: Callable[[Account, Decimal, List[Dict], List[str]], Decimal],
+    ):
+        """
+        Initialize the projection.
+
+        Args:
+            accounts: Accounts included in the metrics
+            start_date: First day covered
+            end_date: Last day covered
+            transactions: Transactions of all accounts keyed by day
+            confidence: Day confidence calculation of the metrics service
+        """
+        self.accounts = accounts
+        self.start_date = start_date
+        self.end_date = end_date
+        self._transactions = transactions
+        self._confidence = confidence
+        self._total_balance = sum(
+            (account.available_balance for account in accounts), Decimal("0")
+        )
+        self._metrics: Dict[date, CustomForecastResult] = {}
+
+    @property
+    def starting_balance(self) -> Decimal:
+        """Get the combined available balance of the accounts."""
+        return self._total_balance
+
+    def flows_for(self, target_date: DateType) -> Tuple[Decimal, Decimal]:
+        """
+        Get the total inflow and outflow of a day.
+
+        Args:
+            target_date: Day to total; days without transactions total zero
+
+        Returns:
+            Tuple of (inflow, outflow), both non-negative
+        """
+        total_inflow = Decimal("0")
+        total_outflow = Decimal("0")
+        for trans in self._transactions.get(_as_naive_utc(target_date).date(), []):
+            if trans["amount"] > 0:
+                total_inflow += trans["amount"]
+            else:
+                total_outflow += abs(trans["amount"])
+        return total_inflow, total_outflow
+
+    def covers(self, target_date: DateType) -> bool:
+        """Check whether a day is inside the projected range."""
+        return self.start_date <= _as_naive_utc(target_date).date() <= self.end_date
+
+    def metrics_for(self, target_date: DateType) -> Optional[CustomForecastResult]:
+        """
+        Get cashflow metrics for a day in the range.
+
+        Args:
+            target_date: Date to get metrics for
+
+        Returns:
+            CustomForecastResult with metrics or None if there are no accounts
+
+        Raises:
+            ValueError: If the date is outside the projected range
+        """
+        if not self.accounts:
+            return None
+        if not self.covers(target_date):
+            raise ValueError(
+                f"{target_date} is outside the projection "
+                f"{self.start_date} to {self.end_date}"
+            )
+
+        day = _as_naive_utc(target_date).date()
+        if day in self._metrics:
+            return self._metrics[day]
+
+        day_transactions = self._transactions.get(day, [])
+        total_inflow, total_outflow = self.flows_for(day)
+
+        metrics = CustomForecastResult(
+            date=utc_datetime(day.year, day.month, day.day),
+            projected_balance=self._total_balance,
+            projected_income=total_inflow,
+            projected_expenses=total_outflow,
+            confidence_score=self._confidence(
+                self.accounts[0],  # Use first account for base calculation
+                self._total_balance,
+                day_transactions,
+                [],  # No warning flags for this calculation
+            ),
+            contributing_factors={
+                "total_accounts": len(self.accounts),
+                "total_transactions": len(day_transactions),
+            },
+            risk_factors={},
+        )
+        self._metrics[day] = metrics
+        return metrics
 
 
 class MetricsService(CashflowBaseService):
@@ -36,56 +158,41 @@ class MetricsService(CashflowBaseService):
         Returns:
             CustomForecastResult with metrics or None if no data available
         """
-        # Get all accounts using repository
-        metrics_repo = await self.metrics_repository
-        accounts = await metrics_repo.get_all_accounts()
+        projection = await self.get_projection(target_date, target_date)
+        return projection.metrics_for(target_date)
 
-        if not accounts:
-            return None
+    async def get_projection(
+        self, start_date: DateType, end_date: DateType
+    ) -> "CashflowProjection":
+        """Load the data for daily cashflow metrics over a date range.
 
-        # Get day's transactions
-        day_transactions = []
-        total_balance = Decimal("0")
-        total_inflow = Decimal("0")
-        total_outflow = Decimal("0")
+        Callers evaluating many dates, such as bill payment recommendations,
+        load one projection up front instead of calling get_metrics_for_date
+        per date, which would load every account and its transactions again.
 
-        for account in accounts:
-            transactions = await self._transaction_service.get_day_transactions(
-                account,
-                target_date,
-                include_pending=True,
-                include_recurring=True,
-                include_transfers=True,
-            )
-            day_transactions.extend(transactions)
-
-            # Update totals
-            total_balance += account.available_balance
-            for trans in transactions:
-                if trans["amount"] > 0:
-                    total_inflow += trans["amount"]
-                else:
-                    total_outflow += abs(trans["amount"])
-
-        # Calculate confidence score
-        confidence_score = self._calculate_day_confidence(
-            accounts[0],  # Use first account for base calculation
-            total_balance,
-            day_transactions,
-            [],  # No warning flags for this calculation
-        )
+        Args:
+            start_date: First day the projection covers
+            end_date: Last day the projection covers
 
-        return CustomForecastResult(
-            date=target_date,
-            projected_balance=total_balance,
-            projected_income=total_inflow,
-            projected_expenses=total_outflow,
-            confidence_score=confidence_score,
-            contributing_factors={
-                "total_accounts": len(accounts),
-                "total_transactions": len(day_transactions),
-            },
-            risk_factors={},
+        Returns:
+            CashflowProjection answering metrics_for any day in the range
+        """
+        metrics_repo = await self.metrics_repository
+        accounts = await metrics_repo.get_all_accounts()
+        transactions = await self._transaction_service.get_range_transactions(
+            accounts,
+            start_date,
+            end_date,
+            include_pending=True,
+            include_recurring=True,
+            include_transfers=True,
+        )
+        return CashflowProjection(
+            accounts,
+            _as_naive_utc(start_date).date(),
+            _as_naive_utc(end_date).date(),
+            transactions,
+            self._calculate_day_confidence,
         )
 
     async def calculate_required_funds(
@@ -267,6 +374,75 @@ class MetricsService(CashflowBaseService):
         self.update_cashflow_required_income(forecast, tax_rate)
         self.update_cashflow_hourly_rates(forecast)
 
+    async def calculate_90_day_forecast(
+        self,
+        start_date: DateType,
+        days: int = 90,
+        tax_rate: Decimal = Decimal("0.8"),
+    ) -> List[CashflowForecast]:
+        """Calculate and store the daily forecasts of a horizon.
+
+        One projection covering the horizon plus the longest lookahead window
+        is loaded and accumulated into daily closing balances. Each window's
+        minimums for every day come from a single sliding-window pass, so the
+        whole horizon costs O(days) instead of one recomputation per day.
+        Forecasts already stored for these days are replaced.
+
+        Args:
+            start_date: First day of the horizon
+            days: Number of daily forecasts (default: 90)
+            tax_rate: Tax rate as decimal (default 0.80 assumes 20% tax rate)
+
+        Returns:
+            List of stored forecasts, one per day
+
+        Raises:
+            ValueError: If days is less than 1
+        """
+        if days < 1:
+            raise ValueError("Forecast horizon must be at least one day")
+
+        first_day = _as_naive_utc(start_date).date()
+        series_days = days + max(MINIMUM_WINDOWS) - 1
+        projection = await self.get_projection(
+            first_day, first_day + timedelta(days=series_days - 1)
+        )
+
+        # Opening balance, inflow and outflow of each day, and closing balances
+        daily = []
+        closing = []
+        balance = projection.starting_balance
+        for offset in range(series_days):
+            inflow, outflow = projection.flows_for(first_day + timedelta(days=offset))
+            daily.append((balance, inflow, outflow))
+            balance += inflow - outflow
+            closing.append(balance)
+
+        minimums = {
+            window: lookahead_minimums(closing, window) for window in MINIMUM_WINDOWS
+        }
+
+        forecasts = []
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            opening, inflow, outflow = daily[offset]
+            forecast = CashflowForecast(
+                forecast_date=naive_utc_from_date(day.year, day.month, day.day),
+                total_bills=outflow,
+                total_income=inflow,
+                balance=opening,
+                forecast=closing[offset],
+                min_14_day=minimums[14][offset],
+                min_30_day=minimums[30][offset],
+                min_60_day=minimums[60][offset],
+                min_90_day=minimums[90][offset],
+            )
+            self.update_cashflow_all_calculations(forecast, tax_rate)
+            forecasts.append(forecast)
+
+        forecast_repo = await self.forecast_repository
+        return await forecast_repo.replace_range(forecasts)
+
     def _calculate_day_confidence(
         self,
         account: Account,
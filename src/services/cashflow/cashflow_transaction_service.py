@@ -1,5 +1,7 @@
+from calendar import monthrange
+from collections import defaultdict
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from zoneinfo import ZoneInfo
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +10,23 @@ from src.common.cashflow_types import DateType
 from src.models.accounts import Account
 from src.services.cashflow.cashflow_base import CashflowBaseService
 from src.services.feature_flags import FeatureFlagService
+from src.utils.datetime_utils import ensure_utc
+
+
+def _as_naive_utc(value: DateType) -> datetime:
+    """Normalize a date or datetime to a naive UTC datetime (ADR-011)."""
+    if isinstance(value, datetime):
+        return ensure_utc(value).replace(tzinfo=None)
+    return datetime(value.year, value.month, value.day)
+
+
+def _next_month(value: datetime) -> datetime:
+    """Advance a monthly occurrence, clamping the day to the month's length."""
+    year, month_index = divmod(value.year * 12 + value.month, 12)
+    month = month_index + 1
+    return value.replace(
+        year=year, month=month, day=min(value.day, monthrange(year, month)[1])
+    )
 
 
 class TransactionService(CashflowBaseService):
@@ -82,12 +101,13 @@ class TransactionService(CashflowBaseService):
         # Add recurring transactions if requested
         if include_recurring:
             recurring_bills = await transaction_repo.get_recurring_bills(account.id)
+            target_day = _as_naive_utc(target_date).date()
 
             for bill in recurring_bills:
                 # Check if this is a recurring instance for this date
-                current_date = bill.due_date
-                while current_date <= target_date:
-                    if current_date == target_date:
+                current_date = _as_naive_utc(bill.due_date)
+                while current_date.date() <= target_day:
+                    if current_date.date() == target_day:
                         transactions.append(
                             {
                                 "amount": -bill.amount,
@@ -97,12 +117,7 @@ class TransactionService(CashflowBaseService):
                         )
                         break
                     # Advance to next occurrence
-                    next_month = current_date.month + 1
-                    next_year = current_date.year
-                    if next_month > 12:
-                        next_month = 1
-                        next_year += 1
-                    current_date = date(next_year, next_month, current_date.day)
+                    current_date = _next_month(current_date)
 
         # Add transfers if requested
         if include_transfers:
@@ -111,6 +126,84 @@ class TransactionService(CashflowBaseService):
 
         return transactions
 
+    async def get_range_transactions(
+        self,
+        accounts: Sequence[Account],
+        start_date: DateType,
+        end_date: DateType,
+        include_pending: bool = True,
+        include_recurring: bool = True,
+        include_transfers: bool = True,
+    ) -> Dict[date, List[Dict]]:
+        """Get the transactions of every day in a range for several accounts.
+
+        Produces, for each day, the same transactions get_day_transactions
+        returns for each account on that day, with three queries in total
+        rather than three per account and day.
+
+        Args:
+            accounts: Accounts to get transactions for
+            start_date: First day of the range
+            end_date: Last day of the range
+            include_pending: Whether to include pending transactions
+            include_recurring: Whether to include recurring transactions
+            include_transfers: Whether to include transfers
+
+        Returns:
+            Transaction dictionaries keyed by day; days without any are omitted
+        """
+        if not accounts:
+            return {}
+        by_day: Dict[date, List[Dict]] = defaultdict(list)
+
+        transaction_repo = await self.transaction_repository
+        account_ids = [account.id for account in accounts]
+        range_start = _as_naive_utc(start_date).date()
+        range_end = _as_naive_utc(end_date).date()
+
+        for _, due_date, amount, name in await transaction_repo.get_bills_due_between(
+            account_ids, start_date, end_date, include_pending
+        ):
+            by_day[_as_naive_utc(due_date).date()].append(
+                {"amount": -amount, "description": f"Bill: {name}", "type": "bill"}
+            )
+
+        for (
+            _,
+            income_date,
+            amount,
+            source,
+        ) in await transaction_repo.get_income_expected_between(
+            account_ids, start_date, end_date, include_pending
+        ):
+            by_day[_as_naive_utc(income_date).date()].append(
+                {"amount": amount, "description": f"Income: {source}", "type": "income"}
+            )
+
+        if include_recurring:
+            for (
+                _,
+                due_date,
+                amount,
+                name,
+            ) in await transaction_repo.get_recurring_bills_for_accounts(account_ids):
+                # Monthly occurrences from the first due date, as in
+                # get_day_transactions
+                current_date = _as_naive_utc(due_date)
+                while current_date.date() <= range_end:
+                    if current_date.date() >= range_start:
+                        by_day[current_date.date()].append(
+                            {
+                                "amount": -amount,
+                                "description": f"Recurring Bill: {name}",
+                                "type": "recurring_bill",
+                            }
+                        )
+                    current_date = _next_month(current_date)
+
+        # Transfers are not projected yet, as in get_day_transactions
+        return dict(by_day)
+
     async def get_historical_transactions(
         self, account_ids: List[int], start_date: DateType, end_date: DateType
     ) -> List[Dict]:
@@ -126,7 +219,7 @@ class TransactionService(CashflowBaseService):
         """
         transaction_repo = await self.transaction_repository
 
-        # Get payments with sources
+        # Column-only rows; no ORM entities are built for the history
         payments = await transaction_repo.get_historical_payments(
             account_ids, start_date, end_date
         )
@@ -140,23 +233,19 @@ class TransactionService(CashflowBaseService):
         transactions = []
 
         for payment in payments:
-            for source in payment.sources:
-                if source.account_id in account_ids:
-                    transactions.append(
-                        {
-                            "date": (
-                                payment.payment_date
-                                if payment.payment_date.tzinfo
-                                else payment.payment_date.replace(
-                                    tzinfo=ZoneInfo("UTC")
-                                )
-                            ),
-                            "amount": -source.amount,  # Negative for outflow
-                            "type": "payment",
-                            "account_id": source.account_id,
-                            "category": payment.category,
-                        }
-                    )
+            transactions.append(
+                {
+                    "date": (
+                        payment.payment_date
+                        if payment.payment_date.tzinfo
+                        else payment.payment_date.replace(tzinfo=ZoneInfo("UTC"))
+                    ),
+                    "amount": -payment.amount,  # Negative for outflow
+                    "type": "payment",
+                    "account_id": payment.account_id,
+                    "category": payment.category,
+                }
+            )
 
         for income in income_entries:
             transactions.append(
@@ -229,12 +318,14 @@ class TransactionService(CashflowBaseService):
         # Add recurring transactions if requested
         if include_recurring:
             recurring_bills = await transaction_repo.get_recurring_bills(account.id)
+            range_start = _as_naive_utc(start_date).date()
+            range_end = _as_naive_utc(end_date).date()
 
             for bill in recurring_bills:
                 # Generate recurring instances within date range
-                current_date = bill.due_date
-                while current_date <= end_date:
-                    if current_date >= start_date:
+                current_date = _as_naive_utc(bill.due_date)
+                while current_date.date() <= range_end:
+                    if current_date.date() >= range_start:
                         transactions.append(
                             {
                                 "date": current_date,
@@ -244,12 +335,7 @@ class TransactionService(CashflowBaseService):
                             }
                         )
                     # Advance to next occurrence
-                    next_month = current_date.month + 1
-                    next_year = current_date.year
-                    if next_month > 12:
-                        next_month = 1
-                        next_year += 1
-                    current_date = date(next_year, next_month, current_date.day)
+                    current_date = _next_month(current_date)
 
         # Sort transactions by date
         return sorted(transactions, key=lambda x: x["date"])
@@ -0,0 +1,69 @@
+"""
+Domain event subscribers maintaining derived data.
+
+Subscribers run after the publishing transaction committed (see
+src/utils/domain_events.py), so each opens its own session from the given
+session factory and commits its own changes. The response cache needs no
+subscriber: every committed write already bumps its data version.
+"""
+
+from typing import Any, Callable, List
+
+from src.services.balance_history import BalanceHistoryService
+from src.utils.config import settings
+from src.utils.domain_events import (
+    AccountBalanceChanged,
+    DomainEventBus,
+    EventHandler,
+)
+
+
+def balance_history_subscriber(session_factory: Callable[[], Any]) -> EventHandler:
+    """
+    Build a subscriber recording balance history from balance changes.
+
+    A batch records one entry per account holding the balance after all of
+    the batch's changes, rather than one entry per change.
+
+    Args:
+        session_factory: Callable returning a new AsyncSession
+
+    Returns:
+        EventHandler: Async subscriber for AccountBalanceChanged events
+    """
+
+    async def record_balances(events: List[AccountBalanceChanged]) -> None:
+        latest = {event.account_id: event for event in events}
+        reconciled = [
+            account_id
+            for account_id, event in latest.items()
+            if event.reason == "reconciliation"
+        ]
+        async with session_factory() as session:
+            await BalanceHistoryService(session).record_current_balances(
+                latest, reconciled
+            )
+            await session.commit()
+
+    return record_balances
+
+
+def register_event_subscribers(
+    bus: DomainEventBus, session_factory: Callable[[], Any]
+) -> List[EventHandler]:
+    """
+    Subscribe the derived data maintainers enabled in settings.
+
+    Args:
+        bus: Event bus to subscribe to
+        session_factory: Callable returning a new AsyncSession for subscribers
+
+    Returns:
+        List[EventHandler]: Registered handlers, for unsubscribing at shutdown
+    """
+    handlers = []
+    if settings.BALANCE_HISTORY_FROM_EVENTS:
+        handler = balance_history_subscriber(session_factory)
+        bus.subscribe(AccountBalanceChanged, handler)
+        handlers.append(handler)
+    return handlers
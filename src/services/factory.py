@@ -9,14 +9,16 @@ Implemented as part of ADR-016 Account Type Expansion and ADR-019 Banking Accoun
 Updated for ADR-024 Feature Flag System to support service proxies for feature enforcement.
 """
 
-import importlib
-import inspect
 import logging
-from typing import Any, Dict, Optional, Set
+from typing import Any, Callable, Mapping, Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config.providers.feature_flags import ConfigProvider, DatabaseConfigProvider
+from src.registry.account_type_dispatch import (
+    AccountTypeDispatchTable,
+    known_account_types,
+)
 from src.registry.account_types import account_type_registry
 from src.repositories.factory import RepositoryFactory
 from src.repositories.feature_flags import FeatureFlagRepository
@@ -31,12 +33,54 @@ class ServiceFactory:
     Factory for creating services with specialized functionality.
 
     This class implements the factory pattern for creating services with
-    type-specific functionality. It dynamically loads service modules based
-    on account types and binds their functions to the base service instance.
+    type-specific functionality. Service modules for every account type are
+    resolved once into a process-wide dispatch table.
     """
 
-    # Cache for loaded service modules
-    _module_cache: Dict[str, Any] = {}
+    # Default service module per account type when the registry has no entry
+    _DEFAULT_MODULE_PATHS = {
+        "checking": "src.services.account_types.banking.checking",
+        "savings": "src.services.account_types.banking.savings",
+        "credit": "src.services.account_types.banking.credit",
+        "bnpl": "src.services.account_types.banking.bnpl",
+        "payment_app": "src.services.account_types.banking.payment_app",
+        "ewa": "src.services.account_types.banking.ewa",
+        "mortgage": "src.services.account_types.loan.mortgage",
+        "personal": "src.services.account_types.loan.personal",
+        "auto": "src.services.account_types.loan.auto",
+        "student": "src.services.account_types.loan.student",
+        "brokerage": "src.services.account_types.investment.brokerage",
+        "retirement": "src.services.account_types.investment.retirement",
+        "crypto": "src.services.account_types.investment.crypto",
+    }
+
+    # Process-wide dispatch table, built on first use
+    _dispatch_table: Optional[AccountTypeDispatchTable] = None
+
+    @classmethod
+    def get_dispatch_table(cls) -> AccountTypeDispatchTable:
+        """
+        Get the dispatch table of type-specific service functions.
+
+        The table is built once per process; call reset_dispatch_table after
+        registering new account types at runtime.
+
+        Returns:
+            AccountTypeDispatchTable: Shared dispatch table
+        """
+        if cls._dispatch_table is None:
+            cls._dispatch_table = AccountTypeDispatchTable.from_modules(
+                {
+                    account_type: cls._get_module_path(account_type)
+                    for account_type in known_account_types(cls._DEFAULT_MODULE_PATHS)
+                }
+            )
+        return cls._dispatch_table
+
+    @classmethod
+    def reset_dispatch_table(cls) -> None:
+        """Discard the dispatch table so it is rebuilt on next use."""
+        cls._dispatch_table = None
 
     @classmethod
     async def create_account_service(
@@ -128,19 +172,11 @@ class ServiceFactory:
         Returns:
             True if binding was successful, False otherwise
         """
-        # Get the module path for the account type
-        module_path = cls._get_module_path(account_type)
-        if not module_path:
+        functions = cls.get_dispatch_table().functions(account_type)
+        if not functions:
             return False
 
-        # Get the specialized module
-        module = cls._get_or_load_module(module_path)
-        if not module:
-            return False
-
-        # Bind specialized functions to the service
-        cls._bind_module_functions(service, module, session)
-
+        cls._bind_functions(service, functions, session)
         return True
 
     @classmethod
@@ -171,70 +207,24 @@ class ServiceFactory:
             category, sub_type = account_type.split("_", 1)
             return f"src.services.account_types.{category}.{sub_type}"
 
-        # Try to map common account types to default modules
-        type_to_module = {
-            "checking": "src.services.account_types.banking.checking",
-            "savings": "src.services.account_types.banking.savings",
-            "credit": "src.services.account_types.banking.credit",
-            "bnpl": "src.services.account_types.banking.bnpl",
-            "payment_app": "src.services.account_types.banking.payment_app",
-            "ewa": "src.services.account_types.banking.ewa",
-            "mortgage": "src.services.account_types.loan.mortgage",
-            "personal": "src.services.account_types.loan.personal",
-            "auto": "src.services.account_types.loan.auto",
-            "student": "src.services.account_types.loan.student",
-            "brokerage": "src.services.account_types.investment.brokerage",
-            "retirement": "src.services.account_types.investment.retirement",
-            "crypto": "src.services.account_types.investment.crypto",
-        }
-
-        return type_to_module.get(account_type)
+        return cls._DEFAULT_MODULE_PATHS.get(account_type)
 
     @classmethod
-    def _get_or_load_module(cls, module_path: str) -> Optional[Any]:
-        """
-        Get a cached module or load it if not cached.
-
-        Args:
-            module_path: Module path to load
-
-        Returns:
-            Loaded module or None if loading fails
-        """
-        # Return cached module if available
-        if module_path in cls._module_cache:
-            return cls._module_cache[module_path]
-
-        # Try to import the module
-        try:
-            module = importlib.import_module(module_path)
-            cls._module_cache[module_path] = module
-            return module
-        except ImportError as e:
-            # Log the error but don't raise an exception
-            logger.warning("Could not import service module %s: %s", module_path, e)
-            return None
-
-    @classmethod
-    def _bind_module_functions(
+    def _bind_functions(
         cls,
         service: Any,
-        module: Any,
+        functions: Mapping[str, Callable],
         session: AsyncSession,
     ) -> None:
         """
-        Bind functions from the module to the service instance.
+        Bind type-specific functions to the service instance.
 
         Args:
             service: Service instance to bind functions to
-            module: Module containing functions to bind
+            functions: Functions taking a session as first parameter, by name
             session: SQLAlchemy async session to pass to the bound functions
         """
-        # Find all async functions in the module that take a session as first parameter
-        for name, func in inspect.getmembers(module, inspect.iscoroutinefunction):
-            if name.startswith("_"):
-                continue
-
+        for name, func in functions.items():
             # Create a bound method that passes the session to the function
             async def bound_method(*args, _func=func, **kwargs):
                 return await _func(session, *args, **kwargs)
@@ -246,8 +236,6 @@ class ServiceFactory:
             # Bind the method to the service instance
             setattr(service, name, bound_method)
 
-        logger.debug("Bound %s functions to service", module.__name__)
-
 
 class ServiceFactoryHelper:
     """
@@ -265,18 +253,4 @@ class ServiceFactoryHelper:
         Returns:
             Set of function names available for this account type
         """
-        module_path = ServiceFactory._get_module_path(account_type)
-        if not module_path:
-            return set()
-
-        module = ServiceFactory._get_or_load_module(module_path)
-        if not module:
-            return set()
-
-        functions = {
-            name
-            for name, func in inspect.getmembers(module, inspect.iscoroutinefunction)
-            if not name.startswith("_")
-        }
-
-        return functions
+        return set(ServiceFactory.get_dispatch_table().functions(account_type))
@@ -1,6 +1,7 @@
+from collections import defaultdict
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,6 +20,7 @@ from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
 from src.utils.datetime_utils import ensure_utc, naive_utc_from_date
 from src.utils.decimal_precision import DecimalPrecision
+from src.utils.money import from_units, to_units
 
 
 class ImpactAnalysisService(BaseService):
@@ -142,16 +144,8 @@ class ImpactAnalysisService(BaseService):
         # Get repository
         repo = await self._get_repository(AccountRepository)
 
-        # Initialize results list
-        accounts = []
-
-        # Fetch each account individually to handle cases where some IDs might not exist
-        for account_id in account_ids:
-            account = await repo.get(account_id)
-            if account:
-                accounts.append(account)
-
-        return accounts
+        # Fetch all accounts in one query; IDs that don't exist are skipped
+        return list((await repo.get_many(account_ids)).values())
 
     async def _calculate_account_impacts(
         self, accounts: List[Account], splits: List[dict]
@@ -233,32 +227,25 @@ class ImpactAnalysisService(BaseService):
         end_date = today + timedelta(days=analysis_period_days)
         upcoming_bills = await self._get_upcoming_bills(today, end_date)
 
+        # Sum in integer ten-thousandths, which is exact at the 4 decimal
+        # calculation precision; amounts become Decimals again for the schema
+        bill_units_by_month: Dict[int, int] = defaultdict(int)
+        for bill in upcoming_bills:
+            bill_units_by_month[bill.due_date.month] += to_units(bill.amount)
+        available_units = sum(
+            to_units(account.available_balance) for account in accounts
+        )
+        available_funds = from_units(available_units)
+
         # Calculate impacts for each month in the period
         current_date = today
         while current_date <= end_date:
-            # Sum bill amounts with proper precision
-            month_bills = DecimalPrecision.round_for_calculation(
-                sum(
-                    DecimalPrecision.round_for_calculation(bill.amount)
-                    for bill in upcoming_bills
-                    if bill.due_date.month == current_date.month
-                )
-            )
-
-            # Calculate available funds across all accounts with proper precision
-            available_funds = DecimalPrecision.round_for_calculation(
-                sum(
-                    DecimalPrecision.round_for_calculation(account.available_balance)
-                    for account in accounts
-                )
-            )
+            month_units = bill_units_by_month.get(current_date.month, 0)
 
             # Calculate projected deficit
             projected_deficit = None
-            if available_funds < month_bills:
-                projected_deficit = DecimalPrecision.round_for_calculation(
-                    month_bills - available_funds
-                )
+            if available_units < month_units:
+                projected_deficit = from_units(month_units - available_units)
 
             # Use ensure_utc to ensure timezone-aware datetime
             impact_date = ensure_utc(
@@ -267,7 +254,7 @@ class ImpactAnalysisService(BaseService):
             impacts.append(
                 CashflowImpact(
                     date=impact_date,
-                    total_bills=month_bills,
+                    total_bills=from_units(month_units),
                     available_funds=available_funds,
                     projected_deficit=projected_deficit,
                 )
@@ -12,6 +12,7 @@ from src.schemas.income import IncomeCreate, IncomeFilters, IncomeUpdate
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
 from src.utils.decimal_precision import DecimalPrecision
+from src.utils.domain_events import AccountBalanceChanged, domain_events
 
 
 class IncomeService(BaseService):
@@ -456,13 +457,25 @@ class IncomeService(BaseService):
         new_balance_display = DecimalPrecision.round_for_display(new_balance)
 
         # Update the account balance
-        await account_repo.update(
-            account.id, {"available_balance": new_balance_display}
+        await account_repo.update_typed_entity(
+            account.id,
+            account.account_type,
+            {"available_balance": new_balance_display},
         )
 
         # Mark income as deposited using repository method
         income = await income_repo.mark_as_deposited(income_id)
 
+        domain_events.publish(
+            self._session,
+            AccountBalanceChanged(
+                account_id=account.id,
+                balance=new_balance_display,
+                change=income_amount,
+                reason="income_deposit",
+            ),
+        )
+
         # Return the updated income record with relationships loaded
         return await income_repo.get_with_relationships(income_id)
 
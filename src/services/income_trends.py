@@ -12,13 +12,13 @@ for all data access operations rather than direct database queries.
 """
 
 import statistics
-from datetime import timedelta
+from collections import defaultdict
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.income import Income
 from src.repositories.income_trends import IncomeTrendsRepository
 from src.schemas.income_trends import (
     IncomePattern,
@@ -29,7 +29,17 @@ from src.schemas.income_trends import (
 )
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
+from src.utils.compute_executor import run_compute
 from src.utils.datetime_utils import ensure_utc, utc_now
+from src.utils.decimal_precision import DecimalPrecision
+
+
+class IncomePoint(NamedTuple):
+    """An income record as plain values for the pure analysis phase."""
+
+    source: str
+    date: datetime
+    amount: Decimal
 
 
 class IncomeTrendsService(BaseService):
@@ -86,47 +96,79 @@ class IncomeTrendsService(BaseService):
         if not income_records:
             raise ValueError("No income records found for the specified criteria")
 
-        # Group records by source using repository method
-        source_records = await repo.group_records_by_source(income_records)
+        # Plain tuples rather than result rows, so the analysis can run in a
+        # worker process
+        points = [IncomePoint(*record) for record in income_records]
+        patterns, source_stats, seasonality, predictability = await run_compute(
+            IncomeTrendsService._analyze_points, points, request.min_confidence
+        )
+
+        # Get min and max dates from records using repository
+        min_date, max_date = await repo.get_min_max_dates(income_records)
+
+        # Return complete analysis
+        return IncomeTrendsAnalysis(
+            patterns=patterns,
+            seasonality=seasonality,
+            source_statistics=source_stats,
+            analysis_date=utc_now(),
+            data_start_date=ensure_utc(min_date),
+            data_end_date=ensure_utc(max_date),
+            overall_predictability_score=DecimalPrecision.round_for_calculation(
+                Decimal(str(predictability))
+            ),
+        )
+
+    @staticmethod
+    def _analyze_points(
+        points: Sequence[IncomePoint], min_confidence: Decimal
+    ) -> Tuple[
+        List[IncomePattern],
+        List[SourceStatistics],
+        Optional[SeasonalityMetrics],
+        float,
+    ]:
+        """Run the CPU-bound part of a trends analysis.
+
+        Args:
+            points: Income records ordered by date
+            min_confidence: Minimum confidence of included regular patterns
+
+        Returns:
+            Tuple of (patterns, source statistics, seasonality, predictability)
+        """
+        source_points: Dict[str, List[IncomePoint]] = defaultdict(list)
+        for point in points:
+            source_points[point.source].append(point)
 
         # Analyze patterns for each source
         patterns: List[IncomePattern] = []
         source_stats: List[SourceStatistics] = []
 
-        for source, records in source_records.items():
-            pattern = await self._analyze_source_pattern(source, records)
+        for source, records in source_points.items():
+            pattern = IncomeTrendsService._analyze_source_pattern(source, records)
             # For irregular patterns, always include them regardless of confidence
             if (
                 pattern.frequency == "irregular"
-                or pattern.confidence_score >= request.min_confidence
+                or pattern.confidence_score >= min_confidence
             ):
                 patterns.append(pattern)
 
-            stats = await self._calculate_source_statistics(source, records)
+            stats = IncomeTrendsService._calculate_source_statistics(source, records)
             source_stats.append(stats)
 
         # Analyze seasonality across all records
-        seasonality = await self._analyze_seasonality(income_records, repo)
+        seasonality = IncomeTrendsService._analyze_seasonality(points)
 
         # Calculate overall predictability
-        predictability = self._calculate_overall_predictability(patterns, source_stats)
-
-        # Get min and max dates from records using repository
-        min_date, max_date = await repo.get_min_max_dates(income_records)
-
-        # Return complete analysis
-        return IncomeTrendsAnalysis(
-            patterns=patterns,
-            seasonality=seasonality,
-            source_statistics=source_stats,
-            analysis_date=utc_now(),
-            data_start_date=ensure_utc(min_date),
-            data_end_date=ensure_utc(max_date),
-            overall_predictability_score=predictability,
+        predictability = IncomeTrendsService._calculate_overall_predictability(
+            patterns, source_stats
         )
+        return patterns, source_stats, seasonality, predictability
 
-    async def _analyze_source_pattern(
-        self, source: str, records: List[Income]
+    @staticmethod
+    def _analyze_source_pattern(
+        source: str, records: Sequence[IncomePoint]
     ) -> IncomePattern:
         """Analyze pattern for a specific income source.
 
@@ -147,7 +189,9 @@ class IncomeTrendsService(BaseService):
             return IncomePattern(
                 source=source,
                 frequency="irregular",
-                average_amount=sum(amounts) / len(amounts),
+                average_amount=DecimalPrecision.round_for_display(
+                    sum(amounts) / len(amounts)
+                ),
                 confidence_score=Decimal("0.0"),
                 last_occurrence=ensure_utc(max(dates)),
                 next_predicted=None,
@@ -159,7 +203,9 @@ class IncomeTrendsService(BaseService):
             str(statistics.stdev(intervals) if len(intervals) > 1 else float("inf"))
         )
 
-        frequency, confidence = self._determine_frequency(avg_interval, interval_std)
+        frequency, confidence = IncomeTrendsService._determine_frequency(
+            avg_interval, interval_std
+        )
 
         # Predict next occurrence if pattern is reliable
         next_predicted = None
@@ -171,14 +217,17 @@ class IncomeTrendsService(BaseService):
         return IncomePattern(
             source=source,
             frequency=frequency,
-            average_amount=sum(amounts) / len(amounts),
-            confidence_score=confidence,
+            average_amount=DecimalPrecision.round_for_display(
+                sum(amounts) / len(amounts)
+            ),
+            confidence_score=DecimalPrecision.round_for_calculation(confidence),
             last_occurrence=ensure_utc(max(dates)),
             next_predicted=next_predicted,
         )
 
+    @staticmethod
     def _determine_frequency(
-        self, avg_interval: Decimal, interval_std: Decimal
+        avg_interval: Decimal, interval_std: Decimal
     ) -> Tuple[str, Decimal]:
         """Determine frequency pattern and confidence score.
 
@@ -214,8 +263,9 @@ class IncomeTrendsService(BaseService):
 
         return best_match, max(Decimal("0.0"), min(Decimal("1.0"), best_confidence))
 
-    async def _calculate_source_statistics(
-        self, source: str, records: List[Income]
+    @staticmethod
+    def _calculate_source_statistics(
+        source: str, records: Sequence[IncomePoint]
     ) -> SourceStatistics:
         """Calculate statistical metrics for an income source.
 
@@ -232,16 +282,21 @@ class IncomeTrendsService(BaseService):
             source=source,
             total_occurrences=len(records),
             total_amount=sum(amounts),
-            average_amount=sum(amounts) / len(amounts),
+            average_amount=DecimalPrecision.round_for_display(
+                sum(amounts) / len(amounts)
+            ),
             min_amount=min(amounts),
             max_amount=max(amounts),
-            standard_deviation=Decimal(
-                str(statistics.stdev(amounts) if len(amounts) > 1 else 0)
+            standard_deviation=DecimalPrecision.round_for_display(
+                Decimal(str(statistics.stdev(amounts) if len(amounts) > 1 else 0))
+            ),
+            reliability_score=DecimalPrecision.round_for_calculation(
+                IncomeTrendsService._calculate_reliability_score(records)
             ),
-            reliability_score=self._calculate_reliability_score(records),
         )
 
-    def _calculate_reliability_score(self, records: List[Income]) -> Decimal:
+    @staticmethod
+    def _calculate_reliability_score(records: Sequence[IncomePoint]) -> Decimal:
         """Calculate reliability score based on consistency of amounts and timing.
 
         Args:
@@ -275,14 +330,14 @@ class IncomeTrendsService(BaseService):
 
         return (amount_reliability + interval_reliability) / Decimal("2.0")
 
-    async def _analyze_seasonality(
-        self, records: List[Income], repo: IncomeTrendsRepository
+    @staticmethod
+    def _analyze_seasonality(
+        records: Sequence[IncomePoint],
     ) -> Optional[SeasonalityMetrics]:
         """Analyze seasonal patterns in income data.
 
         Args:
             records: List of income records to analyze
-            repo: IncomeTrendsRepository for data access operations
 
         Returns:
             Seasonality metrics if sufficient data exists, None otherwise
@@ -290,8 +345,10 @@ class IncomeTrendsService(BaseService):
         if len(records) < 12:  # Need at least a year of data
             return None
 
-        # Group by month using repository method
-        monthly_records = await repo.get_records_by_month(records)
+        # Group by month
+        monthly_records: Dict[int, List[IncomePoint]] = defaultdict(list)
+        for record in records:
+            monthly_records[record.date.month].append(record)
 
         # Calculate monthly averages with Decimal
         monthly_averages = {}
@@ -332,11 +389,12 @@ class IncomeTrendsService(BaseService):
             peak_months=peak_months,
             trough_months=trough_months,
             variance_coefficient=float(cv),
-            confidence_score=confidence,
+            confidence_score=DecimalPrecision.round_for_calculation(confidence),
         )
 
+    @staticmethod
     def _calculate_overall_predictability(
-        self, patterns: List[IncomePattern], statistics: List[SourceStatistics]
+        patterns: List[IncomePattern], statistics: List[SourceStatistics]
     ) -> float:
         """Calculate overall predictability score.
 
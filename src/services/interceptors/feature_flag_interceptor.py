@@ -136,7 +136,9 @@ class ServiceInterceptor:
 
         # If we get here, all checks passed
         logger.debug(
-            f"Feature flag check passed for {service_class}.{method_name}",
+            "Feature flag check passed for %s.%s",
+            service_class,
+            method_name,
             extra={
                 "service": service_class,
                 "method": method_name,
@@ -268,7 +270,7 @@ class ServiceInterceptor:
 
             return result
         except Exception as e:
-            logger.error(f"Error getting service requirements: {e}")
+            logger.error("Error getting service requirements: %s", e)
 
             # Return empty dict if no cache, or use expired cache in emergency
             if "service_requirements" in self._cache:
@@ -13,6 +13,7 @@ from src.schemas.liabilities import AutoPayUpdate, LiabilityCreate, LiabilityUpd
 from src.services.base import BaseService
 from src.utils.datetime_utils import days_from_now, ensure_utc, utc_now
 from src.utils.decimal_precision import DecimalPrecision
+from src.utils.domain_events import LiabilityPaid, domain_events
 
 
 class LiabilityService(BaseService):
@@ -635,4 +636,15 @@ class LiabilityService(BaseService):
             Optional[Liability]: Updated liability or None if not found
         """
         liability_repo = await self._get_repository(LiabilityRepository)
-        return await liability_repo.mark_as_paid(liability_id, payment_date)
+        liability = await liability_repo.mark_as_paid(liability_id, payment_date)
+        if liability is not None:
+            domain_events.publish(
+                self._session,
+                LiabilityPaid(
+                    liability_id=liability.id,
+                    account_id=liability.primary_account_id,
+                    amount=liability.amount,
+                    paid_at=payment_date or utc_now(),
+                ),
+            )
+        return liability
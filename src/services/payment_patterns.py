@@ -5,7 +5,9 @@ This module provides services for analyzing payment patterns, including
 frequency detection, amount analysis, and pattern classification.
 """
 
-from typing import Any, List, Optional, Tuple
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +23,8 @@ from src.schemas.payment_patterns import (
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
 
+logger = logging.getLogger(__name__)
+
 
 # TODO: Create a separate ExpensePatternService for analyzing non-bill payment patterns
 class BillPaymentPatternService(BaseService):
@@ -69,8 +73,8 @@ class BillPaymentPatternService(BaseService):
         # Get repository
         pattern_repo = await self._get_repository(PaymentPatternRepository)
 
-        # Get payments using repository
-        payments = await pattern_repo.get_payments_with_filters(
+        # Get the payment fields the analysis reads using repository
+        payments = await pattern_repo.get_payment_points(
             liability_id=request.liability_id,
             account_id=request.account_id,
             category_id=request.category_id,
@@ -79,18 +83,34 @@ class BillPaymentPatternService(BaseService):
             order_by_asc=True,  # Always ascending for pattern analysis
         )
 
-        # Debug info
-        print(
-            f"\nGot {len(payments)} payments for liability {request.liability_id} between {request.start_date} and {request.end_date}"
+        logger.debug(
+            "Analyzing %d payments for liability %s between %s and %s",
+            len(payments),
+            request.liability_id,
+            request.start_date,
+            request.end_date,
         )
-        for p in payments:
-            print(
-                f"  Payment: {p.amount} on {p.payment_date} (liability_id={p.liability_id})"
-            )
+
+        return await self._analyze_points(payments, request)
+
+    async def _analyze_points(
+        self, payments: Sequence[Any], request: PaymentPatternRequest
+    ) -> PaymentPatternAnalysis:
+        """
+        Analyze already loaded payment points.
+
+        Args:
+            payments (Sequence[Any]): Payment points ordered by payment date
+            request (PaymentPatternRequest): Analysis parameters
+
+        Returns:
+            PaymentPatternAnalysis: Comprehensive pattern analysis result
+        """
+        pattern_repo = await self._get_repository(PaymentPatternRepository)
 
         # Not enough data for analysis
         if len(payments) < request.min_sample_size:
-            return self._create_unknown_pattern(payments, request)
+            return await self._create_unknown_pattern(payments, request)
 
         # Calculate metrics using repository methods
         avg_days, std_dev_days, min_days, max_days = (
@@ -378,18 +398,63 @@ class BillPaymentPatternService(BaseService):
         # Get repositories
         pattern_repo = await self._get_repository(PaymentPatternRepository)
 
-        # Get bill payments using repository
-        payments = await pattern_repo.get_bill_payments(liability_id)
+        # Get bill payment fields using repository
+        payments = await pattern_repo.get_payment_points(liability_id=liability_id)
 
-        print(f"\nFound {len(payments)} payments:")
-        for p in payments:
-            print(
-                f"  Payment: {p.amount} on {p.payment_date} (liability_id={p.liability_id})"
-            )
+        logger.debug(
+            "Analyzing %d payments for liability %s", len(payments), liability_id
+        )
 
         if not payments:
             return None
 
+        return await self._analyze_bill_points(liability_id, payments)
+
+    async def analyze_bills_payments(
+        self, liability_ids: Sequence[int]
+    ) -> Dict[int, PaymentPatternAnalysis]:
+        """
+        Analyze payment patterns for several bills from one batch of payments.
+
+        Args:
+            liability_ids (Sequence[int]): IDs of the liabilities/bills to analyze
+
+        Returns:
+            Dict[int, PaymentPatternAnalysis]: Analyses keyed by liability ID;
+                bills without payments are omitted
+        """
+        pattern_repo = await self._get_repository(PaymentPatternRepository)
+        rows = await pattern_repo.get_payment_points_for_liabilities(liability_ids)
+
+        # Rows arrive grouped by liability and ordered by payment date
+        points_by_bill: Dict[int, List[Any]] = defaultdict(list)
+        for row in rows:
+            points_by_bill[row.liability_id].append(row)
+
+        logger.debug(
+            "Analyzing %d payments for %d liabilities", len(rows), len(points_by_bill)
+        )
+
+        return {
+            liability_id: await self._analyze_bill_points(liability_id, payments)
+            for liability_id, payments in points_by_bill.items()
+        }
+
+    async def _analyze_bill_points(
+        self, liability_id: int, payments: Sequence[Any]
+    ) -> PaymentPatternAnalysis:
+        """
+        Analyze the payment points of one bill over their own date range.
+
+        Args:
+            liability_id (int): ID of the liability/bill
+            payments (Sequence[Any]): The bill's payment points, oldest first
+
+        Returns:
+            PaymentPatternAnalysis: Pattern analysis of the bill
+        """
+        pattern_repo = await self._get_repository(PaymentPatternRepository)
+
         # Get date range using repository method
         start_date, end_date = await pattern_repo.get_date_range_for_pattern_analysis(
             payments
@@ -405,5 +470,5 @@ class BillPaymentPatternService(BaseService):
             liability_id=liability_id,  # Add liability_id to request
         )
 
-        # Use existing analysis logic
-        return await self.analyze_payment_patterns(request)
+        # The points already cover the request's date range
+        return await self._analyze_points(payments, request)
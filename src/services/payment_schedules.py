@@ -4,6 +4,7 @@ Payment schedule service implementation.
 This module provides a service for managing payment schedules.
 """
 
+import logging
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional, Tuple
@@ -21,6 +22,8 @@ from src.services.feature_flags import FeatureFlagService
 from src.services.payments import PaymentService
 from src.utils.datetime_utils import ensure_utc, utc_now
 
+logger = logging.getLogger(__name__)
+
 
 class PaymentScheduleService(BaseService):
     """
@@ -251,7 +254,9 @@ class PaymentScheduleService(BaseService):
                 processed_schedules.append(processed_schedule)
             except Exception as e:
                 # Log error but continue processing other schedules
-                print(f"Error processing schedule {schedule.id}: {str(e)}")
+                logger.error(
+                    "Error processing schedule %s: %s", schedule.id, e, exc_info=True
+                )
 
         return processed_schedules
 
@@ -47,9 +47,13 @@ class PaymentService(BaseService):
         # Get account repository
         account_repo = await self._get_repository(AccountRepository)
 
+        # Resolve every source account in one query
+        accounts = await account_repo.get_many(
+            source["account_id"] for source in sources
+        )
+
         for source in sources:
-            # Get account from repository
-            account = await account_repo.get(source["account_id"])
+            account = accounts.get(source["account_id"])
             if not account:
                 return False, f"Account {source['account_id']} not found"
 
@@ -17,6 +17,7 @@ from src.config.providers.feature_flags import ConfigProvider
 from src.errors.feature_flags import FeatureDisabledError
 from src.services.feature_flags import FeatureFlagService
 from src.services.interceptors.feature_flag_interceptor import ServiceInterceptor
+from src.utils.instrumentation import track_method
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -57,7 +58,8 @@ class ServiceProxy:
         )
 
         logger.debug(
-            f"ServiceProxy initialized for {self._service_class}",
+            "ServiceProxy initialized for %s",
+            self._service_class,
             extra={"service": self._service_class},
         )
 
@@ -97,15 +99,18 @@ class ServiceProxy:
                 )
 
                 # Method call is allowed, execute it
-                if is_async:
-                    return await original_attr(*args, **kwargs)
-                else:
-                    return original_attr(*args, **kwargs)
+                with track_method("service", self._service_class, name) as call:
+                    if is_async:
+                        call.result = await original_attr(*args, **kwargs)
+                    else:
+                        call.result = original_attr(*args, **kwargs)
+                return call.result
 
             except FeatureDisabledError as e:
                 # Log the feature flag violation
                 logger.warning(
-                    f"Feature flag check failed: {e}",
+                    "Feature flag check failed: %s",
+                    e,
                     extra={
                         "service": self._service_class,
                         "method": name,
@@ -138,12 +143,15 @@ class ServiceProxy:
                         loop.close()
 
                     # Method call is allowed, execute it
-                    return original_attr(*args, **kwargs)
+                    with track_method("service", self._service_class, name) as call:
+                        call.result = original_attr(*args, **kwargs)
+                    return call.result
 
                 except FeatureDisabledError as e:
                     # Log the feature flag violation
                     logger.warning(
-                        f"Feature flag check failed: {e}",
+                        "Feature flag check failed: %s",
+                        e,
                         extra={
                             "service": self._service_class,
                             "method": name,
@@ -171,6 +179,7 @@ class ServiceProxy:
             loop.close()
 
         logger.debug(
-            f"Cache invalidated for {self._service_class}",
+            "Cache invalidated for %s",
+            self._service_class,
             extra={"service": self._service_class},
         )
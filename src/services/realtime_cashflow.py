@@ -6,7 +6,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.liabilities import Liability
 from src.models.transaction_history import TransactionHistory
+from src.repositories.accounts import AccountRepository
 from src.repositories.cashflow.cashflow_realtime_repository import (
     RealtimeCashflowRepository,
 )
@@ -21,6 +23,7 @@ from src.schemas.cashflow import (
 from src.schemas.realtime_cashflow import AccountBalance, RealtimeCashflow
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
+from src.utils.datetime_utils import utc_now
 from src.utils.decimal_precision import DecimalPrecision
 
 
@@ -67,19 +70,20 @@ class RealtimeCashflowService(BaseService):
 
     async def get_account_balances(self) -> List[AccountBalance]:
         """Fetch current balances for all accounts."""
-        repo = await self.realtime_repository
-        accounts = await repo.get_all_accounts()
+        # The summary projection avoids joining every account subtype table
+        account_repo = await self._get_repository(AccountRepository)
+        summaries = await account_repo.get_account_summaries()
 
         return [
             AccountBalance(
-                account_id=account.id,
-                name=account.name,
-                type=account.account_type,
-                current_balance=account.available_balance,
-                available_credit=account.available_credit,
-                total_limit=account.total_limit,
+                account_id=summary["id"],
+                name=summary["name"],
+                type=summary["account_type"],
+                current_balance=summary["available_balance"],
+                available_credit=summary["available_credit"],
+                total_limit=summary["credit_limit"],
             )
-            for account in accounts
+            for summary in summaries
         ]
 
     async def get_upcoming_bill(self) -> Tuple[Optional[datetime], Optional[int]]:
@@ -92,10 +96,25 @@ class RealtimeCashflowService(BaseService):
         repo = await self.realtime_repository
         return await repo.calculate_minimum_balance(days=14)
 
+    async def get_unpaid_liabilities(self) -> List[Liability]:
+        """Get all unpaid liabilities."""
+        repo = await self.realtime_repository
+        return await repo.get_unpaid_liabilities()
+
     async def get_realtime_cashflow(self) -> RealtimeCashflow:
         """Get real-time cashflow data across all accounts."""
-        repo = await self.realtime_repository
-        account_balances = await self.get_account_balances()
+        # The lookups are independent, so they run concurrently when possible
+        (
+            account_balances,
+            upcoming_bills,
+            (next_bill_date, days_until_bill),
+            min_balance,
+        ) = await self._run_independent(
+            lambda service: service.get_account_balances(),
+            lambda service: service.get_unpaid_liabilities(),
+            lambda service: service.get_upcoming_bill(),
+            lambda service: service.calculate_minimum_balance(),
+        )
 
         total_funds = sum(
             (acc.current_balance for acc in account_balances if acc.type != "credit"),
@@ -111,13 +130,8 @@ class RealtimeCashflowService(BaseService):
             Decimal(0),
         )
 
-        # Get upcoming bills
-        upcoming_bills = await repo.get_unpaid_liabilities()
         total_liabilities = sum((bill.amount for bill in upcoming_bills), Decimal(0))
 
-        next_bill_date, days_until_bill = await self.get_upcoming_bill()
-        min_balance = await self.calculate_minimum_balance()
-
         # Calculate projected deficit
         projected_deficit = None
         if total_funds < min_balance:
@@ -261,8 +275,10 @@ class RealtimeCashflowService(BaseService):
                     peak_usage_days=[],
                     category_preferences={},
                     utilization_rate=(
-                        abs(account.available_balance) / account.total_limit
-                        if account.account_type == "credit" and account.total_limit
+                        DecimalPrecision.round_for_calculation(
+                            abs(account.available_balance) / account.credit_limit
+                        )
+                        if account.account_type == "credit" and account.credit_limit
                         else None
                     ),
                 )
@@ -282,13 +298,17 @@ class RealtimeCashflowService(BaseService):
 
             # Calculate utilization rate for credit accounts
             utilization_rate = None
-            if account.account_type == "credit" and account.total_limit:
-                utilization_rate = abs(account.available_balance) / account.total_limit
+            if account.account_type == "credit" and account.credit_limit:
+                utilization_rate = DecimalPrecision.round_for_calculation(
+                    abs(account.available_balance) / account.credit_limit
+                )
 
             patterns[account.id] = AccountUsagePattern(
                 account_id=account.id,
                 primary_use=self._determine_primary_use(transactions),
-                average_transaction_size=avg_transaction,
+                average_transaction_size=DecimalPrecision.round_for_display(
+                    avg_transaction
+                ),
                 common_merchants=sorted(
                     merchants_data.keys(), key=merchants_data.get, reverse=True
                 )[:10],
@@ -324,7 +344,10 @@ class RealtimeCashflowService(BaseService):
         if total == 0:
             return {}
 
-        return {k: v / total for k, v in categories.items()}
+        return {
+            k: DecimalPrecision.round_for_calculation(v / total)
+            for k, v in categories.items()
+        }
 
     async def analyze_balance_distribution(self) -> Dict[int, BalanceDistribution]:
         """Analyze balance distribution across accounts."""
@@ -357,16 +380,26 @@ class RealtimeCashflowService(BaseService):
             # Create distribution object with calculated metrics
             distributions[account.id] = BalanceDistribution(
                 account_id=account.id,
-                average_balance=Decimal(str(avg_balance)),
-                balance_volatility=Decimal(str(balance_volatility)),
+                average_balance=DecimalPrecision.round_for_display(
+                    Decimal(str(avg_balance))
+                ),
+                balance_volatility=DecimalPrecision.round_for_display(
+                    Decimal(str(balance_volatility))
+                ),
                 min_balance_30d=min(balances),
                 max_balance_30d=max(balances),
                 typical_balance_range=(
-                    Decimal(str(avg_balance - balance_volatility)),
-                    Decimal(str(avg_balance + balance_volatility)),
+                    DecimalPrecision.round_for_display(
+                        Decimal(str(avg_balance - balance_volatility))
+                    ),
+                    DecimalPrecision.round_for_display(
+                        Decimal(str(avg_balance + balance_volatility))
+                    ),
                 ),
                 percentage_of_total=(
-                    abs(account.available_balance) / total_balance
+                    DecimalPrecision.round_for_calculation(
+                        abs(account.available_balance) / total_balance
+                    )
                     if total_balance > 0 and account.account_type != "credit"
                     else Decimal(0)
                 ),
@@ -404,8 +437,8 @@ class RealtimeCashflowService(BaseService):
 
             # Calculate credit utilization risk
             credit_utilization_risk = None
-            if account.account_type == "credit" and account.total_limit:
-                utilization = abs(account.available_balance) / account.total_limit
+            if account.account_type == "credit" and account.credit_limit:
+                utilization = abs(account.available_balance) / account.credit_limit
                 credit_utilization_risk = min(utilization, Decimal("1"))
 
             # Calculate payment failure risk based on transaction patterns
@@ -436,22 +469,38 @@ class RealtimeCashflowService(BaseService):
             risks[account.id] = AccountRiskAssessment(
                 account_id=account.id,
                 overdraft_risk=overdraft_risk,
-                credit_utilization_risk=credit_utilization_risk,
+                credit_utilization_risk=(
+                    DecimalPrecision.round_for_calculation(credit_utilization_risk)
+                    if credit_utilization_risk is not None
+                    else None
+                ),
                 payment_failure_risk=payment_failure_risk,
-                volatility_score=volatility_score,
-                overall_risk_score=overall_risk,
+                volatility_score=DecimalPrecision.round_for_calculation(
+                    Decimal(str(volatility_score))
+                ),
+                overall_risk_score=DecimalPrecision.round_for_calculation(
+                    Decimal(str(overall_risk))
+                ),
             )
 
         return risks
 
     async def get_cross_account_analysis(self) -> CrossAccountAnalysis:
         """Get comprehensive cross-account analysis."""
-        # All these methods now use repository pattern internally
-        correlations = await self.analyze_account_correlations()
-        transfer_patterns = await self.analyze_transfer_patterns()
-        usage_patterns = await self.analyze_usage_patterns()
-        balance_distribution = await self.analyze_balance_distribution()
-        risk_assessment = await self.assess_account_risks()
+        # The analyses are independent, so they run concurrently when possible
+        (
+            correlations,
+            transfer_patterns,
+            usage_patterns,
+            balance_distribution,
+            risk_assessment,
+        ) = await self._run_independent(
+            lambda service: service.analyze_account_correlations(),
+            lambda service: service.analyze_transfer_patterns(),
+            lambda service: service.analyze_usage_patterns(),
+            lambda service: service.analyze_balance_distribution(),
+            lambda service: service.assess_account_risks(),
+        )
 
         return CrossAccountAnalysis(
             correlations=correlations,
@@ -459,5 +508,5 @@ class RealtimeCashflowService(BaseService):
             usage_patterns=usage_patterns,
             balance_distribution=balance_distribution,
             risk_assessment=risk_assessment,
-            timestamp=datetime.now().date(),
+            timestamp=utc_now(),
         )
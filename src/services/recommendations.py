@@ -1,6 +1,6 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,11 +17,17 @@ from src.schemas.recommendations import (
     RecommendationResponse,
 )
 from src.services.base import BaseService
-from src.services.cashflow.cashflow_metrics_service import MetricsService
+from src.services.cashflow.cashflow_metrics_service import (
+    CashflowProjection,
+    MetricsService,
+)
 from src.services.feature_flags import FeatureFlagService
 from src.services.payment_patterns import BillPaymentPatternService
 from src.utils.datetime_utils import ensure_utc, utc_now
 
+# Irregular patterns search this many days before the due date (2 weeks)
+IRREGULAR_SEARCH_DAYS = 14
+
 
 class RecommendationService(BaseService):
     """
@@ -78,6 +84,11 @@ class RecommendationService(BaseService):
         """
         Generate bill payment timing recommendations based on historical patterns.
 
+        Payment histories, affected accounts and the cashflow projection are
+        loaded once for all active bills, and every bill's candidate dates are
+        then evaluated against that shared data, so the number of queries does
+        not grow with the number of bills.
+
         Args:
             account_ids: Optional list of account IDs to filter by
 
@@ -94,14 +105,37 @@ class RecommendationService(BaseService):
 
         # Get active bills
         bills = await liability_repo.get_active_bills()
+        bill_ids = [bill.id for bill in bills]
 
-        for bill in bills:
-            recommendation = await self._analyze_bill_payment_timing(bill, account_ids)
-            if recommendation:
-                recommendations.append(recommendation)
-                if recommendation.impact.savings_potential:
-                    total_savings += recommendation.impact.savings_potential
-                confidence_sum += self._confidence_to_decimal(recommendation.confidence)
+        # One batch of payment histories and payer accounts for every bill
+        patterns = (
+            await self.pattern_service.analyze_bills_payments(bill_ids) if bills else {}
+        )
+        affected_accounts = await self._get_affected_accounts(bill_ids, account_ids)
+
+        # Only bills with a history and affected accounts can be recommended
+        candidates = [
+            bill
+            for bill in bills
+            if patterns.get(bill.id) and affected_accounts.get(bill.id)
+        ]
+
+        if candidates:
+            # One projection spanning every candidate date of every bill
+            start_date, end_date = self._projection_window(candidates, patterns)
+            projection = await self.metrics_service.get_projection(start_date, end_date)
+
+            for bill in candidates:
+                recommendation = await self._analyze_bill_payment_timing(
+                    bill, patterns[bill.id], affected_accounts[bill.id], projection
+                )
+                if recommendation:
+                    recommendations.append(recommendation)
+                    if recommendation.impact.savings_potential:
+                        total_savings += recommendation.impact.savings_potential
+                    confidence_sum += self._confidence_to_decimal(
+                        recommendation.confidence
+                    )
 
         avg_confidence = (
             confidence_sum / len(recommendations) if recommendations else Decimal("0")
@@ -117,36 +151,65 @@ class RecommendationService(BaseService):
             generated_at=generated_at,
         )
 
+    def _projection_window(
+        self,
+        bills: List[Liability],
+        patterns: Dict[int, PaymentPatternAnalysis],
+    ) -> Tuple[date, date]:
+        """
+        Get the date range covering every date the bills may be evaluated on.
+
+        Recommended dates are never after a bill's due date and precede it by
+        at most the irregular search window, the regular pattern interval or
+        the seasonal lead time.
+
+        Args:
+            bills: Bills that will be evaluated
+            patterns: Payment pattern analyses keyed by bill ID
+
+        Returns:
+            Tuple of (first date, last date)
+        """
+        start_date: Optional[date] = None
+        end_date: Optional[date] = None
+        for bill in bills:
+            pattern_analysis = patterns[bill.id]
+            lookback = max(
+                IRREGULAR_SEARCH_DAYS,
+                int(pattern_analysis.frequency_metrics.average_days_between),
+                *(
+                    int(season.avg_days_before_due)
+                    for season in (pattern_analysis.seasonal_metrics or {}).values()
+                ),
+            )
+            due = ensure_utc(bill.due_date).date()
+            first = due - timedelta(days=lookback)
+            start_date = first if start_date is None else min(start_date, first)
+            end_date = due if end_date is None else max(end_date, due)
+        return start_date, end_date
+
     async def _analyze_bill_payment_timing(
-        self, bill: Liability, account_ids: Optional[List[int]]
+        self,
+        bill: Liability,
+        pattern_analysis: PaymentPatternAnalysis,
+        affected_accounts: List[Account],
+        projection: CashflowProjection,
     ) -> Optional[BillPaymentTimingRecommendation]:
         """
-        Analyze payment patterns for a bill and generate timing recommendations.
+        Evaluate a bill's payment timing against the shared cashflow projection.
 
         Args:
             bill: Liability to analyze
-            account_ids: Optional list of account IDs to filter by
+            pattern_analysis: Payment pattern analysis of the bill
+            affected_accounts: Accounts that fund the bill's payments
+            projection: Cashflow projection covering the bill's candidate dates
 
         Returns:
             Recommendation for optimal payment timing or None if no recommendation
         """
-        # Get payment patterns
-        pattern_analysis: Optional[PaymentPatternAnalysis] = (
-            await self.pattern_service.analyze_bill_payments(bill.id)
-        )
-
-        if not pattern_analysis:
-            return None
-
-        # Get affected accounts
-        affected_accounts = await self._get_affected_accounts(bill.id, account_ids)
-
-        if not affected_accounts:
-            return None
-
         # Analyze optimal payment timing
         optimal_date, confidence, reason = await self._calculate_optimal_payment_date(
-            bill, pattern_analysis, affected_accounts
+            bill, pattern_analysis, affected_accounts, projection
         )
 
         if not optimal_date:
@@ -154,7 +217,7 @@ class RecommendationService(BaseService):
 
         # Calculate impact metrics
         impact = await self._calculate_impact_metrics(
-            bill, optimal_date, affected_accounts
+            bill, optimal_date, affected_accounts, projection
         )
 
         # Create recommendation with proper timezone handling
@@ -174,50 +237,50 @@ class RecommendationService(BaseService):
         )
 
     async def _get_affected_accounts(
-        self, bill_id: int, account_ids: Optional[List[int]]
-    ) -> List[Account]:
+        self, bill_ids: List[int], account_ids: Optional[List[int]]
+    ) -> Dict[int, List[Account]]:
         """
-        Get accounts affected by a bill's payments.
+        Get the accounts affected by each bill's payments.
 
         Args:
-            bill_id: ID of the bill to analyze
+            bill_ids: IDs of the bills to analyze
             account_ids: Optional list of account IDs to filter by
 
         Returns:
-            List of affected accounts
+            Affected accounts keyed by bill ID; bills without any are omitted
         """
+        if not bill_ids:
+            return {}
+
         # Get repositories
         payment_repo = await self._get_repository(PaymentRepository)
         account_repo = await self._get_repository(AccountRepository)
 
-        # Get recent payments for the bill with sources loaded
-        payments = await payment_repo.get_recent_bill_payments(bill_id, limit=5)
-
-        # Get unique account IDs from payment sources
-        account_ids_set = set()
-        for payment in payments:
-            for source in payment.sources:
-                if not account_ids or source.account_id in account_ids:
-                    account_ids_set.add(source.account_id)
-
-        # Get account details
-        if not account_ids_set:
-            return []
-
-        # Get accounts with those IDs
-        accounts = []
-        for account_id in account_ids_set:
-            account = await account_repo.get(account_id)
-            if account:
-                accounts.append(account)
+        # Source accounts of each bill's five most recent payments
+        payer_ids = await payment_repo.get_recent_payment_accounts(bill_ids, limit=5)
+        if account_ids:
+            payer_ids = {
+                bill_id: [acc_id for acc_id in ids if acc_id in account_ids]
+                for bill_id, ids in payer_ids.items()
+            }
+
+        # Get all affected accounts in one query
+        accounts = await account_repo.get_many(
+            acc_id for ids in payer_ids.values() for acc_id in ids
+        )
 
-        return accounts
+        return {
+            bill_id: [accounts[acc_id] for acc_id in ids if acc_id in accounts]
+            for bill_id, ids in payer_ids.items()
+            if any(acc_id in accounts for acc_id in ids)
+        }
 
     async def _calculate_optimal_payment_date(
         self,
         bill: Liability,
         pattern_analysis: PaymentPatternAnalysis,
         accounts: List[Account],
+        projection: CashflowProjection,
     ) -> Tuple[Optional[date], Optional[ConfidenceLevel], str]:
         """
         Calculate the optimal payment date based on patterns and account status.
@@ -226,6 +289,7 @@ class RecommendationService(BaseService):
             bill: Liability to analyze
             pattern_analysis: Analysis of payment patterns
             accounts: Affected accounts
+            projection: Cashflow projection covering the candidate dates
 
         Returns:
             Tuple of (optimal date, confidence level, reason)
@@ -234,7 +298,7 @@ class RecommendationService(BaseService):
             return await self._analyze_regular_pattern(bill, pattern_analysis, accounts)
         elif pattern_analysis.pattern_type == PatternType.IRREGULAR:
             return await self._analyze_irregular_pattern(
-                bill, pattern_analysis, accounts
+                bill, pattern_analysis, accounts, projection
             )
         elif pattern_analysis.pattern_type == PatternType.SEASONAL:
             return await self._analyze_seasonal_pattern(
@@ -249,6 +313,7 @@ class RecommendationService(BaseService):
         bill: Liability,
         recommended_date: date,
         accounts: List[Account],
+        projection: CashflowProjection,
     ) -> ImpactMetrics:
         """
         Calculate the impact of the recommendation on accounts.
@@ -257,6 +322,7 @@ class RecommendationService(BaseService):
             bill: The liability being analyzed
             recommended_date: Recommended payment date
             accounts: List of affected accounts
+            projection: Cashflow projection covering both dates
 
         Returns:
             Impact metrics for the recommendation
@@ -275,10 +341,8 @@ class RecommendationService(BaseService):
         )
 
         # Calculate impacts based on cashflow projections
-        current_metrics = await self.metrics_service.get_metrics_for_date(current_due)
-        recommended_metrics = await self.metrics_service.get_metrics_for_date(
-            recommended
-        )
+        current_metrics = projection.metrics_for(current_due)
+        recommended_metrics = projection.metrics_for(recommended)
 
         if recommended_metrics and current_metrics:
             balance_impact = (
@@ -439,6 +503,7 @@ class RecommendationService(BaseService):
         accounts: List[
             Account
         ],  # Keep this for potential future use and API compatibility
+        projection: CashflowProjection,
     ) -> Tuple[Optional[date], ConfidenceLevel, str]:
         """
         Analyze irregular payment patterns for optimal timing.
@@ -447,6 +512,7 @@ class RecommendationService(BaseService):
             bill: Liability to analyze
             pattern_analysis: Analysis of payment patterns
             accounts: Affected accounts
+            projection: Cashflow projection covering the search window
 
         Returns:
             Tuple of (optimal date, confidence level, reason)
@@ -456,9 +522,9 @@ class RecommendationService(BaseService):
         best_balance = Decimal("-999999")
 
         # Check different potential dates
-        for days in range(1, 15):  # Check up to 2 weeks before due date
+        for days in range(1, IRREGULAR_SEARCH_DAYS + 1):
             check_date = bill.due_date - timedelta(days=days)
-            metrics = await self.metrics_service.get_metrics_for_date(check_date)
+            metrics = projection.metrics_for(check_date)
             if metrics and metrics.projected_balance > best_balance:
                 best_date = check_date
                 best_balance = metrics.projected_balance
@@ -1,5 +1,4 @@
-from datetime import date, datetime
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,7 +11,11 @@ from src.repositories.recurring_bills import RecurringBillRepository
 from src.schemas.recurring_bills import RecurringBillCreate, RecurringBillUpdate
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
-from src.utils.datetime_utils import naive_utc_from_date
+from src.utils.datetime_utils import (
+    month_sequence,
+    naive_utc_from_date,
+    naive_utc_month_day,
+)
 from src.utils.decimal_precision import DecimalPrecision
 
 
@@ -196,26 +199,42 @@ class RecurringBillService(BaseService):
         Returns:
             Liability: New liability instance with proper UTC due date
         """
-        # Create due date using proper ADR-011 datetime compliance
-        due_date = naive_utc_from_date(year, int(month), recurring_bill.day_of_month)
-
-        # Create liability with appropriate fields
-        liability = Liability(
-            name=recurring_bill.bill_name,
-            # Ensure proper decimal precision for monetary values
-            amount=DecimalPrecision.round_for_display(recurring_bill.amount),
-            due_date=due_date,
-            primary_account_id=recurring_bill.account_id,
-            category_id=recurring_bill.category_id,
-            auto_pay=recurring_bill.auto_pay,
-            recurring=True,
-            recurring_bill_id=recurring_bill.id,
+        return Liability(
+            **self._liability_values(recurring_bill, int(month), year),
             category=recurring_bill.category,  # Set the relationship directly
         )
-        return liability
+
+    def _liability_values(
+        self, recurring_bill: RecurringBill, month: int, year: int
+    ) -> Dict[str, Any]:
+        """
+        Get the column values of the liability a template generates for a month.
+
+        The due date uses ADR-011 naive UTC storage and falls on the template's
+        day of month, or the last day of shorter months.
+
+        Args:
+            recurring_bill: The recurring bill template
+            month: Month (1-12)
+            year: Full year (e.g., 2025)
+
+        Returns:
+            Dict[str, Any]: Liability column values
+        """
+        return {
+            "name": recurring_bill.bill_name,
+            # Ensure proper decimal precision for monetary values
+            "amount": DecimalPrecision.round_for_display(recurring_bill.amount),
+            "due_date": naive_utc_month_day(year, month, recurring_bill.day_of_month),
+            "primary_account_id": recurring_bill.account_id,
+            "category_id": recurring_bill.category_id,
+            "auto_pay": recurring_bill.auto_pay,
+            "recurring": True,
+            "recurring_bill_id": recurring_bill.id,
+        }
 
     async def generate_bills(
-        self, recurring_bill_id: int, month: int, year: int
+        self, recurring_bill_id: int, month: int, year: int, months: int = 1
     ) -> List[Liability]:
         """
         Generate liabilities for a recurring bill pattern.
@@ -224,56 +243,32 @@ class RecurringBillService(BaseService):
             recurring_bill_id: ID of the recurring bill template
             month: Month (1-12) to generate bills for
             year: Year to generate bills for
+            months: Number of consecutive months to generate, starting at month
 
         Returns:
             List of generated liability instances (empty if already exists)
         """
-        # Get repositories
         recurring_bill_repo = await self._get_repository(RecurringBillRepository)
-        liability_repo = await self._get_repository(LiabilityRepository)
-
-        # Get recurring bill with relationships
-        db_recurring_bill = await recurring_bill_repo.get_with_relationships(
-            recurring_bill_id, include_category=True
-        )
+        db_recurring_bill = await recurring_bill_repo.get(recurring_bill_id)
 
-        if not db_recurring_bill or not db_recurring_bill.active:
+        if not db_recurring_bill:
             return []
 
-        # Check if bills already exist for this month/year using repository method
-        # Create the due date for checking
-        check_date = date(year, month, db_recurring_bill.day_of_month)
-        # Convert to datetime for consistent comparison
-        check_datetime = datetime.combine(check_date, datetime.min.time())
-
-        # Use repository to check if liability already exists
-        already_exists = await recurring_bill_repo.check_liability_exists(
-            recurring_bill_id, check_datetime
+        return await self._generate_liabilities(
+            [db_recurring_bill], month, year, months
         )
 
-        if already_exists:
-            return []  # Bills already exist for this period
-
-        # Create new liability using service method instead of model method
-        liability = self.create_liability_from_recurring(
-            db_recurring_bill, str(month), year
-        )
-
-        # Use repository to create liability
-        created_liability = await liability_repo.create(liability.__dict__)
-
-        return [created_liability]
-
     async def generate_bills_for_month(
-        self, month: int, year: int, active_only: bool = True
+        self, month: int, year: int, active_only: bool = True, months: int = 1
     ) -> List[Liability]:
         """
-        Generate liabilities for all recurring bills for a specific month.
+        Generate liabilities for all recurring bills for a month or run of months.
 
         Args:
             month: Month (1-12) to generate bills for
             year: Year to generate bills for
             active_only: If True, only process active recurring bills
+            months: Number of consecutive months to generate, starting at month
 
         Returns:
             List of all generated liability instances
@@ -284,11 +279,52 @@ class RecurringBillService(BaseService):
             limit=1000,  # Increased limit to ensure we get all bills
         )
 
-        generated_bills = []
+        return await self._generate_liabilities(recurring_bills, month, year, months)
+
+    async def _generate_liabilities(
+        self,
+        recurring_bills: List[RecurringBill],
+        month: int,
+        year: int,
+        months: int,
+    ) -> List[Liability]:
+        """
+        Generate the missing liabilities of recurring bills over a run of months.
+
+        The liabilities already generated for the period are loaded with one
+        query, the missing ones are computed in memory and inserted with one
+        set-based statement. Inactive templates generate nothing.
+
+        Args:
+            recurring_bills: Recurring bill templates
+            month: First month (1-12) to generate bills for
+            year: Year of the first month
+            months: Number of consecutive months to generate
+
+        Returns:
+            List of generated liability instances, ordered by due date
+        """
+        templates = [bill for bill in recurring_bills if bill.active]
+        if not templates or months < 1:
+            return []
+
+        # Get repositories
+        recurring_bill_repo = await self._get_repository(RecurringBillRepository)
+        liability_repo = await self._get_repository(LiabilityRepository)
+
+        # The month after the run bounds the period
+        *periods, (end_year, end_month) = month_sequence(year, month, months + 1)
+        existing = await recurring_bill_repo.get_generated_due_dates(
+            [template.id for template in templates],
+            naive_utc_from_date(year, month, 1),
+            naive_utc_from_date(end_year, end_month, 1),
+        )
 
-        # Generate bills for each recurring bill
-        for recurring_bill in recurring_bills:
-            bills = await self.generate_bills(recurring_bill.id, month, year)
-            generated_bills.extend(bills)
+        rows = []
+        for template in templates:
+            for period_year, period_month in periods:
+                values = self._liability_values(template, period_month, period_year)
+                if (template.id, values["due_date"].date()) not in existing:
+                    rows.append(values)
 
-        return generated_bills
+        return await liability_repo.insert_generated(rows)
@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.models.income import Income
 from src.models.recurring_income import RecurringIncome
@@ -23,7 +24,12 @@ from src.schemas.recurring_income import (
 )
 from src.services.base import BaseService
 from src.services.feature_flags import FeatureFlagService
-from src.utils.datetime_utils import naive_utc_from_date, utc_now
+from src.utils.datetime_utils import (
+    month_sequence,
+    naive_utc_from_date,
+    naive_utc_month_day,
+    utc_now,
+)
 
 
 class RecurringIncomeService(BaseService):
@@ -71,20 +77,38 @@ class RecurringIncomeService(BaseService):
         Returns:
             Income: New income entry with proper UTC date
         """
-        income_entry = Income(
-            source=recurring_income.source,
-            amount=recurring_income.amount,
-            date=naive_utc_from_date(
-                year, month, recurring_income.day_of_month
-            ),  # Store as naive UTC
-            account_id=recurring_income.account_id,
-            category_id=recurring_income.category_id,
-            deposited=recurring_income.auto_deposit,
-            recurring=True,
-            recurring_income_id=recurring_income.id,
+        return Income(
+            **self._income_values(recurring_income, month, year),
             category=recurring_income.category,
         )
-        return income_entry
+
+    def _income_values(
+        self, recurring_income: RecurringIncome, month: int, year: int
+    ) -> Dict[str, Any]:
+        """
+        Get the column values of the income entry a template generates for a month.
+
+        The date is stored as naive UTC and falls on the template's day of
+        month, or the last day of shorter months.
+
+        Args:
+            recurring_income: The recurring income template
+            month: Month number (1-12)
+            year: Full year (e.g., 2025)
+
+        Returns:
+            Dict[str, Any]: Income column values
+        """
+        return {
+            "source": recurring_income.source,
+            "amount": recurring_income.amount,
+            "date": naive_utc_month_day(year, month, recurring_income.day_of_month),
+            "account_id": recurring_income.account_id,
+            "category_id": recurring_income.category_id,
+            "deposited": recurring_income.auto_deposit,
+            "recurring": True,
+            "recurring_income_id": recurring_income.id,
+        }
 
     async def create(self, income_data: RecurringIncomeCreate) -> RecurringIncome:
         """
@@ -208,13 +232,17 @@ class RecurringIncomeService(BaseService):
 
     async def generate_income(self, request: GenerateIncomeRequest) -> List[Income]:
         """
-        Generate income entries for a specific month/year from recurring templates.
+        Generate income entries for a month or run of months from recurring templates.
+
+        The templates and the entries already generated for the period are
+        loaded with one query each, the missing entries are computed in memory
+        and inserted with one set-based statement.
 
         Args:
-            request: Request containing month and year for income generation
+            request: Request containing the first month/year and number of months
 
         Returns:
-            List[Income]: List of generated income entries
+            List[Income]: List of generated income entries, ordered by date
         """
         # Get repositories
         recurring_repo = await self._get_repository(RecurringIncomeRepository)
@@ -222,24 +250,34 @@ class RecurringIncomeService(BaseService):
 
         # Get all active recurring income templates
         templates = await recurring_repo.get_active_income()
+        if not templates:
+            return []
 
-        generated_income = []
-        for template in templates:
-            # Check if income entry already exists for this month/year
-            existing_entries = await income_repo.find_by_recurring_and_date(
-                template.id, request.month, request.year
-            )
-
-            # If no existing entry, create a new one
-            if not existing_entries:
-                # Create new income entry from template using service method
-                income_entry = self.create_income_from_recurring(
-                    template, request.month, request.year
-                )
+        # The month after the run bounds the period
+        *periods, (end_year, end_month) = month_sequence(
+            request.year, request.month, request.months + 1
+        )
+        existing = await income_repo.get_generated_months(
+            [template.id for template in templates],
+            naive_utc_from_date(request.year, request.month, 1),
+            naive_utc_from_date(end_year, end_month, 1),
+        )
 
-                # Create income entry using repository
-                created_entry = await income_repo.create(income_entry.__dict__)
-                generated_income.append(created_entry)
+        # At most one entry per template and month
+        rows = [
+            self._income_values(template, period_month, period_year)
+            for template in templates
+            for period_year, period_month in periods
+            if (template.id, period_year, period_month) not in existing
+        ]
+        generated_income = await income_repo.insert_generated(rows)
+
+        # Templates were loaded with their category; share it with the entries
+        categories = {template.id: template.category for template in templates}
+        for income in generated_income:
+            set_committed_value(
+                income, "category", categories[income.recurring_income_id]
+            )
 
         return generated_income
 
@@ -9,8 +9,10 @@ Uses ADR-011 compliant datetime handling with utilities from datetime_utils.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional
 
+from src.models.accounts import Account
 from src.models.transaction_history import TransactionHistory, TransactionType
 from src.repositories.accounts import AccountRepository
 from src.repositories.transaction_history import TransactionHistoryRepository
@@ -21,6 +23,22 @@ from src.schemas.transaction_history import (
     TransactionHistoryUpdate as TransactionUpdate,
 )
 from src.services.base import BaseService
+from src.utils.domain_events import (
+    AccountBalanceChanged,
+    TransactionCreated,
+    TransactionDeleted,
+    TransactionUpdated,
+    domain_events,
+)
+
+
+def _pending_total_changes(
+    transaction_type: TransactionType, amount: Decimal
+) -> Dict[str, Decimal]:
+    """Split a signed transaction amount into adjust_pending_totals arguments."""
+    if transaction_type == TransactionType.CREDIT:
+        return {"debit_change": Decimal(0), "credit_change": amount}
+    return {"debit_change": amount, "credit_change": Decimal(0)}
 
 
 class TransactionService(BaseService):
@@ -73,18 +91,32 @@ class TransactionService(BaseService):
 
         # Update account balance based on transaction type
         if transaction_data.transaction_type == TransactionType.CREDIT:
-            account.available_balance += transaction_data.amount
+            balance_change = transaction_data.amount
         else:  # DEBIT
-            account.available_balance -= transaction_data.amount
+            balance_change = -transaction_data.amount
 
         # Update the account
-        await account_repo.update(
-            account_id, {"available_balance": account.available_balance}
+        account = await account_repo.update_balance(account_id, balance_change)
+        await account_repo.adjust_pending_totals(
+            account_id,
+            **_pending_total_changes(
+                transaction_data.transaction_type, transaction_data.amount
+            ),
         )
 
         # Create transaction using repository
         transaction = await transaction_repo.create(transaction_dict)
 
+        domain_events.publish(
+            self._session,
+            TransactionCreated(
+                account_id=account_id,
+                transaction_id=transaction.id,
+                transaction_type=transaction.transaction_type.value,
+                amount=transaction.amount,
+            ),
+        )
+        self._publish_balance_change(account, balance_change)
         return transaction
 
     async def get_transaction(
@@ -186,19 +218,33 @@ class TransactionService(BaseService):
 
         new_impact = new_amount if new_type == TransactionType.CREDIT else -new_amount
 
-        # Adjust account balance if impact changes
+        # Adjust account balance and running totals if impact changes
         if old_impact != new_impact:
             balance_adjustment = new_impact - old_impact
-            new_balance = transaction.account.available_balance + balance_adjustment
 
             # Update account balance
             account_repo = await self._get_repository(AccountRepository)
-            await account_repo.update(
-                transaction.account.id, {"available_balance": new_balance}
+            account = await account_repo.update_balance(
+                transaction.account.id, balance_adjustment
+            )
+            self._publish_balance_change(account, balance_adjustment)
+
+            changes = _pending_total_changes(
+                transaction.transaction_type, -transaction.amount
             )
+            for key, change in _pending_total_changes(new_type, new_amount).items():
+                changes[key] += change
+            await account_repo.adjust_pending_totals(transaction.account.id, **changes)
 
         # Update the transaction
         updated_transaction = await transaction_repo.update(transaction_id, update_data)
+        domain_events.publish(
+            self._session,
+            TransactionUpdated(
+                account_id=updated_transaction.account_id,
+                transaction_id=transaction_id,
+            ),
+        )
         return updated_transaction
 
     async def delete_transaction(self, transaction_id: int) -> bool:
@@ -230,11 +276,30 @@ class TransactionService(BaseService):
 
         # Update account balance
         account_repo = await self._get_repository(AccountRepository)
-        new_balance = transaction.account.available_balance + adjustment
-        await account_repo.update(
-            transaction.account.id, {"available_balance": new_balance}
+        account = await account_repo.update_balance(transaction.account.id, adjustment)
+        await account_repo.adjust_pending_totals(
+            transaction.account.id,
+            **_pending_total_changes(transaction.transaction_type, -transaction.amount),
         )
 
         # Delete the transaction
         await transaction_repo.delete(transaction_id)
+
+        domain_events.publish(
+            self._session,
+            TransactionDeleted(account_id=account.id, transaction_id=transaction_id),
+        )
+        self._publish_balance_change(account, adjustment)
         return True
+
+    def _publish_balance_change(self, account: Account, change: Decimal) -> None:
+        """Publish the balance change of a committed transaction write."""
+        domain_events.publish(
+            self._session,
+            AccountBalanceChanged(
+                account_id=account.id,
+                balance=account.available_balance,
+                change=change,
+                reason="transaction",
+            ),
+        )
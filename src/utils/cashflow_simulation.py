@@ -0,0 +1,209 @@
+"""
+Monte Carlo cashflow simulation.
+
+This module simulates many possible paths of a combined balance over a
+horizon of days and summarises them per day as percentile bands and a
+probability of overdraft. Paths are generated in vectorized NumPy batches:
+every random draw of a batch is one array operation and balances are a
+cumulative sum along the day axis, so thousands of paths cost a few array
+passes rather than a Python loop per path and day.
+
+Flows are modelled in three parts:
+
+- fixed flows: amounts known in advance, such as expected income records,
+  summed into one net flow per day;
+- variable bills: bills due on a known day whose amount varies around the
+  billed amount with the spread of the bill's past payments;
+- income streams: recurring income arriving every ``interval`` days after its
+  last known occurrence, with normally distributed timing and amount.
+
+The module is pure and performs no I/O; ForecastService builds the inputs
+from accounts, bills and payment/income pattern analyses. Batches draw from
+child seeds of one SeedSequence, so a seed reproduces the same bands however
+the batches are scheduled. NumPy is imported when a simulation first runs, so
+importing the forecast service does not load it.
+"""
+
+import math
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+# Occurrences further than this many timing standard deviations outside the
+# horizon cannot land inside it
+_TIMING_REACH = 4.0
+
+
+class VariableBill(NamedTuple):
+    """A bill due on a known day with a varying amount."""
+
+    day: int  # offset from the first simulated day
+    amount: float
+    std_dev: float
+
+
+class IncomeStream(NamedTuple):
+    """Recurring income with uncertain timing and amount."""
+
+    first_day: float  # offset of the next expected occurrence
+    interval: float  # days between occurrences
+    timing_std_dev: float  # days
+    amount: float
+    std_dev: float
+
+
+class SimulationInputs(NamedTuple):
+    """Everything a simulation needs, as plain numbers."""
+
+    days: int
+    starting_balance: float
+    fixed_flows: Sequence[float]  # net known flow of each day
+    bills: Sequence[VariableBill] = ()
+    income: Sequence[IncomeStream] = ()
+
+
+class BalanceBands(NamedTuple):
+    """Per-day summary of simulated balance paths."""
+
+    percentiles: Tuple[float, ...]
+    bands: "np.ndarray"  # (len(percentiles), days) closing balance percentiles
+    mean: "np.ndarray"  # (days,) mean closing balance
+    overdraft_probability: "np.ndarray"  # (days,) share of paths below threshold
+    horizon_overdraft_probability: float  # share below threshold on any day
+
+
+def _income_occurrences(
+    streams: Sequence[IncomeStream], days: int
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Expand income streams into nominal occurrences that can fall in range."""
+    import numpy as np
+
+    nominal, timing, amount, std_dev = [], [], [], []
+    for stream in streams:
+        if stream.interval <= 0:
+            raise ValueError("Income interval must be positive")
+        reach = _TIMING_REACH * stream.timing_std_dev
+        # Skip whole intervals already behind the horizon
+        first = max(0, math.ceil((-reach - stream.first_day) / stream.interval))
+        occurrence = first
+        while stream.first_day + occurrence * stream.interval < days + reach:
+            nominal.append(stream.first_day + occurrence * stream.interval)
+            timing.append(stream.timing_std_dev)
+            amount.append(stream.amount)
+            std_dev.append(stream.std_dev)
+            occurrence += 1
+    return (
+        np.asarray(nominal, dtype=np.float64),
+        np.asarray(timing, dtype=np.float64),
+        np.asarray(amount, dtype=np.float64),
+        np.asarray(std_dev, dtype=np.float64),
+    )
+
+
+def simulate_batch(
+    inputs: SimulationInputs, paths: int, seed: "np.random.SeedSequence"
+) -> "np.ndarray":
+    """
+    Simulate one batch of closing balance paths.
+
+    Args:
+        inputs: Simulation inputs
+        paths: Number of paths in the batch
+        seed: Seed of the batch's random generator
+
+    Returns:
+        np.ndarray: Closing balances of shape (paths, days)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    days = inputs.days
+    flows = np.tile(np.asarray(inputs.fixed_flows, dtype=np.float64), (paths, 1))
+    rows = np.arange(paths)[:, None]
+
+    if inputs.bills:
+        bill_days = np.asarray([bill.day for bill in inputs.bills], dtype=np.intp)
+        amounts = rng.normal(
+            [bill.amount for bill in inputs.bills],
+            [bill.std_dev for bill in inputs.bills],
+            size=(paths, len(inputs.bills)),
+        )
+        np.subtract.at(
+            flows,
+            (
+                np.broadcast_to(rows, amounts.shape),
+                np.broadcast_to(bill_days, amounts.shape),
+            ),
+            np.maximum(amounts, 0.0),
+        )
+
+    nominal, timing, amount, std_dev = _income_occurrences(inputs.income, days)
+    if nominal.size:
+        shape = (paths, nominal.size)
+        arrival = np.rint(nominal + rng.standard_normal(shape) * timing).astype(np.intp)
+        amounts = np.maximum(rng.normal(amount, std_dev, size=shape), 0.0)
+        inside = (arrival >= 0) & (arrival < days)
+        np.add.at(
+            flows,
+            (np.broadcast_to(rows, shape)[inside], arrival[inside]),
+            amounts[inside],
+        )
+
+    return inputs.starting_balance + np.cumsum(flows, axis=1)
+
+
+def simulate(
+    inputs: SimulationInputs,
+    paths: int,
+    seed: Optional[int] = None,
+    threshold: float = 0.0,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> BalanceBands:
+    """
+    Simulate balance paths and summarise them per day.
+
+    Args:
+        inputs: Simulation inputs
+        paths: Number of paths to simulate (at least 1)
+        seed: Seed for reproducible results; None draws fresh entropy
+        threshold: Balance below which a path counts as overdrawn
+        percentiles: Percentiles of the closing balance to report
+        batch_size: Maximum paths generated per batch
+
+    Returns:
+        BalanceBands: Percentile bands and overdraft probabilities
+
+    Raises:
+        ValueError: If paths, days or batch_size is less than 1, or the
+            fixed flows do not cover every day
+    """
+    if paths < 1 or batch_size < 1:
+        raise ValueError("Paths and batch size must be at least 1")
+    if inputs.days < 1:
+        raise ValueError("Simulation must cover at least one day")
+    if len(inputs.fixed_flows) != inputs.days:
+        raise ValueError("Fixed flows must contain one value per day")
+
+    import numpy as np
+
+    batches = math.ceil(paths / batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(batches)
+    balances = np.empty((paths, inputs.days), dtype=np.float64)
+    for index, batch_seed in enumerate(seeds):
+        start = index * batch_size
+        stop = min(start + batch_size, paths)
+        balances[start:stop] = simulate_batch(inputs, stop - start, batch_seed)
+
+    overdrawn = balances < threshold
+    return BalanceBands(
+        percentiles=tuple(percentiles),
+        bands=np.percentile(balances, percentiles, axis=0),
+        mean=balances.mean(axis=0),
+        overdraft_probability=overdrawn.mean(axis=0),
+        horizon_overdraft_probability=float(overdrawn.any(axis=1).mean()),
+    )
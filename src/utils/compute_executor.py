@@ -0,0 +1,142 @@
+"""
+Executor for CPU-bound computation phases.
+
+Pattern detection, seasonality and simulation code is plain Python (or NumPy)
+that holds the event loop for as long as it runs, stalling every other request
+served by the worker. Services hand those pure phases to run_compute, which
+runs them on a configurable executor:
+
+- "process": a ProcessPoolExecutor, so the computation runs outside the
+  worker's interpreter and its GIL. Functions and arguments must be
+  picklable, so services ship plain rows, tuples and NumPy arrays rather than
+  ORM objects or sessions, and call module-level functions or static methods.
+- "thread": a ThreadPoolExecutor, which keeps the loop responsive between
+  bytecode slices and while NumPy releases the GIL.
+- "inline": runs the function directly on the event loop, as before.
+
+Workers are started lazily on first use. Process workers are spawned rather
+than forked, because forking a process running an event loop and a
+connection pool copies their state into the child.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EXECUTOR_KINDS = ("process", "thread", "inline")
+
+
+class ComputeExecutor:
+    """Runs CPU-bound functions off the event loop."""
+
+    def __init__(self, kind: str = "process", max_workers: Optional[int] = None):
+        """
+        Initialize the executor without starting any workers.
+
+        Args:
+            kind: "process", "thread" or "inline"
+            max_workers: Worker count; None uses the executor's default
+
+        Raises:
+            ValueError: If kind is not a known executor kind
+        """
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unknown compute executor {kind!r}; expected one of "
+                f"{', '.join(EXECUTOR_KINDS)}"
+            )
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="compute",
+                    )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a function on the executor and wait for its result.
+
+        Args:
+            func: Function to run; must be picklable for process executors
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            T: The function's result
+
+        Raises:
+            Exception: Whatever the function raised
+        """
+        if self.kind == "inline":
+            return func(*args, **kwargs)
+
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                executor, functools.partial(func, *args, **kwargs)
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool next time
+            logger.error("Compute process pool broke; it will be restarted")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers, if any were started.
+
+        Args:
+            wait: Wait for running computations to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+compute_executor = ComputeExecutor(
+    settings.COMPUTE_EXECUTOR, settings.COMPUTE_MAX_WORKERS
+)
+
+
+async def run_compute(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a CPU-bound function on the process-wide compute executor.
+
+    Args:
+        func: Function to run; module-level or a static method so it pickles
+        *args: Positional arguments, as plain picklable data
+        **kwargs: Keyword arguments, as plain picklable data
+
+    Returns:
+        T: The function's result
+    """
+    return await compute_executor.run(func, *args, **kwargs)
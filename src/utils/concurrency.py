@@ -0,0 +1,54 @@
+"""
+Bounded concurrency helpers.
+
+Services use these to run independent steps of an analysis at the same time
+without opening an unbounded number of database connections.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_bounded(
+    factories: Sequence[Callable[[], Awaitable[T]]], limit: int
+) -> List[T]:
+    """
+    Await coroutines with at most ``limit`` of them in flight.
+
+    Coroutines are created lazily from the factories so that a step waiting
+    for a slot has not started any work yet. Results are returned in the
+    order of the factories; the first exception propagates and the remaining
+    steps are cancelled.
+
+    Args:
+        factories: Callables each returning an awaitable to run
+        limit: Maximum number of awaitables running at once (at least 1)
+
+    Returns:
+        List[T]: Results in factory order
+
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    if limit < 1:
+        raise ValueError("Concurrency limit must be at least 1")
+    if limit == 1 or len(factories) <= 1:
+        return [await factory() for factory in factories]
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(factory: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            return await factory()
+
+    tasks = [asyncio.ensure_future(run(factory)) for factory in factories]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Let cancelled steps release their sessions before propagating
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
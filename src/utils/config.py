@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -8,6 +8,9 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./debtonator.db"
+    # Create missing tables at startup; disable when Alembic migrations manage
+    # the schema to skip the metadata checks
+    DATABASE_CREATE_TABLES: bool = True
 
     # Application
     DEBUG: bool = False
@@ -19,6 +22,43 @@ class Settings(BaseSettings):
     # Environment
     APP_ENV: str = "development"
 
+    # Balance history retention (None keeps raw records/daily rollups forever)
+    BALANCE_HISTORY_RAW_RETENTION_DAYS: Optional[int] = None
+    BALANCE_HISTORY_DAILY_ROLLUP_RETENTION_DAYS: Optional[int] = None
+
+    # Instrumentation
+    METRICS_ENABLED: bool = True
+    SERVER_TIMING_ENABLED: bool = False
+    # Requests executing more SQL statements than this are logged (None disables)
+    REQUEST_QUERY_BUDGET: Optional[int] = None
+
+    # Response cache for read-heavy endpoints, invalidated by committed writes
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+
+    # Analysis
+    # Independent sub-analyses run concurrently on separate pooled sessions, at
+    # most this many at a time (1 runs them sequentially on the request session)
+    ANALYSIS_MAX_CONCURRENCY: int = 4
+    # Executor for CPU-bound analysis phases: "process", "thread" or "inline"
+    # (see src/utils/compute_executor.py); None workers uses the CPU count
+    COMPUTE_EXECUTOR: str = "process"
+    COMPUTE_MAX_WORKERS: Optional[int] = None
+
+    # Domain events (see src/utils/domain_events.py): seconds to collect
+    # committed events before delivering them to subscribers as one batch
+    DOMAIN_EVENTS_BATCH_WINDOW: float = 0.05
+    DOMAIN_EVENTS_MAX_BATCH_SIZE: int = 500
+    # Record a balance history entry for every committed balance change
+    BALANCE_HISTORY_FROM_EVENTS: bool = False
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" or "json"
+    # Fraction of DEBUG records kept per logger, e.g. "src.repositories.proxies=0.01"
+    LOG_SAMPLE_RATES_STR: str = ""
+
     # Feature Flags
     ENABLE_FEATURE_FLAG_MANAGEMENT: bool = True
 
@@ -38,6 +78,16 @@ class Settings(BaseSettings):
             if origin.strip()
         ]
 
+    @property
+    def log_sample_rates(self) -> Dict[str, float]:
+        """Get DEBUG sample rates keyed by logger name"""
+        rates = {}
+        for entry in self.LOG_SAMPLE_RATES_STR.split(","):
+            name, _, rate = entry.partition("=")
+            if name.strip() and rate.strip():
+                rates[name.strip()] = float(rate)
+        return rates
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
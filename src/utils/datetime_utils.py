@@ -30,7 +30,7 @@ Key function categories:
 
 import calendar
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Any, Collection, List, Optional, TypeVar, Union, overload
+from typing import Any, Collection, List, Optional, Tuple, TypeVar, Union, overload
 
 # Type definitions for improved type hinting
 DateType = TypeVar("DateType", datetime, date, str)
@@ -150,6 +150,30 @@ def naive_utc_from_date(
     return aware.replace(tzinfo=None)
 
 
+def naive_utc_month_day(year: int, month: int, day: int) -> datetime:
+    """
+    Creates a naive UTC midnight datetime for a day of a month.
+
+    Days past the end of the month are clamped to its last day, so a day of
+    month taken from a recurring template (e.g. 31) is valid in every month.
+
+    Args:
+        year: Full year (e.g., 2025)
+        month: Month number (1-12)
+        day: Day of month (1-31)
+
+    Returns:
+        datetime: Naive datetime that semantically represents UTC
+
+    Example:
+        >>> # A bill due on the 31st falls on February 28th in 2025
+        >>> due_date = naive_utc_month_day(2025, 2, 31)
+    """
+    return naive_utc_from_date(
+        year, month, min(day, calendar.monthrange(year, month)[1])
+    )
+
+
 def naive_days_from_now(days: int) -> datetime:
     """
     Get naive datetime n days from now (for database storage).
@@ -1148,6 +1172,28 @@ def naive_safe_end_date(today: datetime, days: int) -> datetime:
     )
 
 
+def month_sequence(year: int, month: int, count: int) -> List[Tuple[int, int]]:
+    """
+    List consecutive months as (year, month) pairs.
+
+    Args:
+        year: Year of the first month
+        month: First month (1-12)
+        count: Number of months to list
+
+    Returns:
+        List[Tuple[int, int]]: (year, month) pairs starting at the given month
+
+    Example:
+        >>> month_sequence(2025, 11, 3)
+        [(2025, 11), (2025, 12), (2026, 1)]
+    """
+    return [
+        (year + (month - 1 + offset) // 12, (month - 1 + offset) % 12 + 1)
+        for offset in range(count)
+    ]
+
+
 def is_month_boundary(dt1: datetime, dt2: datetime) -> bool:
     """
     Check if two datetimes cross a month boundary.
@@ -9,6 +9,14 @@ throughout the application.
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any, List, Optional
 
+from src.utils.money import (
+    UNITS_PER_CENT,
+    allocate_by_ratios,
+    allocate_evenly,
+    cents_to_decimal,
+    to_units,
+)
+
 
 class DecimalPrecision:
     """Utility class for handling decimal precision in financial calculations."""
@@ -78,21 +86,8 @@ class DecimalPrecision:
         Returns:
             List of distributed amounts that sum exactly to the total
         """
-        # Step 1: Calculate base amount (integer division)
-        cents = int(total * 100)
-        base_cents = cents // parts
-
-        # Step 2: Calculate remainder
-        remainder_cents = cents - (base_cents * parts)
-
-        # Step 3: Distribute base amounts
-        result = [Decimal(base_cents) / 100] * parts
-
-        # Step 4: Distribute remainder one cent at a time
-        for i in range(remainder_cents):
-            result[i] += Decimal("0.01")
-
-        return result
+        units = allocate_evenly(to_units(total), parts)
+        return [cents_to_decimal(part // UNITS_PER_CENT) for part in units]
 
     @staticmethod
     def distribute_by_percentage(
@@ -113,37 +108,13 @@ class DecimalPrecision:
         if abs(percentage_sum - Decimal("100")) > Decimal("0.0001"):
             raise ValueError(f"Percentages must sum to 100%, got {percentage_sum}%")
 
-        # Calculate amounts with 4 decimal precision
-        amounts = [total * (p / Decimal("100")) for p in percentages]
-
-        # Round to 2 decimal places for initial allocation
-        rounded = [
-            amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            for amount in amounts
-        ]
-
-        # Calculate difference due to rounding
-        rounded_sum = sum(rounded)
-        remainder = (total - rounded_sum).quantize(Decimal("0.01"))
-
-        # Distribute remainder using largest fractional part method
-        if remainder != Decimal("0"):
-            # Find indices of amounts with the largest fractional parts
-            fractional_parts = [
-                (i, (amounts[i] - rounded[i]).copy_abs()) for i in range(len(amounts))
-            ]
-            fractional_parts.sort(key=lambda x: x[1], reverse=True)
-
-            # Add or subtract cents from amounts with the largest fractional parts
-            cents_to_distribute = int(remainder * 100)
-            for i in range(abs(cents_to_distribute)):
-                idx = fractional_parts[i % len(fractional_parts)][0]
-                if cents_to_distribute > 0:
-                    rounded[idx] += Decimal("0.01")
-                else:
-                    rounded[idx] -= Decimal("0.01")
-
-        return rounded
+        # Scale the percentages to integers over a common power of ten so
+        # shares of the total are exact integer ratios
+        percentages = [Decimal(percentage) for percentage in percentages]
+        places = max([0] + [-p.as_tuple().exponent for p in percentages])
+        numerators = [int(percentage.scaleb(places)) for percentage in percentages]
+        units = allocate_by_ratios(to_units(total), numerators, 100 * 10**places)
+        return [cents_to_decimal(part // UNITS_PER_CENT) for part in units]
 
     @staticmethod
     def split_bill_amount(total: Decimal, splits: int) -> List[Decimal]:
@@ -0,0 +1,232 @@
+"""
+In-process domain event bus.
+
+Writes that change data other parts of the application derive from (balance
+history, available credit, dashboards) publish domain events describing what
+happened, and subscribers keep the derived data current instead of each
+reader recomputing it:
+
+- Services publish events on the session doing the write with
+  DomainEventBus.publish. Events wait in the session until its transaction
+  ends: they are delivered after a commit and discarded on a rollback, so
+  subscribers never see changes that did not happen.
+- Delivery runs on the event loop after the commit returns. Events arriving
+  within the batch window are collected and each subscriber receives every
+  matching event of the batch in one call, so a burst of writes (a bulk
+  import, a day of transactions) costs one update of the derived data.
+- Subscribers are async callables taking a list of events. They run after the
+  write committed, so they open their own sessions; a failing subscriber is
+  logged and does not affect the others or the publisher.
+
+Like the response cache's data version, the bus is per process: events
+committed in another worker process are not delivered here.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding (bus, event) pairs published in the transaction
+_PENDING_KEY = "debtonator_domain_events"
+
+EventHandler = Callable[[List[Any]], Awaitable[None]]
+
+
+class TransactionCreated(NamedTuple):
+    """A transaction was recorded on an account."""
+
+    account_id: int
+    transaction_id: int
+    transaction_type: str
+    amount: Decimal
+
+
+class TransactionUpdated(NamedTuple):
+    """A transaction's amount, type or details changed."""
+
+    account_id: int
+    transaction_id: int
+
+
+class TransactionDeleted(NamedTuple):
+    """A transaction was removed from an account."""
+
+    account_id: int
+    transaction_id: int
+
+
+class AccountBalanceChanged(NamedTuple):
+    """An account's available balance changed."""
+
+    account_id: int
+    balance: Decimal
+    change: Decimal
+    reason: str  # "transaction", "income_deposit" or "reconciliation"
+
+
+class LiabilityPaid(NamedTuple):
+    """A liability was marked as paid."""
+
+    liability_id: int
+    account_id: int
+    amount: Decimal
+    paid_at: datetime
+
+
+def _after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    by_bus: Dict[int, Tuple["DomainEventBus", List[Any]]] = {}
+    for bus, domain_event in pending:
+        by_bus.setdefault(id(bus), (bus, []))[1].append(domain_event)
+    for bus, events in by_bus.values():
+        bus.dispatch(events)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _install_listeners(session_class: Any = Session) -> None:
+    if event.contains(session_class, "after_commit", _after_commit):
+        return
+    event.listen(session_class, "after_commit", _after_commit)
+    event.listen(session_class, "after_rollback", _after_rollback)
+
+
+class DomainEventBus:
+    """Delivers committed domain events to subscribers in batches."""
+
+    def __init__(self, batch_window: float = 0.05, max_batch_size: int = 500):
+        """
+        Initialize the bus without subscribers.
+
+        Args:
+            batch_window: Seconds to collect events before a delivery
+            max_batch_size: Maximum number of events per delivery
+        """
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._subscribers: List[Tuple[Tuple[Type, ...], EventHandler]] = []
+        self._queue: List[Any] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(
+        self,
+        event_types: Union[Type, Sequence[Type]],
+        handler: EventHandler,
+    ) -> None:
+        """
+        Register a handler for one or more event types.
+
+        Registering the same handler for the same types again has no effect.
+
+        Args:
+            event_types: Event class or classes the handler receives
+            handler: Async callable receiving a list of matching events
+        """
+        if isinstance(event_types, type):
+            event_types = (event_types,)
+        subscription = (tuple(event_types), handler)
+        if subscription not in self._subscribers:
+            self._subscribers.append(subscription)
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        """
+        Remove every registration of a handler.
+
+        Args:
+            handler: Handler passed to subscribe
+        """
+        self._subscribers = [
+            subscription
+            for subscription in self._subscribers
+            if subscription[1] is not handler
+        ]
+
+    def publish(self, session: Any, domain_event: Any) -> None:
+        """
+        Queue an event for delivery once the session's transaction commits.
+
+        Args:
+            session: Session (or AsyncSession) performing the write
+            domain_event: Event describing the write
+        """
+        _install_listeners()
+        session.info.setdefault(_PENDING_KEY, []).append((self, domain_event))
+
+    def dispatch(self, events: List[Any]) -> None:
+        """
+        Schedule delivery of committed events on the running event loop.
+
+        Args:
+            events: Events whose writes have committed
+        """
+        if not self._subscribers or not events:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(
+                "Dropping %d domain events committed outside an event loop",
+                len(events),
+            )
+            return
+
+        self._queue.extend(events)
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._deliver())
+
+    async def drain(self) -> None:
+        """Wait until every dispatched event has been delivered."""
+        while self._task is not None and not self._task.done():
+            await asyncio.shield(self._task)
+
+    async def _deliver(self) -> None:
+        while self._queue:
+            if len(self._queue) < self.max_batch_size and self.batch_window > 0:
+                await asyncio.sleep(self.batch_window)
+            batch = self._queue[: self.max_batch_size]
+            del self._queue[: self.max_batch_size]
+            await self._deliver_batch(batch)
+
+    async def _deliver_batch(self, batch: List[Any]) -> None:
+        for event_types, handler in list(self._subscribers):
+            matching = [item for item in batch if isinstance(item, event_types)]
+            if not matching:
+                continue
+            try:
+                await handler(matching)
+            except Exception:
+                logger.exception(
+                    "Domain event handler %s failed on %d events",
+                    getattr(handler, "__qualname__", handler),
+                    len(matching),
+                )
+
+
+domain_events = DomainEventBus(
+    settings.DOMAIN_EVENTS_BATCH_WINDOW, settings.DOMAIN_EVENTS_MAX_BATCH_SIZE
+)
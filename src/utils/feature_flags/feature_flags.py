@@ -131,10 +131,10 @@ async def configure_feature_flags(
         # Check if flag exists in database
         flag = await repository.get(flag_config["name"])
         if not flag:
-            logger.info(f"Creating default feature flag: {flag_config['name']}")
+            logger.info("Creating default feature flag: %s", flag_config["name"])
             await service.create_flag(flag_config)
         else:
-            logger.debug(f"Feature flag already exists: {flag_config['name']}")
+            logger.debug("Feature flag already exists: %s", flag_config["name"])
 
     # Initialize service (loads all flags from DB)
     await service.initialize()
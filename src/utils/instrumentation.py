@@ -0,0 +1,424 @@
+"""
+Query count and latency instrumentation.
+
+This module records, for every HTTP request, how many SQL statements were
+executed and how long they took, along with per-method timings and returned
+row counts for repository and service calls made through the proxy layer.
+Per-request figures are collected on a RequestMetrics object held in a
+context variable; the process-wide MetricsRegistry aggregates them for the
+/metrics endpoint in Prometheus text exposition format.
+
+Statement counts come from SQLAlchemy engine events (see instrument_engine),
+so they cover every query regardless of which code path issued it. Method
+timings come from FeatureFlagRepositoryProxy and ServiceProxy, which wrap
+each call in track_method.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "debtonator"
+
+# Upper bounds for the statements-per-request histogram
+STATEMENT_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+
+# Number of slowest methods reported in Server-Timing headers and budget logs
+TOP_METHOD_COUNT = 5
+
+
+class MethodTiming:
+    """Accumulated timing for one method within a single request."""
+
+    __slots__ = ("calls", "seconds", "rows")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.rows = 0
+
+
+class RequestMetrics:
+    """
+    Metrics collected while handling a single request.
+
+    Attributes:
+        statement_count: Number of SQL statements executed
+        statement_seconds: Total time spent executing SQL statements
+        methods: Per-method timings keyed by (layer, class name, method name)
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.statement_count = 0
+        self.statement_seconds = 0.0
+        self.methods: Dict[Tuple[str, str, str], MethodTiming] = {}
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the request started."""
+        return time.perf_counter() - self.started
+
+    def record_method(
+        self, key: Tuple[str, str, str], seconds: float, rows: int
+    ) -> None:
+        """
+        Record one method call.
+
+        Args:
+            key: (layer, class name, method name)
+            seconds: Call duration
+            rows: Rows returned by the call
+        """
+        timing = self.methods.get(key)
+        if timing is None:
+            timing = self.methods[key] = MethodTiming()
+        timing.calls += 1
+        timing.seconds += seconds
+        timing.rows += rows
+
+    def slowest_methods(
+        self, limit: int = TOP_METHOD_COUNT
+    ) -> List[Tuple[Tuple[str, str, str], MethodTiming]]:
+        """
+        Get the methods with the highest total time.
+
+        Args:
+            limit: Maximum number of methods to return
+
+        Returns:
+            List of (key, timing) pairs, slowest first
+        """
+        return sorted(
+            self.methods.items(), key=lambda item: item[1].seconds, reverse=True
+        )[:limit]
+
+    def server_timing(self) -> str:
+        """
+        Format the metrics as a Server-Timing header value.
+
+        Returns:
+            str: Header value with total, database and slowest method entries
+        """
+        entries = [
+            f"total;dur={self.elapsed * 1000:.2f}",
+            f'db;dur={self.statement_seconds * 1000:.2f};desc="{self.statement_count} statements"',
+        ]
+        for (layer, class_name, method_name), timing in self.slowest_methods():
+            entries.append(
+                f"{layer}.{class_name}.{method_name};dur={timing.seconds * 1000:.2f}"
+            )
+        return ", ".join(entries)
+
+
+_current_request: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "debtonator_request_metrics", default=None
+)
+
+
+def current_request_metrics() -> Optional[RequestMetrics]:
+    """Get metrics for the request being handled, if any."""
+    return _current_request.get()
+
+
+@contextmanager
+def request_metrics_scope() -> Iterator[RequestMetrics]:
+    """
+    Collect metrics for the duration of a request.
+
+    Scopes may nest, for example a benchmark wrapping an in-process request;
+    statements of the inner scope are also added to the enclosing one.
+
+    Yields:
+        RequestMetrics: The metrics object receiving statements and timings
+    """
+    parent = _current_request.get()
+    metrics = RequestMetrics()
+    token = _current_request.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current_request.reset(token)
+        if parent is not None:
+            parent.statement_count += metrics.statement_count
+            parent.statement_seconds += metrics.statement_seconds
+
+
+def _count_rows(result: Any) -> int:
+    """Best-effort count of rows in a method's return value."""
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, (list, tuple, set, frozenset)):
+        return len(result)
+    return 1
+
+
+class MethodCall:
+    """Handle yielded by track_method for reporting the call's result."""
+
+    __slots__ = ("result",)
+
+    def __init__(self) -> None:
+        self.result: Any = None
+
+
+@contextmanager
+def track_method(layer: str, class_name: str, method_name: str) -> Iterator[MethodCall]:
+    """
+    Time a repository or service method call.
+
+    Callers assign the method's return value to the yielded handle's `result`
+    so returned rows can be counted. Calls that raise are still timed.
+
+    Args:
+        layer: "repository" or "service"
+        class_name: Name of the wrapped class
+        method_name: Name of the called method
+
+    Yields:
+        MethodCall: Handle receiving the call result
+    """
+    call = MethodCall()
+    started = time.perf_counter()
+    try:
+        yield call
+    finally:
+        seconds = time.perf_counter() - started
+        rows = _count_rows(call.result)
+        key = (layer, class_name, method_name)
+        request = _current_request.get()
+        if request is not None:
+            request.record_method(key, seconds, rows)
+        metrics_registry.record_method(key, seconds, rows)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("debtonator_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("debtonator_query_start")
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    request = _current_request.get()
+    if request is not None:
+        request.statement_count += 1
+        request.statement_seconds += seconds
+    metrics_registry.record_statement(seconds)
+
+
+def instrument_engine(engine: Any) -> None:
+    """
+    Count and time every statement executed through an engine.
+
+    Safe to call more than once for the same engine.
+
+    Args:
+        engine: Engine or AsyncEngine to instrument
+    """
+    sync_engine: Engine = (
+        engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    )
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[Any, ...], **extra: Any) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape_label(v)}"' for n, v in pairs) + "}"
+
+
+class MetricsRegistry:
+    """
+    Process-wide aggregate of request, statement and method metrics.
+
+    Values are plain counters guarded by a lock and rendered on demand in
+    Prometheus text exposition format, so no client library is required.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard every recorded value."""
+        with self._lock:
+            self._requests: Dict[Tuple[str, str, str], int] = {}
+            self._request_seconds: Dict[Tuple[str, str], List[float]] = {}
+            self._request_statements: Dict[Tuple[str, str], List[int]] = {}
+            self._budget_exceeded: Dict[Tuple[str, str], int] = {}
+            self._statements = 0
+            self._statement_seconds = 0.0
+            self._methods: Dict[Tuple[str, str, str], List[float]] = {}
+
+    def record_statement(self, seconds: float) -> None:
+        """Record one executed SQL statement."""
+        with self._lock:
+            self._statements += 1
+            self._statement_seconds += seconds
+
+    def record_method(
+        self, key: Tuple[str, str, str], seconds: float, rows: int
+    ) -> None:
+        """Record one repository or service method call."""
+        with self._lock:
+            totals = self._methods.setdefault(key, [0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += rows
+
+    def record_request(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        metrics: RequestMetrics,
+        budget_exceeded: bool = False,
+    ) -> None:
+        """
+        Record a completed request.
+
+        Args:
+            method: HTTP method
+            route: Route path template
+            status_code: Response status code
+            metrics: Metrics collected for the request
+            budget_exceeded: Whether the request exceeded the query budget
+        """
+        key = (method, route)
+        with self._lock:
+            request_key = (method, route, str(status_code))
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+
+            duration = self._request_seconds.setdefault(key, [0, 0.0])
+            duration[0] += 1
+            duration[1] += metrics.elapsed
+
+            buckets = self._request_statements.setdefault(
+                key, [0] * (len(STATEMENT_COUNT_BUCKETS) + 2)
+            )
+            for index, bound in enumerate(STATEMENT_COUNT_BUCKETS):
+                if metrics.statement_count <= bound:
+                    buckets[index] += 1
+            # Trailing slots hold the +Inf bucket (also the count) and the sum
+            buckets[-2] += 1
+            buckets[-1] += metrics.statement_count
+
+            if budget_exceeded:
+                self._budget_exceeded[key] = self._budget_exceeded.get(key, 0) + 1
+
+    def render(self) -> str:
+        """
+        Render every metric in Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text ending in a newline
+        """
+        p = METRIC_PREFIX
+        lines: List[str] = []
+        with self._lock:
+            lines += [
+                f"# HELP {p}_http_requests_total HTTP requests handled.",
+                f"# TYPE {p}_http_requests_total counter",
+            ]
+            for key, count in sorted(self._requests.items()):
+                labels = _labels(("method", "route", "status"), key)
+                lines.append(f"{p}_http_requests_total{labels} {count}")
+
+            lines += [
+                f"# HELP {p}_http_request_duration_seconds HTTP request latency.",
+                f"# TYPE {p}_http_request_duration_seconds summary",
+            ]
+            for key, (count, total) in sorted(self._request_seconds.items()):
+                labels = _labels(("method", "route"), key)
+                lines.append(f"{p}_http_request_duration_seconds_sum{labels} {total}")
+                lines.append(f"{p}_http_request_duration_seconds_count{labels} {count}")
+
+            lines += [
+                f"# HELP {p}_http_request_db_statements SQL statements per HTTP request.",
+                f"# TYPE {p}_http_request_db_statements histogram",
+            ]
+            for key, buckets in sorted(self._request_statements.items()):
+                names = ("method", "route")
+                for bound, value in zip(STATEMENT_COUNT_BUCKETS, buckets):
+                    labels = _labels(names, key, le=bound)
+                    lines.append(
+                        f"{p}_http_request_db_statements_bucket{labels} {value}"
+                    )
+                labels = _labels(names, key, le="+Inf")
+                lines.append(
+                    f"{p}_http_request_db_statements_bucket{labels} {buckets[-2]}"
+                )
+                labels = _labels(names, key)
+                lines.append(
+                    f"{p}_http_request_db_statements_sum{labels} {buckets[-1]}"
+                )
+                lines.append(
+                    f"{p}_http_request_db_statements_count{labels} {buckets[-2]}"
+                )
+
+            lines += [
+                f"# HELP {p}_http_request_query_budget_exceeded_total Requests over the query budget.",
+                f"# TYPE {p}_http_request_query_budget_exceeded_total counter",
+            ]
+            for key, count in sorted(self._budget_exceeded.items()):
+                labels = _labels(("method", "route"), key)
+                lines.append(
+                    f"{p}_http_request_query_budget_exceeded_total{labels} {count}"
+                )
+
+            lines += [
+                f"# HELP {p}_db_statements_total SQL statements executed.",
+                f"# TYPE {p}_db_statements_total counter",
+                f"{p}_db_statements_total {self._statements}",
+                f"# HELP {p}_db_statement_duration_seconds_total Time spent executing SQL.",
+                f"# TYPE {p}_db_statement_duration_seconds_total counter",
+                f"{p}_db_statement_duration_seconds_total {self._statement_seconds}",
+            ]
+
+            method_names = ("layer", "class", "method")
+            method_metrics = (
+                ("method_calls_total", "Repository and service method calls.", 0),
+                (
+                    "method_duration_seconds_total",
+                    "Time spent in repository and service methods.",
+                    1,
+                ),
+                (
+                    "method_rows_total",
+                    "Rows returned by repository and service methods.",
+                    2,
+                ),
+            )
+            for name, help_text, index in method_metrics:
+                lines += [
+                    f"# HELP {p}_{name} {help_text}",
+                    f"# TYPE {p}_{name} counter",
+                ]
+                for key, totals in sorted(self._methods.items()):
+                    labels = _labels(method_names, key)
+                    lines.append(f"{p}_{name}{labels} {totals[index]}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry rendered by the /metrics endpoint
+metrics_registry = MetricsRegistry()
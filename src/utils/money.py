@@ -0,0 +1,237 @@
+"""
+Fixed-point money arithmetic for internal calculations.
+
+Monetary columns are Numeric(12, 4) and amounts cross the schema and
+database boundaries as Decimal (ADR-013). Inside calculations, chains of
+Decimal operations each followed by a quantize call are comparatively slow,
+so this module represents money as an integer number of ten-thousandths of
+a unit ("units"), matching the four decimal places of the columns exactly:
+
+- to_units/from_units convert single amounts at the boundary;
+- units_array/decimals_from_units convert whole series to and from int64
+  NumPy arrays for vectorized aggregation;
+- allocate_evenly and allocate_by_ratios split an amount into parts with
+  the largest remainder method using integer arithmetic only.
+
+Sums, differences and integer multiples of units are exact Python ints, so
+no rounding happens between the two conversions. Conversion from Decimal
+rounds half away from zero, like DecimalPrecision.round_for_calculation.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+UNITS_PER_WHOLE = 10_000  # 4 decimal places, matching Numeric(12, 4)
+UNITS_PER_CENT = 100
+
+MoneyInput = Union[Decimal, int, str]
+
+
+def div_round_half_up(numerator: int, denominator: int) -> int:
+    """
+    Divide integers, rounding halves away from zero.
+
+    Args:
+        numerator: Dividend
+        denominator: Divisor (positive)
+
+    Returns:
+        int: Rounded quotient
+    """
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if remainder * 2 >= denominator:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def div_round_half_even(numerator: int, denominator: int) -> int:
+    """
+    Divide integers, rounding halves to the nearest even quotient.
+
+    This matches Decimal.quantize under the default context.
+
+    Args:
+        numerator: Dividend
+        denominator: Divisor (positive)
+
+    Returns:
+        int: Rounded quotient
+    """
+    quotient, remainder = divmod(abs(numerator), denominator)
+    if remainder * 2 > denominator or (
+        remainder * 2 == denominator and quotient % 2 == 1
+    ):
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def to_units(value: MoneyInput) -> int:
+    """
+    Convert an amount to integer ten-thousandths.
+
+    Args:
+        value: Amount as a Decimal, an integer number of whole units, or a
+            decimal string
+
+    Returns:
+        int: The amount in units, rounded half up to four decimal places
+    """
+    if isinstance(value, int):
+        return value * UNITS_PER_WHOLE
+    if not isinstance(value, Decimal):
+        value = Decimal(value)
+    return int(value.scaleb(4).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _scaled_decimal(value: int, places: int) -> Decimal:
+    whole, fraction = divmod(abs(value), 10**places)
+    sign = "-" if value < 0 else ""
+    return Decimal(f"{sign}{whole}.{fraction:0{places}d}")
+
+
+def from_units(units: int) -> Decimal:
+    """
+    Convert integer ten-thousandths to a Decimal with four decimal places.
+
+    Args:
+        units: Amount in units
+
+    Returns:
+        Decimal: The amount, as round_for_calculation would return it
+    """
+    return _scaled_decimal(int(units), 4)
+
+
+def round_units_to_cents(units: int) -> int:
+    """
+    Round an amount in units to a whole number of cents, half up.
+
+    Args:
+        units: Amount in units
+
+    Returns:
+        int: The rounded amount in cents
+    """
+    return div_round_half_up(int(units), UNITS_PER_CENT)
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """
+    Convert integer cents to a Decimal with two decimal places.
+
+    Args:
+        cents: Amount in cents
+
+    Returns:
+        Decimal: The amount, as round_for_display would return it
+    """
+    return _scaled_decimal(int(cents), 2)
+
+
+def units_array(values: Iterable[MoneyInput]) -> "np.ndarray":
+    """
+    Convert amounts to an int64 array of units.
+
+    Args:
+        values: Amounts to convert
+
+    Returns:
+        np.ndarray: One int64 element per amount
+    """
+    import numpy as np
+
+    return np.fromiter((to_units(value) for value in values), dtype=np.int64)
+
+
+def decimals_from_units(units: Iterable[int]) -> List[Decimal]:
+    """
+    Convert units, such as an int64 array, back to Decimals.
+
+    Args:
+        units: Amounts in units
+
+    Returns:
+        List[Decimal]: The amounts with four decimal places
+    """
+    return [from_units(value) for value in units]
+
+
+def allocate_evenly(units: int, parts: int, step: int = UNITS_PER_CENT) -> List[int]:
+    """
+    Split an amount into equal parts of whole steps.
+
+    The amount is truncated to whole steps; the leftover steps go one each to
+    the first parts, so the parts differ by at most one step.
+
+    Args:
+        units: Amount to split, in units
+        parts: Number of parts (at least 1)
+        step: Granularity of the parts, in units (a cent by default)
+
+    Returns:
+        List[int]: Parts in units, summing to the truncated amount
+
+    Raises:
+        ValueError: If parts is less than 1
+    """
+    if parts < 1:
+        raise ValueError("Amount must be split into at least one part")
+    steps = abs(units) // step if units >= 0 else -(abs(units) // step)
+    base, remainder = divmod(steps, parts)
+    return [
+        (base + 1) * step if index < remainder else base * step
+        for index in range(parts)
+    ]
+
+
+def allocate_by_ratios(
+    units: int,
+    numerators: Sequence[int],
+    denominator: int,
+    step: int = UNITS_PER_CENT,
+) -> List[int]:
+    """
+    Split an amount by ratios into parts of whole steps.
+
+    Each part is first rounded half up to a whole step. The difference
+    between the amount and the rounded parts is then rounded half to even to
+    whole steps and handed back, one step at a time, to the parts whose exact
+    shares were furthest from their rounded values. An amount with a
+    fraction of exactly half a step left over therefore keeps the rounded
+    parts as they are when their step count is even.
+
+    Args:
+        units: Amount to split, in units
+        numerators: Numerator of each part's ratio
+        denominator: Common denominator of the ratios (positive)
+        step: Granularity of the parts, in units (a cent by default)
+
+    Returns:
+        List[int]: Parts in units, summing to whole steps within half a step
+            of the amount
+    """
+    if not numerators:
+        return []
+    scale = denominator * step
+    # Exact shares are numerator * units / scale steps; keep them as integer
+    # numerators over scale so rounding errors can be compared exactly
+    shares = [numerator * units for numerator in numerators]
+    rounded = [div_round_half_up(share, scale) for share in shares]
+    # Round the leftover, not the amount, so results match the Decimal
+    # implementation this replaced: (total - sum(parts)).quantize(cent)
+    remainder = div_round_half_even(units - sum(rounded) * step, step)
+
+    if remainder:
+        errors = sorted(
+            range(len(shares)),
+            key=lambda index: abs(shares[index] - rounded[index] * scale),
+            reverse=True,
+        )
+        adjustment = 1 if remainder > 0 else -1
+        for offset in range(abs(remainder)):
+            rounded[errors[offset % len(errors)]] += adjustment
+
+    return [steps * step for steps in rounded]
@@ -0,0 +1,251 @@
+"""
+In-process response cache invalidated by a data version.
+
+Read-heavy endpoints are recomputed from data that changes rarely. This
+module provides the two pieces the response cache middleware builds on:
+
+- DataVersion: a process-wide counter bumped whenever a session commits a
+  write, so anything cached under an older version is known to be stale.
+  Writes are detected with SQLAlchemy session events (see track_data_version),
+  covering both unit-of-work flushes and DML statements run through
+  session.execute.
+- ResponseCache: a size-bounded LRU of rendered response bodies keyed by
+  request, each stamped with the data version it was computed under and an
+  expiry for content that also depends on the clock.
+
+The version is per process, so a write committed by another worker process
+does not invalidate this process's entries; deployments running several
+workers should rely on the per-route TTLs or disable the cache.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.utils.config import settings
+
+# Session.info key marking a transaction that wrote data
+_WRITE_FLAG = "debtonator_data_written"
+
+
+class DataVersion:
+    """Monotonic counter identifying the current state of the data."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+
+    @property
+    def current(self) -> int:
+        """Get the current version."""
+        return self._value
+
+    def bump(self) -> int:
+        """
+        Advance the version after a committed write.
+
+        Returns:
+            int: The new version
+        """
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+data_version = DataVersion()
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    # new/dirty/deleted still describe what this flush wrote
+    if session.new or session.dirty or session.deleted:
+        session.info[_WRITE_FLAG] = True
+
+
+def _do_orm_execute(orm_execute_state: Any) -> None:
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info[_WRITE_FLAG] = True
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop(_WRITE_FLAG, False):
+        data_version.bump()
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_WRITE_FLAG, None)
+
+
+def track_data_version(session_class: Any = Session) -> None:
+    """
+    Bump the data version whenever a session of this class commits a write.
+
+    Listening on the base Session class covers every session, including the
+    sync sessions behind AsyncSession. Safe to call more than once.
+
+    Args:
+        session_class: Session class (or sessionmaker) to listen on
+    """
+    if event.contains(session_class, "after_commit", _after_commit):
+        return
+    event.listen(session_class, "after_flush", _after_flush)
+    event.listen(session_class, "do_orm_execute", _do_orm_execute)
+    event.listen(session_class, "after_commit", _after_commit)
+    event.listen(session_class, "after_rollback", _after_rollback)
+
+
+class CachedResponse:
+    """A rendered response body stored in the cache."""
+
+    __slots__ = ("version", "expires_at", "etag", "status_code", "headers", "body")
+
+    def __init__(
+        self,
+        version: int,
+        expires_at: float,
+        status_code: int,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> None:
+        self.version = version
+        self.expires_at = expires_at
+        self.etag = make_etag(body)
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong entity tag for a response body.
+
+    Args:
+        body: Rendered response body
+
+    Returns:
+        str: Quoted entity tag
+    """
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class ResponseCache:
+    """
+    LRU cache of response bodies bounded by entry count and total bytes.
+
+    Entries are looked up with the current data version; an entry computed
+    under another version, or past its expiry, is dropped on lookup.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 8 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, ...], CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Get the total size in bytes of the cached bodies."""
+        return self._size
+
+    def get(self, key: Tuple[str, ...], version: int) -> Optional[CachedResponse]:
+        """
+        Get a fresh cached response.
+
+        Args:
+            key: Cache key of the request
+            version: Current data version
+
+        Returns:
+            Optional[CachedResponse]: The entry, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.version != version or entry.expires_at <= time.monotonic()
+            ):
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: Tuple[str, ...],
+        version: int,
+        ttl: float,
+        status_code: int,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> CachedResponse:
+        """
+        Store a response, evicting least recently used entries to fit.
+
+        Bodies larger than the whole byte budget are returned but not stored.
+
+        Args:
+            key: Cache key of the request
+            version: Data version the body was computed under
+            ttl: Seconds the entry stays fresh
+            status_code: Response status code
+            headers: Response headers to replay
+            body: Rendered response body
+
+        Returns:
+            CachedResponse: The entry, with its entity tag
+        """
+        entry = CachedResponse(
+            version, time.monotonic() + ttl, status_code, headers, body
+        )
+        if len(body) > self.max_bytes:
+            return entry
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        return entry
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _discard(self, key: Tuple[str, ...]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.body)
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
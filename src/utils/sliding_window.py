@@ -0,0 +1,51 @@
+"""
+Sliding window aggregates over daily series.
+
+Cashflow metrics ask, for every day of a horizon, for the lowest projected
+balance in the days ahead. Recomputing each window from scratch costs
+O(days x window); the monotonic deque used here answers every window of a
+series in a single O(days) pass.
+
+NumPy is available, but a strided window view still compares every value
+of every window, and the balances are Decimal, so the values are kept as
+they are rather than converted to float arrays.
+"""
+
+from collections import deque
+from typing import Deque, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def lookahead_minimums(values: Sequence[T], window: int) -> List[T]:
+    """
+    Get the minimum of each value and the ``window - 1`` values after it.
+
+    Windows running past the end of the series are truncated, so the last
+    value's minimum is the value itself.
+
+    Args:
+        values: Series to scan, such as daily closing balances
+        window: Number of values in each window (at least 1)
+
+    Returns:
+        List[T]: Window minimums, one per value
+
+    Raises:
+        ValueError: If window is less than 1
+    """
+    if window < 1:
+        raise ValueError("Window must contain at least one value")
+
+    minimums: List[T] = [None] * len(values)  # type: ignore[list-item]
+    # Indices still able to be a window minimum; their values increase from
+    # front to back and the front holds the minimum of the current window
+    candidates: Deque[int] = deque()
+    for index in range(len(values) - 1, -1, -1):
+        while candidates and values[candidates[-1]] >= values[index]:
+            candidates.pop()
+        candidates.append(index)
+        if candidates[0] >= index + window:
+            candidates.popleft()
+        minimums[index] = values[candidates[0]]
+    return minimums
@@ -0,0 +1,259 @@
+"""
+Exact bill split allocation solver.
+
+This module allocates one or more liabilities across funding accounts at
+minimum total cost. The problem is modelled as a min-cost flow network and
+solved exactly in integer cents, so allocations never lose or invent a cent
+to rounding.
+
+Network layout for liabilities L1..Ln ordered by due date and each account A:
+
+    source --(cost tiers)--> A[n] --cap(n-1)--> A[n-1] ... A[2] --cap(1)--> A[1]
+    A[i] --> Li --> sink (capacity: liability amount)
+
+Flow through the edge into A[i] is the total drawn from the account for
+liabilities due on or before Li, so capacity on that edge enforces that the
+account can still cover everything due by that date. Parallel tier edges
+from the source carry increasing per-cent costs, which expresses convex
+costs such as credit utilization penalties.
+
+The solver is pure and performs no I/O; the BillSplitService builds the
+network from account and liability state.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class SplitDemand(NamedTuple):
+    """A liability to allocate, in due-date order."""
+
+    liability_id: int
+    amount: int  # cents
+    preferred_account_id: Optional[int] = None
+
+
+class SplitSolution(NamedTuple):
+    """Result of a split allocation solve."""
+
+    allocations: Dict[int, Dict[int, int]]  # liability_id -> account_id -> cents
+    unallocated: Dict[int, int]  # liability_id -> cents that could not be funded
+    total_cost: int  # sum of cents * per-cent cost
+
+
+class _FlowNetwork:
+    """Residual graph with successive shortest path min-cost flow."""
+
+    def __init__(self, node_count: int):
+        self.graph: List[List[int]] = [[] for _ in range(node_count)]
+        # Parallel edge arrays: target, residual capacity, cost
+        self.to: List[int] = []
+        self.cap: List[int] = []
+        self.cost: List[int] = []
+
+    def add_edge(self, source: int, target: int, capacity: int, cost: int) -> int:
+        """Add an edge and its reverse; returns the forward edge index."""
+        index = len(self.to)
+        self.graph[source].append(index)
+        self.to.append(target)
+        self.cap.append(capacity)
+        self.cost.append(cost)
+        self.graph[target].append(index + 1)
+        self.to.append(source)
+        self.cap.append(0)
+        self.cost.append(-cost)
+        return index
+
+    def flow(self, edge: int) -> int:
+        """Flow currently routed through a forward edge."""
+        return self.cap[edge + 1]
+
+    def min_cost_flow(self, source: int, sink: int) -> Tuple[int, int]:
+        """
+        Push as much flow as possible from source to sink at minimum cost.
+
+        Each iteration augments along a cheapest path by its full bottleneck
+        capacity, so the iteration count depends on the network shape rather
+        than on amounts in cents.
+
+        Returns:
+            Tuple[int, int]: Total flow and total cost
+        """
+        total_flow = 0
+        total_cost = 0
+        node_count = len(self.graph)
+
+        while True:
+            # Bellman-Ford (queue based) since residual edges carry negative costs
+            distance = [None] * node_count
+            parent_edge = [-1] * node_count
+            in_queue = [False] * node_count
+            distance[source] = 0
+            queue = [source]
+            in_queue[source] = True
+            head = 0
+            while head < len(queue):
+                node = queue[head]
+                head += 1
+                in_queue[node] = False
+                for edge in self.graph[node]:
+                    if self.cap[edge] <= 0:
+                        continue
+                    target = self.to[edge]
+                    candidate = distance[node] + self.cost[edge]
+                    if distance[target] is None or candidate < distance[target]:
+                        distance[target] = candidate
+                        parent_edge[target] = edge
+                        if not in_queue[target]:
+                            queue.append(target)
+                            in_queue[target] = True
+
+            if distance[sink] is None:
+                return total_flow, total_cost
+
+            bottleneck = None
+            node = sink
+            while node != source:
+                edge = parent_edge[node]
+                if bottleneck is None or self.cap[edge] < bottleneck:
+                    bottleneck = self.cap[edge]
+                node = self.to[edge ^ 1]
+
+            node = sink
+            while node != source:
+                edge = parent_edge[node]
+                self.cap[edge] -= bottleneck
+                self.cap[edge ^ 1] += bottleneck
+                node = self.to[edge ^ 1]
+
+            total_flow += bottleneck
+            total_cost += bottleneck * distance[sink]
+
+
+class SplitSolver:
+    """
+    Minimum-cost allocation of liabilities across accounts in integer cents.
+
+    Usage:
+        solver = SplitSolver(demands)
+        solver.add_account(account_id, capacities, cost_tiers)
+        solution = solver.solve()
+
+    Costs are integers per cent allocated; callers choose the scale.
+    """
+
+    # Cost added per cent when a liability is paid from an account other than
+    # its preferred one, so ties between equally cheap accounts resolve to the
+    # liability's primary account
+    NON_PREFERRED_COST = 1
+
+    def __init__(self, demands: List[SplitDemand]):
+        """
+        Initialize the solver.
+
+        Args:
+            demands: Liabilities to allocate, ordered by due date
+        """
+        self.demands = list(demands)
+        self._accounts: List[Tuple[int, List[int], List[Tuple[int, int]]]] = []
+
+    def add_account(
+        self,
+        account_id: int,
+        capacities: List[int],
+        cost_tiers: List[Tuple[int, int]],
+    ) -> None:
+        """
+        Add a funding account.
+
+        Args:
+            account_id: Account ID
+            capacities: Maximum cumulative cents the account can fund for
+                liabilities up to and including each demand, one per demand
+            cost_tiers: (width in cents, cost per cent) pairs; the widths
+                bound the total drawn from the account and costs should be
+                non-decreasing for the tiers to model a convex cost
+
+        Raises:
+            ValueError: If capacities do not match the number of demands
+        """
+        if len(capacities) != len(self.demands):
+            raise ValueError("One capacity per demand is required")
+        self._accounts.append((account_id, capacities, cost_tiers))
+
+    def solve(self) -> SplitSolution:
+        """
+        Compute the minimum-cost allocation.
+
+        When the accounts cannot cover every demand, the solution funds as
+        much as possible and reports the remainder in `unallocated`.
+
+        Returns:
+            SplitSolution: Allocations, unfunded remainders and total cost
+        """
+        demand_count = len(self.demands)
+        source = 0
+        sink = 1
+        demand_node = {index: 2 + index for index in range(demand_count)}
+        next_node = 2 + demand_count
+        account_nodes: List[List[int]] = []
+        for _ in self._accounts:
+            account_nodes.append(list(range(next_node, next_node + demand_count)))
+            next_node += demand_count
+
+        network = _FlowNetwork(next_node)
+
+        for index, demand in enumerate(self.demands):
+            network.add_edge(demand_node[index], sink, max(demand.amount, 0), 0)
+
+        allocation_edges: List[Tuple[int, int, int]] = []
+        for (account_id, capacities, cost_tiers), nodes in zip(
+            self._accounts, account_nodes
+        ):
+            if demand_count == 0:
+                continue
+            top = nodes[-1]
+            # Everything drawn from the account must fit the last capacity
+            remaining = max(capacities[-1], 0)
+            for width, tier_cost in cost_tiers:
+                width = min(width, remaining)
+                if width > 0:
+                    network.add_edge(source, top, width, tier_cost)
+                    remaining -= width
+            # Chain from the latest due date down to the earliest
+            for index in range(demand_count - 1, 0, -1):
+                network.add_edge(
+                    nodes[index], nodes[index - 1], max(capacities[index - 1], 0), 0
+                )
+            for index, demand in enumerate(self.demands):
+                extra = (
+                    0
+                    if demand.preferred_account_id in (None, account_id)
+                    else self.NON_PREFERRED_COST
+                )
+                edge = network.add_edge(
+                    nodes[index],
+                    demand_node[index],
+                    max(min(capacities[index], demand.amount), 0),
+                    extra,
+                )
+                allocation_edges.append((edge, demand.liability_id, account_id))
+
+        _, total_cost = network.min_cost_flow(source, sink)
+
+        allocations: Dict[int, Dict[int, int]] = {
+            demand.liability_id: {} for demand in self.demands
+        }
+        for edge, liability_id, account_id in allocation_edges:
+            flow = network.flow(edge)
+            if flow > 0:
+                allocations[liability_id][account_id] = flow
+
+        unallocated = {}
+        for demand in self.demands:
+            remainder = demand.amount - sum(allocations[demand.liability_id].values())
+            if remainder > 0:
+                unallocated[demand.liability_id] = remainder
+
+        return SplitSolution(
+            allocations=allocations, unallocated=unallocated, total_cost=total_cost
+        )
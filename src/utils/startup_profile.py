@@ -0,0 +1,176 @@
+"""
+Startup profiling.
+
+Cold start matters for short-lived workers and CLI jobs, where importing the
+application can take longer than the work itself. This module provides:
+
+- StartupProfile: wall-clock timings of named startup phases, which the
+  application lifespan logs once startup completes;
+- parse_import_times/format_import_report: an import-time breakdown built
+  from the output of Python's -X importtime option, listing the slowest
+  modules and the total time spent per package;
+- profile_imports: runs that breakdown for a module in a fresh interpreter,
+  so modules already imported by the caller do not hide their cost.
+
+tools/startup_profile.py prints the report from the command line.
+"""
+
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+_IMPORT_TIME_PREFIX = "import time:"
+
+
+class ImportTime(NamedTuple):
+    """Import time of one module, as reported by -X importtime."""
+
+    module: str
+    self_us: int  # time spent in the module's own body
+    cumulative_us: int  # including the modules it imported first
+    depth: int  # nesting level; 0 for modules imported directly
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    """
+    Parse -X importtime output.
+
+    Args:
+        output: Standard error of an interpreter run with -X importtime
+
+    Returns:
+        List[ImportTime]: One entry per imported module, in report order
+    """
+    times = []
+    for line in output.splitlines():
+        if not line.startswith(_IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(_IMPORT_TIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        times.append(
+            ImportTime(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return times
+
+
+def package_totals(times: List[ImportTime], depth: int = 2) -> Dict[str, int]:
+    """
+    Sum the self time of modules per package.
+
+    Args:
+        times: Parsed import times
+        depth: Number of leading name components identifying a package, so
+            2 groups src.services.accounts under src.services
+
+    Returns:
+        Dict[str, int]: Microseconds per package, slowest first
+    """
+    totals: Dict[str, int] = {}
+    for entry in times:
+        package = ".".join(entry.module.split(".")[:depth])
+        totals[package] = totals.get(package, 0) + entry.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def format_import_report(
+    times: List[ImportTime], top: int = 25, package_depth: int = 2
+) -> str:
+    """
+    Format an import-time breakdown.
+
+    Args:
+        times: Parsed import times
+        top: Number of modules and packages to list
+        package_depth: Name components identifying a package
+
+    Returns:
+        str: Report listing the total, the slowest packages by self time and
+            the slowest modules by cumulative time
+    """
+    total_us = sum(entry.self_us for entry in times)
+    lines = [f"Total import time: {total_us / 1000:.1f} ms ({len(times)} modules)"]
+
+    lines += ["", "Packages by self time (ms):"]
+    for package, micros in list(package_totals(times, package_depth).items())[:top]:
+        lines.append(f"  {micros / 1000:9.1f}  {package}")
+
+    lines += ["", "Modules by cumulative time (ms):"]
+    slowest = sorted(times, key=lambda entry: entry.cumulative_us, reverse=True)
+    for entry in slowest[:top]:
+        lines.append(
+            f"  {entry.cumulative_us / 1000:9.1f}  "
+            f"{entry.self_us / 1000:7.1f}  {entry.module}"
+        )
+    return "\n".join(lines)
+
+
+def profile_imports(
+    module: str = "src.main", python: Optional[str] = None
+) -> List[ImportTime]:
+    """
+    Measure the import times of a module in a fresh interpreter.
+
+    Args:
+        module: Module to import
+        python: Interpreter to run; defaults to the current one
+
+    Returns:
+        List[ImportTime]: Import times of the module and everything it imports
+
+    Raises:
+        subprocess.CalledProcessError: If the module fails to import
+    """
+    result = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(result.stderr)
+
+
+class StartupProfile:
+    """Wall-clock timings of named startup phases."""
+
+    def __init__(self) -> None:
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time the enclosed block as a startup phase.
+
+        Args:
+            name: Phase name used in the report
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    @property
+    def total_ms(self) -> float:
+        """Get the total time of all phases in milliseconds."""
+        return sum(seconds for _, seconds in self.phases) * 1000
+
+    def report(self) -> str:
+        """
+        Summarise the phases on one line.
+
+        Returns:
+            str: Phase timings such as "create_tables=12.3ms, feature_flags=4.5ms"
+        """
+        return ", ".join(
+            f"{name}={seconds * 1000:.1f}ms" for name, seconds in self.phases
+        )
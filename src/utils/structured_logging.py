@@ -0,0 +1,202 @@
+"""
+Structured logging configuration.
+
+Provides the pieces the application uses to emit logs that are cheap on hot
+paths and easy to ingest:
+
+- request_id_scope / current_request_id: a ContextVar carrying the id of the
+  request being handled, set by RequestIdMiddleware
+- RequestIdFilter: stamps that id onto every record so text and JSON output
+  can be correlated per request
+- JsonFormatter: one JSON object per line with the standard fields, the
+  request id, any ``extra`` fields and the formatted exception
+- SamplingFilter: keeps only a fraction of high-volume low-level records for
+  selected logger hierarchies
+- configure_logging: installs a single root handler from settings
+
+Messages should use logging's lazy %-style arguments rather than f-strings so
+nothing is formatted unless a handler actually emits the record.
+"""
+
+import itertools
+import json
+import logging
+import sys
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Mapping, Optional, TextIO
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", (), None))
+) | {"message", "asctime", "request_id"}
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"
+
+_request_id: ContextVar[Optional[str]] = ContextVar(
+    "debtonator_request_id", default=None
+)
+
+
+def new_request_id() -> str:
+    """Generate a request id for requests that did not supply one."""
+    return uuid.uuid4().hex
+
+
+def current_request_id() -> Optional[str]:
+    """Get the id of the request being handled, if any."""
+    return _request_id.get()
+
+
+@contextmanager
+def request_id_scope(request_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Make a request id current for the duration of the block.
+
+    Args:
+        request_id: Id to use; a new one is generated when omitted
+
+    Yields:
+        str: The current request id
+    """
+    request_id = request_id or new_request_id()
+    token = _request_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        _request_id.reset(token)
+
+
+class RequestIdFilter(logging.Filter):
+    """Add the current request id (or "-") to every record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = _request_id.get() or "-"
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep one in every N low-level records per logger hierarchy.
+
+    Rates are fractions between 0 and 1 keyed by logger name; a rate applies
+    to that logger and its children, with the most specific name winning.
+    Sampling is counter based rather than random so a rate of 0.1 emits
+    exactly every tenth record. Records above max_level are never sampled.
+    """
+
+    def __init__(
+        self, rates: Mapping[str, float], max_level: int = logging.DEBUG
+    ) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            rates: Fraction of records to keep, keyed by logger name
+            max_level: Highest level subject to sampling
+        """
+        super().__init__()
+        self.max_level = max_level
+        self._intervals: Dict[str, int] = {}
+        for name, rate in rates.items():
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Sample rate for {name!r} must be in [0, 1]")
+            # 0 drops everything; otherwise keep every round(1/rate)th record
+            self._intervals[name] = 0 if rate == 0 else max(1, round(1 / rate))
+        self._counters: Dict[str, Iterator[int]] = {
+            name: itertools.count() for name in self._intervals
+        }
+        # Resolved prefix per logger name, computed once
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def _prefix_for(self, logger_name: str) -> Optional[str]:
+        try:
+            return self._resolved[logger_name]
+        except KeyError:
+            pass
+        prefix: Optional[str] = None
+        name = logger_name
+        while name:
+            if name in self._intervals:
+                prefix = name
+                break
+            name = name.rpartition(".")[0]
+        self._resolved[logger_name] = prefix
+        return prefix
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        prefix = self._prefix_for(record.name)
+        if prefix is None:
+            return True
+        interval = self._intervals[prefix]
+        if interval == 0:
+            return False
+        return next(self._counters[prefix]) % interval == 0
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None) or _request_id.get(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_format: bool = False,
+    sample_rates: Optional[Mapping[str, float]] = None,
+    stream: Optional[TextIO] = None,
+) -> logging.Handler:
+    """
+    Install a single structured handler on the root logger.
+
+    Replaces handlers previously installed by this function, so it is safe
+    to call more than once.
+
+    Args:
+        level: Root log level name
+        json_format: Emit JSON lines instead of text
+        sample_rates: Fraction of DEBUG records to keep, keyed by logger name
+        stream: Output stream, stderr by default
+
+    Returns:
+        logging.Handler: The installed handler
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.set_name("debtonator")
+    if sample_rates:
+        # Drop sampled-out records before doing any other work on them
+        handler.addFilter(SamplingFilter(sample_rates))
+    handler.addFilter(RequestIdFilter())
+    handler.setFormatter(
+        JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    )
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        if existing.get_name() == "debtonator":
+            root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    return handler
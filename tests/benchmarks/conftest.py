@@ -0,0 +1,78 @@
+"""
+Fixtures for the performance benchmark suite.
+
+Benchmarks run against a synthetic household generated inside the usual
+rolled-back test transaction. Results are written to .benchmarks/latest.json
+after every run. SQL statement counts are compared against the committed
+tests/benchmarks/baseline.json; timings are compared against
+.benchmarks/timings.json, recorded on the local machine. Pass
+--benchmark-save-baseline to record both baselines.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.utils.instrumentation import instrument_engine
+from tests.helpers.benchmarks import (
+    BenchmarkResult,
+    BenchmarkRunner,
+    load_results,
+    load_statement_baseline,
+    save_results,
+    save_statement_baseline,
+)
+from tests.helpers.datasets import HouseholdDataset, HouseholdSpec, generate_household
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+RESULTS_DIR = Path(__file__).resolve().parents[2] / ".benchmarks"
+RESULTS_PATH = RESULTS_DIR / "latest.json"
+# Timings are machine-specific, so their baseline is never committed
+TIMINGS_PATH = RESULTS_DIR / "timings.json"
+
+# Dataset used by every benchmark; changing it invalidates the baseline
+BENCHMARK_SPEC = HouseholdSpec()
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request) -> Dict[str, BenchmarkResult]:
+    """Results of every benchmark in the session, saved when it ends."""
+    results: Dict[str, BenchmarkResult] = {}
+    yield results
+
+    if not results:
+        return
+    save_results(RESULTS_PATH, results)
+    if request.config.getoption("--benchmark-save-baseline"):
+        statements = load_statement_baseline(BASELINE_PATH)
+        statements.update({name: result.statements for name, result in results.items()})
+        save_statement_baseline(BASELINE_PATH, statements)
+
+        timings = load_results(TIMINGS_PATH)
+        timings.update(results)
+        save_results(TIMINGS_PATH, timings)
+
+
+@pytest_asyncio.fixture
+async def household(db_session: AsyncSession) -> HouseholdDataset:
+    """A synthetic household in the test database."""
+    return await generate_household(db_session, BENCHMARK_SPEC)
+
+
+@pytest_asyncio.fixture
+async def benchmark(
+    request, db_session: AsyncSession, benchmark_results
+) -> BenchmarkRunner:
+    """Runner measuring operations against the stored baselines."""
+    instrument_engine(db_session.bind.engine)
+    saving = request.config.getoption("--benchmark-save-baseline")
+    return BenchmarkRunner(
+        statements={} if saving else load_statement_baseline(BASELINE_PATH),
+        timings={} if saving else load_results(TIMINGS_PATH),
+        tolerance=request.config.getoption("--benchmark-tolerance"),
+        enforce=not saving,
+        results=benchmark_results,
+    )
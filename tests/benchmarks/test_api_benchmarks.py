@@ -0,0 +1,31 @@
+"""
+Benchmarks for key read endpoints, exercised through the full HTTP stack.
+"""
+
+import pytest
+
+from src.utils.response_cache import response_cache
+
+pytestmark = pytest.mark.benchmark
+
+ENDPOINTS = [
+    ("list_accounts", "/api/v1/accounts/"),
+    ("list_account_summaries", "/api/v1/accounts/summary"),
+    ("list_income", "/api/v1/income/"),
+    ("list_income_categories", "/api/v1/income/categories"),
+    ("list_unpaid_liabilities", "/api/v1/liabilities/unpaid/"),
+    ("get_cross_account_analysis", "/api/v1/realtime-cashflow/cross-account-analysis"),
+]
+
+
+@pytest.mark.parametrize("name,path", ENDPOINTS, ids=[n for n, _ in ENDPOINTS])
+async def test_endpoint(client, household, benchmark, name, path):
+    """Full request/response cycle of a read endpoint."""
+
+    async def get():
+        # Measure the computed response rather than a response cache hit
+        response_cache.clear()
+        response = await client.get(path)
+        assert response.status_code == 200, response.text
+
+    await benchmark.measure(f"api.{name}", get)
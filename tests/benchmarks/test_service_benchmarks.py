@@ -0,0 +1,202 @@
+"""
+Benchmarks for service-layer hot paths.
+
+Each benchmark runs against the synthetic household and is compared with the
+stored baseline for both median time and SQL statement count.
+"""
+
+import csv
+import io
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import select
+
+from src.models.categories import Category
+from src.models.liabilities import Liability
+from src.schemas.cashflow.cashflow_forecasting import (
+    AccountForecastRequest,
+    CustomForecastParameters,
+    ProbabilisticForecastParameters,
+)
+from src.schemas.income_trends import IncomeTrendsRequest
+from src.services.bulk_import import BulkImportService
+from src.services.cashflow.cashflow_forecast_service import ForecastService
+from src.services.cashflow.cashflow_metrics_service import MetricsService
+from src.services.categories import CategoryService
+from src.services.category_matcher import CategoryMatcher
+from src.services.income import IncomeService
+from src.services.income_trends import IncomeTrendsService
+from src.services.liabilities import LiabilityService
+from src.services.realtime_cashflow import RealtimeCashflowService
+from src.services.recurring_bills import RecurringBillService
+from src.utils.datetime_utils import ensure_utc
+
+pytestmark = pytest.mark.benchmark
+
+
+async def test_custom_forecast(db_session, household, benchmark):
+    """90-day custom forecast across every funding account."""
+    start = ensure_utc(household.anchor)
+    params = CustomForecastParameters(
+        start_date=start,
+        end_date=start + timedelta(days=90),
+        include_pending=True,
+        account_ids=household.funding_account_ids,
+        confidence_threshold=Decimal("0.8"),
+    )
+
+    await benchmark.measure(
+        "forecast.custom_90_days",
+        lambda: ForecastService(db_session).get_custom_forecast(params),
+        rounds=3,
+    )
+
+
+async def test_probabilistic_forecast(db_session, household, benchmark):
+    """90-day Monte Carlo forecast of 2000 paths across every funding account."""
+    start = ensure_utc(household.anchor)
+    params = ProbabilisticForecastParameters(
+        start_date=start,
+        end_date=start + timedelta(days=89),
+        account_ids=household.funding_account_ids,
+        paths=2000,
+        seed=1,
+    )
+
+    await benchmark.measure(
+        "forecast.probabilistic_90_days",
+        lambda: ForecastService(db_session).get_probabilistic_forecast(params),
+        rounds=3,
+    )
+
+
+async def test_account_forecast(db_session, household, benchmark):
+    """90-day forecast for a single checking account."""
+    start = ensure_utc(household.anchor)
+    params = AccountForecastRequest(
+        account_id=household.account_ids["checking"][0],
+        start_date=start,
+        end_date=start + timedelta(days=90),
+    )
+
+    await benchmark.measure(
+        "forecast.account_90_days",
+        lambda: ForecastService(db_session).get_account_forecast(params),
+        rounds=3,
+    )
+
+
+async def test_rolling_forecast(db_session, household, benchmark):
+    """90 stored daily forecasts with 14/30/60/90-day lookahead minimums."""
+    await benchmark.measure(
+        "cashflow_metrics.forecast_90_days",
+        lambda: MetricsService(db_session).calculate_90_day_forecast(
+            household.anchor.date()
+        ),
+        rounds=3,
+    )
+
+
+async def test_cross_account_analysis(db_session, household, benchmark):
+    """Cross-account correlation, transfer, usage and risk analysis."""
+    await benchmark.measure(
+        "realtime_cashflow.cross_account_analysis",
+        lambda: RealtimeCashflowService(db_session).get_cross_account_analysis(),
+    )
+
+
+async def test_income_trends(db_session, household, benchmark):
+    """Income trend analysis over the full income history."""
+    request = IncomeTrendsRequest(
+        start_date=ensure_utc(household.anchor - timedelta(days=365)),
+        end_date=ensure_utc(household.anchor),
+        min_confidence=Decimal("0"),
+    )
+
+    await benchmark.measure(
+        "income_trends.analyze_one_year",
+        lambda: IncomeTrendsService(db_session).analyze_trends(request),
+    )
+
+
+async def test_bulk_import_preview(db_session, household, benchmark):
+    """Validation preview of a 200-row liabilities CSV."""
+    category_names = list(household.category_ids)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer,
+        fieldnames=[
+            "month",
+            "day_of_month",
+            "bill_name",
+            "amount",
+            "account_name",
+            "primary_account_id",
+        ],
+    )
+    writer.writeheader()
+    for row in range(200):
+        writer.writerow(
+            {
+                "month": row % 12 + 1,
+                "day_of_month": row % 28 + 1,
+                "bill_name": f"Imported Bill {row}",
+                "amount": f"{10 + row % 90}.99",
+                "account_name": category_names[row % len(category_names)],
+                "primary_account_id": household.account_ids["checking"][0],
+            }
+        )
+    content = buffer.getvalue().encode()
+
+    async def preview():
+        service = BulkImportService(
+            db_session,
+            LiabilityService(db_session),
+            IncomeService(db_session),
+            CategoryService(db_session),
+        )
+        file = UploadFile(filename="liabilities.csv", file=io.BytesIO(content))
+        result = await service.preview_liabilities_import(file)
+        assert not result.validation_errors, result.validation_errors[:3]
+
+    await benchmark.measure("bulk_import.preview_200_liabilities", preview)
+
+
+async def test_category_matching(db_session, household, benchmark):
+    """Match a year of bills against every root category."""
+    rows = (
+        await db_session.execute(
+            select(Liability.name, Liability.amount, Category.name)
+            .join(Category, Liability.category_id == Category.id)
+            .where(Liability.due_date >= household.anchor - timedelta(days=365))
+        )
+    ).all()
+    transactions = [
+        {"type": "bill", "name": name, "amount": amount, "category": category}
+        for name, amount, category in rows
+    ]
+    roots = [name for name in household.category_ids if " " not in name]
+
+    async def match_all():
+        matcher = CategoryMatcher(db_session)
+        for root in roots:
+            await matcher.get_matching_transactions(transactions, root)
+
+    await benchmark.measure("category_matcher.match_year_of_bills", match_all)
+
+
+async def test_recurring_bill_generation(db_session, household, benchmark):
+    """Backfill a year of bills from every recurring bill template."""
+    # Each round fills a year nothing has been generated for yet
+    years = iter(range(household.anchor.year + 2, household.anchor.year + 10))
+
+    await benchmark.measure(
+        "recurring_bills.generate_year",
+        lambda: RecurringBillService(db_session).generate_bills_for_month(
+            1, next(years), months=12
+        ),
+        rounds=3,
+    )
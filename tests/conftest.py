@@ -1,5 +1,7 @@
+from decimal import Decimal
 from typing import AsyncGenerator
 
+import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -8,7 +10,43 @@ from sqlalchemy.orm import sessionmaker
 from src.database.base import Base
 from src.database.database import get_db
 from src.main import app
+from src.models.account_types.banking.checking import CheckingAccount
+from src.models.account_types.banking.credit import CreditAccount
 from src.registry.account_registry_init import register_account_types
+from src.utils.response_cache import response_cache
+
+
+def pytest_addoption(parser):
+    """Register options for the performance benchmark suite."""
+    group = parser.getgroup("benchmarks", "performance benchmark suite")
+    group.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run tests marked as benchmarks (skipped by default)",
+    )
+    group.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        default=False,
+        help="Record benchmark results as the new baseline instead of comparing",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=1.0,
+        help="Allowed relative slowdown against the local timing baseline (default 1.0)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they were explicitly requested."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="use --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 # Ensure account type registry is initialized for testing
@@ -133,6 +171,39 @@ async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
         await connection.close()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def file_engine(tmp_path):
+    """
+    Engine on a database file with a checking and a credit account.
+
+    Unlike db_session, sessions on this engine each get their own connection
+    and really commit, for tests of code that opens sessions of its own.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all(
+            [
+                CheckingAccount(
+                    name="Checking",
+                    available_balance=Decimal("1000.00"),
+                    current_balance=Decimal("1000.00"),
+                ),
+                CreditAccount(
+                    name="Credit",
+                    available_balance=Decimal("-200.00"),
+                    current_balance=Decimal("-200.00"),
+                    credit_limit=Decimal("1000.00"),
+                    available_credit=Decimal("800.00"),
+                ),
+            ]
+        )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
     """Create a new AsyncClient that uses the test database."""
@@ -148,3 +219,5 @@ async def client(db_session) -> AsyncGenerator[AsyncClient, None]:
     async with AsyncClient(transport=transport, base_url="http://test") as test_client:
         yield test_client
     app.dependency_overrides.clear()
+    # Cached responses were computed from this test's rolled back data
+    response_cache.clear()
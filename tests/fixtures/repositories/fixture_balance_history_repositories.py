@@ -9,6 +9,7 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.balance_history import BalanceHistoryRepository
+from src.repositories.balance_history_rollups import BalanceHistoryRollupRepository
 
 
 @pytest_asyncio.fixture
@@ -25,3 +26,19 @@ async def balance_history_repository(
         BalanceHistoryRepository: Repository for balance history operations
     """
     return BalanceHistoryRepository(db_session)
+
+
+@pytest_asyncio.fixture
+async def balance_history_rollup_repository(
+    db_session: AsyncSession,
+) -> BalanceHistoryRollupRepository:
+    """
+    Fixture for BalanceHistoryRollupRepository with test database session.
+
+    Args:
+        db_session: Database session fixture
+
+    Returns:
+        BalanceHistoryRollupRepository: Repository for balance history rollups
+    """
+    return BalanceHistoryRollupRepository(db_session)
@@ -0,0 +1,185 @@
+"""
+Benchmark harness for the performance suite.
+
+A BenchmarkRunner times an async operation over several rounds, counts the
+SQL statements each round executes (using the instrumentation from
+src.utils.instrumentation) and compares the result against two baselines.
+Statement counts are deterministic for a given dataset, so they are committed
+and any increase is reported as a regression. Timings depend on the machine,
+so they are only compared against results recorded locally on the same
+machine, with a relative tolerance and an absolute floor to absorb noise.
+"""
+
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.utils.instrumentation import request_metrics_scope
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and statement count of one benchmark."""
+
+    name: str
+    rounds: int
+    median_ms: float
+    min_ms: float
+    max_ms: float
+    statements: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__})
+
+
+def load_results(path: Path) -> Dict[str, BenchmarkResult]:
+    """Load benchmark results keyed by name; empty if the file is missing."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {
+        name: BenchmarkResult.from_dict(result)
+        for name, result in data.get("benchmarks", {}).items()
+    }
+
+
+def save_results(path: Path, results: Dict[str, BenchmarkResult]) -> None:
+    """Write benchmark results as JSON, sorted by name."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"benchmarks": {name: asdict(results[name]) for name in sorted(results)}}
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def load_statement_baseline(path: Path) -> Dict[str, int]:
+    """Load baseline SQL statement counts keyed by name; empty if missing."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {
+        name: entry["statements"] for name, entry in data.get("benchmarks", {}).items()
+    }
+
+
+def save_statement_baseline(path: Path, statements: Dict[str, int]) -> None:
+    """Write baseline SQL statement counts as JSON, sorted by name."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "benchmarks": {
+            name: {"statements": statements[name]} for name in sorted(statements)
+        }
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+class BenchmarkRunner:
+    """
+    Measure async operations and check them against the baselines.
+
+    Args:
+        statements: Baseline SQL statement counts keyed by benchmark name
+        timings: Baseline results recorded on this machine, keyed by name
+        tolerance: Allowed relative slowdown of the median time
+        min_delta_ms: Slowdowns smaller than this are never regressions
+        enforce: Raise on regressions (disabled while recording a baseline)
+        results: Mapping receiving every measurement, shared across runners
+    """
+
+    def __init__(
+        self,
+        statements: Dict[str, int],
+        timings: Optional[Dict[str, BenchmarkResult]] = None,
+        tolerance: float = 1.0,
+        min_delta_ms: float = 25.0,
+        enforce: bool = True,
+        results: Optional[Dict[str, BenchmarkResult]] = None,
+    ):
+        self.statements = statements
+        self.timings = timings if timings is not None else {}
+        self.tolerance = tolerance
+        self.min_delta_ms = min_delta_ms
+        self.enforce = enforce
+        self.results = results if results is not None else {}
+
+    async def measure(
+        self,
+        name: str,
+        operation: Callable[[], Awaitable[Any]],
+        rounds: int = 5,
+        warmup: int = 1,
+    ) -> BenchmarkResult:
+        """
+        Time an operation and record its statement count.
+
+        Args:
+            name: Unique benchmark name, used as the baseline key
+            operation: Zero-argument callable returning a fresh awaitable
+            rounds: Timed rounds
+            warmup: Untimed rounds run first
+
+        Returns:
+            BenchmarkResult: The measurement
+
+        Raises:
+            AssertionError: If enforcing and the result regressed
+        """
+        for _ in range(warmup):
+            await operation()
+
+        timings: List[float] = []
+        statements = 0
+        for _ in range(rounds):
+            with request_metrics_scope() as metrics:
+                started = time.perf_counter()
+                await operation()
+                timings.append((time.perf_counter() - started) * 1000)
+            statements = max(statements, metrics.statement_count)
+
+        result = BenchmarkResult(
+            name=name,
+            rounds=rounds,
+            median_ms=round(statistics.median(timings), 3),
+            min_ms=round(min(timings), 3),
+            max_ms=round(max(timings), 3),
+            statements=statements,
+        )
+        self.results[name] = result
+
+        regressions = self.regressions(result)
+        if self.enforce and regressions:
+            raise AssertionError(f"{name} regressed: " + "; ".join(regressions))
+        return result
+
+    def regressions(self, result: BenchmarkResult) -> List[str]:
+        """
+        Compare a result against its baselines.
+
+        Args:
+            result: Result to check
+
+        Returns:
+            List[str]: Descriptions of each regression, empty if none
+        """
+        problems = []
+        baseline_statements = self.statements.get(result.name)
+        if baseline_statements is not None and result.statements > baseline_statements:
+            problems.append(
+                f"{result.statements} SQL statements (baseline {baseline_statements})"
+            )
+
+        baseline: Optional[BenchmarkResult] = self.timings.get(result.name)
+        if baseline is None:
+            return problems
+        allowed_ms = max(
+            baseline.median_ms * (1 + self.tolerance),
+            baseline.median_ms + self.min_delta_ms,
+        )
+        if result.median_ms > allowed_ms:
+            problems.append(
+                f"median {result.median_ms:.1f}ms (baseline "
+                f"{baseline.median_ms:.1f}ms, allowed {allowed_ms:.1f}ms)"
+            )
+        return problems
@@ -0,0 +1,14 @@
+"""
+Synthetic datasets for performance testing.
+
+This package contains deterministic data generators that populate the test
+database with realistic volumes of data for the benchmark suite.
+"""
+
+from tests.helpers.datasets.household import (
+    HouseholdDataset,
+    HouseholdSpec,
+    generate_household,
+)
+
+__all__ = ["HouseholdDataset", "HouseholdSpec", "generate_household"]
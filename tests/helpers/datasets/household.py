@@ -0,0 +1,469 @@
+"""
+Deterministic synthetic household dataset generator.
+
+Builds a realistic, reproducible household for performance work: accounts of
+every banking type, a category tree, recurring bills and income with their
+generated liabilities and income records, bill splits, payments, years of
+transaction history and daily balance history.
+
+All randomness comes from a seeded random.Random and every date is an offset
+from a single anchor day, so the same spec always produces the same shape of
+data relative to the anchor. Bulk tables are written with multi-row Core
+inserts so large datasets load in seconds.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.account_types.banking.bnpl import BNPLAccount
+from src.models.account_types.banking.checking import CheckingAccount
+from src.models.account_types.banking.credit import CreditAccount
+from src.models.account_types.banking.ewa import EWAAccount
+from src.models.account_types.banking.payment_app import PaymentAppAccount
+from src.models.account_types.banking.savings import SavingsAccount
+from src.models.balance_history import BalanceHistory
+from src.models.bill_splits import BillSplit
+from src.models.categories import Category
+from src.models.income import Income
+from src.models.income_categories import IncomeCategory
+from src.models.liabilities import Liability, LiabilityStatus
+from src.models.payments import Payment, PaymentSource
+from src.models.recurring_bills import RecurringBill
+from src.models.recurring_income import RecurringIncome
+from src.models.transaction_history import TransactionHistory, TransactionType
+from src.utils.datetime_utils import naive_utc_now
+
+ROOT_CATEGORIES = (
+    "Housing",
+    "Utilities",
+    "Transportation",
+    "Food",
+    "Insurance",
+    "Health",
+    "Entertainment",
+    "Debt",
+)
+SUBCATEGORY_NAMES = ("Primary", "Secondary", "Online", "Local", "Annual", "Shared")
+INCOME_CATEGORIES = ("Salary", "Freelance", "Interest", "Refunds")
+MERCHANTS = (
+    "Grocery Mart",
+    "Fuel Stop",
+    "Coffee House",
+    "Online Market",
+    "Pharmacy",
+    "Hardware Depot",
+    "Streaming Co",
+    "Transit Card",
+    "Restaurant",
+    "Bookshop",
+)
+
+ACCOUNT_TYPES = ("checking", "savings", "credit", "bnpl", "ewa", "payment_app")
+
+
+@dataclass(frozen=True)
+class HouseholdSpec:
+    """
+    Size and shape of a synthetic household.
+
+    Attributes:
+        accounts_per_type: Accounts created for each banking account type
+        history_days: Days of history before the anchor day
+        future_days: Days of scheduled bills and income after the anchor day
+        recurring_bills: Number of recurring bill definitions
+        recurring_income: Number of recurring income definitions
+        transactions_per_account_per_month: Transaction history density
+        split_ratio: Share of liabilities split across two accounts
+        category_depth: Levels below each root category
+        category_breadth: Children per category
+        one_off_bills: Non-recurring liabilities spread over the window
+        seed: Random seed
+    """
+
+    accounts_per_type: int = 2
+    history_days: int = 730
+    future_days: int = 90
+    recurring_bills: int = 12
+    recurring_income: int = 3
+    transactions_per_account_per_month: int = 30
+    split_ratio: float = 0.25
+    category_depth: int = 2
+    category_breadth: int = 3
+    one_off_bills: int = 40
+    seed: int = 20240101
+
+
+@dataclass
+class HouseholdDataset:
+    """Identifiers and row counts of a generated household."""
+
+    spec: HouseholdSpec
+    anchor: datetime
+    account_ids: Dict[str, List[int]] = field(default_factory=dict)
+    category_ids: Dict[str, int] = field(default_factory=dict)
+    income_category_ids: Dict[str, int] = field(default_factory=dict)
+    recurring_bill_ids: List[int] = field(default_factory=list)
+    recurring_income_ids: List[int] = field(default_factory=list)
+    liability_ids: List[int] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def all_account_ids(self) -> List[int]:
+        """Every account ID, in account type order."""
+        return [
+            account_id
+            for account_type in ACCOUNT_TYPES
+            for account_id in self.account_ids.get(account_type, [])
+        ]
+
+    @property
+    def funding_account_ids(self) -> List[int]:
+        """Checking and savings account IDs."""
+        return self.account_ids["checking"] + self.account_ids["savings"]
+
+
+def _money(rng: random.Random, low: float, high: float) -> Decimal:
+    return Decimal(str(round(rng.uniform(low, high), 2)))
+
+
+def _month_days(anchor: date, start: int, end: int, day_of_month: int) -> List[date]:
+    """Every date with the given day of month between two anchor offsets."""
+    first = anchor + timedelta(days=start)
+    last = anchor + timedelta(days=end)
+    year, month = first.year, first.month
+    dates = []
+    while (year, month) <= (last.year, last.month):
+        candidate = date(year, month, day_of_month)
+        if first <= candidate <= last:
+            dates.append(candidate)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return dates
+
+
+async def _insert(session: AsyncSession, model, rows: List[dict]) -> None:
+    if rows:
+        await session.execute(insert(model), rows)
+
+
+async def generate_household(
+    session: AsyncSession,
+    spec: HouseholdSpec = HouseholdSpec(),
+    anchor: Optional[datetime] = None,
+) -> HouseholdDataset:
+    """
+    Populate the database with a synthetic household.
+
+    Args:
+        session: Session to write through; the caller owns the transaction
+        spec: Dataset size and shape
+        anchor: Day the history ends and the schedule starts (default today)
+
+    Returns:
+        HouseholdDataset: Generated identifiers and row counts
+    """
+    rng = random.Random(spec.seed)
+    anchor = (anchor or naive_utc_now()).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    anchor_day = anchor.date()
+    dataset = HouseholdDataset(spec=spec, anchor=anchor)
+
+    # Category tree
+    level = []
+    for name in ROOT_CATEGORIES:
+        category = Category(name=name, description=f"{name} expenses")
+        session.add(category)
+        level.append(category)
+    await session.flush()
+    for category in level:
+        dataset.category_ids[category.name] = category.id
+    leaves = list(level)
+    for _ in range(spec.category_depth):
+        next_level = []
+        for parent in level:
+            for suffix in SUBCATEGORY_NAMES[: spec.category_breadth]:
+                child = Category(name=f"{parent.name} {suffix}", parent_id=parent.id)
+                session.add(child)
+                next_level.append(child)
+        await session.flush()
+        for category in next_level:
+            dataset.category_ids[category.name] = category.id
+        if next_level:
+            leaves = next_level
+        level = next_level
+    leaf_ids = [category.id for category in leaves]
+
+    for name in INCOME_CATEGORIES:
+        income_category = IncomeCategory(name=name)
+        session.add(income_category)
+        await session.flush()
+        dataset.income_category_ids[name] = income_category.id
+
+    # Accounts of every banking type
+    builders = {
+        "checking": lambda n: CheckingAccount(
+            name=f"Checking {n}",
+            current_balance=_money(rng, 2000, 8000),
+            available_balance=_money(rng, 2000, 8000),
+            has_overdraft_protection=n % 2 == 0,
+            overdraft_limit=Decimal("500.00") if n % 2 == 0 else None,
+        ),
+        "savings": lambda n: SavingsAccount(
+            name=f"Savings {n}",
+            current_balance=_money(rng, 5000, 20000),
+            available_balance=_money(rng, 5000, 20000),
+            interest_rate=Decimal("0.0350"),
+        ),
+        "credit": lambda n: CreditAccount(
+            name=f"Credit {n}",
+            current_balance=-_money(rng, 200, 3000),
+            available_balance=-_money(rng, 200, 3000),
+            credit_limit=Decimal("5000.00") * n,
+            available_credit=_money(rng, 1000, 4000),
+            apr=Decimal("0.2199"),
+            statement_due_date=anchor + timedelta(days=10 + n),
+        ),
+        "bnpl": lambda n: BNPLAccount(
+            name=f"BNPL {n}",
+            current_balance=Decimal("400.00"),
+            available_balance=Decimal("400.00"),
+            original_amount=Decimal("800.00"),
+            installment_count=4,
+            installments_paid=2,
+            installment_amount=Decimal("200.00"),
+            payment_frequency="biweekly",
+            next_payment_date=anchor + timedelta(days=7 * n),
+            bnpl_provider="Affirm",
+        ),
+        "ewa": lambda n: EWAAccount(
+            name=f"EWA {n}",
+            current_balance=Decimal("150.00"),
+            available_balance=Decimal("150.00"),
+            provider="DailyPay",
+            max_advance_percentage=Decimal("0.5000"),
+            next_payday=anchor + timedelta(days=5 + n),
+        ),
+        "payment_app": lambda n: PaymentAppAccount(
+            name=f"Payment App {n}",
+            current_balance=_money(rng, 50, 500),
+            available_balance=_money(rng, 50, 500),
+            platform="Venmo",
+            has_debit_card=True,
+        ),
+    }
+    for account_type in ACCOUNT_TYPES:
+        accounts = [
+            builders[account_type](n) for n in range(1, spec.accounts_per_type + 1)
+        ]
+        session.add_all(accounts)
+        await session.flush()
+        dataset.account_ids[account_type] = [account.id for account in accounts]
+
+    bill_accounts = dataset.account_ids["checking"] + dataset.account_ids["credit"]
+    funding_accounts = dataset.funding_account_ids
+
+    # Recurring bills and the liabilities generated from them
+    liability_rows = []
+    for index in range(spec.recurring_bills):
+        recurring_bill = RecurringBill(
+            bill_name=f"Recurring Bill {index + 1}",
+            amount=_money(rng, 25, 1500),
+            day_of_month=rng.randint(1, 28),
+            account_id=rng.choice(bill_accounts),
+            category_id=rng.choice(leaf_ids),
+            auto_pay=rng.random() < 0.5,
+        )
+        session.add(recurring_bill)
+        await session.flush()
+        dataset.recurring_bill_ids.append(recurring_bill.id)
+
+        for due in _month_days(
+            anchor_day,
+            -spec.history_days,
+            spec.future_days,
+            recurring_bill.day_of_month,
+        ):
+            paid = due < anchor_day
+            liability_rows.append(
+                {
+                    "name": recurring_bill.bill_name,
+                    "amount": recurring_bill.amount,
+                    "due_date": datetime.combine(due, datetime.min.time()),
+                    "category_id": recurring_bill.category_id,
+                    "primary_account_id": recurring_bill.account_id,
+                    "recurring": True,
+                    "recurring_bill_id": recurring_bill.id,
+                    "auto_pay": recurring_bill.auto_pay,
+                    "paid": paid,
+                    "status": LiabilityStatus.PAID if paid else LiabilityStatus.PENDING,
+                }
+            )
+
+    for index in range(spec.one_off_bills):
+        offset = rng.randint(-spec.history_days, spec.future_days)
+        due = anchor + timedelta(days=offset)
+        liability_rows.append(
+            {
+                "name": f"One-off Bill {index + 1}",
+                "amount": _money(rng, 10, 600),
+                "due_date": due,
+                "category_id": rng.choice(leaf_ids),
+                "primary_account_id": rng.choice(bill_accounts),
+                "paid": offset < 0,
+                "status": (
+                    LiabilityStatus.PAID if offset < 0 else LiabilityStatus.PENDING
+                ),
+            }
+        )
+    await _insert(session, Liability, liability_rows)
+
+    liabilities = (
+        await session.execute(
+            select(
+                Liability.id,
+                Liability.amount,
+                Liability.due_date,
+                Liability.primary_account_id,
+                Liability.paid,
+                Liability.category_id,
+            ).order_by(Liability.id)
+        )
+    ).all()
+    dataset.liability_ids = [row.id for row in liabilities]
+
+    # Splits for a share of liabilities, payments for everything already paid
+    split_rows = []
+    payment_rows = []
+    split_amounts: Dict[int, List[tuple]] = {}
+    category_names = {value: key for key, value in dataset.category_ids.items()}
+    for row in liabilities:
+        allocations = [(row.primary_account_id, row.amount)]
+        if rng.random() < spec.split_ratio:
+            other = rng.choice(
+                [a for a in funding_accounts if a != row.primary_account_id]
+            )
+            share = (row.amount * Decimal("0.4")).quantize(Decimal("0.01"))
+            allocations = [
+                (row.primary_account_id, row.amount - share),
+                (other, share),
+            ]
+            split_rows.extend(
+                {"liability_id": row.id, "account_id": account_id, "amount": amount}
+                for account_id, amount in allocations
+            )
+        if row.paid:
+            split_amounts[row.id] = allocations
+            payment_rows.append(
+                {
+                    "liability_id": row.id,
+                    "amount": row.amount,
+                    "payment_date": row.due_date - timedelta(days=rng.randint(0, 3)),
+                    "category": category_names[row.category_id],
+                }
+            )
+    await _insert(session, BillSplit, split_rows)
+    await _insert(session, Payment, payment_rows)
+
+    payments = (await session.execute(select(Payment.id, Payment.liability_id))).all()
+    source_rows = [
+        {"payment_id": payment.id, "account_id": account_id, "amount": amount}
+        for payment in payments
+        for account_id, amount in split_amounts.get(payment.liability_id, [])
+    ]
+    await _insert(session, PaymentSource, source_rows)
+
+    # Recurring income and income records (twice monthly)
+    income_rows = []
+    income_sources = list(INCOME_CATEGORIES)
+    for index in range(spec.recurring_income):
+        source = income_sources[index % len(income_sources)]
+        recurring_income = RecurringIncome(
+            source=f"{source} {index + 1}",
+            amount=_money(rng, 800, 3500),
+            day_of_month=1 + (index * 7) % 14,
+            account_id=funding_accounts[index % len(funding_accounts)],
+            category_id=dataset.income_category_ids[source],
+            auto_deposit=True,
+        )
+        session.add(recurring_income)
+        await session.flush()
+        dataset.recurring_income_ids.append(recurring_income.id)
+
+        for day in (recurring_income.day_of_month, recurring_income.day_of_month + 14):
+            for received in _month_days(
+                anchor_day, -spec.history_days, spec.future_days, day
+            ):
+                deposited = received < anchor_day
+                amount = recurring_income.amount + _money(rng, -50, 50)
+                income_rows.append(
+                    {
+                        "date": datetime.combine(received, datetime.min.time()),
+                        "source": recurring_income.source,
+                        "amount": amount,
+                        "deposited": deposited,
+                        "undeposited_amount": Decimal("0") if deposited else amount,
+                        "account_id": recurring_income.account_id,
+                        "category_id": recurring_income.category_id,
+                        "recurring": True,
+                        "recurring_income_id": recurring_income.id,
+                    }
+                )
+    await _insert(session, Income, income_rows)
+
+    # Transaction and daily balance history for every account
+    transaction_rows = []
+    balance_rows = []
+    months = max(spec.history_days // 30, 1)
+    per_account = spec.transactions_per_account_per_month * months
+    for account_id in dataset.all_account_ids:
+        balance = _money(rng, 500, 5000)
+        for _ in range(per_account):
+            is_credit = rng.random() < 0.2
+            transaction_rows.append(
+                {
+                    "account_id": account_id,
+                    "amount": _money(rng, 5, 250),
+                    "transaction_type": (
+                        TransactionType.CREDIT if is_credit else TransactionType.DEBIT
+                    ),
+                    "description": rng.choice(MERCHANTS),
+                    "transaction_date": anchor
+                    - timedelta(
+                        days=rng.randint(1, spec.history_days),
+                        minutes=rng.randint(0, 1439),
+                    ),
+                }
+            )
+        for days_ago in range(spec.history_days, 0, -1):
+            balance += _money(rng, -120, 125)
+            balance_rows.append(
+                {
+                    "account_id": account_id,
+                    "balance": balance,
+                    "is_reconciled": days_ago % 30 == 0,
+                    "timestamp": anchor
+                    - timedelta(days=days_ago)
+                    + timedelta(hours=rng.randint(8, 20)),
+                }
+            )
+    await _insert(session, TransactionHistory, transaction_rows)
+    await _insert(session, BalanceHistory, balance_rows)
+    await session.flush()
+
+    dataset.counts = {
+        "accounts": len(dataset.all_account_ids),
+        "categories": len(dataset.category_ids),
+        "liabilities": len(liability_rows),
+        "bill_splits": len(split_rows),
+        "payments": len(payment_rows),
+        "income": len(income_rows),
+        "transactions": len(transaction_rows),
+        "balance_history": len(balance_rows),
+    }
+    return dataset
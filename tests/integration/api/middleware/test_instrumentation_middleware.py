@@ -0,0 +1,111 @@
+"""
+Integration tests for the request instrumentation middleware.
+
+These tests run a small application against the test database to verify
+that SQL statements and proxied repository calls are attributed to the
+request that made them, reported in Server-Timing headers, checked against
+the query budget and exposed by the /metrics endpoint.
+"""
+
+import logging
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.middleware.instrumentation import RequestInstrumentationMiddleware
+from src.config.providers.feature_flags import InMemoryConfigProvider
+from src.repositories.categories import CategoryRepository
+from src.repositories.proxies.feature_flag_proxy import FeatureFlagRepositoryProxy
+from src.utils.instrumentation import MetricsRegistry, instrument_engine
+
+
+def create_app(db_session: AsyncSession, registry: MetricsRegistry, **options):
+    """Build an app whose route runs proxied repository calls."""
+    app = FastAPI()
+    app.add_middleware(RequestInstrumentationMiddleware, registry=registry, **options)
+
+    @app.get("/categories/{category_id}")
+    async def get_category(category_id: int):
+        repository = FeatureFlagRepositoryProxy(
+            repository=CategoryRepository(db_session),
+            feature_flag_service=None,
+            config_provider=InMemoryConfigProvider({}),
+        )
+        await repository.get(category_id)
+        categories = await repository.get_multi()
+        return {"count": len(categories)}
+
+    return app
+
+
+@pytest_asyncio.fixture
+async def instrumented_session(db_session: AsyncSession) -> AsyncSession:
+    """Test session whose engine reports executed statements."""
+    instrument_engine(db_session.bind.engine)
+    # Open the test savepoint now so it is not counted against a request
+    await db_session.connection()
+    return db_session
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_statements_and_methods(instrumented_session):
+    """Test that the Server-Timing header covers statements and proxied calls."""
+    registry = MetricsRegistry()
+    app = create_app(instrumented_session, registry, server_timing=True)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/categories/1")
+
+    assert response.status_code == 200
+    header = response.headers["Server-Timing"]
+    assert 'desc="2 statements"' in header
+    assert "repository.CategoryRepository.get;dur=" in header
+    assert "repository.CategoryRepository.get_multi;dur=" in header
+
+    output = registry.render()
+    labels = 'method="GET",route="/categories/{category_id}"'
+    assert f'debtonator_http_requests_total{{{labels},status="200"}} 1' in output
+    assert f"debtonator_http_request_db_statements_sum{{{labels}}} 2" in output
+
+
+@pytest.mark.asyncio
+async def test_query_budget_logs_excess_statements(instrumented_session, caplog):
+    """Test that requests above the query budget are logged and counted."""
+    registry = MetricsRegistry()
+    app = create_app(instrumented_session, registry, query_budget=1)
+
+    with caplog.at_level(logging.WARNING, "src.api.middleware.instrumentation"):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/categories/1")
+
+    assert "Server-Timing" not in response.headers
+    assert any(
+        "executed 2 SQL statements (budget 1)" in record.getMessage()
+        for record in caplog.records
+    )
+    assert (
+        'debtonator_http_request_query_budget_exceeded_total{method="GET",'
+        'route="/categories/{category_id}"} 1' in registry.render()
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    """Test that the application exposes metrics in Prometheus text format."""
+    await client.get("/api/v1/categories/")
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'debtonator_http_requests_total{method="GET",route="/api/v1/categories/"'
+        in response.text
+    )
@@ -0,0 +1,71 @@
+"""
+Integration tests for the request id middleware.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.api.middleware.request_id import REQUEST_ID_HEADER, RequestIdMiddleware
+from src.utils.structured_logging import RequestIdFilter, current_request_id
+
+
+def create_app() -> FastAPI:
+    """Build an app whose route logs and returns the current request id."""
+    app = FastAPI()
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.get("/whoami")
+    async def whoami():
+        logging.getLogger("src.test.request_id").info("handling request")
+        return {"request_id": current_request_id()}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_generates_request_id_and_correlates_logs(caplog):
+    """Test that a generated id is current, logged and echoed."""
+    id_filter = RequestIdFilter()
+    caplog.handler.addFilter(id_filter)
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=create_app()), base_url="http://test"
+        ) as client:
+            with caplog.at_level(logging.INFO, logger="src.test.request_id"):
+                response = await client.get("/whoami")
+    finally:
+        caplog.handler.removeFilter(id_filter)
+
+    request_id = response.headers[REQUEST_ID_HEADER]
+    assert request_id
+    assert response.json() == {"request_id": request_id}
+    records = [r for r in caplog.records if r.name == "src.test.request_id"]
+    assert [r.request_id for r in records] == [request_id]
+    assert current_request_id() is None
+
+
+@pytest.mark.asyncio
+async def test_reuses_supplied_request_id():
+    """Test that a caller-supplied id is propagated."""
+    async with AsyncClient(
+        transport=ASGITransport(app=create_app()), base_url="http://test"
+    ) as client:
+        response = await client.get("/whoami", headers={REQUEST_ID_HEADER: "abc-123"})
+
+    assert response.headers[REQUEST_ID_HEADER] == "abc-123"
+    assert response.json() == {"request_id": "abc-123"}
+
+
+@pytest.mark.asyncio
+async def test_replaces_oversized_request_id():
+    """Test that unreasonably long ids are not trusted."""
+    async with AsyncClient(
+        transport=ASGITransport(app=create_app()), base_url="http://test"
+    ) as client:
+        response = await client.get("/whoami", headers={REQUEST_ID_HEADER: "x" * 500})
+
+    assert response.headers[REQUEST_ID_HEADER] != "x" * 500
+    assert len(response.headers[REQUEST_ID_HEADER]) == 32
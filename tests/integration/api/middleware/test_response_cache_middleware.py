@@ -0,0 +1,119 @@
+"""
+Integration tests for the response cache middleware.
+
+These tests go through the application's middleware stack against the test
+database to verify that cached responses carry ETags, revalidate to 304 Not
+Modified and are recomputed once a write is committed.
+"""
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.middleware.response_cache import ResponseCacheMiddleware
+from src.models.categories import Category
+from src.utils.config import settings
+from src.utils.response_cache import ResponseCache, response_cache
+
+CATEGORIES_URL = "/api/v1/categories/"
+
+
+@pytest.mark.asyncio
+async def test_repeated_get_is_served_from_cache(client: AsyncClient):
+    """Test that a second identical request is a cache hit with the same ETag."""
+    first = await client.get(CATEGORIES_URL)
+    second = await client.get(CATEGORIES_URL)
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert first.headers["ETag"] == second.headers["ETag"]
+    assert first.json() == second.json()
+    assert second.headers["content-type"] == "application/json"
+    assert len(response_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_not_modified(client: AsyncClient):
+    """Test that If-None-Match with the current ETag gets an empty 304."""
+    first = await client.get(CATEGORIES_URL)
+
+    response = await client.get(
+        CATEGORIES_URL, headers={"If-None-Match": first.headers["ETag"]}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == first.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_carry_cors_headers(client: AsyncClient):
+    """Test that cache hits and 304s still pass through CORS."""
+    origin = settings.cors_origins[0]
+    headers = {"Origin": origin}
+
+    first = await client.get(CATEGORIES_URL, headers=headers)
+    hit = await client.get(CATEGORIES_URL, headers=headers)
+    not_modified = await client.get(
+        CATEGORIES_URL, headers={**headers, "If-None-Match": first.headers["ETag"]}
+    )
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert hit.headers["X-Cache"] == "HIT"
+    assert not_modified.status_code == 304
+    for response in (first, hit, not_modified):
+        assert response.headers["Access-Control-Allow-Origin"] == origin
+
+
+@pytest.mark.asyncio
+async def test_query_parameters_are_part_of_the_key(client: AsyncClient):
+    """Test that different parameters are cached separately."""
+    await client.get(CATEGORIES_URL, params={"limit": 10})
+    response = await client.get(CATEGORIES_URL, params={"limit": 20})
+
+    assert response.headers["X-Cache"] == "MISS"
+    assert len(response_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_committed_write_invalidates_cached_response(db_session: AsyncSession):
+    """Test that committing a write makes cached responses stale."""
+    cache = ResponseCache()
+    app = FastAPI()
+    app.add_middleware(ResponseCacheMiddleware, routes={"/count": 60}, cache=cache)
+
+    @app.get("/count")
+    async def count_categories():
+        result = await db_session.execute(select(func.count(Category.id)))
+        return {"count": result.scalar_one()}
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        first = await client.get("/count")
+
+        db_session.add(Category(name="Utilities"))
+        await db_session.commit()
+
+        response = await client.get(
+            "/count", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+    assert first.json() == {"count": 0}
+    assert response.status_code == 200
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert response.json() == {"count": 1}
+
+
+@pytest.mark.asyncio
+async def test_uncached_routes_have_no_etag(client: AsyncClient):
+    """Test that routes without a TTL bypass the cache."""
+    response = await client.get("/api/v1/accounts/summary")
+
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert len(response_cache) == 0
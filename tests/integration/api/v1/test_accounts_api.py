@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+from httpx import AsyncClient
+
+from src.models.accounts import Account
+
+
+async def test_get_accounts(
+    client: AsyncClient, test_checking_account: Account, test_credit_account: Account
+):
+    """Test listing accounts reads only base account columns"""
+    response = await client.get("/api/v1/accounts/")
+
+    assert response.status_code == 200
+    data = {account["id"]: account for account in response.json()}
+    assert data[test_checking_account.id]["account_type"] == "checking"
+    assert data[test_credit_account.id]["account_type"] == "credit"
+    assert "credit_limit" not in data[test_credit_account.id]
+
+
+async def test_get_account_summaries(
+    client: AsyncClient,
+    db_session,
+    test_checking_account: Account,
+    test_credit_account: Account,
+):
+    """Test retrieving the lightweight account summary projection via API"""
+    test_checking_account.is_closed = True
+    await db_session.flush()
+
+    response = await client.get("/api/v1/accounts/summary")
+
+    assert response.status_code == 200
+    data = {summary["id"]: summary for summary in response.json()}
+    credit = data[test_credit_account.id]
+    assert credit["name"] == test_credit_account.name
+    assert Decimal(credit["credit_limit"]) == Decimal("2000.00")
+    assert data[test_checking_account.id]["credit_limit"] is None
+
+    response = await client.get(
+        "/api/v1/accounts/summary", params={"include_closed": False}
+    )
+
+    assert response.status_code == 200
+    assert [summary["id"] for summary in response.json()] == [test_credit_account.id]
@@ -0,0 +1,52 @@
+from datetime import datetime
+from decimal import Decimal
+
+from httpx import AsyncClient
+
+from src.models.accounts import Account
+from src.models.balance_history import BalanceHistory
+
+
+async def test_get_balance_history_series(
+    client: AsyncClient, db_session, test_checking_account: Account
+):
+    """Test retrieving a daily balance history series via API"""
+    for timestamp, balance in (
+        (datetime(2025, 3, 3, 9), Decimal("100.00")),
+        (datetime(2025, 3, 3, 15), Decimal("125.50")),
+    ):
+        db_session.add(
+            BalanceHistory(
+                account_id=test_checking_account.id,
+                balance=balance,
+                timestamp=timestamp,
+            )
+        )
+    await db_session.flush()
+
+    response = await client.get(
+        f"/api/v1/accounts/{test_checking_account.id}/balance-history",
+        params={"start_date": "2025-03-01", "end_date": "2025-03-31"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["resolution"] == "daily"
+    assert len(data["buckets"]) == 1
+    bucket = data["buckets"][0]
+    assert bucket["period_start"] == "2025-03-03"
+    assert Decimal(bucket["close_balance"]) == Decimal("125.50")
+    assert Decimal(bucket["average_balance"]) == Decimal("112.75")
+    assert bucket["record_count"] == 2
+
+
+async def test_get_balance_history_series_invalid_range(
+    client: AsyncClient, test_checking_account: Account
+):
+    """Test that an inverted date range is rejected"""
+    response = await client.get(
+        f"/api/v1/accounts/{test_checking_account.id}/balance-history",
+        params={"start_date": "2025-03-31", "end_date": "2025-03-01"},
+    )
+
+    assert response.status_code == 400
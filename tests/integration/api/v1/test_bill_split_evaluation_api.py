@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from httpx import AsyncClient
+
+from src.models.accounts import Account
+from src.models.liabilities import Liability
+
+
+async def test_evaluate_split_candidates(
+    client: AsyncClient, test_liability: Liability, test_checking_account: Account
+):
+    """Test ranking candidate split allocations via API"""
+    account_id = str(test_checking_account.id)
+    response = await client.post(
+        "/api/v1/bill-splits/evaluate",
+        json={
+            "liability_id": test_liability.id,
+            "candidates": [
+                {"allocations": {account_id: "40.00"}},
+                {"allocations": {account_id: "100.00"}},
+            ],
+            "top_k": 1,
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["evaluated_count"] == 2
+    assert len(data["results"]) == 1
+    assert data["results"][0]["candidate_index"] == 1
+    assert data["results"][0]["is_feasible"] is True
+    assert Decimal(data["results"][0]["allocations"][account_id]) == Decimal("100.00")
+
+
+async def test_evaluate_split_candidates_unknown_liability(
+    client: AsyncClient, test_checking_account: Account
+):
+    """Test that evaluating a missing liability returns 404"""
+    response = await client.post(
+        "/api/v1/bill-splits/evaluate",
+        json={
+            "liability_id": 99999,
+            "candidates": [{"allocations": {str(test_checking_account.id): "1.00"}}],
+        },
+    )
+
+    assert response.status_code == 404
+
+
+async def test_optimize_splits(
+    client: AsyncClient, test_liability: Liability, test_checking_account: Account
+):
+    """Test computing the optimal split for a bill via API"""
+    response = await client.get(f"/api/v1/bill-splits/optimize/{test_liability.id}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["is_feasible"] is True
+    allocations = data["liabilities"][0]["allocations"]
+    assert Decimal(allocations[str(test_checking_account.id)]) == Decimal("100.00")
+
+
+async def test_optimize_monthly_splits_empty_month(client: AsyncClient):
+    """Test that a month without unpaid bills returns an empty plan"""
+    response = await client.get("/api/v1/bill-splits/optimize/monthly/2001/1")
+
+    assert response.status_code == 200
+    assert response.json()["liabilities"] == []
@@ -0,0 +1,24 @@
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.income import Income
+from src.models.income_categories import IncomeCategory
+
+
+async def test_list_income(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_income: Income,
+    test_income_category: IncomeCategory,
+):
+    """Test listing income loads the category for serialization"""
+    test_income.category_id = test_income_category.id
+    await db_session.flush()
+    db_session.expunge_all()
+
+    response = await client.get("/api/v1/income/")
+
+    assert response.status_code == 200
+    data = {income["id"]: income for income in response.json()}
+    assert data[test_income.id]["category"]["id"] == test_income_category.id
+    assert data[test_income.id]["category"]["name"] == test_income_category.name
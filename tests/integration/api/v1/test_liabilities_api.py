@@ -159,3 +159,13 @@ async def test_invalid_auto_pay_settings(client: AsyncClient, test_liability):
     assert "settings" in error_detail["detail"][0]["loc"]
     assert "preferred_pay_date" in error_detail["detail"][0]["loc"]
     assert "less than or equal to" in error_detail["detail"][0]["msg"]
+
+
+async def test_list_unpaid_liabilities(client: AsyncClient, test_liability):
+    """Test listing unpaid liabilities serializes stored datetimes"""
+    response = await client.get("/api/v1/liabilities/unpaid/")
+
+    assert response.status_code == 200
+    data = {liability["id"]: liability for liability in response.json()}
+    assert test_liability.id in data
+    assert data[test_liability.id]["due_date"].endswith(("Z", "+00:00"))
@@ -0,0 +1,113 @@
+"""
+Integration tests for the Alembic migration chain.
+
+The migrations are the only supported way to create or upgrade a production
+schema, so they must produce exactly what the models declare. These tests run
+the real alembic CLI against a scratch SQLite database.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+
+from src.database.base import Base
+
+pytestmark = pytest.mark.integration
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def run_alembic(database_path: Path, *args: str) -> None:
+    """Run an alembic command against a SQLite database file."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{database_path}",
+    }
+    subprocess.run(
+        [sys.executable, "-m", "alembic", *args],
+        cwd=PROJECT_ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def migrated_database(tmp_path: Path) -> Path:
+    """A scratch database upgraded to the latest revision."""
+    database_path = tmp_path / "migrations.db"
+    run_alembic(database_path, "upgrade", "head")
+    return database_path
+
+
+def include_application_tables(obj, name, type_, reflected, compare_to) -> bool:
+    """Skip tables that test helpers register on the shared metadata."""
+    return not (type_ == "table" and name.startswith("test_"))
+
+
+def test_upgrade_matches_models(migrated_database: Path):
+    """Upgrading to head yields a schema with no drift from the models."""
+    engine = create_engine(f"sqlite:///{migrated_database}")
+    try:
+        with engine.connect() as connection:
+            context = MigrationContext.configure(
+                connection, opts={"include_object": include_application_tables}
+            )
+            diff = compare_metadata(context, Base.metadata)
+    finally:
+        engine.dispose()
+
+    assert diff == []
+
+
+def test_hot_path_indexes_exist(migrated_database: Path):
+    """The composite indexes backing hot query paths are created."""
+    engine = create_engine(f"sqlite:///{migrated_database}")
+    try:
+        inspector = inspect(engine)
+        indexes = {
+            table: {index["name"] for index in inspector.get_indexes(table)}
+            for table in (
+                "balance_history",
+                "liabilities",
+                "payment_sources",
+                "payments",
+                "statement_history",
+                "transaction_history",
+            )
+        }
+    finally:
+        engine.dispose()
+
+    assert "idx_balance_history_account_timestamp" in indexes["balance_history"]
+    assert {
+        "idx_liabilities_due_date",
+        "idx_liabilities_primary_account_due",
+        "idx_liabilities_unpaid_due_date",
+    } <= indexes["liabilities"]
+    assert {
+        "idx_payment_sources_account_id",
+        "idx_payment_sources_payment_id",
+    } <= indexes["payment_sources"]
+    assert "idx_payments_payment_date" in indexes["payments"]
+    assert "idx_statement_history_account_date" in indexes["statement_history"]
+    assert "idx_transaction_history_account_date" in indexes["transaction_history"]
+
+
+def test_downgrade_to_base(migrated_database: Path):
+    """Every migration can be reverted."""
+    run_alembic(migrated_database, "downgrade", "base")
+
+    engine = create_engine(f"sqlite:///{migrated_database}")
+    try:
+        tables = set(inspect(engine).get_table_names())
+    finally:
+        engine.dispose()
+
+    assert tables <= {"alembic_version"}
@@ -10,7 +10,9 @@ from decimal import Decimal
 from typing import List
 
 import pytest
+from sqlalchemy import inspect
 
+from src.models.account_types.banking.credit import CreditAccount
 from src.models.accounts import Account
 from src.models.statement_history import StatementHistory
 from src.repositories.accounts import AccountRepository
@@ -155,6 +157,80 @@ async def test_get_by_type(
         assert account.account_type == "credit"
 
 
+async def test_get_active_accounts_loads_subtype_columns(
+    account_repository: AccountRepository,
+    test_multiple_accounts: List[Account],
+    db_session,
+):
+    """Test that active accounts come back with type-specific fields loaded."""
+    # 1. ARRANGE: Start from an empty identity map
+    db_session.expunge_all()
+
+    # 2. ACT: Get all active accounts
+    results = await account_repository.get_active_accounts()
+
+    # 3. ASSERT: Subtype columns are readable without lazy loading
+    credit = next(account for account in results if account.account_type == "credit")
+    assert credit.credit_limit > 0
+    for account in results:
+        assert inspect(account).unloaded.isdisjoint(
+            inspect(account).mapper.column_attrs.keys()
+        )
+
+
+async def test_get_typed(
+    account_repository: AccountRepository,
+    test_checking_account: Account,
+    test_credit_account: Account,
+    db_session,
+):
+    """Test getting an account whose type is known joins only its subtype."""
+    # 1. ARRANGE: Start from an empty identity map
+    credit_id = test_credit_account.id
+    checking_id = test_checking_account.id
+    db_session.expunge_all()
+
+    # 2. ACT: Get the credit account as a credit account and as checking
+    credit = await account_repository.get_typed(credit_id, "credit")
+    mismatched = await account_repository.get_typed(checking_id, "credit")
+
+    # 3. ASSERT: Verify the operation results
+    assert isinstance(credit, CreditAccount)
+    assert credit.credit_limit == Decimal("2000.00")
+    assert mismatched is None
+    # Served from the session once loaded
+    assert await account_repository.get_typed(credit_id, "credit") is credit
+
+
+async def test_get_account_summaries(
+    account_repository: AccountRepository,
+    test_checking_account: Account,
+    test_credit_account: Account,
+):
+    """Test the lightweight account summary projection."""
+    # 1. ARRANGE: Close the checking account
+    test_checking_account.is_closed = True
+    await account_repository.session.flush()
+
+    # 2. ACT: Get summaries with and without closed accounts
+    summaries = await account_repository.get_account_summaries()
+    open_summaries = await account_repository.get_account_summaries(
+        include_closed=False
+    )
+
+    # 3. ASSERT: Verify the operation results
+    by_id = {summary["id"]: summary for summary in summaries}
+    credit = by_id[test_credit_account.id]
+    assert credit["account_type"] == "credit"
+    assert credit["credit_limit"] == Decimal("2000.00")
+    assert credit["available_balance"] == Decimal("-500.00")
+    checking = by_id[test_checking_account.id]
+    assert checking["credit_limit"] is None
+    assert checking["available_credit"] is None
+    assert checking["is_closed"] is True
+    assert [summary["id"] for summary in open_summaries] == [test_credit_account.id]
+
+
 async def test_update_balance(
     account_repository: AccountRepository, test_checking_account: Account
 ):
@@ -13,6 +13,7 @@ from typing import List
 
 import pytest
 
+from src.common.cashflow_types import TimeResolution
 from src.models.accounts import Account
 from src.models.balance_history import BalanceHistory
 from src.repositories.balance_history import BalanceHistoryRepository
@@ -461,6 +462,94 @@ async def test_get_missing_days(
     assert day_minus_10 not in missing_days
 
 
+async def test_get_missing_days_for_accounts(
+    balance_history_repository: BalanceHistoryRepository,
+    test_balance_history_with_gaps: List[BalanceHistory],
+    test_checking_account: Account,
+    test_savings_account: Account,
+):
+    """
+    Test finding missing days for several accounts in one call.
+
+    Args:
+        balance_history_repository: Repository fixture for balance history
+        test_balance_history_with_gaps: Test balance history records with gaps fixture
+        test_checking_account: Test checking account fixture
+        test_savings_account: Test savings account fixture
+    """
+    # 1. ARRANGE: Setup is done with fixture
+    today = utc_now().date()
+    start = today - timedelta(days=10)
+
+    # 2. ACT: Get missing days for both accounts
+    missing = await balance_history_repository.get_missing_days_for_accounts(
+        [test_checking_account.id, test_savings_account.id], start, today
+    )
+
+    # 3. ASSERT: Checking has gaps between entries, savings has no entries at all
+    assert len(missing[test_checking_account.id]) == 8
+    assert today not in missing[test_checking_account.id]
+    assert missing[test_savings_account.id][0] == start
+    assert len(missing[test_savings_account.id]) == 11
+
+
+async def test_get_balance_ohlc(
+    balance_history_repository: BalanceHistoryRepository,
+    test_checking_account: Account,
+):
+    """
+    Test downsampling balance history into daily and monthly OHLC buckets.
+
+    Args:
+        balance_history_repository: Repository fixture for balance history
+        test_checking_account: Test checking account fixture
+    """
+    # 1. ARRANGE: Record three balances on one day and one on the next day
+    day_one = utc_now().replace(
+        day=1, hour=8, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+    entries = [
+        (day_one, Decimal("100.00")),
+        (day_one + timedelta(hours=2), Decimal("50.00")),
+        (day_one + timedelta(hours=4), Decimal("175.00")),
+        (day_one + timedelta(days=1), Decimal("160.00")),
+    ]
+    for timestamp, balance in entries:
+        schema = create_balance_history_schema(
+            account_id=test_checking_account.id, balance=balance
+        )
+        data = schema.model_dump()
+        data["timestamp"] = timestamp
+        await balance_history_repository.create(data)
+
+    # 2. ACT: Get daily and monthly series
+    start = day_one.replace(hour=0)
+    end = start + timedelta(days=2)
+    daily = await balance_history_repository.get_balance_ohlc(
+        test_checking_account.id, start, end, TimeResolution.DAILY
+    )
+    monthly = await balance_history_repository.get_balance_ohlc(
+        test_checking_account.id, start, end, TimeResolution.MONTHLY
+    )
+
+    # 3. ASSERT: Verify bucket values
+    assert len(daily) == 2
+    first_day = daily[0]
+    assert first_day["period_start"] == day_one.date()
+    assert first_day["open_balance"] == Decimal("100.00")
+    assert first_day["high_balance"] == Decimal("175.00")
+    assert first_day["low_balance"] == Decimal("50.00")
+    assert first_day["close_balance"] == Decimal("175.00")
+    assert first_day["record_count"] == 3
+    assert daily[1]["open_balance"] == daily[1]["close_balance"] == Decimal("160.00")
+
+    assert len(monthly) == 1
+    assert monthly[0]["period_start"] == day_one.date()
+    assert monthly[0]["open_balance"] == Decimal("100.00")
+    assert monthly[0]["close_balance"] == Decimal("160.00")
+    assert monthly[0]["record_count"] == 4
+
+
 async def test_get_available_credit_trend(
     balance_history_repository: BalanceHistoryRepository,
     test_credit_account: Account,
@@ -275,6 +275,69 @@ async def test_get_account_split_totals_with_date_range(
     assert total == expected_total
 
 
+async def test_get_upcoming_totals_by_account(
+    bill_split_repository: BillSplitRepository,
+    test_bill_splits: List[BillSplit],
+    test_liability: Liability,
+    test_checking_account: Account,
+):
+    """Test totaling upcoming obligations for several accounts in one query."""
+    # 1. ARRANGE: Fixture splits are due with the liability in 30 days
+    start_date = days_ago(0)
+    unknown_account_id = test_checking_account.id + 1000
+
+    # 2. ACT: Total obligations with and without the liability excluded
+    totals = await bill_split_repository.get_upcoming_totals_by_account(
+        [test_checking_account.id, unknown_account_id],
+        start_date,
+        days_from_now(10),
+        days_from_now(90),
+    )
+    excluded = await bill_split_repository.get_upcoming_totals_by_account(
+        [test_checking_account.id],
+        start_date,
+        days_from_now(10),
+        days_from_now(90),
+        exclude_liability_id=test_liability.id,
+    )
+
+    # 3. ASSERT: Only the long horizon reaches the due date
+    expected_total = sum(split.amount for split in test_bill_splits)
+    assert totals[test_checking_account.id] == (Decimal("0"), expected_total)
+    assert totals[unknown_account_id] == (Decimal("0"), Decimal("0"))
+    assert excluded[test_checking_account.id] == (Decimal("0"), Decimal("0"))
+
+
+async def test_get_obligation_schedule(
+    bill_split_repository: BillSplitRepository,
+    test_bill_splits: List[BillSplit],
+    test_liability: Liability,
+    test_checking_account: Account,
+):
+    """Test grouping unpaid split obligations by account and due date."""
+    # 1. ARRANGE: Fixture splits share the liability's due date
+    start_date = days_ago(0)
+    end_date = days_from_now(60)
+
+    # 2. ACT: Get the schedule with and without the liability excluded
+    schedule = await bill_split_repository.get_obligation_schedule(
+        [test_checking_account.id], start_date, end_date
+    )
+    excluded = await bill_split_repository.get_obligation_schedule(
+        [test_checking_account.id],
+        start_date,
+        end_date,
+        exclude_liability_ids=[test_liability.id],
+    )
+
+    # 3. ASSERT: One grouped entry for the due date
+    entries = schedule[test_checking_account.id]
+    assert len(entries) == 1
+    assert datetime_equals(entries[0][0], test_liability.due_date, ignore_timezone=True)
+    assert entries[0][1] == sum(split.amount for split in test_bill_splits)
+    assert excluded[test_checking_account.id] == []
+
+
 async def test_get_split_distribution(
     bill_split_repository: BillSplitRepository,
     test_bill_splits: List[BillSplit],
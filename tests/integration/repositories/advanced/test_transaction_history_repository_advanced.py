@@ -289,6 +289,60 @@ async def test_get_transaction_patterns(
     assert has_bill_pattern
 
 
+async def test_get_transaction_patterns_for_accounts(
+    transaction_history_repository: TransactionHistoryRepository,
+    test_checking_account: Account,
+    test_savings_account: Account,
+    test_recurring_transaction_patterns: List[TransactionHistory],
+):
+    """Test identifying recurring transaction patterns for several accounts.
+
+    Uses ADR-011 compliant datetime handling with utilities.
+    """
+    # 1. ARRANGE: Add a biweekly transfer pattern to the savings account
+    transfer_schemas = [
+        create_transaction_history_schema(
+            account_id=test_savings_account.id,
+            amount=Decimal("100.00"),
+            transaction_type=TransactionType.CREDIT,
+            description="Paycheck Transfer",
+            transaction_date=days_ago(offset),
+        )
+        for offset in (2, 16, 30)
+    ]
+    await transaction_history_repository.bulk_create(
+        [schema.model_dump() for schema in transfer_schemas]
+    )
+
+    # 2. ACT: Analyze both accounts in one call
+    patterns = (
+        await transaction_history_repository.get_transaction_patterns_for_accounts(
+            [test_checking_account.id, test_savings_account.id]
+        )
+    )
+
+    # 3. ASSERT: Verify patterns are grouped per account
+    checking_descriptions = {
+        p["description"] for p in patterns[test_checking_account.id]
+    }
+    assert "Weekly Grocery Shopping" in checking_descriptions
+    assert "Paycheck Transfer" not in checking_descriptions
+
+    assert len(patterns[test_savings_account.id]) == 1
+    transfer = patterns[test_savings_account.id][0]
+    assert transfer["count"] == 3
+    assert transfer["average_amount"] == Decimal("100.00")
+    assert transfer["transaction_type"] == TransactionType.CREDIT
+    assert transfer["pattern_type"] == "Bi-weekly"
+    assert abs(transfer["average_days_between"] - 14) < 0.01
+    assert datetime_greater_than(
+        transfer["last_occurrence"], transfer["first_occurrence"], ignore_timezone=True
+    )
+
+    confidences = [p["confidence"] for p in patterns[test_checking_account.id]]
+    assert confidences == sorted(confidences, reverse=True)
+
+
 async def test_bulk_create_transactions(
     transaction_history_repository: TransactionHistoryRepository,
     test_checking_account: Account,
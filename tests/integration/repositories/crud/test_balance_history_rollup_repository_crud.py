@@ -0,0 +1,121 @@
+"""
+Integration tests for the BalanceHistoryRollupRepository.
+
+This module contains tests for writing, reading and pruning balance history
+rollups using the standard Arrange-Act-Assert pattern.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from src.common.cashflow_types import TimeResolution
+from src.models.accounts import Account
+from src.repositories.balance_history_rollups import BalanceHistoryRollupRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_bucket(period_start: date, balance: Decimal, count: int = 1) -> dict:
+    """Build a rollup bucket with a flat balance for the whole period."""
+    return {
+        "period_start": period_start,
+        "open_balance": balance,
+        "close_balance": balance,
+        "high_balance": balance,
+        "low_balance": balance,
+        "average_balance": balance,
+        "open_available_credit": None,
+        "close_available_credit": None,
+        "min_available_credit": None,
+        "max_available_credit": None,
+        "record_count": count,
+    }
+
+
+async def test_replace_rollups_is_idempotent(
+    balance_history_rollup_repository: BalanceHistoryRollupRepository,
+    test_checking_account: Account,
+):
+    """Test that rewriting a period replaces the existing rollup."""
+    # 1. ARRANGE: Write two daily buckets
+    account_id = test_checking_account.id
+    await balance_history_rollup_repository.replace_rollups(
+        TimeResolution.DAILY,
+        {
+            account_id: [
+                make_bucket(date(2025, 3, 1), Decimal("100.00")),
+                make_bucket(date(2025, 3, 2), Decimal("200.00")),
+            ]
+        },
+    )
+
+    # 2. ACT: Rewrite the second day
+    written = await balance_history_rollup_repository.replace_rollups(
+        TimeResolution.DAILY,
+        {account_id: [make_bucket(date(2025, 3, 2), Decimal("250.00"), count=2)]},
+    )
+
+    # 3. ASSERT: Verify only one row per period exists with the new values
+    rollups = await balance_history_rollup_repository.get_rollups(
+        [account_id],
+        TimeResolution.DAILY,
+        datetime(2025, 3, 1),
+        datetime(2025, 3, 31),
+    )
+    assert written == 1
+    assert len(rollups) == 2
+    assert rollups[0].close_balance == Decimal("100.00")
+    assert rollups[1].close_balance == Decimal("250.00")
+    assert rollups[1].record_count == 2
+
+
+async def test_delete_before(
+    balance_history_rollup_repository: BalanceHistoryRollupRepository,
+    test_checking_account: Account,
+):
+    """Test pruning rollups of one tier before a cutoff."""
+    # 1. ARRANGE: Write daily and monthly buckets in two months
+    account_id = test_checking_account.id
+    buckets = {
+        account_id: [
+            make_bucket(date(2025, 2, 1), Decimal("100.00")),
+            make_bucket(date(2025, 3, 1), Decimal("200.00")),
+        ]
+    }
+    await balance_history_rollup_repository.replace_rollups(
+        TimeResolution.DAILY, buckets
+    )
+    await balance_history_rollup_repository.replace_rollups(
+        TimeResolution.MONTHLY, buckets
+    )
+
+    # 2. ACT: Delete daily rollups before March
+    deleted = await balance_history_rollup_repository.delete_before(
+        TimeResolution.DAILY, date(2025, 3, 1)
+    )
+
+    # 3. ASSERT: Only the February daily rollup was removed
+    daily = await balance_history_rollup_repository.get_rollups(
+        [account_id], TimeResolution.DAILY, datetime(2025, 1, 1), datetime(2025, 12, 31)
+    )
+    monthly = await balance_history_rollup_repository.get_rollups(
+        [account_id],
+        TimeResolution.MONTHLY,
+        datetime(2025, 1, 1),
+        datetime(2025, 12, 31),
+    )
+    assert deleted == 1
+    assert [r.period_start.date() for r in daily] == [date(2025, 3, 1)]
+    assert len(monthly) == 2
+
+
+async def test_weekly_resolution_has_no_tier(
+    balance_history_rollup_repository: BalanceHistoryRollupRepository,
+):
+    """Test that weekly rollups are rejected since they derive from daily ones."""
+    with pytest.raises(ValueError, match="No rollup tier"):
+        await balance_history_rollup_repository.get_rollups(
+            [1], TimeResolution.WEEKLY, datetime(2025, 1, 1), datetime(2025, 1, 31)
+        )
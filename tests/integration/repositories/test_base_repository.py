@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.base_repository import BaseRepository
 from src.utils.datetime_utils import utc_now
+from src.utils.instrumentation import instrument_engine, request_metrics_scope
 from tests.helpers.models.basic_test_models import TestBasicDBModel
 from tests.helpers.schema_factories.basic_test_schema_factories import (
     create_test_item_schema,
@@ -481,3 +482,96 @@ async def test_transaction_rollback(db_session: AsyncSession):
     )
     item = result.scalars().first()
     assert item is None  # Transaction was rolled back
+
+
+@pytest.mark.asyncio
+async def test_get_reuses_session_instance(
+    db_engine, test_item_repository: BaseRepository, test_item: TestBasicDBModel
+):
+    """
+    Test that get() returns an instance already loaded in the session
+    without querying the database again.
+
+    Args:
+        db_engine: Engine the session is bound to
+        test_item_repository: Repository for TestBasicDBModel
+        test_item: Test item fixture
+    """
+    # 1. ARRANGE: Count statements executed through the test engine
+    instrument_engine(db_engine)
+
+    # 2. SCHEMA: Not applicable for this read operation
+
+    # 3. ACT: Retrieve an item the session already holds
+    with request_metrics_scope() as metrics:
+        retrieved_item = await test_item_repository.get(test_item.id)
+
+    # 4. ASSERT: Verify the identity map was used
+    assert retrieved_item is test_item
+    assert metrics.statement_count == 0
+
+
+@pytest.mark.asyncio
+async def test_get_queries_expired_instance(
+    db_session: AsyncSession,
+    test_item_repository: BaseRepository,
+    test_item: TestBasicDBModel,
+):
+    """
+    Test that get() reloads an instance whose attributes were expired.
+
+    Args:
+        db_session: Database session for repository operations
+        test_item_repository: Repository for TestBasicDBModel
+        test_item: Test item fixture
+    """
+    # 1. ARRANGE: Expire the cached instance
+    item_id = test_item.id
+    db_session.expire(test_item)
+
+    # 2. SCHEMA: Not applicable for this read operation
+
+    # 3. ACT: Retrieve the item
+    retrieved_item = await test_item_repository.get(item_id)
+
+    # 4. ASSERT: Verify the attributes were loaded again
+    assert retrieved_item is test_item
+    assert retrieved_item.name == "Fixture Test Item"
+
+
+@pytest.mark.asyncio
+async def test_get_many(db_engine, db_session: AsyncSession):
+    """
+    Test retrieving several records by primary key in a single query.
+
+    Args:
+        db_engine: Engine the session is bound to
+        db_session: Database session for repository operations
+    """
+    # 1. ARRANGE: Create items and detach all but the first from the session
+    repo = BaseRepository(db_session, TestBasicDBModel)
+    items = [
+        await repo.create(
+            create_test_item_schema(
+                name=f"Item {i}", numeric_value=Decimal("1.00")
+            ).model_dump()
+        )
+        for i in range(4)
+    ]
+    ids = [item.id for item in items]
+    for item in items[1:]:
+        db_session.expunge(item)
+    instrument_engine(db_engine)
+
+    # 2. SCHEMA: Not applicable for this read operation
+
+    # 3. ACT: Retrieve the items in reverse order with a duplicate and a missing ID
+    with request_metrics_scope() as metrics:
+        found = await repo.get_many([ids[3], 9999, ids[2], ids[1], ids[0], ids[3]])
+
+    # 4. ASSERT: Verify the operation results
+    assert list(found) == [ids[3], ids[2], ids[1], ids[0]]
+    assert found[ids[0]] is items[0]
+    assert [found[id].name for id in ids] == ["Item 0", "Item 1", "Item 2", "Item 3"]
+    # Only the items missing from the session are selected, in one statement
+    assert metrics.statement_count == 1
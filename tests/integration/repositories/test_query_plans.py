@@ -0,0 +1,160 @@
+"""
+Query plan regression tests for hot repository paths.
+
+Each test captures the SQL a repository method actually issues and runs it
+through SQLite's EXPLAIN QUERY PLAN. A full table scan of a hot table means
+an index was dropped or a query stopped matching one, which these tests
+report before it shows up as a slow endpoint.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import AsyncIterator, List, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.balance_history import BalanceHistoryRepository
+from src.repositories.liabilities import LiabilityRepository
+from src.repositories.payments import PaymentRepository
+from src.repositories.statement_history import StatementHistoryRepository
+from src.repositories.transaction_history import TransactionHistoryRepository
+from src.utils.datetime_utils import naive_utc_now
+
+pytestmark = pytest.mark.integration
+
+HOT_TABLES = {
+    "balance_history",
+    "liabilities",
+    "payment_sources",
+    "payments",
+    "statement_history",
+    "transaction_history",
+}
+
+
+@asynccontextmanager
+async def capture_statements(
+    session: AsyncSession,
+) -> AsyncIterator[List[Tuple[str, tuple]]]:
+    """Record every SELECT statement the session sends to the database."""
+    statements: List[Tuple[str, tuple]] = []
+    connection = (await session.connection()).sync_connection
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, tuple(parameters or ())))
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+async def full_scans(
+    session: AsyncSession, statements: List[Tuple[str, tuple]]
+) -> List[str]:
+    """Return plan lines that scan a hot table without using an index."""
+    connection = await session.connection()
+    scans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        for row in result:
+            detail = row[-1]
+            words = detail.split()
+            if (
+                len(words) >= 2
+                and words[0] == "SCAN"
+                and words[1] in HOT_TABLES
+                and "INDEX" not in words
+            ):
+                scans.append(f"{detail}\n  in: {statement}")
+    return scans
+
+
+async def assert_uses_indexes(session: AsyncSession, statements) -> None:
+    """Fail with the offending plans if any hot table is fully scanned."""
+    assert statements, "No statements were captured"
+    scans = await full_scans(session, statements)
+    assert not scans, "Full table scans on hot paths:\n" + "\n".join(scans)
+
+
+@pytest.mark.asyncio
+async def test_transaction_history_date_range_plan(
+    db_session: AsyncSession,
+    transaction_history_repository: TransactionHistoryRepository,
+):
+    """Transaction history by account and date range uses an index."""
+    now = naive_utc_now()
+    async with capture_statements(db_session) as statements:
+        await transaction_history_repository.get_by_date_range(
+            1, now - timedelta(days=30), now
+        )
+    await assert_uses_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_balance_history_date_range_plan(
+    db_session: AsyncSession, balance_history_repository: BalanceHistoryRepository
+):
+    """Balance history by account and date range uses an index."""
+    now = naive_utc_now()
+    async with capture_statements(db_session) as statements:
+        await balance_history_repository.get_by_date_range(
+            1, now - timedelta(days=30), now
+        )
+    await assert_uses_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_statement_history_date_range_plan(
+    db_session: AsyncSession,
+    statement_history_repository: StatementHistoryRepository,
+):
+    """Statement history by account and date range uses an index."""
+    now = naive_utc_now()
+    async with capture_statements(db_session) as statements:
+        await statement_history_repository.get_by_date_range(
+            1, now - timedelta(days=365), now
+        )
+    await assert_uses_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_payments_date_range_plan(
+    db_session: AsyncSession, payment_repository: PaymentRepository
+):
+    """Payments in a date range, with their sources, use indexes."""
+    now = naive_utc_now()
+    async with capture_statements(db_session) as statements:
+        await payment_repository.get_payments_in_date_range(
+            now - timedelta(days=30), now, include_sources=True
+        )
+    await assert_uses_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_liability_due_range_plan(
+    db_session: AsyncSession, liability_repository: LiabilityRepository
+):
+    """Bills due in a range use the due date indexes."""
+    now = naive_utc_now()
+    async with capture_statements(db_session) as statements:
+        await liability_repository.get_bills_due_in_range(now, now + timedelta(days=30))
+        await liability_repository.get_upcoming_payments(days=30)
+        await liability_repository.get_overdue_bills()
+    await assert_uses_indexes(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_liabilities_for_account_plan(
+    db_session: AsyncSession, liability_repository: LiabilityRepository
+):
+    """Bills for an account use the primary account index."""
+    async with capture_statements(db_session) as statements:
+        await liability_repository.get_bills_for_account(1)
+    await assert_uses_indexes(db_session, statements)
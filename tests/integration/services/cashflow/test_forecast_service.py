@@ -8,7 +8,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.income import Income
 from src.models.liabilities import Liability
-from src.schemas.cashflow import AccountForecastRequest, CustomForecastParameters
+from src.models.payments import Payment, PaymentSource
+from src.schemas.cashflow import (
+    AccountForecastRequest,
+    CustomForecastParameters,
+    ProbabilisticForecastParameters,
+)
 from src.services.cashflow.cashflow_forecast_service import ForecastService
 from src.utils.datetime_utils import (
     days_from_now,
@@ -18,6 +23,7 @@ from src.utils.datetime_utils import (
     naive_start_of_day,
     utc_now,
 )
+from src.utils.instrumentation import instrument_engine, request_metrics_scope
 
 
 @pytest.mark.asyncio
@@ -259,6 +265,52 @@ async def test_get_forecast_empty_range(
         assert entry.projected_balance == test_checking_account.available_balance
 
 
+@pytest.mark.asyncio
+async def test_get_account_forecast_credit_utilization(
+    db_session: AsyncSession, test_credit_account
+):
+    """Test that credit utilization is measured against the credit limit."""
+    service = ForecastService(session=db_session)
+    start_date = date.today() + timedelta(days=100)
+    request = AccountForecastRequest(
+        account_id=test_credit_account.id,
+        start_date=ensure_utc(naive_start_of_day(start_date)),
+        end_date=ensure_utc(naive_end_of_day(start_date + timedelta(days=5))),
+        include_pending=True,
+        include_recurring=True,
+        include_transfers=True,
+    )
+
+    forecast_response = await service.get_account_forecast(request)
+
+    # $500 owed against a $2,000 limit
+    assert forecast_response.metrics.credit_utilization == Decimal("0.25")
+
+
+@pytest.mark.asyncio
+async def test_get_account_forecast_rounds_credit_utilization(
+    db_session: AsyncSession, test_credit_account
+):
+    """Test that repeating-decimal utilization is rounded for the schema."""
+    test_credit_account.credit_limit = Decimal("3000.00")
+    await db_session.flush()
+    service = ForecastService(session=db_session)
+    start_date = date.today() + timedelta(days=100)
+    request = AccountForecastRequest(
+        account_id=test_credit_account.id,
+        start_date=ensure_utc(naive_start_of_day(start_date)),
+        end_date=ensure_utc(naive_end_of_day(start_date + timedelta(days=5))),
+        include_pending=True,
+        include_recurring=True,
+        include_transfers=True,
+    )
+
+    forecast_response = await service.get_account_forecast(request)
+
+    # $500 owed against a $3,000 limit
+    assert forecast_response.metrics.credit_utilization == Decimal("0.1667")
+
+
 @pytest.mark.asyncio
 async def test_get_required_funds_empty_range(
     db_session: AsyncSession, test_checking_account
@@ -512,3 +564,146 @@ async def test_get_custom_forecast_no_accounts(db_session: AsyncSession):
     # Act & Assert: Verify appropriate error is raised
     with pytest.raises(ValueError, match="No valid accounts found for analysis"):
         await service.get_custom_forecast(params)
+
+
+async def _seed_probabilistic_history(
+    db_session: AsyncSession, account, category
+) -> None:
+    """Create a monthly salary history and a bill paid at varying amounts."""
+    for month in range(1, 7):
+        db_session.add(
+            Income(
+                date=naive_days_from_now(-30 * month + 5),
+                source="Salary",
+                amount=Decimal("2000.00") + month,
+                deposited=True,
+                account_id=account.id,
+            )
+        )
+    bill = Liability(
+        name="Electric",
+        amount=Decimal("150.00"),
+        due_date=naive_days_from_now(10),
+        category_id=category.id,
+        primary_account_id=account.id,
+        paid=False,
+    )
+    db_session.add(bill)
+    await db_session.flush()
+    for month, amount in enumerate(("120.00", "180.00", "140.00"), start=1):
+        payment = Payment(
+            liability_id=bill.id,
+            amount=Decimal(amount),
+            payment_date=naive_days_from_now(-30 * month),
+            category="Utilities",
+        )
+        payment.sources = [PaymentSource(account_id=account.id, amount=Decimal(amount))]
+        db_session.add(payment)
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_get_probabilistic_forecast(
+    db_session: AsyncSession, test_checking_account, test_category
+):
+    """Simulated bands widen with the bill spread and include recurring income."""
+    await _seed_probabilistic_history(db_session, test_checking_account, test_category)
+    service = ForecastService(session=db_session)
+    params = ProbabilisticForecastParameters(
+        start_date=utc_now(),
+        end_date=days_from_now(59),
+        account_ids=[test_checking_account.id],
+        paths=1000,
+        seed=42,
+    )
+
+    forecast = await service.get_probabilistic_forecast(params)
+
+    assert len(forecast.days) == 60
+    assert forecast.income_streams == 1
+    assert forecast.variable_bills == 1
+    assert forecast.starting_balance == test_checking_account.available_balance
+
+    first_day = forecast.days[0]
+    assert first_day.date.date() == date.today()
+    assert first_day.percentile_5 == first_day.percentile_95
+    # The bill amount varies, so the bands spread once it is due
+    after_bill = forecast.days[10]
+    assert after_bill.percentile_5 < after_bill.median < after_bill.percentile_95
+    # Two salary payments arrive within the period
+    assert forecast.days[-1].median > first_day.median + Decimal("3500")
+    for day in forecast.days:
+        assert Decimal("0") <= day.overdraft_probability <= Decimal("1")
+
+    # The same seed reproduces the same bands
+    again = await service.get_probabilistic_forecast(params)
+    assert again.days == forecast.days
+
+
+@pytest.mark.asyncio
+async def test_probabilistic_forecast_without_pending_income(
+    db_session: AsyncSession, test_checking_account, test_category
+):
+    """Streams continue from the last deposit when pending income is excluded."""
+    await _seed_probabilistic_history(db_session, test_checking_account, test_category)
+    db_session.add(
+        Income(
+            date=naive_days_from_now(5),
+            source="Salary",
+            amount=Decimal("2000.00"),
+            deposited=False,
+            account_id=test_checking_account.id,
+        )
+    )
+    await db_session.flush()
+    service = ForecastService(session=db_session)
+    params = ProbabilisticForecastParameters(
+        start_date=utc_now(),
+        end_date=days_from_now(59),
+        account_ids=[test_checking_account.id],
+        include_pending=False,
+        paths=1000,
+        seed=42,
+    )
+
+    forecast = await service.get_probabilistic_forecast(params)
+
+    # The pending salary is left out, but the stream still expects it
+    assert forecast.income_streams == 1
+    assert forecast.days[-1].median > forecast.days[0].median + Decimal("3500")
+
+
+@pytest.mark.asyncio
+async def test_probabilistic_forecast_statements_independent_of_paths(
+    db_session: AsyncSession, db_engine, test_checking_account, test_category
+):
+    """Simulating more paths runs no additional queries."""
+    await _seed_probabilistic_history(db_session, test_checking_account, test_category)
+    service = ForecastService(session=db_session)
+    instrument_engine(db_engine)
+
+    def params(paths: int) -> ProbabilisticForecastParameters:
+        return ProbabilisticForecastParameters(
+            start_date=utc_now(), end_date=days_from_now(89), paths=paths, seed=1
+        )
+
+    with request_metrics_scope() as few:
+        await service.get_probabilistic_forecast(params(100))
+    with request_metrics_scope() as many:
+        await service.get_probabilistic_forecast(params(10000))
+
+    assert many.statement_count == few.statement_count
+
+
+@pytest.mark.asyncio
+async def test_get_probabilistic_forecast_rejects_long_period(
+    db_session: AsyncSession, test_checking_account
+):
+    """Probabilistic forecasts are limited to about a year."""
+    service = ForecastService(session=db_session)
+    params = ProbabilisticForecastParameters(
+        start_date=utc_now(), end_date=days_from_now(400)
+    )
+
+    with pytest.raises(ValueError, match="at most 366 days"):
+        await service.get_probabilistic_forecast(params)
@@ -1,11 +1,18 @@
 """Integration tests for the cashflow metrics service."""
 
+from datetime import timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.cashflow import CashflowForecast
+from src.models.categories import Category
+from src.models.liabilities import Liability, LiabilityStatus
 from src.services.cashflow.cashflow_metrics_service import MetricsService
+from src.utils.datetime_utils import naive_utc_now
+from src.utils.instrumentation import instrument_engine, request_metrics_scope
 
 
 @pytest.mark.asyncio
@@ -261,3 +268,97 @@ async def test_calculate_required_income_method(db_session: AsyncSession):
 
     # Test with zero deficit
     assert metrics_service.calculate_required_income(Decimal("0.00")) == Decimal("0.00")
+
+
+async def _seed_upcoming_bills(
+    db_session: AsyncSession, account, category: Category, count: int
+) -> None:
+    """Create unpaid bills due over the coming months."""
+    now = naive_utc_now()
+    for index in range(count):
+        db_session.add(
+            Liability(
+                name=f"Forecast Bill {index}",
+                amount=Decimal("400.00") + index,
+                due_date=now + timedelta(days=5 + 11 * index),
+                category_id=category.id,
+                primary_account_id=account.id,
+                active=True,
+                paid=False,
+                status=LiabilityStatus.PENDING,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_calculate_90_day_forecast_window_minimums(
+    db_session: AsyncSession, test_checking_account, test_category: Category
+):
+    """Stored forecasts carry each day's lookahead minimums and deficits."""
+    await _seed_upcoming_bills(db_session, test_checking_account, test_category, 12)
+    service = MetricsService(session=db_session)
+    start = naive_utc_now().date()
+
+    forecasts = await service.calculate_90_day_forecast(start)
+
+    # Closing balances recomputed day by day from the same projection
+    projection = await service.get_projection(
+        start, start + timedelta(days=90 + 89 - 1)
+    )
+    balance = projection.starting_balance
+    closing = []
+    for offset in range(90 + 89):
+        inflow, outflow = projection.flows_for(start + timedelta(days=offset))
+        balance += inflow - outflow
+        closing.append(balance)
+
+    assert len(forecasts) == 90
+    assert all(forecast.id is not None for forecast in forecasts)
+    assert min(closing) < 0
+    for offset, forecast in enumerate(forecasts):
+        assert forecast.forecast_date.date() == start + timedelta(days=offset)
+        assert forecast.forecast == closing[offset]
+        assert forecast.min_14_day == min(closing[offset : offset + 14])
+        assert forecast.min_30_day == min(closing[offset : offset + 30])
+        assert forecast.min_60_day == min(closing[offset : offset + 60])
+        assert forecast.min_90_day == min(closing[offset : offset + 90])
+    lowest = min(forecasts[0].min_14_day, forecasts[0].min_90_day)
+    assert forecasts[0].daily_deficit == service.calculate_daily_deficit(lowest, 14)
+    assert forecasts[0].hourly_rate_40 > 0
+
+
+@pytest.mark.asyncio
+async def test_calculate_90_day_forecast_replaces_stored_days(
+    db_session: AsyncSession,
+    db_engine,
+    test_checking_account,
+    test_category: Category,
+):
+    """Recalculating replaces the stored days with a constant statement count."""
+    instrument_engine(db_engine)
+    service = MetricsService(session=db_session)
+    start = naive_utc_now().date()
+
+    with request_metrics_scope() as short:
+        await service.calculate_90_day_forecast(start, days=10)
+
+    await _seed_upcoming_bills(db_session, test_checking_account, test_category, 12)
+    with request_metrics_scope() as full:
+        forecasts = await service.calculate_90_day_forecast(start)
+
+    stored = await db_session.scalar(select(func.count(CashflowForecast.id)))
+    assert stored == len(forecasts) == 90
+    assert full.statement_count == short.statement_count
+
+
+@pytest.mark.asyncio
+async def test_calculate_90_day_forecast_rejects_empty_horizon(
+    db_session: AsyncSession,
+):
+    """A horizon must contain at least one day."""
+    service = MetricsService(session=db_session)
+    with pytest.raises(ValueError, match="at least one day"):
+        await service.calculate_90_day_forecast(naive_utc_now().date(), days=0)
@@ -1,15 +1,24 @@
 """Integration tests for the cashflow transaction service."""
 
-from datetime import timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.account_types.banking.checking import CheckingAccount
 from src.models.accounts import Account
+from src.models.income import Income
+from src.models.liabilities import Liability, LiabilityStatus
+from src.models.payments import Payment, PaymentSource
 from src.models.transaction_history import TransactionHistory, TransactionType
 from src.services.cashflow.cashflow_transaction_service import TransactionService
-from src.utils.datetime_utils import naive_days_ago, utc_now
+from src.utils.datetime_utils import (
+    naive_days_ago,
+    naive_days_from_now,
+    utc_datetime,
+    utc_now,
+)
 
 
 @pytest.mark.asyncio
@@ -266,3 +275,171 @@ async def test_get_transactions_by_date_range_empty(db_session: AsyncSession):
 
     # Assert: Empty result for range with no transactions
     assert len(transactions) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_historical_transactions(db_session: AsyncSession):
+    """Test historical transactions include only the requested accounts' flows."""
+    # Arrange: Two accounts sharing a payment, plus out-of-range and undeposited rows
+    primary = CheckingAccount(
+        name="History Primary",
+        available_balance=Decimal("1000.00"),
+        current_balance=Decimal("1000.00"),
+    )
+    other = CheckingAccount(
+        name="History Other",
+        available_balance=Decimal("1000.00"),
+        current_balance=Decimal("1000.00"),
+    )
+    db_session.add_all([primary, other])
+    await db_session.flush()
+
+    shared = Payment(
+        amount=Decimal("100.00"),
+        payment_date=naive_days_ago(5),
+        category="Utilities",
+        sources=[
+            PaymentSource(account_id=primary.id, amount=Decimal("60.00")),
+            PaymentSource(account_id=other.id, amount=Decimal("40.00")),
+        ],
+    )
+    old = Payment(
+        amount=Decimal("20.00"),
+        payment_date=naive_days_ago(90),
+        category="Utilities",
+        sources=[PaymentSource(account_id=primary.id, amount=Decimal("20.00"))],
+    )
+    deposited = Income(
+        date=naive_days_ago(3),
+        source="Salary",
+        amount=Decimal("500.00"),
+        deposited=True,
+        account_id=primary.id,
+    )
+    pending = Income(
+        date=naive_days_ago(2),
+        source="Bonus",
+        amount=Decimal("50.00"),
+        deposited=False,
+        account_id=primary.id,
+    )
+    db_session.add_all([shared, old, deposited, pending])
+    await db_session.flush()
+
+    service = TransactionService(session=db_session)
+    today = utc_now().date()
+
+    # Act: Get the last month of history for the primary account
+    transactions = await service.get_historical_transactions(
+        [primary.id], today - timedelta(days=30), today
+    )
+
+    # Assert: Only the primary account's share and deposited income, in date order
+    assert [(t["type"], t["amount"], t["account_id"]) for t in transactions] == [
+        ("payment", Decimal("-60.00"), primary.id),
+        ("income", Decimal("500.00"), primary.id),
+    ]
+    assert transactions[0]["category"] == "Utilities"
+    assert transactions[0]["date"].tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_get_range_transactions_matches_day_transactions(
+    db_session: AsyncSession, test_category
+):
+    """Test range transactions equal per-day transactions of every account."""
+    # Arrange: Bills and expected income for two accounts over a week
+    first = CheckingAccount(
+        name="Range First",
+        available_balance=Decimal("1000.00"),
+        current_balance=Decimal("1000.00"),
+    )
+    second = CheckingAccount(
+        name="Range Second",
+        available_balance=Decimal("500.00"),
+        current_balance=Decimal("500.00"),
+    )
+    db_session.add_all([first, second])
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            Liability(
+                name="Range Rent",
+                amount=Decimal("400.00"),
+                due_date=naive_days_from_now(2),
+                category_id=test_category.id,
+                primary_account_id=first.id,
+                status=LiabilityStatus.PENDING,
+            ),
+            Liability(
+                name="Range Power",
+                amount=Decimal("60.00"),
+                due_date=naive_days_from_now(4),
+                category_id=test_category.id,
+                primary_account_id=second.id,
+                status=LiabilityStatus.PENDING,
+            ),
+            Income(
+                date=naive_days_from_now(2),
+                source="Salary",
+                amount=Decimal("900.00"),
+                deposited=False,
+                account_id=first.id,
+            ),
+        ]
+    )
+    await db_session.flush()
+
+    service = TransactionService(session=db_session)
+    today = utc_now().date()
+    end = today + timedelta(days=6)
+
+    # Act: Load the whole range at once
+    by_day = await service.get_range_transactions([first, second], today, end)
+
+    # Assert: Every day holds what get_day_transactions returns for that day
+    day = today
+    while day <= end:
+        expected = []
+        for account in (first, second):
+            expected.extend(await service.get_day_transactions(account, day))
+        assert sorted(by_day.get(day, []), key=lambda t: t["description"]) == (
+            sorted(expected, key=lambda t: t["description"])
+        )
+        day += timedelta(days=1)
+    assert len(by_day[today + timedelta(days=2)]) == 2
+    assert await service.get_range_transactions([], today, end) == {}
+
+
+@pytest.mark.asyncio
+async def test_recurring_bills_project_past_month_end(
+    db_session: AsyncSession, test_checking_account, test_category
+):
+    """Test recurring bills due on the 31st project into shorter months."""
+    # Arrange: A monthly bill stored with a naive month-end due date
+    db_session.add(
+        Liability(
+            name="Month End Loan",
+            amount=Decimal("250.00"),
+            due_date=datetime(2025, 1, 31),
+            category_id=test_category.id,
+            primary_account_id=test_checking_account.id,
+            recurring=True,
+        )
+    )
+    await db_session.flush()
+    service = TransactionService(session=db_session)
+
+    # Act: Look up February with UTC-aware bounds
+    day_transactions = await service.get_day_transactions(
+        test_checking_account, utc_datetime(2025, 2, 28), include_pending=False
+    )
+    by_day = await service.get_range_transactions(
+        [test_checking_account], utc_datetime(2025, 2, 1), utc_datetime(2025, 2, 28)
+    )
+
+    # Assert: The occurrence is clamped to the last day of February
+    assert [t["type"] for t in day_transactions] == ["recurring_bill"]
+    assert day_transactions[0]["amount"] == Decimal("-250.00")
+    assert [t["type"] for t in by_day[date(2025, 2, 28)]] == ["recurring_bill"]
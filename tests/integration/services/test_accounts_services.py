@@ -3,8 +3,14 @@ from decimal import Decimal
 
 import pytest
 
-from src.models.transaction_history import TransactionHistory
+from src.models.transaction_history import TransactionHistory, TransactionType
+from src.schemas.transaction_history import (
+    TransactionHistoryCreate,
+    TransactionHistoryUpdate,
+)
 from src.services.accounts import AccountService
+from src.services.transactions import TransactionService
+from src.utils.datetime_utils import naive_utc_now, utc_now
 
 
 @pytest.mark.asyncio
@@ -37,6 +43,10 @@ async def test_calculate_available_credit(db_session, test_credit_account):
     db_session.add(credit_transaction)
     await db_session.flush()
 
+    # Transactions added outside the TransactionService reach the running
+    # totals through reconciliation
+    await service.reconcile_pending_totals([test_credit_account.id])
+
     # Calculate available credit
     result = await service.calculate_available_credit(test_credit_account.id)
 
@@ -69,6 +79,85 @@ async def test_calculate_available_credit_no_transactions(
     assert result.available_credit == Decimal("1500.00")  # 2000 - |-500|
 
 
+@pytest.mark.asyncio
+async def test_transaction_service_maintains_pending_totals(
+    db_session, test_credit_account
+):
+    """Test running totals follow transaction creation, updates and deletion"""
+    service = AccountService(db_session)
+    transaction_service = TransactionService(db_session)
+
+    debit = await transaction_service.create_transaction(
+        test_credit_account.id,
+        TransactionHistoryCreate(
+            account_id=test_credit_account.id,
+            amount=Decimal("100.00"),
+            transaction_type=TransactionType.DEBIT,
+            transaction_date=utc_now(),
+        ),
+    )
+    await transaction_service.create_transaction(
+        test_credit_account.id,
+        TransactionHistoryCreate(
+            account_id=test_credit_account.id,
+            amount=Decimal("50.00"),
+            transaction_type=TransactionType.CREDIT,
+            transaction_date=utc_now(),
+        ),
+    )
+    assert test_credit_account.pending_debit_total == Decimal("100.00")
+    assert test_credit_account.pending_credit_total == Decimal("50.00")
+
+    result = await service.calculate_available_credit(test_credit_account.id)
+    assert result.pending_transactions == Decimal("50.00")
+
+    await transaction_service.update_transaction(
+        debit.id,
+        TransactionHistoryUpdate(
+            id=debit.id,
+            amount=Decimal("30.00"),
+            transaction_type=TransactionType.CREDIT,
+        ),
+    )
+    assert test_credit_account.pending_debit_total == Decimal("0")
+    assert test_credit_account.pending_credit_total == Decimal("80.00")
+
+    await transaction_service.delete_transaction(debit.id)
+    assert test_credit_account.pending_credit_total == Decimal("50.00")
+
+    summary = await service.reconcile_pending_totals([test_credit_account.id])
+    assert summary == {"accounts_checked": 1, "accounts_corrected": 0}
+
+
+@pytest.mark.asyncio
+async def test_reconcile_pending_totals_corrects_drift(
+    db_session, test_credit_account, test_checking_account
+):
+    """Test reconciliation against the full transaction aggregate"""
+    service = AccountService(db_session)
+
+    db_session.add(
+        TransactionHistory(
+            account_id=test_credit_account.id,
+            amount=Decimal("12.3456"),
+            transaction_type=TransactionType.DEBIT,
+            transaction_date=naive_utc_now(),
+        )
+    )
+    await db_session.flush()
+
+    summary = await service.reconcile_pending_totals()
+
+    assert summary["accounts_checked"] >= 2
+    assert summary["accounts_corrected"] == 1
+    assert test_credit_account.pending_debit_total == Decimal("12.3456")
+    assert test_credit_account.pending_credit_total == Decimal("0")
+    assert test_checking_account.pending_debit_total == Decimal("0")
+
+    summary = await service.reconcile_pending_totals()
+    assert summary["accounts_corrected"] == 0
+
+
 @pytest.mark.asyncio
 async def test_calculate_available_credit_non_credit_account(
     db_session, test_checking_account
@@ -90,3 +179,97 @@ async def test_calculate_available_credit_account_not_found(db_session):
 
     result = await service.calculate_available_credit(999)
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_apply_type_specific_function_to_accounts(
+    db_session, test_checking_account, test_credit_account
+):
+    """Test batched dispatch of a type-specific function across accounts"""
+    service = AccountService(db_session)
+    overview = {"checking_balance": Decimal("0"), "total_cash": Decimal("0")}
+
+    # Checking has an update_overview function, credit has no service module
+    results = await service._apply_type_specific_function_to_accounts(
+        "update_overview", [test_checking_account, test_credit_account], overview
+    )
+
+    assert set(results) == {test_checking_account.id}
+    assert overview["checking_balance"] == test_checking_account.available_balance
+    assert overview["total_cash"] == test_checking_account.available_balance
+
+
+@pytest.mark.asyncio
+async def test_apply_type_specific_function_to_accounts_account_arg(
+    db_session, test_checking_account
+):
+    """Test passing a derived argument per account to the dispatched function"""
+    service = AccountService(db_session)
+
+    results = await service._apply_type_specific_function_to_accounts(
+        "get_upcoming_payments",
+        [test_checking_account],
+        14,
+        account_arg=lambda account: account.id,
+    )
+
+    assert results == {test_checking_account.id: []}
+
+
+@pytest.mark.asyncio
+async def test_apply_type_specific_function_to_accounts_bnpl_overview(
+    db_session, test_bnpl_account, test_bnpl_account_nearly_paid
+):
+    """Test that BNPL balances count as positive debt whatever their sign"""
+    service = AccountService(db_session)
+    overview = {"bnpl_balance": Decimal("0"), "total_debt": Decimal("0")}
+    # Debt stored as a negative balance must not offset the other account
+    test_bnpl_account.current_balance = Decimal("-400.00")
+
+    results = await service._apply_type_specific_function_to_accounts(
+        "update_overview", [test_bnpl_account, test_bnpl_account_nearly_paid], overview
+    )
+
+    assert set(results) == {test_bnpl_account.id, test_bnpl_account_nearly_paid.id}
+    assert overview["bnpl_balance"] == Decimal("500.00")
+    assert overview["total_debt"] == Decimal("500.00")
+
+
+@pytest.mark.asyncio
+async def test_apply_type_specific_function_to_accounts_bnpl_upcoming_payments(
+    db_session, test_bnpl_account, test_bnpl_account_with_upcoming_payment
+):
+    """Test BNPL installments due within the window are listed per account"""
+    service = AccountService(db_session)
+
+    results = await service._apply_type_specific_function_to_accounts(
+        "get_upcoming_payments",
+        [test_bnpl_account, test_bnpl_account_with_upcoming_payment],
+        7,
+        account_arg=lambda account: account.id,
+    )
+
+    # The basic account's installment is due in 14 days, outside the window
+    assert results[test_bnpl_account.id] == []
+    payments = results[test_bnpl_account_with_upcoming_payment.id]
+    assert len(payments) == 1
+    assert payments[0]["account_type"] == "bnpl"
+    assert payments[0]["amount"] == Decimal("100.00")
+    assert payments[0]["remaining_installments"] == 3
+    assert (
+        payments[0]["due_date"]
+        == test_bnpl_account_with_upcoming_payment.next_payment_date
+    )
+
+
+@pytest.mark.asyncio
+async def test_apply_type_specific_validation_bnpl(db_session):
+    """Test that BNPL creation rules are enforced through the dispatch table"""
+    service = AccountService(db_session)
+
+    with pytest.raises(ValueError, match="Installments paid cannot exceed"):
+        await service._apply_type_specific_validation(
+            "bnpl",
+            "validate_create",
+            {"installment_count": 4, "installments_paid": 5},
+        )
@@ -0,0 +1,301 @@
+"""
+Integration tests for balance history rollups in the BalanceHistoryService.
+
+Covers rollup maintenance on write, tiered series reads, backfilling history
+recorded before the first rollup and the retention policy that compacts old
+raw records.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from src.common.cashflow_types import TimeResolution
+from src.models.accounts import Account
+from src.repositories.balance_history import BalanceHistoryRepository
+from src.repositories.balance_history_rollups import BalanceHistoryRollupRepository
+from src.schemas.balance_history import BalanceHistoryCreate
+from src.services.balance_history import BalanceHistoryService
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(scope="function")
+def balance_history_service(db_session):
+    return BalanceHistoryService(db_session)
+
+
+async def record(service, account_id, balance, timestamp):
+    """Record a balance through the service at a naive UTC timestamp."""
+    await service.record_balance_change(
+        BalanceHistoryCreate(account_id=account_id, balance=Decimal(balance)),
+        timestamp,
+    )
+
+
+async def test_record_balance_change_maintains_rollups(
+    balance_history_service: BalanceHistoryService,
+    balance_history_rollup_repository: BalanceHistoryRollupRepository,
+    test_checking_account: Account,
+):
+    """Test that recording balances keeps daily and monthly rollups current."""
+    account_id = test_checking_account.id
+    await record(balance_history_service, account_id, "100.00", datetime(2025, 3, 3, 9))
+    await record(balance_history_service, account_id, "40.00", datetime(2025, 3, 3, 12))
+    await record(balance_history_service, account_id, "70.00", datetime(2025, 3, 4, 9))
+
+    daily = await balance_history_rollup_repository.get_rollups(
+        [account_id], TimeResolution.DAILY, datetime(2025, 3, 1), datetime(2025, 3, 31)
+    )
+    monthly = await balance_history_rollup_repository.get_rollups(
+        [account_id],
+        TimeResolution.MONTHLY,
+        datetime(2025, 3, 1),
+        datetime(2025, 3, 31),
+    )
+
+    assert len(daily) == 2
+    assert daily[0].open_balance == Decimal("100.00")
+    assert daily[0].close_balance == Decimal("40.00")
+    assert daily[0].record_count == 2
+    assert len(monthly) == 1
+    assert monthly[0].open_balance == Decimal("100.00")
+    assert monthly[0].close_balance == Decimal("70.00")
+    assert monthly[0].low_balance == Decimal("40.00")
+    assert monthly[0].average_balance == Decimal("70.00")
+    assert monthly[0].record_count == 3
+
+
+async def test_get_balance_series_weekly_and_monthly(
+    balance_history_service: BalanceHistoryService,
+    test_checking_account: Account,
+):
+    """Test weekly series merged from daily rollups and monthly tier reads."""
+    account_id = test_checking_account.id
+    # Monday 2025-03-03 through Monday 2025-03-10 spans two weeks
+    for offset, balance in enumerate(["10.00", "20.00", "30.00"]):
+        await record(
+            balance_history_service,
+            account_id,
+            balance,
+            datetime(2025, 3, 3 + offset, 12),
+        )
+    await record(balance_history_service, account_id, "5.00", datetime(2025, 3, 10, 12))
+
+    weekly = await balance_history_service.get_balance_series(
+        account_id, date(2025, 3, 5), date(2025, 3, 31), TimeResolution.WEEKLY
+    )
+    monthly = await balance_history_service.get_balance_series(
+        account_id, date(2025, 3, 1), date(2025, 3, 31), TimeResolution.MONTHLY
+    )
+
+    assert [bucket["period_start"] for bucket in weekly] == [
+        date(2025, 3, 3),
+        date(2025, 3, 10),
+    ]
+    assert weekly[0]["open_balance"] == Decimal("10.00")
+    assert weekly[0]["close_balance"] == Decimal("30.00")
+    assert weekly[0]["record_count"] == 3
+    assert len(monthly) == 1
+    assert monthly[0]["close_balance"] == Decimal("5.00")
+
+
+async def test_get_balance_series_fills_from_raw_records(
+    balance_history_service: BalanceHistoryService,
+    balance_history_repository: BalanceHistoryRepository,
+    test_checking_account: Account,
+):
+    """Test that periods without rollups are served from raw records."""
+    await balance_history_repository.create(
+        {
+            "account_id": test_checking_account.id,
+            "balance": Decimal("500.00"),
+            "timestamp": datetime(2025, 4, 2, 8),
+        }
+    )
+
+    series = await balance_history_service.get_balance_series(
+        test_checking_account.id, date(2025, 4, 1), date(2025, 4, 30)
+    )
+
+    assert len(series) == 1
+    assert series[0]["period_start"] == date(2025, 4, 2)
+    assert series[0]["close_balance"] == Decimal("500.00")
+
+
+async def test_record_balance_change_merges_without_scanning_raw_records(
+    balance_history_service: BalanceHistoryService,
+    balance_history_repository: BalanceHistoryRepository,
+    balance_history_rollup_repository: BalanceHistoryRollupRepository,
+    test_checking_account: Account,
+):
+    """Test that a write only merges into the touched rollup rows."""
+    account_id = test_checking_account.id
+    # 1. ARRANGE: Raw history earlier in the month that was never rolled up
+    await balance_history_repository.create(
+        {
+            "account_id": account_id,
+            "balance": Decimal("500.00"),
+            "timestamp": datetime(2025, 5, 2, 12),
+        }
+    )
+
+    # 2. ACT: Record two balances through the service
+    await record(balance_history_service, account_id, "30.00", datetime(2025, 5, 9, 9))
+    await record(balance_history_service, account_id, "10.00", datetime(2025, 5, 9, 12))
+
+    # 3. ASSERT: The rollups hold only the merged balances
+    monthly = await balance_history_rollup_repository.get_rollups(
+        [account_id],
+        TimeResolution.MONTHLY,
+        datetime(2025, 5, 1),
+        datetime(2025, 5, 31),
+    )
+    assert len(monthly) == 1
+    assert monthly[0].record_count == 2
+    assert monthly[0].open_balance == Decimal("30.00")
+    assert monthly[0].close_balance == Decimal("10.00")
+    assert monthly[0].average_balance == Decimal("20.00")
+
+
+async def test_get_balance_series_includes_history_before_first_rollup(
+    balance_history_service: BalanceHistoryService,
+    balance_history_repository: BalanceHistoryRepository,
+    test_checking_account: Account,
+):
+    """Test that raw history recorded before the first rollup is not lost."""
+    account_id = test_checking_account.id
+    # 1. ARRANGE: Five days of raw history, then one balance via the service
+    for day in range(1, 6):
+        await balance_history_repository.create(
+            {
+                "account_id": account_id,
+                "balance": Decimal(50 * day),
+                "timestamp": datetime(2025, 5, day, 12),
+            }
+        )
+    await record(balance_history_service, account_id, "10.00", datetime(2025, 5, 9, 12))
+
+    # 2. ACT: Read the daily series, then backfill and read the monthly series
+    daily = await balance_history_service.get_balance_series(
+        account_id, date(2025, 5, 1), date(2025, 5, 31)
+    )
+    await balance_history_service.backfill_rollups([account_id])
+    monthly = await balance_history_service.get_balance_series(
+        account_id, date(2025, 5, 1), date(2025, 5, 31), TimeResolution.MONTHLY
+    )
+
+    # 3. ASSERT: Every day is present and the month covers all six records
+    assert [bucket["period_start"] for bucket in daily] == [
+        date(2025, 5, day) for day in (1, 2, 3, 4, 5, 9)
+    ]
+    assert len(monthly) == 1
+    assert monthly[0]["open_balance"] == Decimal("50.00")
+    assert monthly[0]["close_balance"] == Decimal("10.00")
+    assert monthly[0]["high_balance"] == Decimal("250.00")
+    assert monthly[0]["record_count"] == 6
+
+
+async def test_get_balance_series_does_not_write_rollups(
+    balance_history_service: BalanceHistoryService,
+    balance_history_repository: BalanceHistoryRepository,
+    balance_history_rollup_repository: BalanceHistoryRollupRepository,
+    test_checking_account: Account,
+):
+    """Test that reads fill gaps from raw records and leave backfill to a job."""
+    account_id = test_checking_account.id
+    # 1. ARRANGE: Raw history in April, then a service write in June
+    for day, balance in ((10, "300.00"), (20, "200.00")):
+        await balance_history_repository.create(
+            {
+                "account_id": account_id,
+                "balance": Decimal(balance),
+                "timestamp": datetime(2025, 4, day, 12),
+            }
+        )
+    await record(balance_history_service, account_id, "90.00", datetime(2025, 6, 2, 12))
+
+    async def april_rollups():
+        return await balance_history_rollup_repository.get_rollups(
+            [account_id],
+            TimeResolution.MONTHLY,
+            datetime(2025, 4, 1),
+            datetime(2025, 4, 30),
+        )
+
+    # 2. ACT: Read a monthly series across both months, then backfill
+    series = await balance_history_service.get_balance_series(
+        account_id, date(2025, 4, 1), date(2025, 6, 30), TimeResolution.MONTHLY
+    )
+    rollups_after_read = await april_rollups()
+    summary = await balance_history_service.backfill_rollups()
+
+    # 3. ASSERT: The series is complete, and only the backfill stores April
+    assert [bucket["period_start"] for bucket in series] == [
+        date(2025, 4, 1),
+        date(2025, 6, 1),
+    ]
+    assert series[0]["record_count"] == 2
+    assert series[0]["close_balance"] == Decimal("200.00")
+    assert rollups_after_read == []
+    assert summary["daily"] == 3
+    april = await april_rollups()
+    assert len(april) == 1
+    assert april[0].record_count == 2
+    assert await balance_history_service.backfill_rollups() == {
+        "daily": 0,
+        "monthly": 0,
+    }
+
+
+async def test_apply_retention_policy_compacts_raw_records(
+    balance_history_service: BalanceHistoryService,
+    balance_history_repository: BalanceHistoryRepository,
+    test_checking_account: Account,
+):
+    """Test that old raw records are rolled up, then deleted unless annotated."""
+    account_id = test_checking_account.id
+    today = date(2025, 6, 30)
+    old_day = datetime(2025, 1, 15, 12)
+    for balance, notes in (("100.00", None), ("300.00", "Checked against bank")):
+        await balance_history_repository.create(
+            {
+                "account_id": account_id,
+                "balance": Decimal(balance),
+                "notes": notes,
+                "timestamp": old_day,
+            }
+        )
+    await balance_history_repository.create(
+        {
+            "account_id": account_id,
+            "balance": Decimal("50.00"),
+            "timestamp": datetime(2025, 6, 29, 12),
+        }
+    )
+
+    summary = await balance_history_service.apply_retention_policy(
+        raw_retention_days=90, daily_rollup_retention_days=90, as_of=today
+    )
+
+    remaining = await balance_history_repository.get_by_account(account_id)
+    january = await balance_history_service.get_balance_series(
+        account_id, date(2025, 1, 1), date(2025, 1, 31), TimeResolution.MONTHLY
+    )
+    assert summary["raw_records_deleted"] == 1
+    assert summary["daily_rollups_deleted"] == 1
+    assert sorted(r.balance for r in remaining) == [Decimal("50.00"), Decimal("300.00")]
+    assert january[0]["record_count"] == 2
+    assert january[0]["high_balance"] == Decimal("300.00")
+    assert january[0]["low_balance"] == Decimal("100.00")
+
+
+async def test_apply_retention_policy_rejects_short_daily_retention(
+    balance_history_service: BalanceHistoryService,
+):
+    """Test that daily rollups cannot expire before raw records."""
+    with pytest.raises(ValueError, match="Daily rollup retention"):
+        await balance_history_service.apply_retention_policy(
+            raw_retention_days=90, daily_rollup_retention_days=30
+        )
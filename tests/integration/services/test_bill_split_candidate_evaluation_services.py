@@ -0,0 +1,118 @@
+"""
+Integration tests for batch evaluation of candidate bill split allocations.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.models.account_types.banking.checking import CheckingAccount
+from src.models.account_types.banking.credit import CreditAccount
+from src.models.liabilities import Liability
+from src.schemas.bill_splits import SplitCandidate
+from src.services.bill_splits import BillSplitService, BillSplitValidationError
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(scope="function")
+def bill_split_service(db_session):
+    return BillSplitService(db_session)
+
+
+async def test_evaluate_split_candidates_ranks_feasible_first(
+    bill_split_service: BillSplitService,
+    test_liability: Liability,
+    test_checking_account: CheckingAccount,
+    test_credit_account: CreditAccount,
+):
+    """Test that candidates are scored and ranked with feasible ones first."""
+    # 1. ARRANGE: Liability of 100.00, checking has 1000.00, credit 500/2000 used
+    checking_id = test_checking_account.id
+    credit_id = test_credit_account.id
+    candidates = [
+        SplitCandidate(allocations={checking_id: Decimal("60.00")}, label="short"),
+        SplitCandidate(allocations={credit_id: Decimal("100.00")}, label="credit"),
+        SplitCandidate(allocations={checking_id: Decimal("100.00")}, label="checking"),
+        SplitCandidate(
+            allocations={checking_id: Decimal("50.00"), credit_id: Decimal("50.00")},
+            label="mixed",
+        ),
+    ]
+
+    # 2. ACT: Evaluate all candidates, keeping the best three
+    response = await bill_split_service.evaluate_split_candidates(
+        test_liability.id, candidates, top_k=3
+    )
+
+    # 3. ASSERT: Infeasible total is dropped and scores are descending
+    assert response.evaluated_count == 4
+    assert [result.label for result in response.results] == [
+        "checking",
+        "mixed",
+        "credit",
+    ]
+    assert all(result.is_feasible for result in response.results)
+    scores = [result.optimization_score for result in response.results]
+    assert scores == sorted(scores, reverse=True)
+
+    credit_result = response.results[2]
+    assert credit_result.credit_utilization[credit_id] == Decimal("0.3")
+    assert credit_result.short_term_impact[credit_id] == Decimal("-100.00")
+
+
+async def test_evaluate_split_candidates_flags_infeasible(
+    bill_split_service: BillSplitService,
+    test_liability: Liability,
+    test_checking_account: CheckingAccount,
+):
+    """Test that mismatched totals and missing accounts are marked infeasible."""
+    # 1. ARRANGE: One candidate short of the liability, one on a missing account
+    candidates = [
+        SplitCandidate(allocations={test_checking_account.id: Decimal("60.00")}),
+        SplitCandidate(
+            allocations={test_checking_account.id + 1000: Decimal("100.00")}
+        ),
+    ]
+
+    # 2. ACT: Evaluate the candidates
+    response = await bill_split_service.evaluate_split_candidates(
+        test_liability.id, candidates
+    )
+
+    # 3. ASSERT: Both are returned but neither is feasible
+    assert len(response.results) == 2
+    assert not any(result.is_feasible for result in response.results)
+    assert all(result.risk_factors for result in response.results)
+
+
+async def test_evaluate_split_candidates_excludes_own_splits(
+    bill_split_service: BillSplitService,
+    test_liability: Liability,
+    test_bill_splits,
+    test_checking_account: CheckingAccount,
+):
+    """Test that existing splits of the liability are not counted as obligations."""
+    # 1. ARRANGE: Liability already has 300.00 of splits on checking
+
+    # 2. ACT: Evaluate a candidate that would replace them
+    response = await bill_split_service.evaluate_split_candidates(
+        test_liability.id,
+        [SplitCandidate(allocations={test_checking_account.id: Decimal("100.00")})],
+    )
+
+    # 3. ASSERT: Only the candidate amount affects the projected balance
+    result = response.results[0]
+    assert result.short_term_impact[test_checking_account.id] == Decimal("-100.00")
+
+
+async def test_evaluate_split_candidates_unknown_liability(
+    bill_split_service: BillSplitService,
+    test_checking_account: CheckingAccount,
+):
+    """Test that evaluating against a missing liability raises."""
+    with pytest.raises(BillSplitValidationError):
+        await bill_split_service.evaluate_split_candidates(
+            99999,
+            [SplitCandidate(allocations={test_checking_account.id: Decimal("1.00")})],
+        )
@@ -0,0 +1,183 @@
+"""
+Integration tests for the cost-minimizing bill split optimizer.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.models.account_types.banking.checking import CheckingAccount
+from src.models.account_types.banking.credit import CreditAccount
+from src.models.bill_splits import BillSplit
+from src.models.categories import Category
+from src.models.income import Income
+from src.models.liabilities import Liability
+from src.services.bill_splits import BillSplitService, BillSplitValidationError
+from src.utils.datetime_utils import naive_first_day_of_month, naive_utc_now
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(scope="function")
+def bill_split_service(db_session):
+    return BillSplitService(db_session)
+
+
+async def create_liability(db_session, category, account, amount, due_date):
+    """Create an unpaid liability with the given account as primary."""
+    liability = Liability(
+        name=f"Bill due {due_date:%Y-%m-%d}",
+        amount=Decimal(amount),
+        due_date=due_date,
+        category_id=category.id,
+        primary_account_id=account.id,
+    )
+    db_session.add(liability)
+    await db_session.flush()
+    return liability
+
+
+async def test_optimize_splits_prefers_cash(
+    bill_split_service: BillSplitService,
+    test_liability: Liability,
+    test_checking_account: CheckingAccount,
+    test_credit_account: CreditAccount,
+):
+    """Test that a bill the checking account can cover costs no interest."""
+    # 1. ARRANGE: 100.00 liability, 1000.00 in checking
+
+    # 2. ACT: Optimize the split
+    result = await bill_split_service.optimize_splits(test_liability.id)
+
+    # 3. ASSERT: Everything is drawn from checking
+    assert result.is_feasible
+    assert result.estimated_interest == Decimal("0.00")
+    assert result.liabilities[0].allocations == {
+        test_checking_account.id: Decimal("100.00")
+    }
+
+
+async def test_optimize_splits_spills_to_credit(
+    db_session,
+    bill_split_service: BillSplitService,
+    test_category: Category,
+    test_checking_account: CheckingAccount,
+    test_credit_account: CreditAccount,
+):
+    """Test that only the shortfall is charged to credit, with interest estimated."""
+    # 1. ARRANGE: 1500.00 bill against 1000.00 cash and a 19.99% APR card
+    liability = await create_liability(
+        db_session,
+        test_category,
+        test_checking_account,
+        "1500.00",
+        naive_utc_now() + timedelta(days=5),
+    )
+
+    # 2. ACT: Optimize the split
+    result = await bill_split_service.optimize_splits(liability.id)
+
+    # 3. ASSERT: Checking is drained exactly, credit covers the rest
+    assert result.is_feasible
+    assert result.liabilities[0].allocations == {
+        test_checking_account.id: Decimal("1000.00"),
+        test_credit_account.id: Decimal("500.00"),
+    }
+    assert result.estimated_interest == Decimal("8.33")
+
+
+async def test_optimize_monthly_splits_accounts_for_cashflow(
+    db_session,
+    bill_split_service: BillSplitService,
+    test_category: Category,
+    test_checking_account: CheckingAccount,
+    test_credit_account: CreditAccount,
+):
+    """Test that the monthly solve honors income and later obligations."""
+    # 1. ARRANGE: Two 600.00 bills next month, 400.00 income between them and
+    # an existing 300.00 split on checking due after them
+    month_start = naive_first_day_of_month(naive_utc_now() + timedelta(days=32))
+    first = await create_liability(
+        db_session,
+        test_category,
+        test_checking_account,
+        "600.00",
+        month_start + timedelta(days=4),
+    )
+    second = await create_liability(
+        db_session,
+        test_category,
+        test_checking_account,
+        "600.00",
+        month_start + timedelta(days=9),
+    )
+    later = await create_liability(
+        db_session,
+        test_category,
+        test_checking_account,
+        "300.00",
+        month_start + timedelta(days=35),
+    )
+    db_session.add(
+        BillSplit(
+            liability_id=later.id,
+            account_id=test_checking_account.id,
+            amount=Decimal("300.00"),
+        )
+    )
+    db_session.add(
+        Income(
+            date=month_start + timedelta(days=6),
+            source="Paycheck",
+            amount=Decimal("400.00"),
+            deposited=False,
+            account_id=test_checking_account.id,
+        )
+    )
+    await db_session.flush()
+
+    # 2. ACT: Solve the month jointly
+    result = await bill_split_service.optimize_monthly_splits(
+        month_start.year, month_start.month
+    )
+
+    # 3. ASSERT: Checking funds 1100.00 so the later split stays covered
+    assert result.is_feasible
+    assert [item.liability_id for item in result.liabilities] == [first.id, second.id]
+    totals = {}
+    for item in result.liabilities:
+        assert sum(item.allocations.values()) == Decimal("600.00")
+        for account_id, amount in item.allocations.items():
+            totals[account_id] = totals.get(account_id, Decimal("0")) + amount
+    assert totals == {
+        test_checking_account.id: Decimal("1100.00"),
+        test_credit_account.id: Decimal("100.00"),
+    }
+
+
+async def test_optimize_splits_reports_shortfall(
+    db_session,
+    bill_split_service: BillSplitService,
+    test_category: Category,
+    test_checking_account: CheckingAccount,
+):
+    """Test that a bill larger than all funds is reported as not feasible."""
+    liability = await create_liability(
+        db_session,
+        test_category,
+        test_checking_account,
+        "1250.00",
+        naive_utc_now() + timedelta(days=5),
+    )
+
+    result = await bill_split_service.optimize_splits(liability.id)
+
+    assert not result.is_feasible
+    assert result.liabilities[0].unallocated_amount == Decimal("250.00")
+
+
+async def test_optimize_splits_unknown_liability(bill_split_service: BillSplitService):
+    """Test that optimizing a missing liability raises."""
+    with pytest.raises(BillSplitValidationError):
+        await bill_split_service.optimize_splits(99999)
@@ -9,6 +9,7 @@ from src.services.bulk_import import BulkImportPreview, BulkImportService
 from src.services.categories import CategoryService
 from src.services.income import IncomeService
 from src.services.liabilities import LiabilityService
+from src.utils.datetime_utils import utc_datetime, utc_now
 
 TEST_DATA_DIR = Path(__file__).parent / "test_data"
 
@@ -50,7 +51,9 @@ def bulk_import_service(db_session):
     liability_service = LiabilityService(db_session)
     income_service = IncomeService(db_session)
     category_service = CategoryService(db_session)
-    return BulkImportService(liability_service, income_service, category_service)
+    return BulkImportService(
+        db_session, liability_service, income_service, category_service
+    )
 
 
 @pytest.mark.asyncio
@@ -236,3 +239,24 @@ async def test_preview_mode_income(bulk_import_service, valid_income_file, reque
     assert result.total_records == 2
     assert len(result.records) == 2
     assert len(result.validation_errors) == 0
+
+
+@pytest.mark.asyncio
+async def test_validate_liability_record_due_date(
+    bulk_import_service, test_checking_account
+):
+    """Test that imported due dates are UTC-aware datetimes in the current year"""
+    record = {
+        "bill_name": "Rent",
+        "amount": "1200.00",
+        "month": "3",
+        "day_of_month": "15",
+        "account_name": "Housing",
+        "primary_account_id": str(test_checking_account.id),
+    }
+
+    liability, error = await bulk_import_service.validate_liability_record(record, 1)
+
+    assert error is None
+    assert liability.due_date == utc_datetime(utc_now().year, 3, 15)
+    assert liability.due_date.tzinfo is not None
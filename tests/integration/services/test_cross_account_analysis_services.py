@@ -294,3 +294,45 @@ async def test_get_cross_account_analysis(db_session):
     assert isinstance(analysis.balance_distribution, dict)
     assert isinstance(analysis.risk_assessment, dict)
     assert analysis.timestamp == datetime.now().date()
+
+
+@pytest.mark.asyncio
+async def test_credit_utilization_uses_credit_limit(db_session, test_credit_account):
+    """Test that credit utilization is measured against the credit limit."""
+    service = RealtimeCashflowService(db_session)
+
+    usage_patterns = await service.analyze_usage_patterns()
+    risks = await service.assess_account_risks()
+
+    # $500 owed against a $2,000 limit
+    assert usage_patterns[test_credit_account.id].utilization_rate == Decimal("0.25")
+    assert risks[test_credit_account.id].credit_utilization_risk == Decimal("0.25")
+    assert risks[test_credit_account.id].overdraft_risk == Decimal("0")
+
+
+@pytest.mark.asyncio
+async def test_cross_account_ratios_are_rounded(db_session, test_credit_account):
+    """Test that repeating-decimal ratios are rounded for the schemas."""
+    test_credit_account.credit_limit = Decimal("3000.00")
+    await db_session.flush()
+    service = RealtimeCashflowService(db_session)
+
+    usage_patterns = await service.analyze_usage_patterns()
+    risks = await service.assess_account_risks()
+
+    # $500 owed against a $3,000 limit
+    assert usage_patterns[test_credit_account.id].utilization_rate == Decimal("0.1667")
+    assert risks[test_credit_account.id].credit_utilization_risk == Decimal("0.1667")
+
+
+@pytest.mark.asyncio
+async def test_analysis_loads_credit_columns_up_front(db_session, test_credit_account):
+    """Test that analysis reads credit limits without lazy loading them."""
+    account_id = test_credit_account.id
+    # Start from an empty identity map so accounts are loaded by the query
+    db_session.expunge_all()
+    service = RealtimeCashflowService(db_session)
+
+    risks = await service.assess_account_risks()
+
+    assert risks[account_id].credit_utilization_risk == Decimal("0.25")
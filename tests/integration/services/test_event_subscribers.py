@@ -0,0 +1,98 @@
+"""
+Integration tests for derived data maintained from domain events.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.models.balance_history import BalanceHistory
+from src.models.balance_history_rollups import BalanceHistoryRollup
+from src.models.transaction_history import TransactionType
+from src.schemas.transaction_history import TransactionHistoryCreate
+from src.services.event_subscribers import register_event_subscribers
+from src.services.transactions import TransactionService
+from src.utils.config import settings
+from src.utils.datetime_utils import utc_now
+from src.utils.domain_events import domain_events
+
+
+@pytest.fixture
+async def subscribers(file_engine, monkeypatch):
+    """Derived data subscribers registered on the process-wide bus."""
+    monkeypatch.setattr(settings, "BALANCE_HISTORY_FROM_EVENTS", True)
+    session_factory = sessionmaker(
+        file_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    handlers = register_event_subscribers(domain_events, session_factory)
+    yield session_factory
+    await domain_events.drain()
+    for handler in handlers:
+        domain_events.unsubscribe(handler)
+
+
+async def _create(session, account_id, amount, transaction_type):
+    await TransactionService(session).create_transaction(
+        account_id,
+        TransactionHistoryCreate(
+            account_id=account_id,
+            amount=Decimal(amount),
+            transaction_type=transaction_type,
+            transaction_date=utc_now(),
+        ),
+    )
+
+
+async def test_committed_transactions_record_balance_history(subscribers):
+    """Test that a burst of transactions records one entry per account."""
+    async with subscribers() as session:
+        await _create(session, 1, "100.00", TransactionType.DEBIT)
+        await _create(session, 2, "50.00", TransactionType.DEBIT)
+        await session.commit()
+    async with subscribers() as session:
+        await _create(session, 1, "25.00", TransactionType.CREDIT)
+        await session.commit()
+
+    await domain_events.drain()
+
+    async with subscribers() as session:
+        entries = (
+            (await session.execute(select(BalanceHistory).order_by("account_id")))
+            .scalars()
+            .all()
+        )
+        rollups = (await session.execute(select(BalanceHistoryRollup))).scalars().all()
+
+    assert [(entry.account_id, entry.balance) for entry in entries] == [
+        (1, Decimal("925.00")),
+        (2, Decimal("-250.00")),
+    ]
+    assert entries[0].available_credit is None
+    assert entries[1].available_credit == Decimal("750.00")
+    assert {rollup.account_id for rollup in rollups} == {1, 2}
+
+
+async def test_rolled_back_transactions_record_nothing(subscribers):
+    """Test that no balance history is recorded for a rolled back write."""
+    async with subscribers() as session:
+        await _create(session, 1, "100.00", TransactionType.DEBIT)
+        await session.rollback()
+
+    await domain_events.drain()
+
+    async with subscribers() as session:
+        entries = (await session.execute(select(BalanceHistory))).scalars().all()
+    assert entries == []
+
+
+def test_balance_history_subscriber_is_opt_in(file_engine):
+    """Test that no subscriber is registered unless enabled in settings."""
+    assert not settings.BALANCE_HISTORY_FROM_EVENTS
+    session_factory = sessionmaker(
+        file_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    assert register_event_subscribers(domain_events, session_factory) == []
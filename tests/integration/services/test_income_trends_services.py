@@ -253,3 +253,38 @@ async def test_filtered_source_analysis(
     assert result.patterns[0].source == "Weekly Job"
     assert len(result.source_statistics) == 1
     assert result.source_statistics[0].source == "Weekly Job"
+
+
+async def test_fractional_averages_are_rounded(db_session):
+    """Test that averages with repeating decimals are rounded for the schemas"""
+    # Arrange
+    service = IncomeTrendsService(db_session)
+    base_date = date(2024, 1, 1)
+    for i, amount in enumerate(["100.00", "100.00", "101.00"]):
+        db_session.add(
+            Income(
+                date=base_date + timedelta(weeks=i),
+                source="Side Job",
+                amount=Decimal(amount),
+                deposited=True,
+                undeposited_amount=Decimal("0.00"),
+                created_at=base_date,
+                updated_at=base_date,
+                account_id=1,
+            )
+        )
+    await db_session.commit()
+
+    request = IncomeTrendsRequest(
+        start_date=utc_datetime(2024, 1, 1), end_date=utc_datetime(2024, 12, 31)
+    )
+
+    # Act
+    result = await service.analyze_trends(request)
+
+    # Assert
+    pattern = next(p for p in result.patterns if p.source == "Side Job")
+    stats = next(s for s in result.source_statistics if s.source == "Side Job")
+    assert pattern.average_amount == Decimal("100.33")
+    assert stats.average_amount == Decimal("100.33")
+    assert stats.standard_deviation == pytest.approx(0.58)
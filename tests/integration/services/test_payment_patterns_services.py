@@ -5,7 +5,8 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.accounts import Account
+from src.models.account_types.banking.checking import CheckingAccount
+from src.models.account_types.banking.credit import CreditAccount
 from src.models.categories import Category
 from src.models.liabilities import Liability, LiabilityStatus
 from src.models.payments import Payment, PaymentSource
@@ -18,19 +19,19 @@ async def test_accounts(db_session: AsyncSession):
     """Create test accounts for payment patterns"""
     now = datetime.now(timezone.utc)
     accounts = [
-        Account(
+        CreditAccount(
             name="Test Credit",
-            type="credit",
             available_balance=Decimal("-500"),
-            total_limit=Decimal("1000"),
+            current_balance=Decimal("500"),
+            credit_limit=Decimal("1000"),
             available_credit=Decimal("500"),
             created_at=now,
             updated_at=now,
         ),
-        Account(
+        CheckingAccount(
             name="Test Checking",
-            type="checking",
             available_balance=Decimal("1000"),
+            current_balance=Decimal("1000"),
             created_at=now,
             updated_at=now,
         ),
@@ -4,11 +4,14 @@ from decimal import Decimal
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.account_types.banking.checking import CheckingAccount
+from src.models.account_types.banking.credit import CreditAccount
 from src.models.accounts import Account
 from src.models.liabilities import Liability
 from src.models.payments import Payment
 from src.schemas.payments import PaymentCreate, PaymentSourceCreate, PaymentUpdate
 from src.services.payments import PaymentService
+from src.utils.instrumentation import instrument_engine, request_metrics_scope
 
 
 @pytest.fixture(scope="function")
@@ -332,3 +335,42 @@ async def test_get_payments_for_account(
     # Get payments for non-existent account
     payments = await payment_service.get_payments_for_account(99999)
     assert len(payments) == 0
+
+
+@pytest.mark.asyncio
+async def test_validate_account_availability_loads_sources_in_one_query(
+    payment_service: PaymentService, db_engine, db_session: AsyncSession
+):
+    """Test that all source accounts are resolved with a single SELECT"""
+    accounts = [
+        CheckingAccount(
+            name=f"Source Checking {i}",
+            available_balance=Decimal("500.00"),
+            current_balance=Decimal("500.00"),
+        )
+        for i in range(5)
+    ]
+    accounts.append(
+        CreditAccount(
+            name="Source Credit",
+            current_balance=Decimal("200.00"),
+            available_balance=Decimal("-200.00"),
+            credit_limit=Decimal("1000.00"),
+            available_credit=Decimal("800.00"),
+        )
+    )
+    db_session.add_all(accounts)
+    await db_session.flush()
+    sources = [
+        {"account_id": account.id, "amount": Decimal("100.00")} for account in accounts
+    ]
+    # Start from an empty identity map, as a new request would
+    db_session.expunge_all()
+    instrument_engine(db_engine)
+
+    with request_metrics_scope() as metrics:
+        valid, error = await payment_service.validate_account_availability(sources)
+
+    assert valid is True
+    assert error is None
+    assert metrics.statement_count == 1
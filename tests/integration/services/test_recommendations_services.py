@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.account_types.banking.checking import CheckingAccount
 from src.models.accounts import Account
 from src.models.categories import Category
 from src.models.liabilities import Liability, LiabilityStatus
@@ -12,6 +13,8 @@ from src.models.payments import Payment, PaymentSource
 from src.schemas.payment_patterns import PatternType
 from src.schemas.recommendations import ConfidenceLevel
 from src.services.recommendations import RecommendationService
+from src.utils.datetime_utils import naive_utc_now
+from src.utils.instrumentation import instrument_engine, request_metrics_scope
 
 
 @pytest.fixture(scope="function")
@@ -239,3 +242,73 @@ async def test_credit_utilization_calculation(
 
     # Additional 100 should increase utilization to 60%
     assert adjusted_utilization == Decimal("60")
+
+
+async def _seed_bills_with_history(
+    db_session: AsyncSession, category: Category, name: str, count: int
+) -> CheckingAccount:
+    """Create bills each paid on a regular monthly schedule from one account."""
+    account = CheckingAccount(
+        name=f"{name} Checking",
+        available_balance=Decimal("5000.00"),
+        current_balance=Decimal("5000.00"),
+        created_at=naive_utc_now(),
+        updated_at=naive_utc_now(),
+    )
+    db_session.add(account)
+    await db_session.flush()
+
+    now = naive_utc_now()
+    for index in range(count):
+        bill = Liability(
+            name=f"{name} Bill {index}",
+            amount=Decimal("75.00"),
+            due_date=now + timedelta(days=10 + index),
+            category_id=category.id,
+            primary_account_id=account.id,
+            active=True,
+            paid=False,
+            status=LiabilityStatus.PENDING,
+            created_at=now,
+            updated_at=now,
+        )
+        db_session.add(bill)
+        await db_session.flush()
+        for month in range(1, 4):
+            payment = Payment(
+                liability_id=bill.id,
+                amount=Decimal("75.00"),
+                payment_date=now - timedelta(days=30 * month),
+                category="Utilities",
+                created_at=now,
+                updated_at=now,
+            )
+            payment.sources = [
+                PaymentSource(account_id=account.id, amount=Decimal("75.00"))
+            ]
+            db_session.add(payment)
+    await db_session.flush()
+    return account
+
+
+@pytest.mark.asyncio
+async def test_recommendation_statement_count_independent_of_bill_count(
+    db_session: AsyncSession, db_engine, test_category: Category
+):
+    """Recommendations for many bills run the same statements as for one."""
+    service = RecommendationService(db_session)
+    instrument_engine(db_engine)
+
+    account = await _seed_bills_with_history(db_session, test_category, "Single", 1)
+    with request_metrics_scope() as single:
+        response = await service.get_bill_payment_recommendations()
+    assert len(response.recommendations) == 1
+    assert response.recommendations[0].affected_accounts == [account.id]
+
+    await _seed_bills_with_history(db_session, test_category, "Several", 4)
+    db_session.expunge_all()
+    with request_metrics_scope() as several:
+        response = await service.get_bill_payment_recommendations()
+    assert len(response.recommendations) == 5
+
+    assert several.statement_count == single.statement_count
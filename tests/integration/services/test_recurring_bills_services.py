@@ -8,8 +8,10 @@ from src.models.accounts import Account
 from src.models.categories import Category
 from src.models.liabilities import Liability
 from src.models.recurring_bills import RecurringBill
+from src.repositories.liabilities import LiabilityRepository
 from src.schemas.recurring_bills import RecurringBillCreate, RecurringBillUpdate
 from src.services.recurring_bills import RecurringBillService
+from src.utils.instrumentation import instrument_engine, request_metrics_scope
 
 
 @pytest.fixture
@@ -346,3 +348,57 @@ async def test_liability_datetime_handling(
     assert liability.due_date.hour == 0
     assert liability.due_date.minute == 0
     assert liability.due_date.second == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_bills_for_month_range(
+    db_session: AsyncSession, db_engine, test_recurring_bill: RecurringBill
+):
+    """Test a year of bills is generated set-based and only once"""
+    service = RecurringBillService(db_session)
+    second_bill = RecurringBill(
+        bill_name="Month End Bill",
+        amount=Decimal("30.00"),
+        day_of_month=31,
+        account_id=test_recurring_bill.account_id,
+        category_id=test_recurring_bill.category_id,
+        active=True,
+    )
+    db_session.add(second_bill)
+    await db_session.flush()
+    instrument_engine(db_engine)
+
+    with request_metrics_scope() as metrics:
+        generated = await service.generate_bills_for_month(1, 2025, months=12)
+
+    # Templates, existing due dates and one INSERT, however many rows
+    assert metrics.statement_count == 3
+    assert len(generated) == 24
+    month_end_dates = [
+        bill.due_date.date()
+        for bill in generated
+        if bill.recurring_bill_id == second_bill.id
+    ]
+    assert date(2025, 2, 28) in month_end_dates
+    assert date(2025, 4, 30) in month_end_dates
+    assert all(bill.recurring for bill in generated)
+
+    # Generating an overlapping run only adds the months not generated yet
+    generated = await service.generate_bills_for_month(12, 2025, months=2)
+    assert sorted(bill.due_date.date() for bill in generated) == [
+        date(2026, 1, 15),
+        date(2026, 1, 31),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generated_bill_uniqueness(
+    db_session: AsyncSession, test_recurring_bill: RecurringBill
+):
+    """Test the unique constraint skips liabilities that already exist"""
+    service = RecurringBillService(db_session)
+    liability_repo = LiabilityRepository(db_session)
+    rows = [service._liability_values(test_recurring_bill, 6, 2025)]
+
+    assert len(await liability_repo.insert_generated(rows)) == 1
+    assert await liability_repo.insert_generated(rows) == []
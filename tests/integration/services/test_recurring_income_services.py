@@ -317,3 +317,28 @@ async def test_cascade_delete_income_entries(
     for entry_id in entry_ids:
         result = await db_session.get(Income, entry_id)
         assert result is None
+
+
+async def test_generate_income_for_month_range(
+    db_session: AsyncSession, test_recurring_income_with_category: RecurringIncome
+):
+    """Test generating several months of income entries at once."""
+    service = RecurringIncomeService(db_session)
+    request = GenerateIncomeRequest(month=11, year=2025, months=3)
+
+    results = await service.generate_income(request)
+
+    assert [(entry.date.year, entry.date.month) for entry in results] == [
+        (2025, 11),
+        (2025, 12),
+        (2026, 1),
+    ]
+    assert all(
+        entry.category.id == test_recurring_income_with_category.category_id
+        for entry in results
+    )
+
+    # Months already generated are skipped
+    request = GenerateIncomeRequest(month=12, year=2025, months=3)
+    results = await service.generate_income(request)
+    assert [(entry.date.year, entry.date.month) for entry in results] == [(2026, 2)]
@@ -0,0 +1,73 @@
+"""
+Integration tests for running independent service steps concurrently.
+"""
+
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services.realtime_cashflow import RealtimeCashflowService
+
+
+async def test_run_independent_uses_sibling_sessions(file_engine):
+    """Test that steps on an engine-bound session each get their own session."""
+    async with AsyncSession(file_engine, expire_on_commit=False) as session:
+        service = RealtimeCashflowService(session)
+
+        sessions = await service._run_independent(
+            lambda sibling: _session_of(sibling),
+            lambda sibling: _session_of(sibling),
+            limit=2,
+        )
+
+    assert len({id(s) for s in sessions}) == 2
+    assert session not in sessions
+
+
+async def test_run_independent_is_sequential_on_connection(db_session):
+    """Test that a connection-bound session runs every step on the service itself."""
+    service = RealtimeCashflowService(db_session)
+
+    services = await service._run_independent(
+        lambda same: _identity(same), lambda same: _identity(same)
+    )
+
+    assert services == [service, service]
+
+
+async def test_realtime_cashflow_matches_sequential_result(file_engine):
+    """Test that concurrent and sequential cashflow snapshots agree."""
+    async with AsyncSession(file_engine, expire_on_commit=False) as session:
+        service = RealtimeCashflowService(session)
+        concurrent = await service.get_realtime_cashflow()
+
+    async with AsyncSession(file_engine, expire_on_commit=False) as session:
+        service = RealtimeCashflowService(session)
+        (sequential,) = await service._run_independent(
+            lambda same: same.get_realtime_cashflow(), limit=1
+        )
+
+    assert len(concurrent.account_balances) == 2
+    assert concurrent.total_available_funds == Decimal("1000.00")
+    assert concurrent.total_available_credit == Decimal("800.00")
+    assert concurrent.model_dump(exclude={"timestamp"}) == sequential.model_dump(
+        exclude={"timestamp"}
+    )
+
+
+async def _session_of(service):
+    return service._session
+
+
+async def _identity(service):
+    return service
+
+
+async def test_cross_account_analysis_runs_concurrently(file_engine):
+    """Test that the cross-account analyses complete on sibling sessions."""
+    async with AsyncSession(file_engine, expire_on_commit=False) as session:
+        service = RealtimeCashflowService(session)
+        analysis = await service.get_cross_account_analysis()
+
+    assert set(analysis.usage_patterns) == set(analysis.risk_assessment)
+    assert len(analysis.risk_assessment) == 2
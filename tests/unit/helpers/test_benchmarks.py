@@ -0,0 +1,102 @@
+"""
+Unit tests for the benchmark harness.
+"""
+
+from tests.helpers.benchmarks import (
+    BenchmarkResult,
+    BenchmarkRunner,
+    load_results,
+    load_statement_baseline,
+    save_results,
+    save_statement_baseline,
+)
+
+
+def make_result(median_ms: float = 10.0, statements: int = 5) -> BenchmarkResult:
+    return BenchmarkResult(
+        name="example",
+        rounds=5,
+        median_ms=median_ms,
+        min_ms=median_ms,
+        max_ms=median_ms,
+        statements=statements,
+    )
+
+
+def test_results_round_trip(tmp_path):
+    """Test that saved results load back unchanged."""
+    path = tmp_path / "nested" / "results.json"
+    results = {"example": make_result()}
+
+    save_results(path, results)
+
+    assert load_results(path) == results
+    assert load_results(tmp_path / "missing.json") == {}
+
+
+def test_statement_baseline_round_trip(tmp_path):
+    """Test that the statement baseline stores counts only."""
+    path = tmp_path / "baseline.json"
+
+    save_statement_baseline(path, {"example": 5})
+
+    assert "median_ms" not in path.read_text()
+    assert load_statement_baseline(path) == {"example": 5}
+    assert load_statement_baseline(tmp_path / "missing.json") == {}
+
+
+def test_statement_increase_is_regression():
+    """Test that any additional SQL statement is reported."""
+    runner = BenchmarkRunner(statements={"example": 5})
+
+    assert runner.regressions(make_result(statements=5)) == []
+    assert runner.regressions(make_result(statements=4)) == []
+    assert "6 SQL statements" in runner.regressions(make_result(statements=6))[0]
+
+
+def test_timing_regression_respects_tolerance_and_floor():
+    """Test that small or within-tolerance slowdowns are not regressions."""
+    runner = BenchmarkRunner(
+        statements={},
+        timings={"example": make_result(median_ms=100.0)},
+        tolerance=0.5,
+        min_delta_ms=5.0,
+    )
+    assert runner.regressions(make_result(median_ms=150.0)) == []
+    assert runner.regressions(make_result(median_ms=151.0))
+
+    fast_runner = BenchmarkRunner(
+        statements={}, timings={"example": make_result(median_ms=2.0)}
+    )
+    assert fast_runner.regressions(make_result(median_ms=26.9)) == []
+    assert fast_runner.regressions(make_result(median_ms=27.1))
+
+
+def test_unknown_benchmark_has_no_baseline():
+    """Test that benchmarks missing from the baseline always pass."""
+    runner = BenchmarkRunner(statements={})
+
+    assert runner.regressions(make_result(median_ms=1e6, statements=1000)) == []
+
+
+def test_timings_without_local_baseline_are_not_checked():
+    """Test that only statement counts are enforced without local timings."""
+    runner = BenchmarkRunner(statements={"example": 5})
+
+    assert runner.regressions(make_result(median_ms=1e6, statements=5)) == []
+
+
+async def test_measure_records_result():
+    """Test that measure times every round and stores the result."""
+    calls = []
+
+    async def operation():
+        calls.append(None)
+
+    runner = BenchmarkRunner(statements={})
+    result = await runner.measure("noop", operation, rounds=3, warmup=2)
+
+    assert len(calls) == 5
+    assert result.rounds == 3
+    assert result.statements == 0
+    assert runner.results["noop"] is result
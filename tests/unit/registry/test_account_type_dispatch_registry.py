@@ -0,0 +1,65 @@
+"""
+Unit tests for account type dispatch tables.
+
+These tests verify that dispatch tables resolve type-specific modules once,
+expose only public coroutine functions and cannot be mutated.
+"""
+
+import pytest
+
+from src.registry.account_type_dispatch import (
+    AccountTypeDispatchTable,
+    known_account_types,
+)
+from src.repositories.factory import RepositoryFactory
+from src.services.account_types.banking import checking as checking_service
+from src.services.factory import ServiceFactory
+
+
+def test_from_modules_collects_public_coroutines():
+    """Test that tables map account types to their module's functions."""
+    table = AccountTypeDispatchTable.from_modules(
+        {
+            "checking": "src.services.account_types.banking.checking",
+            "savings": "src.services.account_types.banking.does_not_exist",
+            "unmapped": None,
+        }
+    )
+
+    assert table.account_types == frozenset({"checking"})
+    assert table.get("checking", "validate_create") is checking_service.validate_create
+    assert table.get("checking", "missing_function") is None
+    assert table.get("savings", "validate_create") is None
+    assert dict(table.functions("unmapped")) == {}
+    assert all(not name.startswith("_") for name in table.functions("checking"))
+
+
+def test_dispatch_table_is_immutable():
+    """Test that neither level of the table can be modified."""
+    table = AccountTypeDispatchTable.from_modules(
+        {"checking": "src.services.account_types.banking.checking"}
+    )
+
+    with pytest.raises(TypeError):
+        table.functions("checking")["validate_create"] = None
+    with pytest.raises(TypeError):
+        table._functions["savings"] = {}
+
+
+def test_factories_share_process_wide_tables():
+    """Test that factory tables are built once and reused."""
+    assert ServiceFactory.get_dispatch_table() is ServiceFactory.get_dispatch_table()
+    assert (
+        RepositoryFactory.get_dispatch_table() is RepositoryFactory.get_dispatch_table()
+    )
+    assert ServiceFactory.get_dispatch_table().get("checking", "update_overview")
+    assert RepositoryFactory.get_dispatch_table().account_types
+
+
+def test_known_account_types_includes_registered_and_defaults():
+    """Test that registered types come first and defaults are de-duplicated."""
+    types = known_account_types(["checking", "mortgage"])
+
+    assert "checking" in types
+    assert types.count("checking") == 1
+    assert types[-1] == "mortgage"
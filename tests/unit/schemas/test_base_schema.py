@@ -964,3 +964,80 @@ def test_update_model_without_flag():
     # Manually run the validator
     result = model.validate_required_fields_not_none()
     assert result is model  # Should return self unchanged
+
+
+class MixedFieldsModel(BaseSchemaValidator):
+    """Model mixing datetime-capable, decimal dictionary and plain fields."""
+
+    name: str
+    occurred_at: datetime
+    reviewed_at: Optional[datetime] = None
+    payload: object = None
+    tags: List[datetime] = []
+    shares: MoneyDict = {}
+
+
+def test_field_metadata_lists_only_relevant_fields():
+    """Test that validators are pointed at the fields they need to check."""
+    from src.schemas.base_schema import _field_metadata
+
+    metadata = _field_metadata(MixedFieldsModel)
+
+    assert metadata.datetime_fields == ("occurred_at", "reviewed_at", "payload")
+    assert metadata.decimal_dict_fields == (("shares", "money"),)
+    # Computed per class, so subclasses with more fields get their own
+    assert _field_metadata(DictionaryModel) is not metadata
+    assert _field_metadata(MixedFieldsModel) is metadata
+
+
+def test_datetime_held_by_untyped_field_is_validated():
+    """Test that a datetime in an object field is still checked for UTC."""
+    eastern = datetime.now(ZoneInfo("America/New_York"))
+
+    with pytest.raises(ValidationError, match="must have UTC timezone"):
+        MixedFieldsModel(name="Test", occurred_at=utc_now(), payload=eastern)
+
+
+def test_model_validate_does_not_modify_source_object():
+    """Test that naive datetimes are converted on a copy of the object's dict."""
+
+    class Row:
+        def __init__(self):
+            self.name = "Row"
+            self.occurred_at = datetime(2025, 1, 1, 12, 0)
+
+    row = Row()
+    model = MixedFieldsModel.model_validate(row)
+
+    assert model.occurred_at == utc_datetime(2025, 1, 1, 12, 0)
+    assert row.occurred_at.tzinfo is None
+
+
+def test_model_validate_list():
+    """Test validating many objects and dictionaries in one call."""
+
+    class Row:
+        def __init__(self, index):
+            self.name = f"Row {index}"
+            self.occurred_at = datetime(2025, 1, index + 1)
+
+    rows = [Row(index) for index in range(3)]
+    models = MixedFieldsModel.model_validate_list(
+        rows + [{"name": "Dict", "occurred_at": utc_datetime(2025, 2, 1)}]
+    )
+
+    assert [model.name for model in models] == ["Row 0", "Row 1", "Row 2", "Dict"]
+    assert all(is_adr011_compliant(model.occurred_at) for model in models)
+    assert models[1].occurred_at == utc_datetime(2025, 1, 2)
+    assert MixedFieldsModel.model_validate_list([]) == []
+
+    with pytest.raises(ValidationError, match="multiple of 0.01"):
+        MixedFieldsModel.model_validate_list(
+            [
+                {
+                    "name": "Bad",
+                    "occurred_at": utc_now(),
+                    "shares": {"a": Decimal("1.001")},
+                }
+            ]
+        )
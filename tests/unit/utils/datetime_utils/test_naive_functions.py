@@ -19,6 +19,7 @@ from src.utils.datetime_utils import (
     naive_start_of_day,
     naive_utc_datetime_from_str,
     naive_utc_from_date,
+    naive_utc_month_day,
     naive_utc_now,
 )
 
@@ -327,3 +328,16 @@ def test_naive_safe_end_date():
     # Should be February 29 (end of month in leap year)
     assert end.date() == date(2024, 2, 29)
     assert end.tzinfo is None
+
+
+def test_naive_utc_month_day():
+    """Test naive_utc_month_day clamps the day to the month's length."""
+    # Day within the month
+    result = naive_utc_month_day(2025, 3, 15)
+    assert result == datetime(2025, 3, 15)
+    assert result.tzinfo is None
+
+    # Day past the end of a short month
+    assert naive_utc_month_day(2025, 2, 31) == datetime(2025, 2, 28)
+    assert naive_utc_month_day(2024, 2, 31) == datetime(2024, 2, 29)
+    assert naive_utc_month_day(2025, 4, 31) == datetime(2025, 4, 30)
@@ -12,6 +12,7 @@ from src.utils.datetime_utils import (
     date_range,
     end_of_day,
     is_month_boundary,
+    month_sequence,
     naive_date_range,
     safe_end_date,
     start_of_day,
@@ -210,3 +211,12 @@ def test_naive_date_range_with_no_timezone():
     # This should work but strip timezone
     dates_from_utc = naive_date_range(start_utc, end_utc)
     assert all(d.tzinfo is None for d in dates_from_utc)
+
+
+def test_month_sequence():
+    """Test month_sequence lists consecutive months across year boundaries."""
+    assert month_sequence(2025, 3, 1) == [(2025, 3)]
+    assert month_sequence(2025, 11, 3) == [(2025, 11), (2025, 12), (2026, 1)]
+    assert len(month_sequence(2025, 1, 24)) == 24
+    assert month_sequence(2025, 1, 24)[-1] == (2026, 12)
+    assert month_sequence(2025, 1, 0) == []
@@ -0,0 +1,90 @@
+"""
+Unit tests for the Monte Carlo cashflow simulation.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.cashflow_simulation import (
+    IncomeStream,
+    SimulationInputs,
+    VariableBill,
+    simulate,
+)
+
+
+def test_simulate_without_uncertainty_is_deterministic():
+    """Test that fixed flows alone give identical paths and exact bands."""
+    inputs = SimulationInputs(
+        days=5,
+        starting_balance=10.0,
+        fixed_flows=[1.0, 2.0, 3.0, -20.0, 0.0],
+        bills=[VariableBill(day=1, amount=2.0, std_dev=0.0)],
+    )
+
+    bands = simulate(inputs, paths=50, seed=7)
+
+    expected = [11.0, 11.0, 14.0, -6.0, -6.0]
+    for band in bands.bands:
+        assert band.tolist() == expected
+    assert bands.mean.tolist() == expected
+    assert bands.overdraft_probability.tolist() == [0.0, 0.0, 0.0, 1.0, 1.0]
+    assert bands.horizon_overdraft_probability == 1.0
+
+
+def test_simulate_is_reproducible_with_seed():
+    """Test that a seed reproduces the same bands."""
+    inputs = SimulationInputs(
+        days=60,
+        starting_balance=500.0,
+        fixed_flows=[0.0] * 60,
+        bills=[VariableBill(day=20, amount=900.0, std_dev=150.0)],
+        income=[IncomeStream(3.0, 14.0, 1.0, 400.0, 40.0)],
+    )
+
+    first = simulate(inputs, paths=2000, seed=11, batch_size=250)
+    second = simulate(inputs, paths=2000, seed=11, batch_size=250)
+
+    np.testing.assert_array_equal(first.bands, second.bands)
+    assert first.bands.shape == (5, 60)
+    # Percentiles are ordered on every day
+    assert np.all(np.diff(first.bands, axis=0) >= 0)
+
+
+def test_simulate_overdraft_probability_follows_bill_spread():
+    """Test that a bill centred on the balance overdraws about half the paths."""
+    inputs = SimulationInputs(
+        days=3,
+        starting_balance=1000.0,
+        fixed_flows=[0.0, 0.0, 0.0],
+        bills=[VariableBill(day=1, amount=1000.0, std_dev=100.0)],
+    )
+
+    bands = simulate(inputs, paths=20000, seed=3, threshold=0.0)
+
+    assert bands.overdraft_probability[0] == 0.0
+    assert bands.overdraft_probability[1] == pytest.approx(0.5, abs=0.02)
+    assert bands.horizon_overdraft_probability == pytest.approx(0.5, abs=0.02)
+
+
+def test_simulate_income_arrives_every_interval():
+    """Test that income streams repeat from their first expected day."""
+    inputs = SimulationInputs(
+        days=30,
+        starting_balance=0.0,
+        fixed_flows=[0.0] * 30,
+        income=[IncomeStream(-4.0, 7.0, 0.0, 100.0, 0.0)],
+    )
+
+    bands = simulate(inputs, paths=10, seed=0)
+
+    # Occurrences on days 3, 10, 17 and 24 of the horizon
+    assert bands.mean[2] == 0.0
+    assert bands.mean[3] == 100.0
+    assert bands.mean[29] == 400.0
+
+
+def test_simulate_rejects_mismatched_fixed_flows():
+    """Test that fixed flows must cover every day."""
+    with pytest.raises(ValueError, match="one value per day"):
+        simulate(SimulationInputs(3, 0.0, [0.0, 0.0]), paths=10)
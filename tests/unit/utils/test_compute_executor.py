@@ -0,0 +1,90 @@
+"""
+Unit tests for the compute executor.
+"""
+
+import os
+import threading
+from decimal import Decimal
+
+import pytest
+
+from src.services.bill_splits import BillSplitService
+from src.utils.compute_executor import ComputeExecutor
+from src.utils.datetime_utils import utc_datetime
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+async def test_inline_executor_runs_on_the_event_loop_thread():
+    """Test that the inline executor calls the function directly."""
+    executor = ComputeExecutor("inline")
+
+    assert await executor.run(_thread_name) == threading.current_thread().name
+    assert await executor.run(divmod, 17, 5) == (3, 2)
+
+
+async def test_thread_executor_runs_on_a_worker_thread():
+    """Test that the thread executor runs functions off the loop thread."""
+    executor = ComputeExecutor("thread", max_workers=1)
+    try:
+        assert (await executor.run(_thread_name)).startswith("compute")
+        assert await executor.run(sorted, [3, 1, 2], reverse=True) == [3, 2, 1]
+    finally:
+        executor.shutdown()
+
+
+async def test_process_executor_runs_in_another_process():
+    """Test that the process executor runs functions in a worker process."""
+    executor = ComputeExecutor("process", max_workers=1)
+    try:
+        assert await executor.run(os.getpid) != os.getpid()
+    finally:
+        executor.shutdown()
+
+
+async def test_executor_propagates_exceptions():
+    """Test that exceptions raised by the function reach the caller."""
+    executor = ComputeExecutor("thread", max_workers=1)
+    try:
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(divmod, 1, 0)
+    finally:
+        executor.shutdown()
+
+
+async def test_executor_starts_workers_lazily():
+    """Test that no pool exists until the first computation."""
+    executor = ComputeExecutor("process")
+    assert executor._executor is None
+    executor.shutdown()
+    assert executor._executor is None
+
+
+def test_unknown_executor_kind_is_rejected():
+    """Test that an unknown executor kind raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown compute executor"):
+        ComputeExecutor("gpu")
+
+
+async def test_split_pattern_detection_runs_in_a_worker_process():
+    """Test that a service's pure phase pickles across processes."""
+    rows = [
+        (1, 10, Decimal("60.00"), utc_datetime(2025, 1, 1)),
+        (1, 11, Decimal("40.00"), utc_datetime(2025, 1, 1)),
+        (2, 10, Decimal("30.00"), utc_datetime(2025, 2, 1)),
+        (2, 11, Decimal("20.00"), utc_datetime(2025, 2, 1)),
+    ]
+    executor = ComputeExecutor("process", max_workers=1)
+    try:
+        patterns, metrics = await executor.run(
+            BillSplitService._find_split_patterns, rows
+        )
+    finally:
+        executor.shutdown()
+
+    assert [pattern.pattern_id for pattern in patterns] == ["10:0.60|11:0.40"]
+    assert patterns[0].total_occurrences == 2
+    assert metrics.total_splits == 4
+    assert metrics.account_usage_frequency == {10: 2, 11: 2}
@@ -0,0 +1,57 @@
+"""
+Unit tests for bounded concurrency helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.concurrency import gather_bounded
+
+
+async def test_gather_bounded_limits_in_flight_steps():
+    """Test that no more than the limit run at once and order is kept."""
+    running = 0
+    peak = 0
+
+    def step(value):
+        async def run():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+
+        return run
+
+    results = await gather_bounded([step(i) for i in range(6)], limit=2)
+
+    assert results == list(range(6))
+    assert peak == 2
+
+
+async def test_gather_bounded_cancels_remaining_steps_on_error():
+    """Test that the first failure propagates and cancels the other steps."""
+    cancelled = asyncio.Event()
+
+    async def fail():
+        raise RuntimeError("boom")
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await gather_bounded([slow, fail], limit=2)
+
+    assert cancelled.is_set()
+
+
+async def test_gather_bounded_rejects_invalid_limit():
+    """Test that a limit below 1 is rejected."""
+    with pytest.raises(ValueError):
+        await gather_bounded([], limit=0)
@@ -180,6 +180,19 @@ def test_distribute_by_percentage():
     assert sum(result) == Decimal("100")
 
 
+def test_distribute_by_percentage_half_cent_total():
+    """Test that a half cent left over after rounding is rounded half to even."""
+    result = DecimalPrecision.distribute_by_percentage(
+        Decimal("98.0150"), [Decimal("89.16"), Decimal("10.84")]
+    )
+    assert result == [Decimal("87.39"), Decimal("10.62")]
+
+    result = DecimalPrecision.distribute_by_percentage(
+        Decimal("10.005"), [Decimal("50"), Decimal("50")]
+    )
+    assert result == [Decimal("5.00"), Decimal("5.00")]
+
+
 def test_distribute_by_percentage_with_rounding():
     """Test percentage-based distribution with rounding challenges."""
     # Test with a value that would cause rounding issues
@@ -0,0 +1,143 @@
+"""
+Unit tests for the domain event bus.
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.utils.domain_events import (
+    AccountBalanceChanged,
+    DomainEventBus,
+    TransactionCreated,
+)
+
+
+def _balance_changed(account_id: int, balance: str) -> AccountBalanceChanged:
+    return AccountBalanceChanged(
+        account_id=account_id,
+        balance=Decimal(balance),
+        change=Decimal(balance),
+        reason="transaction",
+    )
+
+
+@pytest.fixture
+async def memory_engine():
+    """Engine on an empty in-memory database."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+class Recorder:
+    """Subscriber recording the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, events):
+        self.batches.append(events)
+
+
+async def test_events_are_delivered_after_commit(memory_engine):
+    """Test that events wait for the commit and arrive as one batch."""
+    bus = DomainEventBus(batch_window=0)
+    recorder = Recorder()
+    bus.subscribe(AccountBalanceChanged, recorder)
+
+    async with AsyncSession(memory_engine) as session:
+        bus.publish(session, _balance_changed(1, "10.00"))
+        bus.publish(session, _balance_changed(2, "20.00"))
+        await bus.drain()
+        assert recorder.batches == []
+
+        await session.commit()
+        await bus.drain()
+
+    assert recorder.batches == [
+        [_balance_changed(1, "10.00"), _balance_changed(2, "20.00")]
+    ]
+
+
+async def test_events_are_discarded_on_rollback(memory_engine):
+    """Test that a rolled back transaction delivers nothing."""
+    bus = DomainEventBus(batch_window=0)
+    recorder = Recorder()
+    bus.subscribe(AccountBalanceChanged, recorder)
+
+    async with AsyncSession(memory_engine) as session:
+        await session.connection()
+        bus.publish(session, _balance_changed(1, "10.00"))
+        await session.rollback()
+        await session.commit()
+        await bus.drain()
+
+    assert recorder.batches == []
+
+
+async def test_bursts_within_the_window_share_a_batch(memory_engine):
+    """Test batching of separate commits and filtering by event type."""
+    bus = DomainEventBus(batch_window=0.05)
+    balances = Recorder()
+    everything = Recorder()
+    bus.subscribe(AccountBalanceChanged, balances)
+    bus.subscribe((AccountBalanceChanged, TransactionCreated), everything)
+    # Registering the same handler again has no effect
+    bus.subscribe(AccountBalanceChanged, balances)
+
+    created = TransactionCreated(
+        account_id=1, transaction_id=7, transaction_type="debit", amount=Decimal("5")
+    )
+    for index in range(3):
+        async with AsyncSession(memory_engine) as session:
+            bus.publish(session, _balance_changed(1, str(index)))
+            if index == 0:
+                bus.publish(session, created)
+            await session.commit()
+    await bus.drain()
+
+    assert len(balances.batches) == 1
+    assert [event.balance for event in balances.batches[0]] == [
+        Decimal(0),
+        Decimal(1),
+        Decimal(2),
+    ]
+    assert everything.batches[0][1] == created
+
+
+async def test_batches_are_limited_in_size():
+    """Test that a large burst is split into batches of max_batch_size."""
+    bus = DomainEventBus(batch_window=0, max_batch_size=2)
+    recorder = Recorder()
+    bus.subscribe(AccountBalanceChanged, recorder)
+
+    bus.dispatch([_balance_changed(index, "1") for index in range(5)])
+    await bus.drain()
+
+    assert [len(batch) for batch in recorder.batches] == [2, 2, 1]
+
+
+async def test_failing_subscriber_does_not_affect_others(caplog):
+    """Test that subscriber errors are logged and delivery continues."""
+    bus = DomainEventBus(batch_window=0)
+    recorder = Recorder()
+
+    async def failing(events):
+        raise RuntimeError("boom")
+
+    bus.subscribe(AccountBalanceChanged, failing)
+    bus.subscribe(AccountBalanceChanged, recorder)
+    bus.dispatch([_balance_changed(1, "1")])
+    await bus.drain()
+
+    assert len(recorder.batches) == 1
+    assert "failed on 1 events" in caplog.text
+
+    bus.unsubscribe(failing)
+    bus.unsubscribe(recorder)
+    bus.dispatch([_balance_changed(1, "1")])
+    await asyncio.sleep(0)
+    assert len(recorder.batches) == 1
@@ -0,0 +1,165 @@
+"""
+Unit tests for query count and latency instrumentation.
+"""
+
+from sqlalchemy import create_engine, text
+
+from src.utils.instrumentation import (
+    MetricsRegistry,
+    RequestMetrics,
+    current_request_metrics,
+    instrument_engine,
+    metrics_registry,
+    request_metrics_scope,
+    track_method,
+)
+
+
+def test_request_scope_sets_current_metrics():
+    """Test that metrics are only current inside a request scope."""
+    assert current_request_metrics() is None
+
+    with request_metrics_scope() as metrics:
+        assert current_request_metrics() is metrics
+
+    assert current_request_metrics() is None
+
+
+def test_nested_scope_rolls_up_statements():
+    """Test that an inner scope's statements are added to the enclosing scope."""
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    try:
+        with engine.connect() as connection:
+            with request_metrics_scope() as outer:
+                connection.execute(text("SELECT 1"))
+                with request_metrics_scope() as inner:
+                    connection.execute(text("SELECT 2"))
+                    connection.execute(text("SELECT 3"))
+                assert current_request_metrics() is outer
+    finally:
+        engine.dispose()
+
+    assert inner.statement_count == 2
+    assert outer.statement_count == 3
+
+
+def test_engine_statements_counted_per_request():
+    """Test that statements executed inside a scope are counted once each."""
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)  # idempotent
+
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with request_metrics_scope() as metrics:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+    finally:
+        engine.dispose()
+
+    assert metrics.statement_count == 2
+    assert metrics.statement_seconds >= 0
+
+
+def test_track_method_records_calls_and_rows():
+    """Test that method timings accumulate calls and returned rows."""
+    with request_metrics_scope() as metrics:
+        with track_method("repository", "AccountRepository", "get_all") as call:
+            call.result = [1, 2, 3]
+        with track_method("repository", "AccountRepository", "get_all") as call:
+            call.result = []
+        with track_method("service", "AccountService", "get_account") as call:
+            call.result = object()
+
+    listing = metrics.methods[("repository", "AccountRepository", "get_all")]
+    assert listing.calls == 2
+    assert listing.rows == 3
+    assert metrics.methods[("service", "AccountService", "get_account")].rows == 1
+
+
+def test_track_method_times_failed_calls():
+    """Test that calls raising an exception are still recorded."""
+    with request_metrics_scope() as metrics:
+        try:
+            with track_method("service", "AccountService", "update_account"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+    timing = metrics.methods[("service", "AccountService", "update_account")]
+    assert timing.calls == 1
+    assert timing.rows == 0
+
+
+def test_server_timing_header_value():
+    """Test Server-Timing formatting of totals and method entries."""
+    metrics = RequestMetrics()
+    metrics.statement_count = 4
+    metrics.statement_seconds = 0.0125
+    metrics.record_method(("service", "AccountService", "get_account"), 0.002, 1)
+
+    value = metrics.server_timing()
+
+    assert value.startswith("total;dur=")
+    assert 'db;dur=12.50;desc="4 statements"' in value
+    assert "service.AccountService.get_account;dur=2.00" in value
+
+
+def test_registry_renders_prometheus_text():
+    """Test the Prometheus exposition output of the registry."""
+    registry = MetricsRegistry()
+    metrics = RequestMetrics()
+    metrics.statement_count = 3
+    registry.record_request("GET", "/api/v1/accounts/{account_id}", 200, metrics)
+    registry.record_request(
+        "GET", "/api/v1/accounts/{account_id}", 200, metrics, budget_exceeded=True
+    )
+    registry.record_statement(0.5)
+    registry.record_method(("repository", "AccountRepository", "get"), 0.25, 1)
+
+    output = registry.render()
+
+    labels = 'method="GET",route="/api/v1/accounts/{account_id}"'
+    assert f'debtonator_http_requests_total{{{labels},status="200"}} 2' in output.split(
+        "\n"
+    )
+    assert (
+        f'debtonator_http_request_db_statements_bucket{{{labels},le="2"}} 0' in output
+    )
+    assert (
+        f'debtonator_http_request_db_statements_bucket{{{labels},le="5"}} 2' in output
+    )
+    assert f"debtonator_http_request_db_statements_sum{{{labels}}} 6" in output
+    assert (
+        f"debtonator_http_request_query_budget_exceeded_total{{{labels}}} 1" in output
+    )
+    assert "debtonator_db_statements_total 1" in output
+    assert (
+        'debtonator_method_rows_total{layer="repository",class="AccountRepository",'
+        'method="get"} 1' in output
+    )
+    assert "# TYPE debtonator_http_request_db_statements histogram" in output
+    assert output.endswith("\n")
+
+
+def test_registry_reset():
+    """Test that reset discards recorded values."""
+    registry = MetricsRegistry()
+    registry.record_statement(0.1)
+    registry.reset()
+
+    assert "debtonator_db_statements_total 0" in registry.render()
+
+
+def test_process_registry_receives_method_calls():
+    """Test that tracked calls reach the process-wide registry."""
+    with track_method("service", "InstrumentationProbe", "probe") as call:
+        call.result = [1]
+
+    assert (
+        'debtonator_method_calls_total{layer="service",class="InstrumentationProbe",'
+        'method="probe"}' in metrics_registry.render()
+    )
@@ -0,0 +1,111 @@
+"""
+Unit tests for fixed-point money arithmetic.
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.utils.decimal_precision import DecimalPrecision
+from src.utils.money import (
+    allocate_by_ratios,
+    allocate_evenly,
+    cents_to_decimal,
+    decimals_from_units,
+    div_round_half_even,
+    div_round_half_up,
+    from_units,
+    round_units_to_cents,
+    to_units,
+    units_array,
+)
+
+
+def test_to_units_rounds_like_round_for_calculation():
+    """Test that conversion rounds half away from zero at 4 places."""
+    for value in ("10.55555", "-10.55555", "10.55554", "0.00005", "123.4567"):
+        decimal = Decimal(value)
+        assert from_units(to_units(decimal)) == DecimalPrecision.round_for_calculation(
+            decimal
+        )
+
+    assert to_units(Decimal("1.2345")) == 12345
+    assert to_units(3) == 30000
+    assert to_units("0.01") == 100
+
+
+def test_from_units_has_four_decimal_places():
+    """Test that units convert back to Decimals with 4 decimal places."""
+    assert str(from_units(12345)) == "1.2345"
+    assert str(from_units(-5)) == "-0.0005"
+    assert str(from_units(0)) == "0.0000"
+    assert str(cents_to_decimal(-1999)) == "-19.99"
+
+
+def test_div_round_half_up_rounds_away_from_zero():
+    """Test integer division rounding of halves and negatives."""
+    assert div_round_half_up(5, 2) == 3
+    assert div_round_half_up(-5, 2) == -3
+    assert div_round_half_up(4, 3) == 1
+    assert div_round_half_up(-4, 3) == -1
+    assert round_units_to_cents(12350) == 124
+    assert round_units_to_cents(-12349) == -123
+
+
+def test_div_round_half_even_rounds_halves_to_even():
+    """Test integer division rounding like Decimal.quantize."""
+    assert div_round_half_even(5, 2) == 2
+    assert div_round_half_even(7, 2) == 4
+    assert div_round_half_even(-5, 2) == -2
+    assert div_round_half_even(-7, 2) == -4
+    assert div_round_half_even(4, 3) == 1
+    assert div_round_half_even(50, 100) == 0
+    assert div_round_half_even(150, 100) == 2
+
+
+def test_units_array_round_trip():
+    """Test that series convert to int64 arrays and back exactly."""
+    values = [Decimal("1.10"), Decimal("-2.2222"), Decimal("99999999.9999")]
+
+    array = units_array(values)
+
+    assert array.dtype == np.int64
+    assert int(array.sum()) == sum(to_units(value) for value in values)
+    assert decimals_from_units(array) == values
+
+
+def test_allocate_evenly_gives_leftover_cents_to_first_parts():
+    """Test even allocation of an amount in whole cents."""
+    assert allocate_evenly(to_units(Decimal("100")), 3) == [333400, 333300, 333300]
+    assert allocate_evenly(to_units(Decimal("-0.02")), 3) == [0, -100, -100]
+    assert sum(allocate_evenly(to_units(Decimal("9999999.99")), 7)) == to_units(
+        Decimal("9999999.99")
+    )
+
+    with pytest.raises(ValueError):
+        allocate_evenly(100, 0)
+
+
+def test_allocate_by_ratios_sums_to_rounded_total():
+    """Test that ratio allocation hands rounding errors back by size."""
+    # 33.335% of 100 rounds up twice; the part with the largest error gives
+    # the cent back
+    parts = allocate_by_ratios(to_units(Decimal("100")), [33335, 33335, 33330], 100000)
+    assert sorted(parts) == [333300, 333300, 333400]
+    assert sum(parts) == to_units(Decimal("100"))
+
+    assert allocate_by_ratios(to_units(Decimal("10")), [1, 1, 1], 3) == [
+        33400,
+        33300,
+        33300,
+    ]
+    assert allocate_by_ratios(100, [], 1) == []
+
+
+def test_allocate_by_ratios_rounds_half_cent_leftover_to_even():
+    """Test that a half-cent leftover is rounded half to even."""
+    # 89.16% and 10.84% of 98.015 round to 87.39 and 10.62; the 0.005 left
+    # over rounds to zero cents
+    parts = allocate_by_ratios(to_units(Decimal("98.0150")), [8916, 1084], 10000)
+    assert parts == [873900, 106200]
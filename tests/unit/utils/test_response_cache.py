@@ -0,0 +1,106 @@
+"""
+Unit tests for the response cache and data version tracking.
+"""
+
+from sqlalchemy import Column, Integer, String, create_engine, update
+from sqlalchemy.orm import Session, declarative_base
+
+from src.utils.response_cache import (
+    ResponseCache,
+    data_version,
+    make_etag,
+    track_data_version,
+)
+
+LocalBase = declarative_base()
+
+
+class Item(LocalBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+def put(cache, key, version=1, body=b"{}", ttl=60.0):
+    return cache.put((key,), version, ttl, 200, {}, body)
+
+
+def test_get_returns_entry_for_current_version():
+    """Test that entries are served only while their data version is current."""
+    cache = ResponseCache()
+    entry = put(cache, "/a", version=1, body=b'{"a": 1}')
+
+    assert cache.get(("/a",), 1) is entry
+    assert entry.etag == make_etag(b'{"a": 1}')
+    assert cache.get(("/a",), 2) is None
+    # The stale entry was dropped on lookup
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_drops_expired_entries():
+    """Test that entries past their TTL are misses."""
+    cache = ResponseCache()
+    put(cache, "/a", ttl=0)
+
+    assert cache.get(("/a",), 1) is None
+
+
+def test_put_evicts_least_recently_used_entries():
+    """Test LRU eviction by entry count."""
+    cache = ResponseCache(max_entries=2)
+    put(cache, "/a")
+    put(cache, "/b")
+    cache.get(("/a",), 1)
+    put(cache, "/c")
+
+    assert cache.get(("/b",), 1) is None
+    assert cache.get(("/a",), 1) is not None
+    assert cache.get(("/c",), 1) is not None
+
+
+def test_put_respects_byte_limit():
+    """Test eviction by total body size and that oversized bodies are not stored."""
+    cache = ResponseCache(max_bytes=10)
+    put(cache, "/a", body=b"123456")
+    put(cache, "/b", body=b"123456")
+
+    assert cache.get(("/a",), 1) is None
+    assert cache.size == 6
+
+    entry = put(cache, "/big", body=b"x" * 11)
+    assert entry.etag == make_etag(b"x" * 11)
+    assert cache.get(("/big",), 1) is None
+    assert cache.size == 6
+
+
+def test_committed_writes_bump_data_version():
+    """Test that only committed writes advance the data version."""
+    # Installing the listeners twice must not bump the version twice
+    track_data_version()
+    track_data_version()
+    engine = create_engine("sqlite://")
+    LocalBase.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        version = data_version.current
+        session.add(Item(name="first"))
+        session.commit()
+        assert data_version.current == version + 1
+
+        # Reads do not bump the version
+        session.get(Item, 1)
+        session.commit()
+        assert data_version.current == version + 1
+
+        # Rolled back writes do not bump the version
+        session.add(Item(name="second"))
+        session.flush()
+        session.rollback()
+        assert data_version.current == version + 1
+
+        # DML statements are writes too
+        session.execute(update(Item).values(name="renamed"))
+        session.commit()
+        assert data_version.current == version + 2
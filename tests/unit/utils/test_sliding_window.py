@@ -0,0 +1,35 @@
+"""
+Unit tests for sliding window aggregates.
+"""
+
+import random
+
+import pytest
+
+from src.utils.sliding_window import lookahead_minimums
+
+
+def test_lookahead_minimums_match_brute_force():
+    """Test that every window minimum matches a direct scan."""
+    rng = random.Random(42)
+    values = [rng.randint(-500, 500) for _ in range(200)]
+
+    for window in (1, 2, 14, 90, 250):
+        expected = [min(values[i : i + window]) for i in range(len(values))]
+        assert lookahead_minimums(values, window) == expected
+
+
+def test_lookahead_minimums_keep_equal_values():
+    """Test that repeated minimums within a window are reported."""
+    assert lookahead_minimums([3, 1, 1, 2, 1, 5], 3) == [1, 1, 1, 1, 1, 5]
+
+
+def test_lookahead_minimums_of_empty_series():
+    """Test that an empty series has no minimums."""
+    assert lookahead_minimums([], 5) == []
+
+
+def test_lookahead_minimums_reject_empty_window():
+    """Test that a window must contain at least one value."""
+    with pytest.raises(ValueError, match="at least one value"):
+        lookahead_minimums([1, 2, 3], 0)
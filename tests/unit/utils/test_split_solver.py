@@ -0,0 +1,86 @@
+"""
+Unit tests for the exact bill split allocation solver.
+"""
+
+import pytest
+
+from src.utils.split_solver import SplitDemand, SplitSolver
+
+
+def test_prefers_cheapest_account():
+    """Test that the full amount comes from the cheapest account with room."""
+    solver = SplitSolver([SplitDemand(liability_id=1, amount=10000)])
+    solver.add_account(10, [50000], [(50000, 0)])
+    solver.add_account(20, [50000], [(50000, 1500)])
+
+    solution = solver.solve()
+
+    assert solution.allocations == {1: {10: 10000}}
+    assert solution.unallocated == {}
+    assert solution.total_cost == 0
+
+
+def test_convex_tiers_spread_across_accounts():
+    """Test that tiered costs move spillover to the next cheapest band."""
+    solver = SplitSolver([SplitDemand(liability_id=1, amount=10000)])
+    solver.add_account(10, [100000], [(3000, 10), (100000, 100)])
+    solver.add_account(20, [100000], [(4000, 20), (100000, 100)])
+
+    solution = solver.solve()
+
+    assert solution.allocations[1] == {10: 6000, 20: 4000}
+    assert solution.total_cost == 3000 * 10 + 4000 * 20 + 3000 * 100
+
+
+def test_cumulative_capacity_respects_due_dates():
+    """Test that funds arriving later are only used for later liabilities."""
+    solver = SplitSolver(
+        [
+            SplitDemand(liability_id=1, amount=10000, preferred_account_id=20),
+            SplitDemand(liability_id=2, amount=10000, preferred_account_id=10),
+        ]
+    )
+    # Account 10 has 100.00 throughout; account 20 is empty until income
+    # arrives between the two due dates
+    solver.add_account(10, [10000, 10000], [(10000, 0)])
+    solver.add_account(20, [0, 10000], [(10000, 0)])
+
+    solution = solver.solve()
+
+    assert solution.allocations == {1: {10: 10000}, 2: {20: 10000}}
+    assert solution.unallocated == {}
+
+
+def test_preferred_account_breaks_ties():
+    """Test that equally cheap accounts resolve to the preferred account."""
+    solver = SplitSolver(
+        [SplitDemand(liability_id=1, amount=500, preferred_account_id=20)]
+    )
+    solver.add_account(10, [1000], [(1000, 0)])
+    solver.add_account(20, [1000], [(1000, 0)])
+
+    assert solver.solve().allocations == {1: {20: 500}}
+
+
+def test_reports_unfunded_remainder_exactly():
+    """Test that shortfalls are reported in cents and nothing is overdrawn."""
+    solver = SplitSolver(
+        [
+            SplitDemand(liability_id=1, amount=10001),
+            SplitDemand(liability_id=2, amount=5000),
+        ]
+    )
+    solver.add_account(10, [3334, 9000], [(9000, 0)])
+
+    solution = solver.solve()
+
+    assert solution.allocations == {1: {10: 3334}, 2: {10: 5000}}
+    assert solution.unallocated == {1: 10001 - 3334}
+
+
+def test_capacity_count_must_match_demands():
+    """Test that each account needs one capacity per demand."""
+    solver = SplitSolver([SplitDemand(liability_id=1, amount=100)])
+
+    with pytest.raises(ValueError):
+        solver.add_account(10, [100, 100], [(100, 0)])
@@ -0,0 +1,89 @@
+"""
+Unit tests for startup profiling.
+"""
+
+import time
+
+from src.utils.startup_profile import (
+    StartupProfile,
+    format_import_report,
+    package_totals,
+    parse_import_times,
+    profile_imports,
+)
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     sqlalchemy.util
+import time:       300 |        420 |   sqlalchemy
+import time:        50 |         50 |       src.services.base
+import time:       200 |        250 |     src.services.accounts
+import time:        80 |        750 | src.main
+"""
+
+
+def test_parse_import_times():
+    """Test parsing of -X importtime output."""
+    times = parse_import_times(SAMPLE_OUTPUT + "unrelated warning\n")
+
+    assert [entry.module for entry in times] == [
+        "sqlalchemy.util",
+        "sqlalchemy",
+        "src.services.base",
+        "src.services.accounts",
+        "src.main",
+    ]
+    assert times[0].self_us == 120
+    assert times[1].cumulative_us == 420
+    assert [entry.depth for entry in times] == [2, 1, 3, 2, 0]
+
+
+def test_package_totals_group_self_time():
+    """Test that self time is summed per package, slowest first."""
+    totals = package_totals(parse_import_times(SAMPLE_OUTPUT))
+
+    assert totals == {
+        "sqlalchemy": 300,
+        "src.services": 250,
+        "sqlalchemy.util": 120,
+        "src.main": 80,
+    }
+    assert package_totals(parse_import_times(SAMPLE_OUTPUT), depth=1) == {
+        "sqlalchemy": 420,
+        "src": 330,
+    }
+
+
+def test_format_import_report():
+    """Test that the report lists totals, packages and modules."""
+    report = format_import_report(parse_import_times(SAMPLE_OUTPUT), top=2)
+
+    assert report.startswith("Total import time: 0.8 ms (5 modules)")
+    assert "0.3  sqlalchemy\n" in report
+    assert "src.main" in report
+    # Only the two slowest modules are listed
+    assert "src.services.base" not in report
+
+
+def test_profile_imports_runs_a_fresh_interpreter():
+    """Test that profiling reports the imported module itself."""
+    times = profile_imports("json")
+
+    assert any(entry.module == "json" for entry in times)
+
+
+def test_startup_profile_records_phases():
+    """Test that phases are timed in order, including failed ones."""
+    profile = StartupProfile()
+    with profile.phase("first"):
+        time.sleep(0.01)
+    try:
+        with profile.phase("second"):
+            raise RuntimeError("startup failed")
+    except RuntimeError:
+        pass
+
+    assert [name for name, _ in profile.phases] == ["first", "second"]
+    assert profile.total_ms >= 10
+    assert profile.report().startswith("first=")
+    assert ", second=" in profile.report()
@@ -0,0 +1,137 @@
+"""
+Unit tests for structured logging.
+"""
+
+import io
+import json
+import logging
+import sys
+
+import pytest
+
+from src.utils.structured_logging import (
+    JsonFormatter,
+    RequestIdFilter,
+    SamplingFilter,
+    configure_logging,
+    current_request_id,
+    request_id_scope,
+)
+
+
+def make_record(name="src.test", level=logging.DEBUG, msg="hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_request_id_scope_sets_and_restores_id():
+    """Test that request ids are current only inside their scope."""
+    assert current_request_id() is None
+
+    with request_id_scope("abc") as request_id:
+        assert request_id == "abc"
+        assert current_request_id() == "abc"
+        with request_id_scope() as generated:
+            assert generated != "abc"
+            assert current_request_id() == generated
+        assert current_request_id() == "abc"
+
+    assert current_request_id() is None
+
+
+def test_request_id_filter_stamps_records():
+    """Test that records carry the current request id or a placeholder."""
+    id_filter = RequestIdFilter()
+
+    outside = make_record()
+    id_filter.filter(outside)
+    with request_id_scope("req-1"):
+        inside = make_record()
+        id_filter.filter(inside)
+
+    assert outside.request_id == "-"
+    assert inside.request_id == "req-1"
+
+
+def test_json_formatter_includes_extra_fields_and_request_id():
+    """Test that JSON lines contain the message, request id and extras."""
+    record = make_record(level=logging.INFO)
+    record.account_id = 7
+    with request_id_scope("req-2"):
+        payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "hello world"
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "src.test"
+    assert payload["request_id"] == "req-2"
+    assert payload["account_id"] == 7
+    assert payload["timestamp"].endswith("Z")
+
+
+def test_json_formatter_includes_exception():
+    """Test that exceptions are formatted into the JSON line."""
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "src.test", logging.ERROR, __file__, 1, "failed", (), sys.exc_info()
+        )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert "ValueError: boom" in payload["exception"]
+
+
+def test_sampling_filter_keeps_one_in_n_debug_records():
+    """Test that sampling applies to a logger hierarchy below max_level only."""
+    sampler = SamplingFilter({"src.repositories": 0.25, "src.quiet": 0})
+
+    kept = [
+        sampler.filter(make_record(name="src.repositories.proxies")) for _ in range(8)
+    ]
+    assert kept.count(True) == 2
+
+    assert not sampler.filter(make_record(name="src.quiet"))
+    assert sampler.filter(make_record(name="src.quiet", level=logging.WARNING))
+    assert sampler.filter(make_record(name="src.services"))
+
+
+def test_sampling_filter_prefers_most_specific_logger():
+    """Test that a child logger rate overrides its parent's."""
+    sampler = SamplingFilter({"src": 0, "src.services.payments": 1})
+
+    assert sampler.filter(make_record(name="src.services.payments.schedules"))
+    assert not sampler.filter(make_record(name="src.services.accounts"))
+
+
+def test_sampling_filter_rejects_invalid_rate():
+    """Test that rates outside [0, 1] are refused."""
+    with pytest.raises(ValueError):
+        SamplingFilter({"src": 1.5})
+
+
+def test_configure_logging_is_idempotent_and_lazy():
+    """Test that reconfiguring replaces the handler and skips disabled levels."""
+    root = logging.getLogger()
+    original_level = root.level
+    stream = io.StringIO()
+    try:
+        configure_logging(level="INFO", json_format=True)
+        handler = configure_logging(level="INFO", json_format=True, stream=stream)
+        assert [h for h in root.handlers if h.get_name() == "debtonator"] == [handler]
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("debug argument was formatted")
+
+        logger = logging.getLogger("src.test.structured")
+        logger.debug("never formatted: %s", Exploding())
+        logger.info("emitted %d", 1)
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["message"] == "emitted 1"
+    finally:
+        for existing in list(root.handlers):
+            if existing.get_name() == "debtonator":
+                root.removeHandler(existing)
+        root.setLevel(original_level)
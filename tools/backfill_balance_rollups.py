@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Balance Rollup Backfill Tool for Debtonator
+
+This script:
+1. Finds accounts with balance history recorded before their first rollup
+2. Rolls that history up into the daily and monthly rollup tiers
+
+Run it once after upgrading, and again after importing balance history.
+
+Usage:
+    python tools/backfill_balance_rollups.py [account_id ...]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to Python path to allow imports
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.database.database import async_session
+from src.services.balance_history import BalanceHistoryService
+
+
+async def backfill(account_ids):
+    """Backfill rollups in one transaction and return the summary"""
+    async with async_session() as session:
+        summary = await BalanceHistoryService(session).backfill_rollups(account_ids)
+        await session.commit()
+    return summary
+
+
+def main():
+    """Backfill the accounts given on the command line, or all accounts"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("account_ids", nargs="*", type=int)
+    args = parser.parse_args()
+
+    summary = asyncio.run(backfill(args.account_ids or None))
+    print(f"Wrote {summary['daily']} daily and {summary['monthly']} monthly rollups")
+
+
+if __name__ == "__main__":
+    main()
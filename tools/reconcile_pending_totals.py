@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Pending Totals Reconciliation Tool for Debtonator
+
+This script:
+1. Sums every account's transaction history by type
+2. Corrects the running debit/credit totals stored on accounts that drifted
+
+Run it periodically (e.g. nightly from cron).
+
+Usage:
+    python tools/reconcile_pending_totals.py [account_id ...]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to Python path to allow imports
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.database.database import async_session
+from src.services.accounts import AccountService
+
+
+async def reconcile(account_ids):
+    """Reconcile pending totals in one transaction and return the summary"""
+    async with async_session() as session:
+        summary = await AccountService(session).reconcile_pending_totals(account_ids)
+        await session.commit()
+    return summary
+
+
+def main():
+    """Reconcile the accounts given on the command line, or all accounts"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("account_ids", nargs="*", type=int)
+    args = parser.parse_args()
+
+    summary = asyncio.run(reconcile(args.account_ids or None))
+    print(
+        f"Checked {summary['accounts_checked']} accounts, "
+        f"corrected {summary['accounts_corrected']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
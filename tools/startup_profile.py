@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""
+Startup Profile Tool for Debtonator
+
+This script:
+1. Imports a module (src.main by default) in a fresh interpreter with -X importtime
+2. Prints the total import time, the slowest packages and the slowest modules
+
+Usage:
+    python tools/startup_profile.py [module] [--top N] [--depth N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to Python path to allow imports
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.utils.startup_profile import format_import_report, profile_imports
+
+
+def main():
+    """Print the import-time breakdown of a module"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("module", nargs="?", default="src.main")
+    parser.add_argument("--top", type=int, default=25, help="entries per list")
+    parser.add_argument(
+        "--depth", type=int, default=2, help="name components per package"
+    )
+    args = parser.parse_args()
+
+    print(
+        format_import_report(
+            profile_imports(args.module), top=args.top, package_depth=args.depth
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()